@@ -1 +1,2 @@
-from .client.client import TikTokLiveClient
\ No newline at end of file
+from .client.client import TikTokLiveClient
+from .client.pool import TikTokLiveClientPool
@@ -1,34 +1,62 @@
 import asyncio
 import inspect
 import logging
+import time
 import traceback
 from asyncio import AbstractEventLoop, Task, CancelledError
+from concurrent.futures import Executor
 from logging import Logger
-from typing import Optional, Type, Dict, Any, Union, Callable, List, Coroutine, AsyncIterator
+from typing import Optional, Type, Dict, Any, Union, Callable, List, Coroutine, AsyncIterator, Tuple, FrozenSet
 
 import httpx
-from pyee.asyncio import AsyncIOEventEmitter
-from pyee.base import Handler
 
+from TikTokLive.client.coalesce import EventCoalescer
+from TikTokLive.client.decoding import DecodedPayload, decode_proto_events
+from TikTokLive.client.dedup import MessageDeduplicator
+from TikTokLive.client.dispatch import EventDispatcher
+from TikTokLive.client.session import ReconnectPolicy, WebcastSession
+from TikTokLive.client.ingest import IngestQueue, ReceivedResponse
+from TikTokLive.client.instrumentation import Instrumentation, Stage
+from TikTokLive.client.lag import LagTracker
 from TikTokLive.client.errors import AlreadyConnectedError, UserOfflineError, UserNotFoundError
 from TikTokLive.client.logger import TikTokLiveLogHandler, LogLevel
+from TikTokLive.client.loop import EventLoopRunner
+from TikTokLive.client.sampling import EventSampler
+from TikTokLive.client.streaks import GiftStreakAggregator
 from TikTokLive.client.web.web_client import TikTokWebClient
 from TikTokLive.client.web.web_settings import WebDefaults
 from TikTokLive.client.ws.ws_client import WebcastWSClient
 from TikTokLive.client.ws.ws_connect import WebcastProxy
-from TikTokLive.events import Event, EventHandler
+from TikTokLive.client.ws.ws_sink import RawFrameSink
+from TikTokLive.events import Event
 from TikTokLive.events.custom_events import WebsocketResponseEvent, FollowEvent, ShareEvent, LiveEndEvent, \
-    DisconnectEvent, LivePauseEvent, LiveUnpauseEvent, UnknownEvent, CustomEvent, ConnectEvent
-from TikTokLive.events.proto_events import EVENT_MAPPINGS, ProtoEvent, ControlEvent
+    DisconnectEvent, LivePauseEvent, LiveUnpauseEvent, UnknownEvent, CustomEvent, ConnectEvent, ReconnectEvent, \
+    GiftStreakProgressEvent, GiftStreakEndEvent, LikeBatchEvent, JoinBatchEvent, RoomUserSeqBatchEvent
+from TikTokLive.events.proto_events import EVENT_MAPPINGS, ProtoEvent, ControlEvent, SocialEvent, GiftEvent, LikeEvent, \
+    JoinEvent, RoomUserSeqEvent
 from TikTokLive.proto import WebcastResponse, WebcastResponseMessage, ControlAction
+from TikTokLive.proto.codec import ProtoCodec, SUPPORTS_UPB, parse_message
 
 
-class TikTokLiveClient(AsyncIOEventEmitter):
+class TikTokLiveClient(EventDispatcher):
     """
     A client to connect to & read from TikTok LIVE streams
 
     """
 
+    """CustomEvent types that are derived from a ProtoEvent, so the ProtoEvent must be decoded if they are listened to"""
+    DERIVED_EVENTS: Dict[Type[ProtoEvent], Tuple[Type[CustomEvent], ...]] = {
+        ControlEvent: (LiveEndEvent, LivePauseEvent, LiveUnpauseEvent),
+        SocialEvent: (FollowEvent, ShareEvent),
+        GiftEvent: (GiftStreakProgressEvent, GiftStreakEndEvent),
+        LikeEvent: (LikeBatchEvent,),
+        JoinEvent: (JoinBatchEvent,),
+        RoomUserSeqEvent: (RoomUserSeqBatchEvent,),
+    }
+
+    """A client's event streams end with its connection"""
+    _streams_end_on_disconnect: bool = True
+
     def __init__(
             self,
             # User to connect to
@@ -71,6 +99,7 @@ class TikTokLiveClient(AsyncIOEventEmitter):
 
         # Overridable properties
         self.ignore_broken_payload: bool = False
+        self.decode_unsubscribed_events: bool = True
 
         # Properties
         self._unique_id: str = self.parse_unique_id(unique_id)
@@ -78,6 +107,17 @@ class TikTokLiveClient(AsyncIOEventEmitter):
         self._room_info: Optional[Dict[str, Any]] = None
         self._gift_info: Optional[Dict[str, Any]] = None
         self._event_loop_task: Optional[Task] = None
+        self._decode_executor: Optional[Executor] = None
+        self._ingest_queue: Optional[IngestQueue] = None
+        self._proto_codec: ProtoCodec = ProtoCodec.BETTERPROTO
+        self._deduplicator: Optional[MessageDeduplicator] = None
+        self._gift_streaks: Optional[GiftStreakAggregator] = None
+        self._coalescer: Optional[EventCoalescer] = None
+        self._sampler: Optional[EventSampler] = None
+        self._lag: Optional[LagTracker] = None
+        self._session: Optional[WebcastSession] = None
+        self._disconnect_requested: Optional[asyncio.Event] = None
+        self._loop_runner: Optional[EventLoopRunner] = None
 
     @classmethod
     def parse_unique_id(cls, unique_id: str) -> str:
@@ -103,7 +143,20 @@ class TikTokLiveClient(AsyncIOEventEmitter):
             fetch_room_info: bool = False,
             fetch_gift_info: bool = False,
             fetch_live_check: bool = True,
-            room_id: Optional[int] = None
+            room_id: Optional[int] = None,
+            decode_executor: Optional[Executor] = None,
+            ingest_queue: Optional[IngestQueue] = None,
+            raw_frame_sink: Optional[RawFrameSink] = None,
+            decode_frames: bool = True,
+            proto_codec: ProtoCodec = ProtoCodec.BETTERPROTO,
+            deduplicator: Optional[MessageDeduplicator] = None,
+            reconnect_policy: Optional[ReconnectPolicy] = None,
+            gift_streaks: Optional[GiftStreakAggregator] = None,
+            coalescer: Optional[EventCoalescer] = None,
+            sampler: Optional[EventSampler] = None,
+            instrumentation: Optional[Instrumentation] = None,
+            track_lag: bool = False,
+            stamp_lag: bool = False
     ) -> Task:
         """
         Create a non-blocking connection to TikTok LIVE and return the task
@@ -115,6 +168,33 @@ class TikTokLiveClient(AsyncIOEventEmitter):
         :param room_id: An override to the room ID to connect directly to the livestream and skip scraping the live.
                         Useful when trying to scale, as scraping the HTML can result in TikTok blocks.
         :param compress_ws_events: Whether to compress the WebSocket events using gzip compression (you should probably have this on)
+        :param decode_executor: An optional thread or process pool to decode the protobuf payloads in, off the event loop.
+                                Frames are shipped as raw bytes & come back as parsed events, in order.
+        :param ingest_queue: An optional bounded queue between the WebSocket reader & the event dispatcher, so that
+                             slow parsing or handlers don't back up into the WebSocket. See `IngestQueue` for overflow policies.
+        :param raw_frame_sink: An optional sink (e.g. `FileFrameSink`) that receives every raw WebcastPushFrame & its receive time,
+                               before any decompression or parsing.
+        :param decode_frames: Whether to decode frames into events. Disable it with a raw_frame_sink to archive rooms at
+                              close to network speed. Only ConnectEvent & DisconnectEvent are emitted in that mode.
+        :param proto_codec: The codec to decode protobuf messages with. ProtoCodec.UPB decodes the hottest messages with the
+                            C protobuf runtime (the "upb" extra), falling back to betterproto if it isn't installed.
+        :param deduplicator: An optional `MessageDeduplicator` that drops messages already received, keyed on msg_id.
+                             Reuse the same one across reconnects to the same room.
+        :param reconnect_policy: Enables a resumable session. When the WebSocket drops, the room is re-signed & resumed from the
+                                 latest cursor with jittered backoff, skipping the room ID, live check & info fetches.
+                                 A ReconnectEvent is emitted with the gap duration. Pair it with a deduplicator.
+        :param gift_streaks: An optional `GiftStreakAggregator` that merges the GiftEvents of each gift streak into a single
+                             GiftStreakEndEvent (& throttled GiftStreakProgressEvents). GiftEvents are still emitted.
+        :param coalescer: An optional `EventCoalescer` that merges the LikeEvents, JoinEvents & RoomUserSeqEvents of each window
+                          (e.g. 250ms) into a LikeBatchEvent, JoinBatchEvent & RoomUserSeqBatchEvent. The merged events are
+                          no longer emitted individually.
+        :param sampler: An optional `EventSampler` with sampling & rate limit policies per event type. Policies on ProtoEvents
+                        drop the messages before they are decoded, the others drop the events before they are emitted.
+        :param instrumentation: Optional hooks (e.g. a `HistogramInstrumentation`) that receive every frame & the time spent
+                                decompressing, parsing, decoding, dispatching & handling, per event type.
+                                Nothing is timed without it.
+        :param track_lag: Whether to track the lag behind TikTok's server timestamps, as rolling percentiles in `client.lag`
+        :param stamp_lag: Whether to also stamp each event's lag on it, as `event.lag` (implies track_lag)
         :return: Task containing the heartbeat of the client
 
         """
@@ -153,13 +233,32 @@ class TikTokLiveClient(AsyncIOEventEmitter):
 
         # <Required> Fetch the first response
         initial_webcast_response: WebcastResponse = await self._web.fetch_signed_websocket()
+        self._decode_executor = decode_executor
+        self._ingest_queue = ingest_queue
+        self._proto_codec = proto_codec
+        self._deduplicator = deduplicator
+        self._gift_streaks = gift_streaks
+        self._coalescer = coalescer
+        self._sampler = sampler
+        self._instrumentation = instrumentation
+        self._lag = LagTracker(stamp_events=stamp_lag) if track_lag or stamp_lag else None
+        self._session = WebcastSession(reconnect_policy) if reconnect_policy is not None else None
+        self._disconnect_requested = asyncio.Event()
+
+        if proto_codec == ProtoCodec.UPB and not SUPPORTS_UPB:
+            self._logger.warning(
+                'The upb codec requires the C protobuf runtime. Falling back to betterproto. '
+                'To install it, type "pip install TikTokLive[upb]".'
+            )
 
         # Start the websocket connection & return it
         self._event_loop_task = self._asyncio_loop.create_task(
             self._ws_client_loop(
                 initial_webcast_response=initial_webcast_response,
                 process_connect_events=process_connect_events,
-                compress_ws_events=compress_ws_events
+                compress_ws_events=compress_ws_events,
+                raw_frame_sink=raw_frame_sink,
+                decode_frames=decode_frames
             )
         )
 
@@ -200,16 +299,33 @@ class TikTokLiveClient(AsyncIOEventEmitter):
 
         return task
 
-    def run(self, **kwargs) -> Task:
+    def run(self, use_uvloop: bool = False, **kwargs) -> Task:
         """
-        Start a thread-blocking connection to TikTokLive
+        Start a thread-blocking connection to TikTokLive, on an event loop owned by the client.
+        Once the connection ends, the tasks left on the loop (e.g. the ping & writer tasks) are cancelled & the loop is closed.
 
+        :param use_uvloop: Whether to run on uvloop, if it is installed (type "pip install TikTokLive[uvloop]")
         :param kwargs: Kwargs to pass to start
         :return: The task, once it's finished
+        :raises RuntimeError: If the client's loop was already created with a different use_uvloop
 
         """
 
-        return self._asyncio_loop.run_until_complete(self.connect(**kwargs))
+        if self._loop_runner is None:
+            self._loop_runner = EventLoopRunner(use_uvloop=use_uvloop)
+
+        # The loop was already created (e.g. by scheduling a callback before running), & the tasks on it can't be moved
+        elif self._loop_runner.use_uvloop != use_uvloop:
+            raise RuntimeError(
+                f"The client's event loop was created before run() with use_uvloop={self._loop_runner.use_uvloop}, "
+                f"so it can't run with use_uvloop={use_uvloop}. Call run() before using the loop, or run it with the same use_uvloop."
+            )
+
+        try:
+            return self._loop_runner.run(self.connect(**kwargs))
+        finally:
+            self._loop_runner.close()
+            self._loop_runner = None
 
     async def disconnect(self, close_client: bool = False) -> None:
         """
@@ -220,6 +336,10 @@ class TikTokLiveClient(AsyncIOEventEmitter):
 
         """
 
+        # Stop a resumable session from reconnecting
+        if self._disconnect_requested is not None:
+            self._disconnect_requested.set()
+
         # Disconnect the WebSocket
         await self._ws.disconnect()
 
@@ -251,48 +371,45 @@ class TikTokLiveClient(AsyncIOEventEmitter):
 
         await self._web.close()
 
-    def on(self, event: Type[Event], f: Optional[EventHandler] = None) -> Union[Handler, Callable[[Handler], Handler]]:
+    def is_subscribed(self, event_type: Type[ProtoEvent]) -> bool:
         """
-        Decorator that can be used to register a Python function as an event listener
+        Check whether a ProtoEvent has a consumer, either a listener for the event itself or for a CustomEvent derived from it.
+        ControlEvent is always subscribed to, as the client relies on it to disconnect when the stream ends.
 
-        :param event: The event to listen to
-        :param f: The function to handle the event
-        :return: The wrapped function as a generated `pyee.Handler` object
+        :param event_type: The ProtoEvent type to check
+        :return: Whether the event has to be decoded
 
         """
 
-        return super(TikTokLiveClient, self).on(event.get_type(), f)
+        if event_type is ControlEvent or self.has_listener(event_type):
+            return True
 
-    def add_listener(self, event: Type[Event], f: EventHandler) -> Handler:
-        """
-        Method that can be used to register a Python function as an event listener
+        for derived_type in self.DERIVED_EVENTS.get(event_type, ()):
+            if self.has_listener(derived_type):
+                return True
 
-        :param event: The event to listen to
-        :param f: The function to handle the event
-        :return: The generated `pyee.Handler` object
+        return False
 
+    def _routed_methods(self) -> Optional[FrozenSet[str]]:
         """
-        if isinstance(event, str):
-            return super().add_listener(event=event, f=f)
+        Get the WebcastResponseMessage methods that must be decoded, so that the others can be skipped on the wire
 
-        return super().add_listener(event=event.get_type(), f=f)
+        :return: The methods, or None if every message is needed
 
-    def has_listener(self, event: Type[Event]) -> bool:
         """
-        Check whether the client is listening to a given event
-
-        :param event: The event to check listening for
-        :return: Whether it is being listened to
 
-        """
+        if self.decode_unsubscribed_events or self.has_listener(WebsocketResponseEvent) or self.has_listener(UnknownEvent):
+            return None
 
-        return event.__name__ in self._events
+        return frozenset(method for method, event_type in EVENT_MAPPINGS.items() if self.is_subscribed(event_type))
 
     async def _ws_client_loop(
             self,
             initial_webcast_response: WebcastResponse,
             process_connect_events: bool,
-            compress_ws_events: bool
+            compress_ws_events: bool,
+            raw_frame_sink: Optional[RawFrameSink] = None,
+            decode_frames: bool = True
     ) -> None:
         """
         Run the websocket loop to handle incoming WS events
@@ -300,6 +417,100 @@ class TikTokLiveClient(AsyncIOEventEmitter):
         :param initial_webcast_response: The WebcastResponse (as bytes) retrieved from the sign server with connection info
         :param process_connect_events: Whether to process initial events sent on room join
         :param compress_ws_events: Whether to compress the WebSocket events using gzip compression
+        :param raw_frame_sink: An optional sink that receives every raw frame before decoding
+        :param decode_frames: Whether to decode frames into events
+        :return: None
+
+        """
+
+        # Decode & dispatch in a separate task, fed by the ingest queue
+        ingest_task: Optional[Task] = None
+
+        if self._ingest_queue is not None:
+            self._ingest_queue.reset()
+            ingest_task = self._asyncio_loop.create_task(self._ingest_loop(self._ingest_queue))
+
+            # Close the queue if the dispatcher dies, so a reader blocked in `put` wakes up & surfaces its error
+            ingest_task.add_done_callback(lambda _: self._ingest_queue.close())
+
+        # End the gift streaks that never receive their repeat_end, even if the room goes quiet
+        gift_streak_task: Optional[Task] = None
+
+        if self._gift_streaks is not None:
+            gift_streak_task = self._asyncio_loop.create_task(self._gift_streak_loop(self._gift_streaks))
+
+        # Flush the coalesced windows on time, even if the room goes quiet
+        coalesce_task: Optional[Task] = None
+
+        if self._coalescer is not None:
+            coalesce_task = self._asyncio_loop.create_task(self._coalesce_loop(self._coalescer))
+
+        try:
+
+            # A resumable session loops back here with a freshly signed response after a drop
+            while initial_webcast_response is not None:
+                try:
+                    await self._ws_read_loop(initial_webcast_response, process_connect_events, compress_ws_events, raw_frame_sink, decode_frames, ingest_task)
+                except ReconnectPolicy.RETRY_ON as ex:
+                    if self._session is None or self._disconnect_requested.is_set():
+                        raise
+                    error = ex
+                else:
+                    error = None
+
+                if self._session is None or self._disconnect_requested.is_set():
+                    break
+
+                initial_webcast_response = await self._resume_session(error)
+
+        finally:
+
+            # Stop the timers first, so they are cancelled even if the dispatcher failed
+            for timer_task in (gift_streak_task, coalesce_task):
+                if timer_task is not None:
+                    timer_task.cancel()
+
+            try:
+
+                # Let the dispatcher drain what has already been read
+                if ingest_task is not None:
+                    self._ingest_queue.close()
+                    await ingest_task
+
+            finally:
+
+                # End the streaks still open, so their gifts aren't lost
+                if gift_streak_task is not None:
+                    for streak_event in self._gift_streaks.flush():
+                        self._dispatch_event(streak_event)
+
+                # Flush the last window
+                if coalesce_task is not None:
+                    for batch_event in self._coalescer.flush():
+                        self._dispatch_event(batch_event)
+
+        # Send the Disconnect event when we disconnect
+        ev: DisconnectEvent = DisconnectEvent()
+        self.emit_event(ev)
+
+    async def _ws_read_loop(
+            self,
+            initial_webcast_response: WebcastResponse,
+            process_connect_events: bool,
+            compress_ws_events: bool,
+            raw_frame_sink: Optional[RawFrameSink],
+            decode_frames: bool,
+            ingest_task: Optional[Task]
+    ) -> None:
+        """
+        Read a single WebSocket connection until it closes, dispatching (or queueing) the responses
+
+        :param initial_webcast_response: The WebcastResponse retrieved from the sign server with connection info
+        :param process_connect_events: Whether to process initial events sent on room join
+        :param compress_ws_events: Whether to compress the WebSocket events using gzip compression
+        :param raw_frame_sink: An optional sink that receives every raw frame before decoding
+        :param decode_frames: Whether to decode frames into events
+        :param ingest_task: The dispatcher task, if there is an ingest queue
         :return: None
 
         """
@@ -309,45 +520,286 @@ class TikTokLiveClient(AsyncIOEventEmitter):
                 initial_webcast_response=initial_webcast_response,
                 process_connect_events=process_connect_events,
                 compress_ws_events=compress_ws_events,
+                decode_executor=self._decode_executor,
+                raw_frame_sink=raw_frame_sink,
+                decode_frames=decode_frames,
+                proto_codec=self._proto_codec,
+                method_filter=self._routed_methods,
+                instrumentation=self._instrumentation,
                 cookies=self._web.cookies,
                 room_id=self._room_id,
                 user_agent=self._web.headers['User-Agent']
         ):
 
-            # Iterate over the events extracted
-            async for event in self._parse_webcast_response(webcast_response):
-                self._logger.debug(f"Received Event '{event.type}' [{event.size} bytes]")
-                self.emit(event.type, event)
+            reconnect_event: Optional[ReconnectEvent] = None
 
-        # Send the Disconnect event when we disconnect
-        ev: DisconnectEvent = DisconnectEvent()
-        self.emit(ev.type, ev)
+            # Keep the resume point & report the gap once a dropped session is back
+            if self._session is not None and (gap := self._session.track(webcast_response)) is not None:
+                self._logger.info(f"Resumed the session after {gap:.2f}s ({self._session.last_attempts} attempt(s)).")
+
+                # Dispatched with the response, so it is in order with the events (through the ingest queue, if any)
+                reconnect_event = ReconnectEvent(
+                    unique_id=self._unique_id,
+                    room_id=self._room_id,
+                    attempts=self._session.last_attempts,
+                    gap=gap
+                )
+
+            # Stamp the receive time before the response can wait in the ingest queue
+            if self._lag is not None:
+                self._lag.received(webcast_response)
+
+            if ingest_task is None:
+                await self._dispatch_webcast_response(webcast_response, reconnect_event)
+                continue
+
+            await self._ingest_queue.put(ReceivedResponse(webcast_response, reconnect_event))
+
+            # Surface dispatcher failures instead of filling the queue forever (the queue is closed once it dies)
+            if ingest_task.done():
+                ingest_task.result()
+
+    async def _resume_session(self, error: Optional[BaseException]) -> Optional[WebcastResponse]:
+        """
+        Re-sign the room after the WebSocket dropped, with jittered backoff. Only the sign fetch is repeated,
+        the room ID, live check & room/gift info from the cold start are reused.
+
+        :param error: The error the connection dropped with, or None if it was closed by the server
+        :return: The signed response pointed at the latest cursor, or None if a disconnect was requested meanwhile
+
+        """
+
+        self._session.dropped(error)
+
+        # A clean close from the server may mean the stream is over
+        check_live: bool = error is None
+
+        while True:
+            if not self._session.policy.should_retry(self._session.attempt):
+                self._logger.error(f"Giving up on resuming the session after {self._session.attempt} attempt(s).")
+                if error is not None:
+                    raise error
+                return None
+
+            delay: float = self._session.policy.backoff(self._session.attempt)
+            self._logger.warning(f"WebSocket dropped ({error!r}), resuming the session in {delay:.2f}s.")
+
+            # Wait out the backoff, unless a disconnect is requested
+            try:
+                await asyncio.wait_for(self._disconnect_requested.wait(), timeout=delay)
+                return None
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                if check_live:
+                    if not await self._web.fetch_is_live(room_id=self._room_id):
+                        self._logger.info("The WebSocket was closed & the stream is no longer live, ending the session.")
+                        return None
+
+                    check_live = False
+
+                return self._session.resume(await self._web.fetch_signed_websocket())
+            except ReconnectPolicy.RETRY_ON as ex:
+                error = ex
+                self._session.dropped(error)
+
+    async def _ingest_loop(self, ingest_queue: IngestQueue) -> None:
+        """
+        Decode & dispatch the responses queued by the WebSocket reader, until the queue is closed
+
+        :param ingest_queue: The queue to consume
+        :return: None
+
+        """
+
+        while (received := await ingest_queue.get()) is not None:
+            await self._dispatch_webcast_response(received.webcast_response, received.reconnect_event)
+
+    async def _gift_streak_loop(self, gift_streaks: GiftStreakAggregator) -> None:
+        """
+        Periodically end & emit the gift streaks that timed out
+
+        :param gift_streaks: The aggregator
+        :return: None
+
+        """
+
+        while True:
+            await asyncio.sleep(gift_streaks.timeout / 4)
+
+            for streak_event in gift_streaks.expire():
+                self._dispatch_event(streak_event)
+
+    async def _coalesce_loop(self, coalescer: EventCoalescer) -> None:
+        """
+        Periodically flush & emit the coalesced windows that are due
+
+        :param coalescer: The coalescer
+        :return: None
+
+        """
+
+        while True:
+            await asyncio.sleep(coalescer.window / 4)
+
+            for batch_event in coalescer.poll():
+                self._dispatch_event(batch_event)
+
+    async def _dispatch_webcast_response(self, webcast_response: WebcastResponse, reconnect_event: Optional[ReconnectEvent] = None) -> None:
+        """
+        Parse a WebcastResponse & emit the events within
+
+        :param webcast_response: The WebcastResponse protobuf message
+        :param reconnect_event: Set if the response is the first of a resumed session, emitted instead of a ConnectEvent
+        :return: None
+
+        """
+
+        # Checked once per response, so the log isn't formatted per event when it's disabled
+        debug: bool = self._logger.isEnabledFor(logging.DEBUG)
+
+        # The lag of the response's events is measured from its receive time
+        received_at: Optional[float] = self._lag.dispatching(webcast_response) if self._lag is not None else None
+
+        # Iterate over the events extracted
+        async for event in self._parse_webcast_response(webcast_response, reconnect_event):
+            if debug:
+                self._logger.debug("Received Event '%s' [%d bytes]", event.type, event.size)
+
+            self._dispatch_event(event, received_at)
+
+        # Backpressure from the event streams (the client's & its pool's), before the next response is dispatched
+        await self.wait_for_streams()
+
+    def _dispatch_event(self, event: Event, received_at: Optional[float] = None) -> None:
+        """
+        Emit an event, unless the sampler drops it
+
+        :param event: The event
+        :param received_at: When the event's WebcastResponse was received, if tracking lag. None for events emitted
+                            on a timer, which don't come from the response being dispatched & so aren't measured.
+        :return: None
 
-    async def _parse_webcast_response(self, webcast_response: WebcastResponse) -> AsyncIterator[Event]:
+        """
+
+        if self._sampler is not None and self._sampler.has_event_policies and not self._sampler.allow_event(event):
+            return
+
+        if received_at is not None:
+            self._lag.dispatched(event, received_at)
+
+        if self._instrumentation is None:
+            self.emit_event(event)
+            return
+
+        started_at: float = time.perf_counter()
+        self.emit_event(event)
+        self._instrumentation.record(Stage.DISPATCH, event.type, time.perf_counter() - started_at)
+
+    async def _parse_webcast_response(self, webcast_response: WebcastResponse, reconnect_event: Optional[ReconnectEvent] = None) -> AsyncIterator[Event]:
         """
         Parse incoming webcast responses into events that can be emitted
 
         :param webcast_response: The WebcastResponse protobuf message
+        :param reconnect_event: Set if the response is the first of a resumed session, emitted instead of a ConnectEvent
         :return: A list of events that can be gleamed from this event
 
         """
 
-        # The first event means we connected
-        if webcast_response.is_first:
+        # The first event means we connected, unless this is a resumed session (which reports the gap instead)
+        if reconnect_event is not None:
+            yield reconnect_event
+        elif webcast_response.is_first:
             yield ConnectEvent(unique_id=self._unique_id, room_id=self._room_id)
 
+        # Drop the messages that were already received, before spending anything on them
+        if self._deduplicator is not None:
+            webcast_response.messages = self._deduplicator.filter(webcast_response.messages)
+
+        # Apply the sampling & rate limits of the messages' events, before decoding them
+        if self._sampler is not None:
+            webcast_response.messages = self._sampler.filter(webcast_response.messages)
+
+        # Decode the payloads on the executor in one batch, if there is one
+        decoded_payloads: Dict[int, DecodedPayload] = await self._decode_webcast_response(webcast_response)
+
         # Yield events
-        for message in webcast_response.messages:
-            for event in await self._parse_webcast_response_message(webcast_response_message=message):
-                if event is not None:
-                    yield event
+        for idx, message in enumerate(webcast_response.messages):
+            for event in await self._parse_webcast_response_message(webcast_response_message=message, decoded_payload=decoded_payloads.get(idx)):
+                if event is None:
+                    continue
+
+                # Merge the high-volume events into the window's batch events instead
+                if self._coalescer is not None and self._coalescer.coalesces(event):
+                    for batch_event in self._coalescer.feed(event):
+                        yield batch_event
+                    continue
+
+                yield event
+
+                # Follow the GiftEvent with the streak events it ends or progresses
+                if self._gift_streaks is not None and isinstance(event, GiftEvent):
+                    for streak_event in self._gift_streaks.feed(event):
+                        yield streak_event
+
+    async def _decode_webcast_response(self, webcast_response: WebcastResponse) -> Dict[int, DecodedPayload]:
+        """
+        Decode the payloads of a WebcastResponse on the decode executor
+
+        :param webcast_response: The WebcastResponse protobuf message
+        :return: The decoded payloads by message index, empty if there is no decode executor
+
+        """
+
+        if self._decode_executor is None:
+            return {}
+
+        # Only ship the payloads that would actually be decoded
+        indices: List[int] = [
+            idx for idx, message in enumerate(webcast_response.messages)
+            if message is not None and self._should_decode(message)
+        ]
+
+        if not indices:
+            return {}
+
+        decoded_payloads: List[DecodedPayload] = await self._asyncio_loop.run_in_executor(
+            self._decode_executor,
+            decode_proto_events,
+            [(webcast_response.messages[idx].method, webcast_response.messages[idx].payload) for idx in indices],
+            self._proto_codec
+        )
+
+        return dict(zip(indices, decoded_payloads))
+
+    def _should_decode(self, webcast_response_message: WebcastResponseMessage) -> bool:
+        """
+        Check whether the payload of a WebcastResponseMessage should be decoded into a ProtoEvent
+
+        :param webcast_response_message: The WebcastResponseMessage protobuf message
+        :return: Whether the message is mapped to a ProtoEvent that someone would receive
 
-    async def _parse_webcast_response_message(self, webcast_response_message: Optional[WebcastResponseMessage]) -> List[Event]:
+        """
+
+        event_type: Optional[Type[ProtoEvent]] = EVENT_MAPPINGS.get(webcast_response_message.method)
+
+        if event_type is None:
+            return False
+
+        return self.decode_unsubscribed_events or self.is_subscribed(event_type)
+
+    async def _parse_webcast_response_message(
+            self,
+            webcast_response_message: Optional[WebcastResponseMessage],
+            decoded_payload: Optional[DecodedPayload] = None
+    ) -> List[Optional[Event]]:
         """
         Parse incoming webcast responses into events that can be emitted
 
         :param webcast_response_message: The WebcastResponseMessage protobuf message
-        :return: A list of events that can be gleamed from this event
+        :param decoded_payload: The payload, if it was already decoded on the decode executor
+        :return: A list of events that can be gleamed from this event (may contain None for events nobody listens to)
 
         """
 
@@ -358,20 +810,53 @@ class TikTokLiveClient(AsyncIOEventEmitter):
 
         # Get the proto mapping for proto-events
         event_type: Optional[Type[ProtoEvent]] = EVENT_MAPPINGS.get(webcast_response_message.method)
-        response_event: Event = WebsocketResponseEvent().from_dict(webcast_response_message.to_dict())
+
+        # Only wrap the message if someone is listening for it
+        response_event: Optional[Event] = (
+            WebsocketResponseEvent.from_message(webcast_response_message)
+            if self.has_listener(WebsocketResponseEvent) else None
+        )
 
         # If the event is not tracked, return
         if event_type is None:
-            return [response_event, UnknownEvent().from_dict(webcast_response_message.to_dict())]
+            if not self.has_listener(UnknownEvent):
+                return [response_event]
+            return [response_event, UnknownEvent.from_message(webcast_response_message)]
+
+        # Skip the decode entirely if nobody would receive the event
+        if not self.decode_unsubscribed_events and not self.is_subscribed(event_type):
+            return [response_event]
 
         # Get the underlying events
-        try:
-            proto_event: ProtoEvent = event_type().parse(webcast_response_message.payload)
-        except Exception:
+        if decoded_payload is None:
+            started_at: Optional[float] = time.perf_counter() if self._instrumentation is not None else None
+
+            try:
+                proto_event: ProtoEvent = parse_message(event_type, webcast_response_message.payload, self._proto_codec)
+            except Exception:
+                decoded_payload = (None, traceback.format_exc())
+            else:
+                decoded_payload = (proto_event, None)
+
+            if started_at is not None:
+                self._instrumentation.record(Stage.DECODE, event_type.get_type(), time.perf_counter() - started_at)
+
+        proto_event, decode_error = decoded_payload
+
+        if decode_error is not None:
             if not self.ignore_broken_payload:
-                self._logger.error(traceback.format_exc() + "\nBroken Payload:\n" + str(webcast_response_message.payload))
+                self._logger.error(decode_error + "\nBroken Payload:\n" + str(webcast_response_message.payload))
             return [response_event]
 
+        # Without a msg_id on the envelope, fall back to de-duplicating on the common.msg_id
+        if (
+                self._deduplicator is not None
+                and not webcast_response_message.msg_id
+                and proto_event.common.msg_id
+                and self._deduplicator.seen(proto_event.common.msg_id)
+        ):
+            return []
+
         parsed_events: List[Event] = [response_event, proto_event]
         custom_event: Optional[Event] = await self.handle_custom_event(webcast_response_message, proto_event)
 
@@ -403,6 +888,10 @@ class TikTokLiveClient(AsyncIOEventEmitter):
         if isinstance(event, ControlEvent):
             if event.action in {ControlAction.STREAM_ENDED, ControlAction.STREAM_SUSPENDED}:
                 # If the stream is over, disconnect the client. Can't await due to circular dependency.
+                # Flag it right away so a resumable session doesn't race the disconnect & reconnect to the ended stream.
+                if self._disconnect_requested is not None:
+                    self._disconnect_requested.set()
+
                 self._asyncio_loop.create_task(self.disconnect())
                 return LiveEndEvent().parse(response.payload)
             elif event.action == ControlAction.STREAM_PAUSED:
@@ -453,10 +942,100 @@ class TikTokLiveClient(AsyncIOEventEmitter):
 
         return self._web
 
+    @property
+    def ws(self) -> WebcastWSClient:
+        """
+        The WebSocket client that this client uses for the connection, including its writer counters
+
+        :return: The WebcastWSClient
+
+        """
+
+        return self._ws
+
+    @property
+    def session(self) -> Optional[WebcastSession]:
+        """
+        The resumable session, if a reconnect policy was passed to `start`. Exposes the resume point & reconnect metrics.
+
+        :return: The session, or None
+
+        """
+
+        return self._session
+
+    @property
+    def deduplicator(self) -> Optional[MessageDeduplicator]:
+        """
+        The message deduplicator, if one was passed to `start`. Exposes the hit & miss counters.
+
+        :return: The deduplicator, or None
+
+        """
+
+        return self._deduplicator
+
+    @property
+    def gift_streaks(self) -> Optional[GiftStreakAggregator]:
+        """
+        The gift streak aggregator, if one was passed to `start`. Exposes the open streak & ended streak counters.
+
+        :return: The aggregator, or None
+
+        """
+
+        return self._gift_streaks
+
+    @property
+    def coalescer(self) -> Optional[EventCoalescer]:
+        """
+        The event coalescer, if one was passed to `start`. Exposes the merged & emitted event counters.
+
+        :return: The coalescer, or None
+
+        """
+
+        return self._coalescer
+
+    @property
+    def lag(self) -> Optional[LagTracker]:
+        """
+        The lag tracker of the room, if `start` was called with track_lag. Exposes the rolling lag percentiles.
+
+        :return: The tracker, or None
+
+        """
+
+        return self._lag
+
+    @property
+    def sampler(self) -> Optional[EventSampler]:
+        """
+        The event sampler, if one was passed to `start`. Exposes the dropped event counters.
+
+        :return: The sampler, or None
+
+        """
+
+        return self._sampler
+
+    @property
+    def ingest_queue(self) -> Optional[IngestQueue]:
+        """
+        The ingest queue between the WebSocket reader & the event dispatcher, if one was passed to `start`.
+        Exposes the queue depth, high-water mark & drop counters.
+
+        :return: The ingest queue, or None
+
+        """
+
+        return self._ingest_queue
+
     @property
     def _asyncio_loop(self) -> AbstractEventLoop:
         """
-        Property to return the existing or generate a new asyncio event loop
+        Property to return the running event loop, or the loop owned by the client if none is running.
+        The owned loop is created once & reused, until `run` closes it.
 
         :return: An asyncio event loop
 
@@ -465,7 +1044,12 @@ class TikTokLiveClient(AsyncIOEventEmitter):
         try:
             return asyncio.get_running_loop()
         except RuntimeError:
-            return asyncio.new_event_loop()
+            pass
+
+        if self._loop_runner is None:
+            self._loop_runner = EventLoopRunner()
+
+        return self._loop_runner.loop
 
     @property
     def connected(self) -> bool:
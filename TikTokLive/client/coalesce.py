@@ -0,0 +1,210 @@
+import time
+from typing import Callable, List, Optional, Set, Tuple, Type, Union, Iterable
+
+from TikTokLive.events import LikeEvent, JoinEvent, RoomUserSeqEvent, LikeBatchEvent, JoinBatchEvent, \
+    RoomUserSeqBatchEvent
+from TikTokLive.proto import ExtendedUser
+
+"""Type hint for the events an EventCoalescer merges"""
+CoalescedEvent: Type = Union[LikeEvent, JoinEvent, RoomUserSeqEvent]
+
+"""Type hint for the events an EventCoalescer emits"""
+BatchEvent: Type = Union[LikeBatchEvent, JoinBatchEvent, RoomUserSeqBatchEvent]
+
+
+class EventCoalescer:
+    """
+    Merges the high-volume LikeEvents, JoinEvents & RoomUserSeqEvents of a room into one batch event of each type per window,
+    so handlers run a few times per second instead of once per event. The merged events are NOT emitted individually.
+
+    A window opens with the first event after the previous one was flushed, and is flushed `window` seconds later,
+    by the client's timer or the first event past it. Empty windows emit nothing.
+
+    """
+
+    def __init__(
+            self,
+            window: float = 0.25,
+            max_users: int = 100,
+            events: Iterable[Type[CoalescedEvent]] = (LikeEvent, JoinEvent, RoomUserSeqEvent),
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Create a coalescer
+
+        :param window: How long (in seconds) events are merged for
+        :param max_users: The maximum number of users listed in a JoinBatchEvent. The distinct users are still all counted.
+        :param events: The events to merge. The others are left alone.
+        :param clock: The clock, in seconds
+
+        """
+
+        if window <= 0 or max_users < 0:
+            raise ValueError("The window must be positive & the maximum user count not negative.")
+
+        self._window: float = window
+        self._max_users: int = max_users
+        self._events: Tuple[Type[CoalescedEvent], ...] = tuple(events)
+        self._clock: Callable[[], float] = clock
+
+        self._opened: Optional[float] = None
+        self._merged: int = 0
+        self._emitted: int = 0
+        self._reset()
+
+    @property
+    def window(self) -> float:
+        """
+        How long (in seconds) events are merged for
+
+        """
+
+        return self._window
+
+    @property
+    def merged(self) -> int:
+        """
+        The number of events merged
+
+        """
+
+        return self._merged
+
+    @property
+    def emitted(self) -> int:
+        """
+        The number of batch events emitted
+
+        """
+
+        return self._emitted
+
+    def coalesces(self, event: object) -> bool:
+        """
+        Check whether an event is merged by the coalescer
+
+        :param event: The event
+        :return: Whether it is merged
+
+        """
+
+        return isinstance(event, self._events)
+
+    def feed(self, event: CoalescedEvent) -> List[BatchEvent]:
+        """
+        Merge an event into the current window
+
+        :param event: A LikeEvent, JoinEvent or RoomUserSeqEvent
+        :return: The batch events of the previous window, if this event is past it
+
+        """
+
+        now: float = self._clock()
+        batches: List[BatchEvent] = self.poll(now)
+
+        if self._opened is None:
+            self._opened = now
+
+        self._merged += 1
+
+        if isinstance(event, LikeEvent):
+            self._like_events += 1
+            self._likes += event.count
+            self._like_total = event.total
+            self._like_users.add(event.user.id)
+
+        elif isinstance(event, JoinEvent):
+            self._join_events += 1
+            self._member_count = event.member_count
+
+            # Only list a user the first time they join in the window
+            if event.user.id not in self._join_users:
+                self._join_users.add(event.user.id)
+
+                if len(self._joiners) < self._max_users:
+                    self._joiners.append(event.user)
+
+        elif isinstance(event, RoomUserSeqEvent):
+            self._seq_events += 1
+            self._seq_latest = event
+
+        return batches
+
+    def poll(self, now: Optional[float] = None) -> List[BatchEvent]:
+        """
+        Flush the current window if it has lasted `window` seconds
+
+        :param now: The current time, in seconds. Defaults to the clock.
+        :return: The batch events, if the window was flushed
+
+        """
+
+        now = self._clock() if now is None else now
+
+        if self._opened is None or now - self._opened < self._window:
+            return []
+
+        return self.flush(now)
+
+    def flush(self, now: Optional[float] = None) -> List[BatchEvent]:
+        """
+        Flush the current window, e.g. when disconnecting
+
+        :param now: The current time, in seconds. Defaults to the clock.
+        :return: The batch events of the window, one per type of event it merged
+
+        """
+
+        if self._opened is None:
+            return []
+
+        now = self._clock() if now is None else now
+        duration: float = now - self._opened
+        batches: List[BatchEvent] = []
+
+        if self._like_events:
+            batches.append(
+                LikeBatchEvent(
+                    likes=self._likes,
+                    total=self._like_total,
+                    unique_users=len(self._like_users),
+                    events=self._like_events,
+                    window=duration
+                )
+            )
+
+        if self._join_events:
+            batches.append(
+                JoinBatchEvent(
+                    users=self._joiners,
+                    unique_users=len(self._join_users),
+                    member_count=self._member_count,
+                    events=self._join_events,
+                    window=duration
+                )
+            )
+
+        if self._seq_events:
+            batches.append(RoomUserSeqBatchEvent(latest=self._seq_latest, events=self._seq_events, window=duration))
+
+        self._emitted += len(batches)
+        self._reset()
+        return batches
+
+    def _reset(self) -> None:
+        """Start an empty window"""
+
+        self._opened = None
+
+        self._like_events: int = 0
+        self._likes: int = 0
+        self._like_total: int = 0
+        self._like_users: Set[int] = set()
+
+        self._join_events: int = 0
+        self._member_count: int = 0
+        self._join_users: Set[int] = set()
+        self._joiners: List[ExtendedUser] = []
+
+        self._seq_events: int = 0
+        self._seq_latest: Optional[RoomUserSeqEvent] = None
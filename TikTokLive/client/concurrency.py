@@ -0,0 +1,167 @@
+from asyncio import Future, iscoroutinefunction
+from collections import deque
+from functools import partial
+from typing import Callable, Any, Optional, List, Deque, Tuple, TYPE_CHECKING
+
+from TikTokLive.events import Event
+
+if TYPE_CHECKING:
+    from TikTokLive.client.dispatch import EventDispatcher
+
+
+class HandlerPool:
+    """
+    Runs a coroutine listener with at most `concurrency` calls in flight. Events arriving while the pool is busy wait
+    in a queue, as plain tuples, instead of each becoming a pending task.
+
+    With `ordered=True`, the pool is split into `concurrency` lanes that each handle one event at a time, in arrival order.
+    Events are assigned a lane by user, so the events of a given user are handled in order while different users
+    are handled in parallel. Events without a user share the first lane.
+
+    """
+
+    __slots__ = (
+        "handler", "concurrency", "ordered", "max_queued", "_dispatcher", "_lanes", "_busy", "_lane_limit",
+        "_in_flight", "_queued", "_handled", "_dropped"
+    )
+
+    def __init__(
+            self,
+            dispatcher: "EventDispatcher",
+            handler: Callable,
+            concurrency: int,
+            ordered: bool = False,
+            max_queued: Optional[int] = None
+    ):
+        """
+        Create a handler pool
+
+        :param dispatcher: The dispatcher the listener belongs to, which tracks the tasks & reports their errors
+        :param handler: The coroutine listener
+        :param concurrency: The maximum number of calls in flight
+        :param ordered: Whether events of the same user are handled one at a time, in order
+        :param max_queued: The maximum number of waiting events. Events past it are dropped. Unbounded by default.
+
+        """
+
+        if not iscoroutinefunction(handler):
+            raise ValueError("Concurrency limits only apply to coroutine (async) handlers.")
+
+        if concurrency < 1 or (max_queued is not None and max_queued < 0):
+            raise ValueError("The concurrency must be at least 1 & the maximum queue size not negative.")
+
+        self.handler: Callable = handler
+        self.concurrency: int = concurrency
+        self.ordered: bool = ordered
+        self.max_queued: Optional[int] = max_queued
+
+        self._dispatcher: "EventDispatcher" = dispatcher
+        self._lanes: List[Deque[Tuple[Any, ...]]] = [deque() for _ in range(concurrency if ordered else 1)]
+        self._busy: List[int] = [0] * len(self._lanes)
+        self._lane_limit: int = 1 if ordered else concurrency
+
+        self._in_flight: int = 0
+        self._queued: int = 0
+        self._handled: int = 0
+        self._dropped: int = 0
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of calls currently running
+
+        """
+
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """
+        The number of events waiting for a free slot
+
+        """
+
+        return self._queued
+
+    @property
+    def handled(self) -> int:
+        """
+        The number of calls completed (including those that raised)
+
+        """
+
+        return self._handled
+
+    @property
+    def dropped(self) -> int:
+        """
+        The number of events dropped because the queue was full
+
+        """
+
+        return self._dropped
+
+    def __call__(self, event: Event, *args: Any) -> None:
+        lane: int = self._lane(event)
+
+        if self._busy[lane] < self._lane_limit:
+            self._start(lane, (event, *args))
+            return
+
+        if self.max_queued is not None and self._queued >= self.max_queued:
+            self._dropped += 1
+            return
+
+        self._lanes[lane].append((event, *args))
+        self._queued += 1
+
+    def _lane(self, event: Event) -> int:
+        """Get the lane of an event, by user when ordered"""
+
+        if not self.ordered:
+            return 0
+
+        user: Any = getattr(event, "user", None)
+        return user.id % self.concurrency if user is not None else 0
+
+    def _start(self, lane: int, args: Tuple[Any, ...]) -> None:
+        """Start a call in a lane, moving on to the lane's next waiting event if it fails to start"""
+
+        while True:
+            try:
+                future: Future = self._dispatcher.start_handler(self.handler(*args))
+                break
+            except Exception as ex:
+                self._handled += 1
+                self._dispatcher.emit("error", ex)
+
+            # Nothing would ever start the waiting events of the lane otherwise
+            if not self._lanes[lane]:
+                return
+
+            self._queued -= 1
+            args = self._lanes[lane].popleft()
+
+        self._busy[lane] += 1
+        self._in_flight += 1
+        future.add_done_callback(partial(self._done, lane))
+
+    def _done(self, lane: int, future: Future) -> None:
+        """Free the slot of a finished call & start the next waiting event of its lane"""
+
+        self._busy[lane] -= 1
+        self._in_flight -= 1
+        self._handled += 1
+
+        # Cancelling the dispatcher's tasks (e.g. `cancel()`) also discards the waiting events
+        if future.cancelled():
+            self._queued -= sum(len(waiting) for waiting in self._lanes)
+
+            for waiting in self._lanes:
+                waiting.clear()
+
+            return
+
+        if self._lanes[lane]:
+            self._queued -= 1
+            self._start(lane, self._lanes[lane].popleft())
@@ -0,0 +1,39 @@
+import traceback
+from typing import List, Tuple, Optional, Type
+
+from TikTokLive.events.proto_events import EVENT_MAPPINGS, ProtoEvent
+from TikTokLive.proto.codec import ProtoCodec, parse_message
+
+"""Type hint for a decoded payload, the event & the formatted traceback if decoding failed"""
+DecodedPayload: Type = Tuple[Optional[ProtoEvent], Optional[str]]
+
+
+def decode_proto_event(method: str, payload: bytes, codec: ProtoCodec = ProtoCodec.BETTERPROTO) -> DecodedPayload:
+    """
+    Decode a WebcastResponseMessage payload into its ProtoEvent
+
+    :param method: The WebcastResponseMessage method, used to look up the event type
+    :param payload: The WebcastResponseMessage payload
+    :param codec: The codec to decode the payload with
+    :return: The event, or the traceback (as a string, so it can cross process boundaries) if decoding failed
+
+    """
+
+    try:
+        return parse_message(EVENT_MAPPINGS[method], payload, codec), None
+    except Exception:
+        return None, traceback.format_exc()
+
+
+def decode_proto_events(payloads: List[Tuple[str, bytes]], codec: ProtoCodec = ProtoCodec.BETTERPROTO) -> List[DecodedPayload]:
+    """
+    Decode a batch of WebcastResponseMessage payloads. This is a module-level function taking & returning
+    picklable values so that it can be run in an executor, once per WebcastResponse.
+
+    :param payloads: (method, payload) pairs to decode
+    :param codec: The codec to decode the payloads with
+    :return: The decoded payloads, in the same order
+
+    """
+
+    return [decode_proto_event(method, payload, codec) for method, payload in payloads]
@@ -0,0 +1,174 @@
+import time
+from collections import deque, OrderedDict
+from typing import Deque, Tuple, Callable, List
+
+from TikTokLive.proto import WebcastResponseMessage
+
+
+class MessageDeduplicator:
+    """
+    Drops messages that were already received, keyed on their msg_id.
+    Duplicates happen when the initial /webcast/fetch/ response overlaps the first WebSocket frames,
+    and when reconnecting to the same room. Pass the same instance to every `start` to cover reconnects.
+
+    The seen msg_ids are kept in a ring of time buckets, so memory is bounded by both a TTL & a maximum size.
+    An id is remembered for at least `ttl - ttl / buckets` seconds, unless the size limit evicts it first.
+    The size limit evicts the oldest ids one at a time, so a burst within a single bucket doesn't forget them all at once.
+
+    """
+
+    def __init__(
+            self,
+            ttl: float = 300.0,
+            max_size: int = 100_000,
+            buckets: int = 10,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Create a deduplicator
+
+        :param ttl: How long (in seconds) to remember a msg_id
+        :param max_size: The maximum number of msg_ids to remember. The oldest msg_id is evicted when it is exceeded.
+        :param buckets: The number of time buckets the TTL is split into
+        :param clock: The clock, in seconds
+
+        """
+
+        if ttl <= 0 or max_size < 1 or buckets < 1:
+            raise ValueError("The TTL, maximum size & bucket count must be positive.")
+
+        self._ttl: float = ttl
+        self._max_size: int = max_size
+        self._bucket_width: float = ttl / buckets
+        self._clock: Callable[[], float] = clock
+
+        self._buckets: Deque[Tuple[float, OrderedDict]] = deque()
+        self._size: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evicted: int = 0
+
+    @property
+    def hits(self) -> int:
+        """
+        The number of duplicate messages dropped
+
+        """
+
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        The number of new messages let through
+
+        """
+
+        return self._misses
+
+    @property
+    def evicted(self) -> int:
+        """
+        The number of msg_ids forgotten early because of the size limit
+
+        """
+
+        return self._evicted
+
+    @property
+    def size(self) -> int:
+        """
+        The number of msg_ids currently remembered
+
+        """
+
+        return self._size
+
+    @property
+    def max_size(self) -> int:
+        """
+        The maximum number of msg_ids remembered
+
+        """
+
+        return self._max_size
+
+    @property
+    def ttl(self) -> float:
+        """
+        How long (in seconds) a msg_id is remembered
+
+        """
+
+        return self._ttl
+
+    def clear(self) -> None:
+        """
+        Forget every msg_id. Counters are kept.
+
+        :return: None
+
+        """
+
+        self._buckets.clear()
+        self._size = 0
+
+    def seen(self, msg_id: int) -> bool:
+        """
+        Check whether a msg_id was already seen & remember it if not
+
+        :param msg_id: The msg_id
+        :return: Whether it is a duplicate
+
+        """
+
+        now: float = self._clock()
+        self._expire(now)
+
+        for _, bucket in self._buckets:
+            if msg_id in bucket:
+                self._hits += 1
+                return True
+
+        # At the size limit, evict the oldest msg_ids
+        while self._size >= self._max_size:
+            self._evict()
+
+        # Open a new bucket once the newest one is a bucket-width old
+        if not self._buckets or now - self._buckets[-1][0] >= self._bucket_width:
+            self._buckets.append((now, OrderedDict()))
+
+        # Ordered by insertion, so the size limit can evict the oldest ids of a bucket first
+        self._buckets[-1][1][msg_id] = None
+        self._size += 1
+        self._misses += 1
+        return False
+
+    def filter(self, messages: List[WebcastResponseMessage]) -> List[WebcastResponseMessage]:
+        """
+        Remove the duplicate messages from a list. Messages without a msg_id are kept.
+
+        :param messages: The WebcastResponseMessages
+        :return: The messages that weren't seen before
+
+        """
+
+        return [message for message in messages if not message.msg_id or not self.seen(message.msg_id)]
+
+    def _expire(self, now: float) -> None:
+        """Drop the buckets older than the TTL"""
+
+        while self._buckets and now - self._buckets[0][0] >= self._ttl:
+            self._size -= len(self._buckets.popleft()[1])
+
+    def _evict(self) -> None:
+        """Drop the oldest msg_id to make room, & its bucket once it is empty"""
+
+        bucket: OrderedDict = self._buckets[0][1]
+        bucket.popitem(last=False)
+
+        if not bucket:
+            self._buckets.popleft()
+
+        self._size -= 1
+        self._evicted += 1
@@ -0,0 +1,405 @@
+import asyncio
+import time
+from asyncio import AbstractEventLoop, Future, iscoroutine
+from functools import partial
+from typing import Dict, Tuple, Callable, Any, Optional, Union, Type, List, Iterable
+
+from pyee.asyncio import AsyncIOEventEmitter
+from pyee.base import Handler
+
+from TikTokLive.client.concurrency import HandlerPool
+from TikTokLive.client.filters import EventFilter, EventPredicate, FilteredHandler, compile_filter
+from TikTokLive.client.ingest import OverflowPolicy
+from TikTokLive.client.instrumentation import Instrumentation, Stage
+from TikTokLive.client.stream import EventStream
+from TikTokLive.events import Event, EventHandler
+
+
+class EventDispatcher(AsyncIOEventEmitter):
+    """
+    An AsyncIOEventEmitter with a precomputed dispatch table. pyee looks listeners up by name & copies them under a lock
+    on every emit; here each event (name or class) maps to an immutable tuple of handlers, rebuilt only when listeners
+    change. Sync handlers are called directly, and the coroutines of one emit are scheduled in a single pass,
+    sharing one done-callback.
+
+    Listeners are still stored by pyee, so `listeners`, `once`, `remove_listener` & co. behave as before.
+
+    """
+
+    """Whether the event streams end on a DisconnectEvent, i.e. whether the dispatcher emits the events of a single connection"""
+    _streams_end_on_disconnect: bool = False
+
+    def __init__(self, loop: Optional[AbstractEventLoop] = None):
+        """
+        Create a dispatcher
+
+        :param loop: The loop to schedule coroutine handlers on. Defaults to the current loop at emit time.
+
+        """
+
+        super().__init__(loop=loop)
+        self._handlers: Dict[str, Tuple[Callable, ...]] = {}
+        self._class_handlers: Dict[type, Tuple[Callable, ...]] = {}
+        self._filters: Dict[EventPredicate, EventFilter] = {}
+        self._streams: List[EventStream] = []
+        self._instrumentation: Optional[Instrumentation] = None
+
+    def on(
+            self,
+            event: Type[Event],
+            f: Optional[EventHandler] = None,
+            where: Optional[Union[EventPredicate, EventFilter]] = None,
+            concurrency: Optional[int] = None,
+            ordered: bool = False,
+            max_queued: Optional[int] = None
+    ) -> Union[Handler, Callable[[Handler], Handler]]:
+        """
+        Decorator that can be used to register a Python function as an event listener
+
+        :param event: The event to listen to
+        :param f: The function to handle the event
+        :param where: An optional filter, e.g. `lambda event: event.gift.diamond_count >= 100`, or an `EventFilter`.
+                      It runs once per event for all the listeners sharing it, before any handler is called.
+        :param concurrency: The maximum number of calls of a coroutine handler in flight. Events past it wait in a queue.
+        :param ordered: With a concurrency limit, handle the events of each user one at a time, in order
+        :param max_queued: With a concurrency limit, the maximum number of waiting events. Events past it are dropped.
+        :return: The wrapped function as a generated `pyee.Handler` object
+
+        """
+
+        if f is None:
+            return lambda handler: self.add_listener(
+                event, handler, where=where, concurrency=concurrency, ordered=ordered, max_queued=max_queued
+            )
+
+        return self.add_listener(event, f, where=where, concurrency=concurrency, ordered=ordered, max_queued=max_queued)
+
+    def add_listener(
+            self,
+            event: Type[Event],
+            f: EventHandler,
+            where: Optional[Union[EventPredicate, EventFilter]] = None,
+            concurrency: Optional[int] = None,
+            ordered: bool = False,
+            max_queued: Optional[int] = None
+    ) -> Handler:
+        """
+        Method that can be used to register a Python function as an event listener
+
+        :param event: The event to listen to
+        :param f: The function to handle the event
+        :param where: An optional filter, e.g. `lambda event: event.gift.diamond_count >= 100`, or an `EventFilter`.
+                      It runs once per event for all the listeners sharing it, before any handler is called.
+        :param concurrency: The maximum number of calls of a coroutine handler in flight. Events past it wait in a queue.
+        :param ordered: With a concurrency limit, handle the events of each user one at a time, in order
+        :param max_queued: With a concurrency limit, the maximum number of waiting events. Events past it are dropped.
+        :return: The generated `pyee.Handler` object
+
+        """
+
+        event_type: str = event if isinstance(event, str) else event.get_type()
+        handler: Callable = f
+
+        if concurrency is not None:
+            handler = HandlerPool(self, f, concurrency, ordered=ordered, max_queued=max_queued)
+
+        # The filter runs first, so rejected events never reach the pool's queue
+        if where is not None:
+            handler = FilteredHandler(handler, compile_filter(self._filters, where))
+
+        # Registered under the handler itself, so that remove_listener still works with it
+        self._add_event_handler(event_type, f, handler)
+        return f
+
+    def handler_pool(self, event: Type[Event], f: EventHandler) -> Optional[HandlerPool]:
+        """
+        Get the pool of a listener registered with a concurrency limit, e.g. to read its in-flight & queued gauges
+
+        :param event: The event the listener was registered for
+        :param f: The listener
+        :return: Its pool, or None if it has no concurrency limit
+
+        """
+
+        event_type: str = event if isinstance(event, str) else event.get_type()
+        handler: Optional[Callable] = self._events.get(event_type, {}).get(f)
+
+        if isinstance(handler, FilteredHandler):
+            handler = handler.handler
+
+        return handler if isinstance(handler, HandlerPool) else None
+
+    @property
+    def handler_pools(self) -> List[HandlerPool]:
+        """
+        The pools of every listener registered with a concurrency limit
+
+        """
+
+        pools: List[HandlerPool] = []
+
+        for handlers in list(self._events.values()):
+            for handler in handlers.values():
+                handler = handler.handler if isinstance(handler, FilteredHandler) else handler
+
+                if isinstance(handler, HandlerPool):
+                    pools.append(handler)
+
+        return pools
+
+    def has_listener(self, event: Type[Event]) -> bool:
+        """
+        Check whether the dispatcher is listening to a given event
+
+        :param event: The event to check listening for
+        :return: Whether it is being listened to
+
+        """
+
+        return event.__name__ in self._events
+
+    def events(
+            self,
+            *events: Type[Event],
+            maxsize: int = 1_000,
+            policy: OverflowPolicy = OverflowPolicy.BLOCK,
+            drop_events: Optional[Iterable[Type[Event]]] = None
+    ) -> EventStream:
+        """
+        Consume events with `async for` instead of callbacks. Events are queued from now on, until the stream is closed
+        (e.g. with `async with`) or, for a client, until it disconnects. Emitters that pass more arguments than the event
+        (e.g. a pool, with the client) yield `(event, *args)` tuples.
+
+        :param events: The event types to receive
+        :param maxsize: The maximum number of queued events
+        :param policy: What to do when the consumer falls behind. BLOCK makes the client wait for it.
+        :param drop_events: The event types that may be dropped with OverflowPolicy.DROP_BY_TYPE
+        :return: The stream, an async iterator of events
+
+        """
+
+        if not events:
+            raise ValueError("At least one event type is required.")
+
+        stream: EventStream = EventStream(
+            self,
+            events,
+            maxsize=maxsize,
+            policy=policy,
+            drop_events=drop_events,
+            end_on_disconnect=self._streams_end_on_disconnect
+        )
+
+        self._streams.append(stream)
+        return stream
+
+    def remove_stream(self, stream: EventStream) -> None:
+        """
+        Stop tracking a closed stream. Called by `EventStream.close`.
+
+        :param stream: The stream
+        :return: None
+
+        """
+
+        if stream in self._streams:
+            self._streams.remove(stream)
+
+    @property
+    def instrumentation(self) -> Optional[Instrumentation]:
+        """
+        The hooks that time the handlers, if any (e.g. passed to the client's `start`)
+
+        """
+
+        return self._instrumentation
+
+    @property
+    def streams(self) -> List[EventStream]:
+        """
+        The open event streams
+
+        """
+
+        return list(self._streams)
+
+    async def wait_for_streams(self) -> None:
+        """
+        Wait until no stream is blocked on its consumer
+
+        :return: None
+
+        """
+
+        for stream in self._streams:
+            if stream.blocked:
+                await stream.wait_writable()
+
+    def emit(self, event: str, *args: Any, **kwargs: Any) -> bool:
+        """
+        Emit an event by name, passing the arguments to each listener
+
+        :param event: The event name
+        :param args: The event arguments
+        :param kwargs: The event keyword arguments
+        :return: Whether any listener handled it
+
+        """
+
+        handlers: Optional[Tuple[Callable, ...]] = self._handlers.get(event)
+
+        if handlers is None:
+            handlers = self._handlers[event] = tuple(self._events.get(event, {}).values())
+
+        if not handlers:
+            self._emit_handle_potential_error(event, args[0] if args else None)
+            return False
+
+        self._run_handlers(handlers, args, kwargs)
+        return True
+
+    def emit_event(self, event: Event, *args: Any) -> bool:
+        """
+        Emit an event object to the listeners of its class, skipping the name lookup of `emit`
+
+        :param event: The event
+        :param args: Extra arguments for the listeners, after the event
+        :return: Whether any listener handled it
+
+        """
+
+        handlers: Optional[Tuple[Callable, ...]] = self._class_handlers.get(event.__class__)
+
+        if handlers is None:
+            handlers = self._class_handlers[event.__class__] = tuple(self._events.get(event.__class__.__name__, {}).values())
+
+        if not handlers:
+            return False
+
+        if self._instrumentation is None:
+            self._run_handlers(handlers, (event, *args), {})
+        else:
+            self._run_handlers_timed(event.__class__.__name__, handlers, (event, *args))
+
+        return True
+
+    def _run_handlers(self, handlers: Tuple[Callable, ...], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        """Call the handlers, then schedule the coroutines they returned"""
+
+        pending: Optional[List[Any]] = None
+
+        for handler in handlers:
+            try:
+                result: Any = handler(*args, **kwargs)
+            except Exception as ex:
+                self.emit("error", ex)
+                continue
+
+            # Sync handlers (& filtered-out ones) return None
+            if result is None:
+                continue
+
+            if iscoroutine(result) or isinstance(result, Future):
+                if pending is None:
+                    pending = []
+                pending.append(result)
+
+        if pending is not None:
+            self._schedule(pending)
+
+    def _run_handlers_timed(self, key: str, handlers: Tuple[Callable, ...], args: Tuple[Any, ...]) -> None:
+        """Call the handlers like `_run_handlers`, recording the duration of each call (& of its coroutine)"""
+
+        for handler in handlers:
+            started_at: float = time.perf_counter()
+
+            try:
+                result: Any = handler(*args)
+            except Exception as ex:
+                self._instrumentation.record(Stage.HANDLER, key, time.perf_counter() - started_at)
+                self.emit("error", ex)
+                continue
+
+            # Coroutine handlers are timed until their task completes
+            if iscoroutine(result) or isinstance(result, Future):
+                future: Future = self.start_handler(result) if iscoroutine(result) else result
+
+                if future is result:
+                    self._schedule([future])
+
+                future.add_done_callback(partial(self._record_handler, self._instrumentation, key, started_at))
+                continue
+
+            self._instrumentation.record(Stage.HANDLER, key, time.perf_counter() - started_at)
+
+    @classmethod
+    def _record_handler(cls, instrumentation: Instrumentation, key: str, started_at: float, future: Future) -> None:
+        """Record the duration of a coroutine handler"""
+
+        instrumentation.record(Stage.HANDLER, key, time.perf_counter() - started_at)
+
+    def _schedule(self, pending: List[Any]) -> None:
+        """Schedule coroutines as tasks on the loop, tracking them like pyee does"""
+
+        loop: AbstractEventLoop = self._loop or asyncio.get_event_loop()
+
+        for awaitable in pending:
+            future: Future = loop.create_task(awaitable) if iscoroutine(awaitable) else awaitable
+            future.add_done_callback(self._handler_done)
+            self._waiting.add(future)
+
+    def start_handler(self, coroutine: Any) -> Future:
+        """
+        Schedule the coroutine of a handler call, tracked like the others for `wait_for_complete`, `cancel` & errors
+
+        :param coroutine: The coroutine
+        :return: Its task
+
+        """
+
+        loop: AbstractEventLoop = self._loop or asyncio.get_event_loop()
+        future: Future = loop.create_task(coroutine)
+        future.add_done_callback(self._handler_done)
+        self._waiting.add(future)
+        return future
+
+    async def wait_for_complete(self) -> None:
+        """
+        Wait for the pending handler calls to complete, including the events still queued by concurrency limits
+
+        :return: None
+
+        """
+
+        # Finished calls of a handler pool start the next queued events
+        while self._waiting:
+            await asyncio.wait(set(self._waiting))
+
+    def _handler_done(self, future: Future) -> None:
+        """Report the exception of a coroutine handler on the `error` event"""
+
+        self._waiting.discard(future)
+
+        if future.cancelled():
+            return
+
+        if (ex := future.exception()) is not None:
+            self.emit("error", ex)
+
+    def _add_event_handler(self, event: str, k: Callable, v: Callable) -> None:
+        super()._add_event_handler(event, k, v)
+        self._invalidate()
+
+    def _remove_listener(self, event: str, f: Callable) -> None:
+        super()._remove_listener(event, f)
+        self._invalidate()
+
+    def remove_all_listeners(self, event: Optional[str] = None) -> None:
+        super().remove_all_listeners(event)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Drop the dispatch tables, to be rebuilt on the next emit"""
+
+        self._handlers = {}
+        self._class_handlers = {}
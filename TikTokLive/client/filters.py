@@ -0,0 +1,123 @@
+import re
+from typing import Callable, Any, Optional, Iterable, Dict, Union
+
+from TikTokLive.events import Event
+
+"""Type hint for a listener filter, a predicate on the event"""
+EventPredicate = Callable[[Event], bool]
+
+
+class EventFilter:
+    """
+    A compiled `where=` filter. Listeners registered with the same filter form a group, and the filter
+    is evaluated once per event for the whole group, before any of its handlers (or their coroutines) are created.
+
+    """
+
+    __slots__ = ("_predicate", "_event", "_result", "evaluated", "rejected")
+
+    def __init__(self, predicate: EventPredicate):
+        """
+        Compile a filter
+
+        :param predicate: Called with the event, returns whether the listeners should receive it
+
+        """
+
+        self._predicate: EventPredicate = predicate
+        self._event: Optional[Event] = None
+        self._result: bool = False
+        self.evaluated: int = 0
+        self.rejected: int = 0
+
+    @classmethod
+    def keywords(cls, words: Iterable[str], attribute: str = "content", case_sensitive: bool = False) -> "EventFilter":
+        """
+        Build a filter matching events whose text contains any of a set of words, e.g. comments mentioning a keyword.
+        The words are compiled into a single pattern, so the text is scanned once whatever the number of words.
+
+        :param words: The words to look for, as whole words (not within a longer word). They may start or end with
+                      symbols or emoji, e.g. "#tag".
+        :param attribute: The event attribute holding the text
+        :param case_sensitive: Whether the match is case-sensitive
+        :return: The filter
+        :raises ValueError: If there are no words, or one is empty (which would match every event)
+
+        """
+
+        unique_words: set = set(words)
+
+        if not unique_words or "" in unique_words:
+            raise ValueError("A keyword filter needs at least one word & no empty words.")
+
+        # Lookarounds rather than \b, which needs a word character on the inside & so never matches around "#tag" or emoji
+        pattern: re.Pattern = re.compile(
+            r"(?<!\w)(?:" + "|".join(re.escape(word) for word in sorted(unique_words, key=len, reverse=True)) + r")(?!\w)",
+            flags=0 if case_sensitive else re.IGNORECASE
+        )
+
+        return cls(lambda event: pattern.search(getattr(event, attribute, "") or "") is not None)
+
+    def matches(self, event: Event) -> bool:
+        """
+        Check whether an event passes the filter. The result is reused for every listener of the group.
+
+        :param event: The event
+        :return: Whether it passes
+
+        """
+
+        if event is not self._event:
+            self._event = event
+            self._result = bool(self._predicate(event))
+            self.evaluated += 1
+            self.rejected += not self._result
+
+        return self._result
+
+
+class FilteredHandler:
+    """
+    Wraps a listener registered with a `where=` filter. Events rejected by the filter return before the handler is called,
+    so a coroutine handler is never created nor scheduled for them.
+
+    """
+
+    __slots__ = ("handler", "where")
+
+    def __init__(self, handler: Callable, where: EventFilter):
+        """
+        Wrap a listener
+
+        :param handler: The listener
+        :param where: The filter of its group
+
+        """
+
+        self.handler: Callable = handler
+        self.where: EventFilter = where
+
+    def __call__(self, event: Event, *args: Any) -> Any:
+        if not self.where.matches(event):
+            return None
+
+        return self.handler(event, *args)
+
+
+def compile_filter(filters: Dict[Any, EventFilter], where: Union[EventPredicate, EventFilter]) -> EventFilter:
+    """
+    Get the compiled filter of a `where=` argument, reusing the same one for the same predicate so its listeners form one group
+
+    :param filters: The filters already compiled by the emitter, by predicate
+    :param where: A predicate or an EventFilter
+    :return: The compiled filter
+
+    """
+
+    if isinstance(where, EventFilter):
+        return where
+
+    if where not in filters:
+        filters[where] = EventFilter(where)
+
+    return filters[where]
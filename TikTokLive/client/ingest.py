@@ -0,0 +1,329 @@
+import asyncio
+import enum
+from collections import deque, Counter
+from dataclasses import dataclass
+from typing import Optional, Deque, Iterable, Union, Type, Set, Dict, Callable, List
+
+from TikTokLive.events import Event, ReconnectEvent
+from TikTokLive.events.proto_events import EVENT_MAPPINGS
+from TikTokLive.proto import WebcastResponse, WebcastResponseMessage
+
+
+class OverflowPolicy(enum.Enum):
+    """
+    What a bounded queue does when an item is added while it is full
+
+    """
+
+    BLOCK = "block"
+    """Wait for the consumer to make room, applying backpressure to the producer"""
+
+    DROP_OLDEST = "drop_oldest"
+    """Discard the oldest queued items to make room"""
+
+    DROP_NEWEST = "drop_newest"
+    """Discard the item being added"""
+
+    DROP_BY_TYPE = "drop_by_type"
+    """Discard items of the configured droppable types, then block if that is not enough"""
+
+
+@dataclass(eq=False)
+class ReceivedResponse:
+    """
+    A WebcastResponse read from the WebSocket, with what the reader knows about it, on its way to the dispatcher
+
+    """
+
+    webcast_response: WebcastResponse
+    """The response"""
+
+    reconnect_event: Optional[ReconnectEvent] = None
+    """Set on the first response of a resumed session, which is reported by this instead of a ConnectEvent"""
+
+
+class IngestQueue:
+    """
+    Bounded queue between the WebSocket reader & the event dispatcher.
+    The reader keeps reading (and acking) frames while decode & dispatch catch up, so slow handlers
+    don't back up into the TCP socket. The size is counted in WebcastResponseMessages, not WebcastResponses.
+
+    """
+
+    def __init__(
+            self,
+            maxsize: int = 10_000,
+            policy: OverflowPolicy = OverflowPolicy.BLOCK,
+            drop_events: Optional[Iterable[Union[Type[Event], str]]] = None
+    ):
+        """
+        Create an ingest queue
+
+        :param maxsize: The maximum number of messages to hold
+        :param policy: What to do when a response arrives while the queue is full
+        :param drop_events: The event types (or WebcastResponseMessage methods) that may be dropped with OverflowPolicy.DROP_BY_TYPE
+
+        """
+
+        if maxsize < 1:
+            raise ValueError("The ingest queue must hold at least one message.")
+
+        if policy == OverflowPolicy.DROP_BY_TYPE and not drop_events:
+            raise ValueError("OverflowPolicy.DROP_BY_TYPE requires at least one droppable event type.")
+
+        self._maxsize: int = maxsize
+        self._policy: OverflowPolicy = policy
+        self._drop_methods: Set[str] = self.resolve_methods(drop_events or [])
+
+        self._responses: Deque[ReceivedResponse] = deque()
+        self._depth: int = 0
+        self._high_water_mark: int = 0
+        self._dropped: Counter = Counter()
+        self._closed: bool = False
+
+        self._not_empty: asyncio.Event = asyncio.Event()
+        self._not_full: asyncio.Event = asyncio.Event()
+        self._not_full.set()
+
+    @classmethod
+    def resolve_methods(cls, events: Iterable[Union[Type[Event], str]]) -> Set[str]:
+        """
+        Resolve event types to the WebcastResponseMessage methods they are decoded from
+
+        :param events: Event types, or method names
+        :return: The set of method names
+
+        """
+
+        event_methods: Dict[Type[Event], str] = {event_type: method for method, event_type in EVENT_MAPPINGS.items()}
+        methods: Set[str] = set()
+
+        for event in events:
+            if isinstance(event, str):
+                methods.add(event)
+            elif event in event_methods:
+                methods.add(event_methods[event])
+            else:
+                raise ValueError(f"'{event.get_type()}' is not decoded from a WebcastResponseMessage & cannot be dropped.")
+
+        return methods
+
+    @property
+    def depth(self) -> int:
+        """
+        The number of messages currently queued
+
+        """
+
+        return self._depth
+
+    @property
+    def high_water_mark(self) -> int:
+        """
+        The highest number of messages that have been queued at once
+
+        """
+
+        return self._high_water_mark
+
+    @property
+    def dropped(self) -> Dict[str, int]:
+        """
+        The number of dropped messages, by WebcastResponseMessage method
+
+        """
+
+        return dict(self._dropped)
+
+    @property
+    def dropped_total(self) -> int:
+        """
+        The total number of dropped messages
+
+        """
+
+        return sum(self._dropped.values())
+
+    @property
+    def maxsize(self) -> int:
+        """
+        The maximum number of messages the queue holds
+
+        """
+
+        return self._maxsize
+
+    @property
+    def policy(self) -> OverflowPolicy:
+        """
+        The overflow policy of the queue
+
+        """
+
+        return self._policy
+
+    def reset(self) -> None:
+        """
+        Reset the queue for a new connection. Counters are kept.
+
+        :return: None
+
+        """
+
+        self._responses.clear()
+        self._depth = 0
+        self._closed = False
+        self._not_empty.clear()
+        self._not_full.set()
+
+    def close(self) -> None:
+        """
+        Close the queue. The consumer receives the remaining responses, then None.
+
+        :return: None
+
+        """
+
+        self._closed = True
+        self._not_empty.set()
+        self._not_full.set()
+
+    async def put(self, received: ReceivedResponse) -> None:
+        """
+        Add a response to the queue, applying the overflow policy if it is full.
+        The first response of a connection is always added, as it carries the ConnectEvent (or ReconnectEvent).
+
+        :param received: The response to add
+        :return: None
+
+        """
+
+        webcast_response: WebcastResponse = received.webcast_response
+
+        while self._is_full(webcast_response) and not webcast_response.is_first and not self._closed:
+
+            if self._policy == OverflowPolicy.DROP_NEWEST:
+                self._drop_messages(webcast_response, lambda _: True)
+                return
+
+            if self._policy == OverflowPolicy.DROP_OLDEST and self._drop_oldest():
+                continue
+
+            if self._policy == OverflowPolicy.DROP_BY_TYPE and self._drop_by_type(webcast_response):
+                if not webcast_response.messages:
+                    return
+                continue
+
+            # BLOCK, or nothing left that the policy allows dropping
+            self._not_full.clear()
+            await self._not_full.wait()
+
+        # Nothing left to deliver
+        if not webcast_response.messages and not webcast_response.is_first:
+            return
+
+        self._responses.append(received)
+        self._depth += self._size(webcast_response)
+        self._high_water_mark = max(self._high_water_mark, self._depth)
+        self._not_empty.set()
+
+    async def get(self) -> Optional[ReceivedResponse]:
+        """
+        Remove & return the oldest response, waiting for one if the queue is empty
+
+        :return: The response, or None once the queue is closed & drained
+
+        """
+
+        while not self._responses:
+            if self._closed:
+                return None
+
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        received: ReceivedResponse = self._responses.popleft()
+        self._depth -= self._size(received.webcast_response)
+        self._not_full.set()
+        return received
+
+    @classmethod
+    def _size(cls, webcast_response: WebcastResponse) -> int:
+        """Message-free responses (e.g. the first one, with connect events disabled) still take a slot"""
+
+        return max(1, len(webcast_response.messages))
+
+    def _is_full(self, webcast_response: WebcastResponse) -> bool:
+        """An empty queue always accepts a response, even one larger than the queue"""
+
+        return self._depth > 0 and self._depth + self._size(webcast_response) > self._maxsize
+
+    def _drop_messages(self, webcast_response: WebcastResponse, predicate: Callable[[WebcastResponseMessage], bool]) -> int:
+        """
+        Drop the messages matching a predicate from a response
+
+        :return: The number of dropped messages
+
+        """
+
+        kept: List[WebcastResponseMessage] = []
+
+        for message in webcast_response.messages:
+            if predicate(message):
+                self._dropped[message.method] += 1
+            else:
+                kept.append(message)
+
+        dropped: int = len(webcast_response.messages) - len(kept)
+        webcast_response.messages = kept
+        return dropped
+
+    def _shrink(self, received: ReceivedResponse, size_before: int) -> None:
+        """Update the depth after dropping messages from a queued response, removing it if nothing is left"""
+
+        if not received.webcast_response.messages and not received.webcast_response.is_first:
+            self._responses.remove(received)
+            self._depth -= size_before
+        else:
+            self._depth -= size_before - self._size(received.webcast_response)
+
+    def _drop_oldest(self) -> bool:
+        """
+        Drop the oldest queued message
+
+        :return: Whether a message was dropped
+
+        """
+
+        for queued in self._responses:
+            if queued.webcast_response.messages:
+                size_before: int = self._size(queued.webcast_response)
+                self._dropped[queued.webcast_response.messages.pop(0).method] += 1
+                self._shrink(queued, size_before)
+                return True
+
+        return False
+
+    def _drop_by_type(self, webcast_response: WebcastResponse) -> bool:
+        """
+        Drop messages of the droppable types, from the incoming response first & then from the queue, oldest first
+
+        :return: Whether anything was dropped
+
+        """
+
+        is_droppable: Callable[[WebcastResponseMessage], bool] = lambda message: message.method in self._drop_methods
+        dropped: int = self._drop_messages(webcast_response, is_droppable)
+
+        for queued in list(self._responses):
+            if not self._is_full(webcast_response):
+                break
+
+            size_before: int = self._size(queued.webcast_response)
+            queued_dropped: int = self._drop_messages(queued.webcast_response, is_droppable)
+
+            if queued_dropped:
+                dropped += queued_dropped
+                self._shrink(queued, size_before)
+
+        return dropped > 0
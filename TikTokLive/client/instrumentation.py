@@ -0,0 +1,292 @@
+import enum
+import os
+import time
+from bisect import bisect_left
+from typing import Dict, Tuple, List, Optional, Union
+
+"""The default histogram buckets, in seconds (10us to 10s)"""
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+    2.5, 5.0, 10.0
+)
+
+
+class Stage(enum.Enum):
+    """
+    A step of the path from a WebSocket frame to the handlers
+
+    """
+
+    DECOMPRESS = "decompress"
+    """Gunzipping a WebcastPushFrame's payload"""
+
+    PARSE = "parse"
+    """Parsing a WebcastResponse (including the decompression, with a decode executor)"""
+
+    DECODE = "decode"
+    """Decoding one WebcastResponseMessage into a ProtoEvent, by event type"""
+
+    DISPATCH = "dispatch"
+    """Emitting one event, including its sync handlers, by event type"""
+
+    HANDLER = "handler"
+    """One handler call, from the call to its return (or its coroutine's completion), by event type"""
+
+
+class Instrumentation:
+    """
+    Hooks called on the hot path of a client. Subclass it to feed your own metrics system.
+    The client only calls them (and only reads the clock) if an instrumentation was passed to `start`.
+
+    """
+
+    def record_frame(self, size: int, received_at: float) -> None:
+        """
+        Called for each WebSocket frame, before it is decoded
+
+        :param size: The size of the frame, in bytes
+        :param received_at: When it was received, as a UNIX timestamp
+        :return: None
+
+        """
+
+    def record(self, stage: Stage, key: str, seconds: float) -> None:
+        """
+        Called with the duration of a stage
+
+        :param stage: The stage
+        :param key: What was timed, e.g. the event type
+        :param seconds: How long it took
+        :return: None
+
+        """
+
+
+class LatencyHistogram:
+    """
+    A cumulative histogram with fixed buckets, like a Prometheus histogram
+
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Create a histogram
+
+        :param buckets: The upper bounds of the buckets, in increasing order
+
+        """
+
+        self.buckets: Tuple[float, ...] = buckets
+        self.counts: List[int] = [0] * (len(buckets) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Record a value
+
+        :param value: The value
+        :return: None
+
+        """
+
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile, as the upper bound of the bucket it falls in
+
+        :param q: The quantile, between 0 & 1
+        :return: The estimate, None if there are no values (or infinity, past the last bucket)
+
+        """
+
+        if not self.count:
+            return None
+
+        rank: float = q * self.count
+        seen: int = 0
+
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            seen += count
+
+            if seen >= rank:
+                return bound
+
+        return float("inf")
+
+    @property
+    def mean(self) -> Optional[float]:
+        """
+        The mean of the values
+
+        """
+
+        return self.sum / self.count if self.count else None
+
+
+class HistogramInstrumentation(Instrumentation):
+    """
+    Aggregates the stage durations into a histogram per stage & key, and counts the frames
+
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Create the aggregator
+
+        :param buckets: The histogram buckets, in seconds
+
+        """
+
+        self._buckets: Tuple[float, ...] = buckets
+        self._histograms: Dict[Tuple[Stage, str], LatencyHistogram] = {}
+        self.frames: int = 0
+        self.frame_bytes: int = 0
+        self.last_frame_at: Optional[float] = None
+
+    def record_frame(self, size: int, received_at: float) -> None:
+        self.frames += 1
+        self.frame_bytes += size
+        self.last_frame_at = received_at
+
+    def record(self, stage: Stage, key: str, seconds: float) -> None:
+        histogram: Optional[LatencyHistogram] = self._histograms.get((stage, key))
+
+        if histogram is None:
+            histogram = self._histograms[(stage, key)] = LatencyHistogram(self._buckets)
+
+        histogram.observe(seconds)
+
+    @property
+    def histograms(self) -> Dict[Tuple[Stage, str], LatencyHistogram]:
+        """
+        The histograms, by stage & key
+
+        """
+
+        return dict(self._histograms)
+
+    def histogram(self, stage: Stage, key: str) -> Optional[LatencyHistogram]:
+        """
+        Get the histogram of a stage & key
+
+        :param stage: The stage
+        :param key: The key, e.g. the event type
+        :return: The histogram, or None if nothing was recorded
+
+        """
+
+        return self._histograms.get((stage, key))
+
+    def reset(self) -> None:
+        """
+        Clear the histograms & frame counters
+
+        :return: None
+
+        """
+
+        self._histograms.clear()
+        self.frames = 0
+        self.frame_bytes = 0
+        self.last_frame_at = None
+
+
+class PrometheusExporter:
+    """
+    Renders a HistogramInstrumentation in the Prometheus text exposition format,
+    to serve from a metrics endpoint or write for the node_exporter textfile collector
+
+    """
+
+    def __init__(self, instrumentation: HistogramInstrumentation, prefix: str = "tiktoklive", labels: Optional[Dict[str, str]] = None):
+        """
+        Create an exporter
+
+        :param instrumentation: The aggregator to export
+        :param prefix: The prefix of the metric names
+        :param labels: Labels added to every sample, e.g. {"room": "username"}
+
+        """
+
+        self._instrumentation: HistogramInstrumentation = instrumentation
+        self._prefix: str = prefix
+        self._labels: str = "".join(f'{name}="{self.escape(value)}",' for name, value in (labels or {}).items())
+
+    @classmethod
+    def escape(cls, value: str) -> str:
+        """
+        Escape a label value
+
+        :param value: The value
+        :return: The escaped value
+
+        """
+
+        return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+    def render(self) -> str:
+        """
+        Render the metrics
+
+        :return: The metrics, in the Prometheus text format
+
+        """
+
+        name: str = f"{self._prefix}_stage_seconds"
+        lines: List[str] = [
+            f"# HELP {name} Time spent in each stage of the client, by event type",
+            f"# TYPE {name} histogram",
+        ]
+
+        for (stage, key), histogram in sorted(self._instrumentation.histograms.items(), key=lambda item: (item[0][0].value, item[0][1])):
+            labels: str = f'{self._labels}stage="{stage.value}",key="{self.escape(key)}"'
+            cumulative: int = 0
+
+            for bound, count in zip((*histogram.buckets, float("inf")), histogram.counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{"+Inf" if bound == float("inf") else repr(bound)}"}} {cumulative}')
+
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum!r}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+        labels: str = "{" + self._labels.rstrip(",") + "}" if self._labels else ""
+
+        lines += [
+            f"# HELP {self._prefix}_frames_total WebSocket frames received",
+            f"# TYPE {self._prefix}_frames_total counter",
+            f"{self._prefix}_frames_total{labels} {self._instrumentation.frames}",
+            f"# HELP {self._prefix}_frame_bytes_total WebSocket frame bytes received",
+            f"# TYPE {self._prefix}_frame_bytes_total counter",
+            f"{self._prefix}_frame_bytes_total{labels} {self._instrumentation.frame_bytes}",
+        ]
+
+        if self._instrumentation.last_frame_at is not None:
+            lines += [
+                f"# HELP {self._prefix}_last_frame_timestamp_seconds When the last WebSocket frame was received",
+                f"# TYPE {self._prefix}_last_frame_timestamp_seconds gauge",
+                f"{self._prefix}_last_frame_timestamp_seconds{labels} {self._instrumentation.last_frame_at!r}",
+            ]
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Write the metrics to a file atomically, e.g. for the node_exporter textfile collector
+
+        :param path: The file path
+        :return: None
+
+        """
+
+        temp_path: str = f"{os.fspath(path)}.{os.getpid()}.{time.monotonic_ns()}.tmp"
+
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.write(self.render())
+
+        os.replace(temp_path, path)
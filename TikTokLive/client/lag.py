@@ -0,0 +1,191 @@
+import time
+from collections import deque
+from typing import Deque, Optional, Callable, Dict, Tuple
+
+from TikTokLive.events import Event
+from TikTokLive.events.base_event import EventLag
+from TikTokLive.proto import WebcastResponse, Common
+
+"""The percentiles reported by `LagTracker.snapshot`"""
+DEFAULT_PERCENTILES: Tuple[float, ...] = (50, 90, 99)
+
+
+class RollingPercentiles:
+    """
+    Percentiles over the latest `window` samples
+
+    """
+
+    __slots__ = ("_samples", "count")
+
+    def __init__(self, window: int = 1_000):
+        """
+        Create the window
+
+        :param window: The number of samples kept
+
+        """
+
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.count: int = 0
+
+    def add(self, value: float) -> None:
+        """
+        Add a sample, evicting the oldest if the window is full
+
+        :param value: The sample
+        :return: None
+
+        """
+
+        self._samples.append(value)
+        self.count += 1
+
+    @property
+    def latest(self) -> Optional[float]:
+        """
+        The latest sample
+
+        """
+
+        return self._samples[-1] if self._samples else None
+
+    def percentiles(self, *percentiles: float) -> Dict[float, Optional[float]]:
+        """
+        Compute percentiles over the window, sorting it once (nearest-rank)
+
+        :param percentiles: The percentiles, between 0 & 100
+        :return: The value of each percentile, None if the window is empty
+
+        """
+
+        ordered: list = sorted(self._samples)
+
+        if not ordered:
+            return {percentile: None for percentile in percentiles}
+
+        return {
+            percentile: ordered[min(len(ordered) - 1, max(0, int(round(percentile / 100 * len(ordered))) - 1))]
+            for percentile in percentiles
+        }
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Compute a percentile over the window
+
+        :param percentile: The percentile, between 0 & 100
+        :return: Its value, None if the window is empty
+
+        """
+
+        return self.percentiles(percentile)[percentile]
+
+
+class LagTracker:
+    """
+    Tracks how far behind TikTok's servers a room is processed, from the server timestamps:
+
+    - network: from the server sending a WebcastResponse (its `now`) to the client receiving it
+    - queue: from the client receiving a WebcastResponse to dispatching it (the time spent in the ingest queue, if any)
+    - receive: from the server creating an event (its `common.create_time`) to the client receiving it
+    - dispatch: from the server creating an event to the client dispatching it to the handlers
+
+    All are in seconds. The server & local clocks are not synchronised, so the absolute values include their skew,
+    but a lag that keeps growing means the client is falling behind. Each client has its own tracker, i.e. one per room.
+    Only the events of a WebcastResponse are measured, not those emitted on a timer (e.g. timed-out gift streaks & batches).
+
+    """
+
+    def __init__(self, window: int = 1_000, stamp_events: bool = False, clock: Callable[[], float] = time.time):
+        """
+        Create a tracker
+
+        :param window: The number of samples the percentiles are computed over, per measure
+        :param stamp_events: Whether to stamp each event's lag on it, as `event.lag`
+        :param clock: The wall clock, in seconds since the epoch
+
+        """
+
+        self.stamp_events: bool = stamp_events
+        self._clock: Callable[[], float] = clock
+
+        self.network: RollingPercentiles = RollingPercentiles(window)
+        self.queue: RollingPercentiles = RollingPercentiles(window)
+        self.receive: RollingPercentiles = RollingPercentiles(window)
+        self.dispatch: RollingPercentiles = RollingPercentiles(window)
+
+    def received(self, webcast_response: WebcastResponse) -> None:
+        """
+        Record the receipt of a WebcastResponse, as it is read from the WebSocket
+
+        :param webcast_response: The response
+        :return: None
+
+        """
+
+        now: float = self._clock()
+
+        # Kept on the response itself, as it may wait in the ingest queue
+        webcast_response.__dict__["_received_at"] = now
+
+        if webcast_response.now:
+            self.network.add(now - webcast_response.now / 1000)
+
+    def dispatching(self, webcast_response: WebcastResponse) -> float:
+        """
+        Record the start of the dispatch of a WebcastResponse, before its events are parsed
+
+        :param webcast_response: The response
+        :return: When it was received, to pass along with its events to `dispatched`
+
+        """
+
+        now: float = self._clock()
+        received_at: float = webcast_response.__dict__.get("_received_at", now)
+        self.queue.add(now - received_at)
+        return received_at
+
+    def dispatched(self, event: Event, received_at: float) -> Optional[EventLag]:
+        """
+        Record the lag of an event of a WebcastResponse, right before it is emitted
+
+        :param event: The event
+        :param received_at: When its response was received, as returned by `dispatching`
+        :return: The lag stamped on it, or None if stamping is disabled or it has no server timestamp (e.g. the client's own events)
+
+        """
+
+        common: Optional[Common] = getattr(event, "common", None)
+
+        if common is None or not common.create_time:
+            return None
+
+        now: float = self._clock()
+        created_at: float = common.create_time / 1000
+        receive: float = received_at - created_at
+
+        self.receive.add(receive)
+        self.dispatch.add(now - created_at)
+
+        if not self.stamp_events:
+            return None
+
+        lag: EventLag = EventLag(receive=receive, dispatch=now - created_at)
+        event.__dict__["_lag"] = lag
+        return lag
+
+    def snapshot(self, percentiles: Tuple[float, ...] = DEFAULT_PERCENTILES) -> Dict[str, Dict[float, Optional[float]]]:
+        """
+        Compute the percentiles of every measure
+
+        :param percentiles: The percentiles, between 0 & 100
+        :return: The percentiles by measure, e.g. {"dispatch": {50: 0.8, 90: 1.2, 99: 3.4}, ...}
+
+        """
+
+        return {
+            "network": self.network.percentiles(*percentiles),
+            "queue": self.queue.percentiles(*percentiles),
+            "receive": self.receive.percentiles(*percentiles),
+            "dispatch": self.dispatch.percentiles(*percentiles),
+        }
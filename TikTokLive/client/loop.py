@@ -0,0 +1,172 @@
+import asyncio
+from asyncio import AbstractEventLoop, Task
+from typing import Optional, Coroutine, Any, TypeVar, Set
+
+try:
+    import uvloop
+
+    SUPPORTS_UVLOOP: bool = True
+except ImportError:
+    SUPPORTS_UVLOOP: bool = False
+
+_T: Any = TypeVar("_T")
+
+
+def new_event_loop(use_uvloop: bool = False) -> AbstractEventLoop:
+    """
+    Create an event loop
+
+    :param use_uvloop: Whether to create a uvloop loop. Falls back to the default loop if uvloop isn't installed.
+    :return: The new event loop
+
+    """
+
+    if use_uvloop and SUPPORTS_UVLOOP:
+        return uvloop.new_event_loop()
+
+    return asyncio.new_event_loop()
+
+
+class EventLoopRunner:
+    """
+    Creates & owns exactly one event loop, so every call made through it (and every task it schedules)
+    lands on the same loop. Closing it cancels the leftover tasks, finalizes async generators & the default executor,
+    then closes the loop.
+
+    """
+
+    def __init__(self, use_uvloop: bool = False, debug: Optional[bool] = None):
+        """
+        Create a runner. The loop is created lazily, on first use.
+
+        :param use_uvloop: Whether to run on uvloop, if it is installed (type "pip install TikTokLive[uvloop]")
+        :param debug: Whether to enable the loop's debug mode
+
+        """
+
+        self._use_uvloop: bool = use_uvloop
+        self._debug: Optional[bool] = debug
+        self._loop: Optional[AbstractEventLoop] = None
+        self._closed: bool = False
+
+    @property
+    def loop(self) -> AbstractEventLoop:
+        """
+        The runner's event loop, created on first access
+
+        """
+
+        if self._closed:
+            raise RuntimeError("The event loop runner is closed.")
+
+        if self._loop is None:
+            self._loop = new_event_loop(self._use_uvloop)
+
+            if self._debug is not None:
+                self._loop.set_debug(self._debug)
+
+        return self._loop
+
+    @property
+    def use_uvloop(self) -> bool:
+        """
+        Whether the runner was asked to run on uvloop
+
+        """
+
+        return self._use_uvloop
+
+    @property
+    def is_uvloop(self) -> bool:
+        """
+        Whether the runner's loop is a uvloop loop
+
+        """
+
+        return self._use_uvloop and SUPPORTS_UVLOOP
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether the runner has been closed
+
+        """
+
+        return self._closed
+
+    def run(self, coroutine: Coroutine[Any, Any, _T]) -> _T:
+        """
+        Run a coroutine to completion on the runner's loop
+
+        :param coroutine: The coroutine
+        :return: Its result
+
+        """
+
+        loop: AbstractEventLoop = self.loop
+
+        if loop.is_running():
+            raise RuntimeError("The event loop runner can't be called from its own running loop.")
+
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(coroutine)
+
+    def close(self) -> None:
+        """
+        Cancel the tasks still pending on the loop, wait for them to finish, then close the loop
+
+        :return: None
+
+        """
+
+        if self._closed:
+            return
+
+        self._closed = True
+
+        if self._loop is None:
+            return
+
+        loop: AbstractEventLoop = self._loop
+
+        try:
+            self._cancel_tasks(loop)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+
+            # Only on Python 3.9+, older loops don't wait for the default executor
+            if hasattr(loop, "shutdown_default_executor"):
+                loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+            self._loop = None
+
+    @classmethod
+    def _cancel_tasks(cls, loop: AbstractEventLoop) -> None:
+        """Cancel every pending task on the loop & wait for them to unwind (e.g. ping & writer tasks)"""
+
+        tasks: Set[Task] = {task for task in asyncio.all_tasks(loop) if not task.done()}
+
+        if not tasks:
+            return
+
+        for task in tasks:
+            task.cancel()
+
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+        for task in tasks:
+            if task.cancelled() or task.exception() is None:
+                continue
+
+            loop.call_exception_handler({
+                "message": "Unhandled exception in a task cancelled at shutdown",
+                "exception": task.exception(),
+                "task": task
+            })
+
+    def __enter__(self) -> "EventLoopRunner":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
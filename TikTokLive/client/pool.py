@@ -0,0 +1,411 @@
+import asyncio
+from asyncio import Task
+from dataclasses import dataclass
+from logging import Logger
+from typing import Optional, Dict, Any, Type, Set, Iterator
+
+import httpx
+
+from TikTokLive.client.client import TikTokLiveClient
+from TikTokLive.client.dispatch import EventDispatcher
+from TikTokLive.client.errors import AlreadyConnectedError
+from TikTokLive.client.lag import LagTracker
+from TikTokLive.client.logger import TikTokLiveLogHandler, LogLevel
+from TikTokLive.client.web.web_settings import SUPPORTS_CURL_CFFI
+from TikTokLive.client.web.web_signer import TikTokSigner
+from TikTokLive.client.ws.ws_connect import WebcastProxy
+from TikTokLive.events import Event
+
+# Import the curl_cffi module if it is supported
+try:
+    import curl_cffi.requests
+# Otherwise, import a dummy class
+except:
+    from TikTokLive.client.web import curl_cffi_dummy as curl_cffi
+
+
+@dataclass
+class PoolStats:
+    """
+    A snapshot of the rooms in a TikTokLiveClientPool
+
+    """
+
+    rooms: int
+    """The number of rooms in the pool"""
+
+    connecting: int
+    """The rooms waiting for (or holding) a connect slot"""
+
+    connected: int
+    """The rooms with an open WebSocket"""
+
+    failed: int
+    """The rooms whose last connection attempt failed"""
+
+    events: int
+    """The number of events emitted by every room since the pool was created"""
+
+    reconnects: int
+    """The number of times the resumable sessions of the current rooms reconnected"""
+
+
+class PooledTikTokLiveClient(TikTokLiveClient):
+    """
+    A client that belongs to a TikTokLiveClientPool.
+    Its events go to its own listeners & to the pool's, and the pool's listeners count as subscriptions for selective decoding.
+
+    """
+
+    def __init__(self, pool: "TikTokLiveClientPool", unique_id: str, **kwargs):
+        """
+        Create a pooled client
+
+        :param pool: The pool it belongs to
+        :param unique_id: The username of the creator to connect to
+        :param kwargs: Arguments to pass to the super-class
+
+        """
+
+        super().__init__(unique_id, **kwargs)
+        self._pool: TikTokLiveClientPool = pool
+
+    def emit(self, event: str, *args: Any, **kwargs: Any) -> bool:
+        """
+        Emit an event to the client's listeners, then to the pool's
+
+        :param event: The event name
+        :param args: The event arguments
+        :param kwargs: The event keyword arguments
+        :return: Whether any listener handled it
+
+        """
+
+        handled: bool = super().emit(event, *args, **kwargs)
+        return self._pool.dispatch(self, event, *args) or handled
+
+    def emit_event(self, event: Event, *args: Any) -> bool:
+        """
+        Emit an event object to the client's listeners, then to the pool's
+
+        :param event: The event
+        :param args: Extra arguments for the listeners, after the event
+        :return: Whether any listener handled it
+
+        """
+
+        handled: bool = super().emit_event(event, *args)
+        return self._pool.dispatch_event(self, event) or handled
+
+    async def wait_for_streams(self) -> None:
+        """
+        Wait until no stream of the client or its pool is blocked on its consumer
+
+        :return: None
+
+        """
+
+        await super().wait_for_streams()
+        await self._pool.wait_for_streams()
+
+    def has_listener(self, event: Type[Event]) -> bool:
+        """
+        Check whether the client or its pool is listening to a given event
+
+        :param event: The event to check listening for
+        :return: Whether it is being listened to
+
+        """
+
+        return super().has_listener(event) or self._pool.has_listener(event)
+
+    @property
+    def pool(self) -> "TikTokLiveClientPool":
+        """
+        The pool the client belongs to
+
+        """
+
+        return self._pool
+
+
+class TikTokLiveClientPool(EventDispatcher):
+    """
+    Multiplexes many rooms over one set of HTTP transports, one URL signer & one event dispatcher.
+    A standalone client creates its own httpx, curl_cffi & signer clients (each with its own TLS context & connection pool),
+    so watching many rooms with separate clients scales memory & file descriptors with the room count.
+
+    Listeners added to the pool receive the events of every room, with the client the event came from as a second argument.
+    Listeners can still be added to each room's client.
+
+    """
+
+    def __init__(
+            self,
+            max_concurrent_connects: int = 5,
+
+            # Proxies
+            web_proxy: Optional[httpx.Proxy] = None,
+            ws_proxy: Optional[WebcastProxy] = None,
+
+            # Shared client kwargs
+            httpx_kwargs: Optional[dict] = None,
+            curl_cffi_kwargs: Optional[dict] = None,
+            signer_kwargs: Optional[dict] = None,
+            ws_kwargs: Optional[dict] = None
+    ):
+        """
+        Create a client pool
+
+        :param max_concurrent_connects: The number of rooms that may be joining at once. Joining scrapes & signs,
+                                        so bursts of joins are what get rate-limited by TikTok & the sign server.
+        :param web_proxy: An optional proxy for the shared HTTP client
+        :param ws_proxy: An optional proxy for every room's WebSocket connection
+        :param httpx_kwargs: Additional kwargs for the shared `httpx.AsyncClient`
+        :param curl_cffi_kwargs: Additional kwargs for the shared `curl_cffi.requests.AsyncSession`
+        :param signer_kwargs: Additional kwargs for the shared URL signer
+        :param ws_kwargs: Additional kwargs for every room's WebSocket client
+
+        """
+
+        super().__init__()
+
+        if max_concurrent_connects < 1:
+            raise ValueError("At least one connection must be allowed at a time.")
+
+        self._logger: Logger = TikTokLiveLogHandler.get_logger(
+            level=LogLevel.ERROR
+        )
+
+        # Shared transports
+        self._httpx: httpx.AsyncClient = httpx.AsyncClient(proxy=web_proxy, **(httpx_kwargs or {}))
+        self._curl_cffi: Optional[curl_cffi.requests.AsyncSession] = curl_cffi.requests.AsyncSession(**(curl_cffi_kwargs or {})) if SUPPORTS_CURL_CFFI else None
+        self._signer: TikTokSigner = TikTokSigner(**(signer_kwargs or {}))
+        self._ws_proxy: Optional[WebcastProxy] = ws_proxy
+        self._ws_kwargs: dict = ws_kwargs or {}
+
+        # Rooms
+        self._clients: Dict[str, PooledTikTokLiveClient] = {}
+        self._tasks: Dict[str, Task] = {}
+        self._connecting: Set[str] = set()
+        self._failed: Dict[str, BaseException] = {}
+        self._connect_limit: asyncio.Semaphore = asyncio.Semaphore(max_concurrent_connects)
+        self._event_count: int = 0
+
+    def dispatch(self, client: TikTokLiveClient, event: str, *args: Any) -> bool:
+        """
+        Emit a room's event to the pool's listeners
+
+        :param client: The client the event came from
+        :param event: The event name
+        :param args: The event arguments
+        :return: Whether any listener handled it
+
+        """
+
+        # pyee's own event, not one from the room
+        if event == "new_listener":
+            return False
+
+        self._event_count += 1
+
+        if event not in self._events:
+            return False
+
+        return super().emit(event, *args, client)
+
+    def dispatch_event(self, client: TikTokLiveClient, event: Event) -> bool:
+        """
+        Emit a room's event object to the pool's listeners, through the dispatch table
+
+        :param client: The client the event came from
+        :param event: The event
+        :return: Whether any listener handled it
+
+        """
+
+        self._event_count += 1
+        return self.emit_event(event, client)
+
+    def add(self, unique_id: str, **kwargs) -> PooledTikTokLiveClient:
+        """
+        Add a room to the pool & connect to it in the background, once a connect slot is free.
+        The client is returned right away, so that room-specific listeners can be added before it connects.
+
+        :param unique_id: The username of the creator to connect to
+        :param kwargs: Kwargs to pass to `TikTokLiveClient.start`
+        :return: The room's client
+
+        """
+
+        unique_id = TikTokLiveClient.parse_unique_id(unique_id)
+
+        if unique_id in self._clients:
+            raise AlreadyConnectedError(f"The room of '{unique_id}' is already in the pool!")
+
+        client: PooledTikTokLiveClient = PooledTikTokLiveClient(
+            self,
+            unique_id,
+            ws_proxy=self._ws_proxy,
+            ws_kwargs=dict(self._ws_kwargs),
+            web_kwargs={
+                "httpx_client": self._httpx,
+                "curl_cffi_client": self._curl_cffi,
+                "signer": self._signer
+            }
+        )
+
+        self._clients[unique_id] = client
+        self._tasks[unique_id] = asyncio.get_running_loop().create_task(self._run_client(client, kwargs))
+        return client
+
+    async def remove(self, unique_id: str) -> None:
+        """
+        Disconnect from a room & remove it from the pool. The shared transports stay open.
+
+        :param unique_id: The username of the creator
+        :return: None
+
+        """
+
+        unique_id = TikTokLiveClient.parse_unique_id(unique_id)
+        client: PooledTikTokLiveClient = self._clients.pop(unique_id)
+        task: Task = self._tasks.pop(unique_id)
+
+        # Not connected yet (waiting for a slot, joining or reconnecting), stop it where it is
+        if client.connected:
+            await client.disconnect()
+        else:
+            task.cancel()
+
+        await asyncio.gather(task, return_exceptions=True)
+        await client.close()
+
+        self._connecting.discard(unique_id)
+        self._failed.pop(unique_id, None)
+
+    async def close(self) -> None:
+        """
+        Remove every room & close the shared transports
+
+        :return: None
+
+        """
+
+        await asyncio.gather(*(self.remove(unique_id) for unique_id in list(self._clients)))
+
+        await self._httpx.aclose()
+        await self._signer.close()
+
+        if self._curl_cffi is not None:
+            await self._curl_cffi.close()
+
+    async def _run_client(self, client: PooledTikTokLiveClient, kwargs: Dict[str, Any]) -> None:
+        """
+        Connect to a room within the connect limit, then wait for its connection to end
+
+        :param client: The room's client
+        :param kwargs: Kwargs to pass to `TikTokLiveClient.start`
+        :return: None
+
+        """
+
+        self._connecting.add(client.unique_id)
+        self._failed.pop(client.unique_id, None)
+
+        try:
+            async with self._connect_limit:
+                task: Task = await client.start(**kwargs)
+        except Exception as ex:
+            self._failed[client.unique_id] = ex
+            self._logger.error(f"Failed to connect to the room of '{client.unique_id}': {ex!r}")
+            return
+        finally:
+            self._connecting.discard(client.unique_id)
+
+        try:
+            await task
+        except Exception as ex:
+            self._failed[client.unique_id] = ex
+            self._logger.error(f"The connection to the room of '{client.unique_id}' failed: {ex!r}")
+
+    @property
+    def clients(self) -> Dict[str, PooledTikTokLiveClient]:
+        """
+        The clients in the pool, by unique_id
+
+        """
+
+        return dict(self._clients)
+
+    @property
+    def failures(self) -> Dict[str, BaseException]:
+        """
+        The error of the last connection attempt, for the rooms that failed to connect
+
+        """
+
+        return dict(self._failed)
+
+    @property
+    def stats(self) -> PoolStats:
+        """
+        A snapshot of the pool's rooms & event count
+
+        """
+
+        return PoolStats(
+            rooms=len(self._clients),
+            connecting=len(self._connecting),
+            connected=sum(1 for client in self._clients.values() if client.connected),
+            failed=len(self._failed),
+            events=self._event_count,
+            reconnects=sum(client.session.reconnects for client in self._clients.values() if client.session is not None)
+        )
+
+    @property
+    def lag(self) -> Dict[str, LagTracker]:
+        """
+        The lag trackers of the rooms started with track_lag, by unique_id
+
+        """
+
+        return {unique_id: client.lag for unique_id, client in self._clients.items() if client.lag is not None}
+
+    @property
+    def httpx_client(self) -> httpx.AsyncClient:
+        """
+        The shared `httpx.AsyncClient`
+
+        """
+
+        return self._httpx
+
+    @property
+    def signer(self) -> TikTokSigner:
+        """
+        The shared URL signer
+
+        """
+
+        return self._signer
+
+    def get(self, unique_id: str) -> Optional[PooledTikTokLiveClient]:
+        """
+        Get the client of a room
+
+        :param unique_id: The username of the creator
+        :return: The client, or None if the room isn't in the pool
+
+        """
+
+        return self._clients.get(TikTokLiveClient.parse_unique_id(unique_id))
+
+    def __contains__(self, unique_id: str) -> bool:
+        return TikTokLiveClient.parse_unique_id(unique_id) in self._clients
+
+    def __iter__(self) -> Iterator[PooledTikTokLiveClient]:
+        return iter(list(self._clients.values()))
+
+    def __len__(self) -> int:
+        return len(self._clients)
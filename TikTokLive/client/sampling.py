@@ -0,0 +1,203 @@
+import time
+from collections import Counter
+from typing import Dict, Union, Type, Callable, List, Optional
+
+from TikTokLive.events import Event
+from TikTokLive.events.proto_events import EVENT_MAPPINGS
+from TikTokLive.proto import WebcastResponseMessage
+
+
+class RateLimit:
+    """
+    Lets through at most `per_second` events per second on average, with bursts of up to `burst` events (a token bucket)
+
+    """
+
+    def __init__(self, per_second: float, burst: Optional[int] = None):
+        """
+        Create a rate limit
+
+        :param per_second: The sustained number of events per second
+        :param burst: The number of events that may pass at once after a quiet period. Defaults to one second's worth.
+
+        """
+
+        if per_second <= 0 or (burst is not None and burst < 1):
+            raise ValueError("The rate must be positive & the burst at least one event.")
+
+        self.per_second: float = per_second
+        self.burst: int = burst or max(1, int(per_second))
+        self._tokens: float = self.burst
+        self._updated: Optional[float] = None
+
+    def allow(self, now: float) -> bool:
+        """
+        Check whether an event may pass, consuming a token if so
+
+        :param now: The current time, in seconds
+        :return: Whether the event passes
+
+        """
+
+        if self._updated is not None:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.per_second)
+
+        self._updated = now
+
+        if self._tokens < 1:
+            return False
+
+        self._tokens -= 1
+        return True
+
+
+class Sample:
+    """
+    Lets through one in every `one_in` events, starting with the first. Deterministic, so counts scale back up exactly.
+
+    """
+
+    def __init__(self, one_in: int):
+        """
+        Create a sampling policy
+
+        :param one_in: Keep one event out of this many
+
+        """
+
+        if one_in < 1:
+            raise ValueError("The sampling ratio must be at least 1.")
+
+        self.one_in: int = one_in
+        self._seen: int = 0
+
+    def allow(self, now: float) -> bool:
+        """
+        Check whether an event is sampled
+
+        :param now: The current time, in seconds (unused)
+        :return: Whether the event passes
+
+        """
+
+        self._seen += 1
+        return (self._seen - 1) % self.one_in == 0
+
+
+"""Type hint for an event policy"""
+EventPolicy: Type = Union[RateLimit, Sample]
+
+
+class EventSampler:
+    """
+    Declarative sampling & rate limits per event type, e.g. at most 20 CommentEvents per second & 1 in 10 LikeEvents.
+
+    Policies on ProtoEvents (or WebcastResponseMessage methods) are applied to the raw messages, before anything is decoded,
+    so a dropped message costs nothing & none of the events it would have produced are emitted. Policies on the other events
+    (e.g. FollowEvent, or the batch & streak events) are applied right before dispatch. The state is per sampler,
+    so use one sampler per client for per-room limits.
+
+    """
+
+    def __init__(self, policies: Dict[Union[Type[Event], str], EventPolicy], clock: Callable[[], float] = time.monotonic):
+        """
+        Create a sampler
+
+        :param policies: The policy of each event type (or WebcastResponseMessage method)
+        :param clock: The clock, in seconds
+
+        """
+
+        event_methods: Dict[Type[Event], str] = {event_type: method for method, event_type in EVENT_MAPPINGS.items()}
+
+        self._clock: Callable[[], float] = clock
+        self._method_policies: Dict[str, EventPolicy] = {}
+        self._event_policies: Dict[str, EventPolicy] = {}
+
+        for event, policy in policies.items():
+            if isinstance(event, str):
+                self._method_policies[event] = policy
+            elif event in event_methods:
+                self._method_policies[event_methods[event]] = policy
+            else:
+                self._event_policies[event.get_type()] = policy
+
+        self._passed: int = 0
+        self._dropped: Counter = Counter()
+
+    @property
+    def passed(self) -> int:
+        """
+        The number of messages & events let through by a policy
+
+        """
+
+        return self._passed
+
+    @property
+    def dropped(self) -> Dict[str, int]:
+        """
+        The number of dropped messages (by WebcastResponseMessage method) & events (by event type)
+
+        """
+
+        return dict(self._dropped)
+
+    @property
+    def dropped_total(self) -> int:
+        """
+        The total number of dropped messages & events
+
+        """
+
+        return sum(self._dropped.values())
+
+    @property
+    def has_event_policies(self) -> bool:
+        """
+        Whether any policy has to be applied to events rather than messages
+
+        """
+
+        return bool(self._event_policies)
+
+    def filter(self, messages: List[WebcastResponseMessage]) -> List[WebcastResponseMessage]:
+        """
+        Remove the messages dropped by their method's policy
+
+        :param messages: The WebcastResponseMessages
+        :return: The messages that pass
+
+        """
+
+        if not self._method_policies:
+            return messages
+
+        now: float = self._clock()
+        return [message for message in messages if self._allow(self._method_policies, message.method, now)]
+
+    def allow_event(self, event: Event) -> bool:
+        """
+        Check whether an event passes its type's policy
+
+        :param event: The event
+        :return: Whether it passes
+
+        """
+
+        return self._allow(self._event_policies, event.type, None)
+
+    def _allow(self, policies: Dict[str, EventPolicy], key: str, now: Optional[float]) -> bool:
+        """Apply the policy of a key, counting the outcome"""
+
+        policy: Optional[EventPolicy] = policies.get(key)
+
+        if policy is None:
+            return True
+
+        if policy.allow(self._clock() if now is None else now):
+            self._passed += 1
+            return True
+
+        self._dropped[key] += 1
+        return False
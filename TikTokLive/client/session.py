@@ -0,0 +1,202 @@
+import asyncio
+import random
+import time
+from typing import Optional, Tuple, Type
+
+import httpx
+from websockets import ConnectionClosed, InvalidStatusCode
+
+from TikTokLive.client.errors import SignAPIError, WebcastBlocked200Error
+from TikTokLive.proto import WebcastResponse
+
+
+class ReconnectPolicy:
+    """
+    How a resumable session reconnects after the WebSocket drops
+
+    """
+
+    """The errors that are treated as a dropped connection, rather than a bug"""
+    RETRY_ON: Tuple[Type[BaseException], ...] = (
+        ConnectionClosed,
+        InvalidStatusCode,
+        WebcastBlocked200Error,
+        SignAPIError,
+        httpx.HTTPError,
+        asyncio.TimeoutError,
+        OSError,
+    )
+
+    def __init__(
+            self,
+            max_attempts: Optional[int] = 10,
+            base_delay: float = 1.0,
+            max_delay: float = 60.0,
+            jitter: float = 0.5
+    ):
+        """
+        Create a reconnect policy
+
+        :param max_attempts: The number of consecutive failed attempts before giving up, or None to retry forever
+        :param base_delay: The delay (in seconds) before the first attempt, doubled after every failed attempt
+        :param max_delay: The maximum delay (in seconds) between attempts
+        :param jitter: The fraction of the delay that is randomized, so that rooms dropped together don't reconnect together
+
+        """
+
+        if base_delay < 0 or max_delay < base_delay or not 0 <= jitter <= 1:
+            raise ValueError("Invalid reconnect policy delays.")
+
+        self.max_attempts: Optional[int] = max_attempts
+        self.base_delay: float = base_delay
+        self.max_delay: float = max_delay
+        self.jitter: float = jitter
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Get the delay before an attempt
+
+        :param attempt: The attempt number, starting at 0
+        :return: The delay, in seconds
+
+        """
+
+        delay: float = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return delay * (1 - self.jitter) + random.uniform(0, delay * self.jitter)
+
+    def should_retry(self, attempt: int) -> bool:
+        """
+        Check whether another attempt is allowed
+
+        :param attempt: The number of consecutive failed attempts so far
+        :return: Whether to try again
+
+        """
+
+        return self.max_attempts is None or attempt < self.max_attempts
+
+
+class WebcastSession:
+    """
+    The resumable state of a connection to a room, and its reconnect metrics.
+    The latest cursor & internal_ext are kept from every WebcastResponse, so that after a drop
+    the room is resumed from where it left off, with a fresh signature & without the cold-start steps.
+
+    """
+
+    def __init__(self, policy: ReconnectPolicy):
+        """
+        Create a session
+
+        :param policy: How to reconnect
+
+        """
+
+        self._policy: ReconnectPolicy = policy
+        self.cursor: Optional[str] = None
+        self.internal_ext: Optional[str] = None
+
+        # Reconnect metrics
+        self.reconnects: int = 0
+        self.failed_attempts: int = 0
+        self.last_attempts: int = 0
+        self.last_gap: Optional[float] = None
+        self.max_gap: float = 0.0
+        self.total_gap: float = 0.0
+        self.last_error: Optional[BaseException] = None
+
+        self._attempt: int = 0
+        self._disconnected_at: Optional[float] = None
+
+    @property
+    def policy(self) -> ReconnectPolicy:
+        """
+        The reconnect policy
+
+        """
+
+        return self._policy
+
+    @property
+    def attempt(self) -> int:
+        """
+        The number of consecutive failed attempts since the last drop
+
+        """
+
+        return self._attempt
+
+    @property
+    def is_resuming(self) -> bool:
+        """
+        Whether the connection dropped & hasn't been resumed yet
+
+        """
+
+        return self._disconnected_at is not None
+
+    def track(self, webcast_response: WebcastResponse) -> Optional[float]:
+        """
+        Keep the resume point of a WebcastResponse
+
+        :param webcast_response: A response read from the WebSocket
+        :return: The gap duration, if this response resumed the session
+
+        """
+
+        if webcast_response.cursor:
+            self.cursor = webcast_response.cursor
+
+        if webcast_response.internal_ext:
+            self.internal_ext = webcast_response.internal_ext
+
+        if not webcast_response.is_first or self._disconnected_at is None:
+            return None
+
+        # The first response of the new connection, we're back
+        gap: float = time.monotonic() - self._disconnected_at
+        self._disconnected_at = None
+        self.last_attempts = self._attempt + 1
+        self._attempt = 0
+        self.reconnects += 1
+        self.last_gap = gap
+        self.max_gap = max(self.max_gap, gap)
+        self.total_gap += gap
+        return gap
+
+    def dropped(self, error: Optional[BaseException]) -> None:
+        """
+        Record a dropped connection (or a failed attempt to resume it)
+
+        :param error: The error, or None if the WebSocket was closed by the server
+        :return: None
+
+        """
+
+        if self._disconnected_at is None:
+            self._disconnected_at = time.monotonic()
+        else:
+            self._attempt += 1
+            self.failed_attempts += 1
+
+        self.last_error = error
+
+    def resume(self, initial_webcast_response: WebcastResponse) -> WebcastResponse:
+        """
+        Point a freshly signed initial response at the session's resume point.
+        Its messages are the room's recent history, which was already received before the drop, so they are discarded.
+
+        :param initial_webcast_response: The response from the sign server
+        :return: The same response, with the latest cursor & internal_ext & without messages
+
+        """
+
+        initial_webcast_response.messages = []
+
+        if self.cursor:
+            initial_webcast_response.cursor = self.cursor
+
+        if self.internal_ext:
+            initial_webcast_response.internal_ext = self.internal_ext
+
+        return initial_webcast_response
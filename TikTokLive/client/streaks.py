@@ -0,0 +1,263 @@
+import time
+from collections import OrderedDict
+from typing import Optional, Callable, List, Tuple, Union
+
+from TikTokLive.events import GiftEvent, GiftStreakEndEvent, GiftStreakProgressEvent
+
+"""Type hint for the key of a gift streak, (user ID, gift ID, group ID)"""
+StreakKey = Tuple[int, int, int]
+
+
+class GiftStreak:
+    """
+    The running totals of a single gift streak
+
+    """
+
+    __slots__ = ("event", "repeat_count", "gift_events", "started", "updated", "progressed")
+
+    def __init__(self, event: GiftEvent, now: float):
+        """
+        Start a streak
+
+        :param event: The first GiftEvent of the streak
+        :param now: The current time, in seconds
+
+        """
+
+        self.event: GiftEvent = event
+        self.repeat_count: int = 0
+        self.gift_events: int = 0
+        self.started: float = now
+        self.updated: float = now
+        self.progressed: Optional[float] = None
+
+    def update(self, event: GiftEvent, now: float) -> None:
+        """
+        Merge a GiftEvent into the streak
+
+        :param event: The GiftEvent
+        :param now: The current time, in seconds
+        :return: None
+
+        """
+
+        # The repeat_count is a running total, & frames can arrive out of order
+        self.repeat_count = max(self.repeat_count, event.repeat_count or 1)
+        self.gift_events += 1
+        self.updated = now
+        self.event = event
+
+    def to_event(self, event_type: type, now: float, **kwargs) -> Union[GiftStreakProgressEvent, GiftStreakEndEvent]:
+        """
+        Build an event with the streak's totals
+
+        :param event_type: GiftStreakProgressEvent or GiftStreakEndEvent
+        :param now: The current time, in seconds
+        :param kwargs: Extra fields for the event
+        :return: The event
+
+        """
+
+        return event_type(
+            user=self.event.user,
+            to_user=self.event.to_user,
+            gift=self.event.gift,
+            group_id=self.event.group_id,
+            repeat_count=self.repeat_count,
+            diamond_count=self.repeat_count * self.event.gift.diamond_count,
+            gift_events=self.gift_events,
+            duration=now - self.started,
+            **kwargs
+        )
+
+
+class GiftStreakAggregator:
+    """
+    Merges the many GiftEvents of a gift streak into a single GiftStreakEndEvent with the streak's totals.
+    Streakable gifts are sent as a GiftEvent per combo with an increasing repeat_count, until one with repeat_end set.
+    Streaks are keyed on (user, gift, group ID), so parallel streaks of the same gift don't mix.
+
+    Memory is bounded by both a timeout & a maximum number of open streaks. Streaks that never receive their repeat_end
+    are ended by the timeout (or evicted, oldest first, at the limit) with `timed_out` set.
+
+    """
+
+    def __init__(
+            self,
+            timeout: float = 10.0,
+            max_streaks: int = 10_000,
+            progress_interval: Optional[float] = None,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Create an aggregator
+
+        :param timeout: How long (in seconds) a streak can go without a GiftEvent before it is ended
+        :param max_streaks: The maximum number of open streaks
+        :param progress_interval: How often (in seconds) a streak emits a GiftStreakProgressEvent, None to disable them
+        :param clock: The clock, in seconds
+
+        """
+
+        if timeout <= 0 or max_streaks < 1 or (progress_interval is not None and progress_interval < 0):
+            raise ValueError("The timeout & maximum streak count must be positive, & the progress interval not negative.")
+
+        self._timeout: float = timeout
+        self._max_streaks: int = max_streaks
+        self._progress_interval: Optional[float] = progress_interval
+        self._clock: Callable[[], float] = clock
+
+        # Ordered by the last update, so the stalest streak is always first
+        self._streaks: OrderedDict[StreakKey, GiftStreak] = OrderedDict()
+        self._gift_events: int = 0
+        self._ended: int = 0
+        self._timed_out: int = 0
+
+    @property
+    def timeout(self) -> float:
+        """
+        How long (in seconds) a streak can go without a GiftEvent before it is ended
+
+        """
+
+        return self._timeout
+
+    @property
+    def size(self) -> int:
+        """
+        The number of open streaks
+
+        """
+
+        return len(self._streaks)
+
+    @property
+    def gift_events(self) -> int:
+        """
+        The number of GiftEvents aggregated
+
+        """
+
+        return self._gift_events
+
+    @property
+    def ended(self) -> int:
+        """
+        The number of GiftStreakEndEvents emitted
+
+        """
+
+        return self._ended
+
+    @property
+    def timed_out(self) -> int:
+        """
+        The number of streaks ended without their repeat_end (timeouts, evictions & flushes)
+
+        """
+
+        return self._timed_out
+
+    @classmethod
+    def key(cls, event: GiftEvent) -> StreakKey:
+        """
+        Get the key of the streak a GiftEvent belongs to
+
+        :param event: The GiftEvent
+        :return: (user ID, gift ID, group ID)
+
+        """
+
+        return event.user.id, event.gift_id or event.gift.id, event.group_id
+
+    def feed(self, event: GiftEvent) -> List[Union[GiftStreakProgressEvent, GiftStreakEndEvent]]:
+        """
+        Aggregate a GiftEvent
+
+        :param event: The GiftEvent
+        :return: The events to emit, the end of the streak & any streak that timed out, or a progress event
+
+        """
+
+        now: float = self._clock()
+        self._gift_events += 1
+        events: List[Union[GiftStreakProgressEvent, GiftStreakEndEvent]] = self.expire(now)
+
+        # Gifts that can't streak are complete on their own
+        if not event.gift.streakable:
+            streak: GiftStreak = GiftStreak(event, now)
+            streak.update(event, now)
+            events.append(self._end(streak, now, timed_out=False))
+            return events
+
+        key: StreakKey = self.key(event)
+        streak: Optional[GiftStreak] = self._streaks.get(key)
+
+        if streak is None:
+            streak = GiftStreak(event, now)
+
+            # At the limit, end the stalest streak to make room
+            if len(self._streaks) >= self._max_streaks:
+                events.append(self._end(self._streaks.popitem(last=False)[1], now, timed_out=True))
+
+            self._streaks[key] = streak
+        else:
+            self._streaks.move_to_end(key)
+
+        streak.update(event, now)
+
+        if event.repeat_end:
+            del self._streaks[key]
+            events.append(self._end(streak, now, timed_out=False))
+            return events
+
+        # Progress is throttled per streak
+        if self._progress_interval is not None and (streak.progressed is None or now - streak.progressed >= self._progress_interval):
+            streak.progressed = now
+            events.append(streak.to_event(GiftStreakProgressEvent, now))
+
+        return events
+
+    def expire(self, now: Optional[float] = None) -> List[GiftStreakEndEvent]:
+        """
+        End the streaks that went longer than the timeout without a GiftEvent
+
+        :param now: The current time, in seconds. Defaults to the clock.
+        :return: The GiftStreakEndEvents of the streaks that timed out
+
+        """
+
+        now = self._clock() if now is None else now
+        events: List[GiftStreakEndEvent] = []
+
+        while self._streaks:
+            streak: GiftStreak = next(iter(self._streaks.values()))
+
+            if now - streak.updated < self._timeout:
+                break
+
+            self._streaks.popitem(last=False)
+            events.append(self._end(streak, now, timed_out=True))
+
+        return events
+
+    def flush(self) -> List[GiftStreakEndEvent]:
+        """
+        End every open streak, e.g. when disconnecting
+
+        :return: The GiftStreakEndEvents of the open streaks
+
+        """
+
+        now: float = self._clock()
+        events: List[GiftStreakEndEvent] = [self._end(streak, now, timed_out=True) for streak in self._streaks.values()]
+        self._streaks.clear()
+        return events
+
+    def _end(self, streak: GiftStreak, now: float, timed_out: bool) -> GiftStreakEndEvent:
+        """Build the end event of a streak & count it"""
+
+        self._ended += 1
+        self._timed_out += timed_out
+        return streak.to_event(GiftStreakEndEvent, now, timed_out=timed_out)
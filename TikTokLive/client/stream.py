@@ -0,0 +1,278 @@
+import asyncio
+from collections import deque, Counter
+from typing import Deque, Any, Tuple, Type, Optional, Iterable, Set, Dict, List, TYPE_CHECKING
+
+from TikTokLive.client.ingest import OverflowPolicy
+from TikTokLive.events import Event, DisconnectEvent
+
+if TYPE_CHECKING:
+    from TikTokLive.client.dispatch import EventDispatcher
+
+"""The policies that make the producer wait once nothing more can be dropped"""
+_WAITING_POLICIES: Tuple[OverflowPolicy, ...] = (OverflowPolicy.BLOCK, OverflowPolicy.DROP_BY_TYPE)
+
+
+class EventStream:
+    """
+    Pull-based consumption of events, as an alternative to callbacks: `async for event in client.events(GiftEvent)`.
+    Events are queued per stream in a bounded queue, with an overflow policy for consumers that fall behind.
+
+    With OverflowPolicy.BLOCK (or DROP_BY_TYPE, once nothing droppable is left), a full stream makes the client wait for
+    the consumer before dispatching the next WebcastResponse, which pushes back through the ingest queue to the WebSocket reader.
+    The events of the current WebcastResponse are still queued, so a stream can briefly hold more than `maxsize` events.
+    A client's stream ends after the client disconnects, or when it is closed.
+
+    """
+
+    def __init__(
+            self,
+            dispatcher: "EventDispatcher",
+            events: Iterable[Type[Event]],
+            maxsize: int = 1_000,
+            policy: OverflowPolicy = OverflowPolicy.BLOCK,
+            drop_events: Optional[Iterable[Type[Event]]] = None,
+            end_on_disconnect: bool = True
+    ):
+        """
+        Create a stream & start queueing events. Use `dispatcher.events(...)` rather than creating one directly.
+
+        :param dispatcher: The client (or pool, or runner) the events come from
+        :param events: The event types to receive
+        :param maxsize: The maximum number of queued events
+        :param policy: What to do when an event arrives while the stream is full
+        :param drop_events: The event types that may be dropped with OverflowPolicy.DROP_BY_TYPE
+        :param end_on_disconnect: Whether the stream ends when a DisconnectEvent is emitted
+
+        """
+
+        if maxsize < 1:
+            raise ValueError("The stream must hold at least one event.")
+
+        if policy == OverflowPolicy.DROP_BY_TYPE and not drop_events:
+            raise ValueError("OverflowPolicy.DROP_BY_TYPE requires at least one droppable event type.")
+
+        self._dispatcher: "EventDispatcher" = dispatcher
+        self._event_types: Tuple[Type[Event], ...] = tuple(events)
+        self._maxsize: int = maxsize
+        self._policy: OverflowPolicy = policy
+        self._drop_types: Set[str] = {event.get_type() for event in drop_events or ()}
+        self._end_on_disconnect: bool = end_on_disconnect
+        self._listened: Set[Type[Event]] = {*self._event_types, DisconnectEvent} if end_on_disconnect else set(self._event_types)
+
+        self._items: Deque[Any] = deque()
+        self._high_water_mark: int = 0
+        self._dropped: Counter = Counter()
+        self._closed: bool = False
+
+        self._not_empty: asyncio.Event = asyncio.Event()
+        self._not_full: asyncio.Event = asyncio.Event()
+        self._not_full.set()
+
+        # Sync listeners, so queueing never creates a task
+        for event_type in self._listened:
+            dispatcher.add_listener(event_type, self._put)
+
+    @property
+    def depth(self) -> int:
+        """
+        The number of events currently queued
+
+        """
+
+        return len(self._items)
+
+    @property
+    def high_water_mark(self) -> int:
+        """
+        The highest number of events that have been queued at once
+
+        """
+
+        return self._high_water_mark
+
+    @property
+    def dropped(self) -> Dict[str, int]:
+        """
+        The number of dropped events, by event type
+
+        """
+
+        return dict(self._dropped)
+
+    @property
+    def maxsize(self) -> int:
+        """
+        The maximum number of queued events
+
+        """
+
+        return self._maxsize
+
+    @property
+    def policy(self) -> OverflowPolicy:
+        """
+        The overflow policy of the stream
+
+        """
+
+        return self._policy
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether the stream is closed. The events already queued can still be read.
+
+        """
+
+        return self._closed
+
+    @property
+    def blocked(self) -> bool:
+        """
+        Whether the producer should wait for the consumer before dispatching more events
+
+        """
+
+        return self._policy in _WAITING_POLICIES and not self._closed and len(self._items) >= self._maxsize
+
+    async def wait_writable(self) -> None:
+        """
+        Wait until the stream has room again (or is closed)
+
+        :return: None
+
+        """
+
+        while self.blocked:
+            self._not_full.clear()
+            await self._not_full.wait()
+
+    def close(self) -> None:
+        """
+        Stop receiving events. The iterator ends once the queued events are read.
+
+        :return: None
+
+        """
+
+        if self._closed:
+            return
+
+        self._closed = True
+
+        for event_type in self._listened:
+            if self._put in self._dispatcher.listeners(event_type.get_type()):
+                self._dispatcher.remove_listener(event_type.get_type(), self._put)
+
+        self._dispatcher.remove_stream(self)
+        self._not_empty.set()
+        self._not_full.set()
+
+    async def get(self) -> Any:
+        """
+        Remove & return the oldest event, waiting for one if the stream is empty
+
+        :return: The event, or (event, *args) for emitters that pass more arguments (e.g. the pool's client)
+        :raises StopAsyncIteration: Once the stream is closed & drained
+
+        """
+
+        while not self._items:
+            if self._closed:
+                raise StopAsyncIteration
+
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        item: Any = self._items.popleft()
+
+        if len(self._items) < self._maxsize:
+            self._not_full.set()
+
+        return item
+
+    async def get_batch(self, max_items: int = 100) -> List[Any]:
+        """
+        Wait for at least one event, then take everything queued (up to max_items) at once, e.g. to publish in batches
+
+        :param max_items: The maximum number of events to take
+        :return: The events, oldest first. Empty once the stream is closed & drained.
+
+        """
+
+        try:
+            batch: List[Any] = [await self.get()]
+        except StopAsyncIteration:
+            return []
+
+        while self._items and len(batch) < max_items:
+            batch.append(self._items.popleft())
+
+        if len(self._items) < self._maxsize:
+            self._not_full.set()
+
+        return batch
+
+    def _put(self, event: Event, *args: Any) -> None:
+        """Queue an event, applying the overflow policy if the stream is full"""
+
+        if self._closed:
+            return
+
+        # The stream ends with the connection, after delivering the DisconnectEvent if it was asked for
+        if self._end_on_disconnect and isinstance(event, DisconnectEvent):
+            if DisconnectEvent in self._event_types:
+                self._items.append((event, *args) if args else event)
+
+            self.close()
+            return
+
+        if len(self._items) >= self._maxsize:
+
+            if self._policy == OverflowPolicy.DROP_NEWEST:
+                self._dropped[event.type] += 1
+                return
+
+            if self._policy == OverflowPolicy.DROP_OLDEST:
+                self._drop(self._items.popleft())
+
+            elif self._policy == OverflowPolicy.DROP_BY_TYPE:
+                self._drop_by_type(event)
+
+                if event.type in self._drop_types and len(self._items) >= self._maxsize:
+                    self._dropped[event.type] += 1
+                    return
+
+        # With BLOCK (or nothing droppable left), the queue overshoots until the producer waits
+        self._items.append((event, *args) if args else event)
+        self._high_water_mark = max(self._high_water_mark, len(self._items))
+        self._not_empty.set()
+
+    def _drop(self, item: Any) -> None:
+        """Count a dropped item"""
+
+        event: Event = item[0] if isinstance(item, tuple) else item
+        self._dropped[event.type] += 1
+
+    def _drop_by_type(self, event: Event) -> None:
+        """Drop the oldest queued event of a droppable type, to make room"""
+
+        for item in self._items:
+            queued: Event = item[0] if isinstance(item, tuple) else item
+
+            if queued.type in self._drop_types:
+                self._items.remove(item)
+                self._drop(item)
+                return
+
+    def __aiter__(self) -> "EventStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        return await self.get()
+
+    async def __aenter__(self) -> "EventStream":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.close()
@@ -1,6 +1,7 @@
 import logging
 import random
 from abc import ABC, abstractmethod
+from http.cookiejar import CookieJar, Cookie
 from typing import Optional, Any, Awaitable, Dict, Literal, Union
 
 import httpx
@@ -18,6 +19,20 @@ except:
     from . import curl_cffi_dummy as curl_cffi
 
 
+class NullCookieJar(CookieJar):
+    """
+    A cookie jar that never stores anything, for `httpx.AsyncClient`s shared by several rooms.
+    Otherwise the client's jar collects every room's Set-Cookie & sends them along with the other rooms' requests.
+
+    """
+
+    def set_cookie(self, cookie: Cookie) -> None:
+        return
+
+    def extract_cookies(self, response: Any, request: Any) -> None:
+        return
+
+
 class TikTokHTTPClient:
     """
     HTTP client for interacting with the various APIs
@@ -29,7 +44,10 @@ class TikTokHTTPClient:
             web_proxy: Optional[Proxy] = None,
             httpx_kwargs: Optional[dict] = None,
             curl_cffi_kwargs: Optional[dict] = None,
-            signer_kwargs: Optional[dict] = None
+            signer_kwargs: Optional[dict] = None,
+            httpx_client: Optional[AsyncClient] = None,
+            curl_cffi_client: Optional[curl_cffi.requests.AsyncSession] = None,
+            signer: Optional[TikTokSigner] = None
     ):
         """
         Create an HTTP client for interacting with the various APIs
@@ -38,20 +56,33 @@ class TikTokHTTPClient:
         :param httpx_kwargs: Additional httpx kwargs
         :param curl_cffi_kwargs: Additional curl_cffi kwargs
         :param signer_kwargs: Additional signer kwargs
+        :param httpx_client: An optional shared `httpx.AsyncClient` to send requests with, instead of creating one.
+                             Cookies, headers & params are still per-client. Its cookie jar is replaced with a
+                             `NullCookieJar`, so rooms don't share cookies. Shared transports are not closed by `close`.
+        :param curl_cffi_client: An optional shared `curl_cffi.requests.AsyncSession`, instead of creating one
+        :param signer: An optional shared URL signer, instead of creating one
 
         """
 
         # The HTTP client
         self._httpx: AsyncClient = self._create_httpx_client(
             proxy=web_proxy,
-            httpx_kwargs=httpx_kwargs or dict()
+            httpx_kwargs=httpx_kwargs or dict(),
+            httpx_client=httpx_client
         )
 
         # The URL signer
-        self._tiktok_signer: TikTokSigner = TikTokSigner(**(signer_kwargs or dict()))
+        self._tiktok_signer: TikTokSigner = signer or TikTokSigner(**(signer_kwargs or dict()))
 
         # Special client for requests that check the TLS certificate
-        self._curl_cffi: Optional[curl_cffi.requests.AsyncSession] = curl_cffi.requests.AsyncSession(**(curl_cffi_kwargs or {})) if SUPPORTS_CURL_CFFI else None
+        self._curl_cffi: Optional[curl_cffi.requests.AsyncSession] = curl_cffi_client or (
+            curl_cffi.requests.AsyncSession(**(curl_cffi_kwargs or {})) if SUPPORTS_CURL_CFFI else None
+        )
+
+        # Only close what we created
+        self._owns_httpx: bool = httpx_client is None
+        self._owns_curl_cffi: bool = curl_cffi_client is None
+        self._owns_signer: bool = signer is None
 
     @property
     def httpx_client(self) -> AsyncClient:
@@ -89,18 +120,21 @@ class TikTokHTTPClient:
     def _create_httpx_client(
             self,
             proxy: Optional[Proxy],
-            httpx_kwargs: Dict[str, Any]
+            httpx_kwargs: Dict[str, Any],
+            httpx_client: Optional[AsyncClient] = None
     ) -> AsyncClient:
         """
         Initialize a new `httpx.AsyncClient`, called internally on object creation
 
         :param proxy: An optional HTTP proxy to initialize the client with
+        :param httpx_client: An optional shared client to use instead. The cookies, headers & params are still created.
         :return: An instance of the `httpx.AsyncClient`
 
         """
 
-        # Create the cookie jar
-        self.cookies = httpx_kwargs.pop("cookies", Cookies())
+        # Create the cookie jar (a Cookies instance, so responses can be extracted into it)
+        cookies: Any = httpx_kwargs.pop("cookies", None)
+        self.cookies = cookies if isinstance(cookies, Cookies) else Cookies(cookies)
 
         # Create the headers
         self.headers = {
@@ -114,6 +148,13 @@ class TikTokHTTPClient:
             **httpx_kwargs.pop("params", dict())
         }
 
+        # A shared client's own jar would leak cookies between rooms, so cookies are only kept (& sent) per room
+        if httpx_client is not None:
+            if not isinstance(httpx_client.cookies.jar, NullCookieJar):
+                httpx_client.cookies = NullCookieJar()
+
+            return httpx_client
+
         return AsyncClient(
             proxy=proxy,
             cookies=self.cookies,
@@ -128,8 +169,14 @@ class TikTokHTTPClient:
 
         """
 
-        await self._httpx.aclose()
-        await self._curl_cffi.close()
+        if self._owns_httpx:
+            await self._httpx.aclose()
+
+        if self._owns_curl_cffi and self._curl_cffi is not None:
+            await self._curl_cffi.close()
+
+        if self._owns_signer:
+            await self._tiktok_signer.close()
 
     def set_session_id(self, session_id: str) -> None:
         """
@@ -290,7 +337,13 @@ class TikTokHTTPClient:
                 raise ValueError("Cannot use the curl_cffi client with httpx backend!")
 
             http_client = http_client or self._httpx
-            return await http_client.send(request)
+            response: httpx.Response = await http_client.send(request)
+
+            # A shared client doesn't store cookies, so keep the room's own
+            if http_client is self._httpx and not self._owns_httpx:
+                self.cookies.extract_cookies(response)
+
+            return response
 
         elif http_backend == "curl_cffi":
 
@@ -63,6 +63,16 @@ class TikTokSigner:
             verify=False
         )
 
+    async def close(self) -> None:
+        """
+        Close the signer's HTTP client
+
+        :return: None
+
+        """
+
+        await self._httpx.aclose()
+
     @property
     def sign_api_key(self) -> Optional[str]:
         """API key for signing requests"""
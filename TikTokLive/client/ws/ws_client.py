@@ -1,17 +1,24 @@
 import asyncio
 import base64
+import time
 import typing
 from asyncio import Task
-from typing import Optional, AsyncIterator, Union, Type
+from concurrent.futures import Executor
+from typing import Optional, AsyncIterator, Union, Type, Callable, AbstractSet, Set
 
 import httpx
 from betterproto import Message
+from websockets import ConnectionClosed
 from websockets.legacy.client import WebSocketClientProtocol
 
+from TikTokLive.client.instrumentation import Instrumentation
 from TikTokLive.client.logger import TikTokLiveLogHandler
 from TikTokLive.client.web.web_settings import WebDefaults
+from TikTokLive.client.ws.ws_sink import RawFrameSink
 from TikTokLive.client.ws.ws_connect import WebcastProxyConnect, WebcastConnect, WebcastProxy, WebcastIterator
+from TikTokLive.client.ws.ws_utils import extract_webcast_response_message
 from TikTokLive.proto import WebcastPushFrame, WebcastResponse
+from TikTokLive.proto.codec import ProtoCodec
 
 
 class WebcastWSClient:
@@ -39,6 +46,15 @@ class WebcastWSClient:
         self._connect_generator_class: Union[Type[WebcastConnect], Type[WebcastProxyConnect]] = WebcastProxyConnect if self._ws_proxy else WebcastConnect
         self._connection_generator: Optional[WebcastConnect] = None
 
+        # Outbound writes (acks & pings) go through one writer task, so the reader never waits on the socket
+        self._writer_task: Optional[Task] = None
+        self._outbound: Optional[asyncio.Queue] = None
+        self._outbound_high_water_mark: int = 0
+        self._acks_sent: int = 0
+        self._ack_latency_total: float = 0.0
+        self._ack_latency_max: float = 0.0
+        self._fallback_sends: Set[Task] = set()
+
     @property
     def ws(self) -> Optional[WebSocketClientProtocol]:
         """
@@ -80,7 +96,7 @@ class WebcastWSClient:
             return
 
         # Log outbound data
-        self._logger.debug(f"Sending data to Webcast Server... {message}")
+        self._logger.debug("Sending data to Webcast Server... %s", message)
 
         # Send the data (+ Serialize the data if it's a protobuf message)
         await self.ws.send(
@@ -105,17 +121,92 @@ class WebcastWSClient:
         if not self.connected:
             return
 
-        # Send the ack
-        await self.send(
+        # Queue the ack for the writer
+        self.queue_send(
             message=WebcastPushFrame(
                 payload_type="ack",
                 # ID of the WebcastPushMessage for the acknowledgement
                 log_id=webcast_push_frame.log_id,
                 # [Unknown] Hypothesized to be an acknowledgement of the WebcastResponse (& its messages) within the WebcastPushMessage
                 payload=(webcast_response.internal_ext or "-").encode()
-            )
+            ),
+            is_ack=True
         )
 
+    def queue_send(self, message: Union[bytes, Message], is_ack: bool = False) -> None:
+        """
+        Queue a message for the writer task without waiting for it to be written.
+        Falls back to a fire-and-forget send if the writer isn't running.
+
+        :param message: Message to send to the WebSocket connection
+        :param is_ack: Whether the message is an ack, for the ack latency counters
+        :return: None
+
+        """
+
+        # Keep a reference to the send, the loop only holds tasks weakly
+        if self._outbound is None:
+            task: Task = asyncio.create_task(self.send(message=message))
+            self._fallback_sends.add(task)
+            task.add_done_callback(self._fallback_send_done)
+            return
+
+        self._outbound.put_nowait((message, time.monotonic(), is_ack))
+        self._outbound_high_water_mark = max(self._outbound_high_water_mark, self._outbound.qsize())
+
+    def _fallback_send_done(self, task: Task) -> None:
+        """Release a fire-and-forget send & log its error, if any"""
+
+        self._fallback_sends.discard(task)
+
+        if not task.cancelled() and task.exception() is not None:
+            self._logger.error(f"Failed to send a message: {task.exception()!r}")
+
+    @property
+    def outbound_queue_size(self) -> int:
+        """
+        The number of messages waiting for the writer task
+
+        """
+
+        return self._outbound.qsize() if self._outbound is not None else 0
+
+    @property
+    def outbound_high_water_mark(self) -> int:
+        """
+        The highest number of messages that have waited for the writer task at once
+
+        """
+
+        return self._outbound_high_water_mark
+
+    @property
+    def acks_sent(self) -> int:
+        """
+        The number of acks written to the WebSocket
+
+        """
+
+        return self._acks_sent
+
+    @property
+    def ack_latency_avg(self) -> Optional[float]:
+        """
+        The average time (in seconds) between queueing an ack & it being written
+
+        """
+
+        return self._ack_latency_total / self._acks_sent if self._acks_sent else None
+
+    @property
+    def ack_latency_max(self) -> float:
+        """
+        The longest time (in seconds) between queueing an ack & it being written
+
+        """
+
+        return self._ack_latency_max
+
     async def disconnect(self) -> None:
         """
         Request to stop the websocket connection & wait
@@ -135,7 +226,13 @@ class WebcastWSClient:
             user_agent: str,
             initial_webcast_response: WebcastResponse,
             process_connect_events: bool = True,
-            compress_ws_events: bool = True
+            compress_ws_events: bool = True,
+            decode_executor: Optional[Executor] = None,
+            raw_frame_sink: Optional[RawFrameSink] = None,
+            decode_frames: bool = True,
+            proto_codec: ProtoCodec = ProtoCodec.BETTERPROTO,
+            method_filter: Optional[Callable[[], Optional[AbstractSet[str]]]] = None,
+            instrumentation: Optional[Instrumentation] = None
     ) -> AsyncIterator[WebcastResponse]:
         """
         Connect to the Webcast server & iterate over response messages.
@@ -167,6 +264,13 @@ class WebcastWSClient:
         :param cookies: The cookies to pass to the WebSocket connection
         :param process_connect_events: Whether to process the initial events sent in the first fetch
         :param compress_ws_events: Whether to ask TikTok to gzip the WebSocket events
+        :param decode_executor: An optional executor to decode the WebSocket frames in, off the event loop
+        :param raw_frame_sink: An optional sink that receives every raw frame & its receive time, before decoding
+        :param decode_frames: Whether to decode frames at all. If False, only the first WebcastResponse is yielded & frames are just archived to the sink.
+        :param proto_codec: The codec to decode the WebSocket frames with
+        :param method_filter: Called per frame for the WebcastResponseMessage methods to decode, or None for all of them.
+                              The other messages are skipped on the wire, before decoding.
+        :param instrumentation: Optional hooks that receive each frame & the time spent decompressing & parsing it
         :return: Yields WebcastResponseMessage, the messages within WebcastResponse.messages
 
         """
@@ -189,6 +293,12 @@ class WebcastWSClient:
             logger=self._logger,
             uri=ws_kwargs.pop('uri', None),  # Always *should* be none as we build this internally
             base_uri_append_str=(ws_kwargs.pop("base_uri_append_str", WebDefaults.ws_client_params_append_str)),
+            decode_executor=decode_executor,
+            raw_frame_sink=raw_frame_sink,
+            decode_frames=decode_frames,
+            proto_codec=proto_codec,
+            method_filter=method_filter,
+            instrumentation=instrumentation,
 
             # Base URI parameters
             base_uri_params={
@@ -217,33 +327,112 @@ class WebcastWSClient:
         )
 
         # Open a connection & yield WebcastResponse items
-        async for webcast_push_frame, webcast_response in typing.cast(WebcastIterator, self._connection_generator):
+        try:
+            async for webcast_push_frame, webcast_response in typing.cast(WebcastIterator, self._connection_generator):
 
-            # The first message does NOT need an ack since we perform the ack with the actual WebSocket connect URI
-            if webcast_response.is_first:
-                self.restart_ping_loop()
+                # Archive-only mode. Decode just the envelope of the WebcastResponse (none of its messages) to ack as usual.
+                if webcast_response is None:
+                    if webcast_push_frame.payload_type == "msg":
+                        envelope: WebcastResponse = extract_webcast_response_message(webcast_push_frame, logger=self._logger, codec=proto_codec, methods=frozenset())
 
-            # Ack when necessary
-            if webcast_response.needs_ack:
-                await self.send_ack(webcast_response=webcast_response, webcast_push_frame=webcast_push_frame)
+                        if envelope.needs_ack:
+                            await self.send_ack(webcast_response=envelope, webcast_push_frame=webcast_push_frame)
+                    continue
 
-            # Yield the response
-            yield webcast_response
+                # The first message does NOT need an ack since we perform the ack with the actual WebSocket connect URI
+                if webcast_response.is_first:
+                    self.restart_writer()
+                    self.restart_ping_loop()
 
-            # If not connected, break
-            if not self.connected:
-                break
+                # Ack when necessary (queued for the writer, this doesn't wait on the socket)
+                if webcast_response.needs_ack:
+                    await self.send_ack(webcast_response=webcast_response, webcast_push_frame=webcast_push_frame)
 
-        # Cancel the ping loop if it hasn't started to
-        if not self._ping_loop.done() and not self._ping_loop.cancelling():
-            self._ping_loop.cancel()
+                # Yield the response
+                yield webcast_response
 
-        if not self._ping_loop.done():
-            await self._ping_loop
+                # If not connected, break
+                if not self.connected:
+                    break
 
-        # Reset internal state
-        self._ping_loop = None
-        self._connection_generator = None
+        # Stop the ping & writer tasks however the connection ended (closed, errored or cancelled)
+        finally:
+            await self.stop_ping_loop()
+            await self.stop_writer()
+
+            # Reset internal state
+            self._connection_generator = None
+
+    def restart_writer(self) -> None:
+        """
+        Restart the writer task & its outbound queue
+
+        """
+
+        if self._writer_task:
+            self._writer_task.cancel()
+
+        self._outbound = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._writer_fn(self._outbound))
+
+    async def stop_writer(self) -> None:
+        """
+        Stop the writer task, discarding anything still queued (the WebSocket is closed at this point)
+
+        """
+
+        if self._writer_task is None:
+            return
+
+        self._writer_task.cancel()
+
+        try:
+            await self._writer_task
+        except asyncio.CancelledError:
+            pass
+        except Exception as ex:
+            # The connection's own error (if any) is the one that matters, don't mask it from the `finally` of connect()
+            self._logger.debug(f"Writer task ended with an error: {ex!r}")
+
+        self._writer_task = None
+        self._outbound = None
+
+    async def _writer_fn(self, outbound: asyncio.Queue) -> None:
+        """
+        Write queued messages (acks & pings) to the WebSocket, in order
+
+        """
+
+        message: Union[bytes, Message]
+        queued_at: float
+        is_ack: bool
+
+        try:
+            while True:
+                message, queued_at, is_ack = await outbound.get()
+
+                try:
+                    await self.send(message=message)
+                except ConnectionClosed:
+                    # The reader sees the close too & ends the connection, nothing more can be written
+                    self._logger.debug("WebSocket closed, stopping the writer task.")
+                    return
+                except Exception as ex:
+                    # Keep the writer alive, otherwise acks & pings pile up in the queue unsent
+                    self._logger.error(f"Failed to send a queued message: {ex!r}")
+                    continue
+
+                if not is_ack:
+                    continue
+
+                latency: float = time.monotonic() - queued_at
+                self._acks_sent += 1
+                self._ack_latency_total += latency
+                self._ack_latency_max = max(self._ack_latency_max, latency)
+
+        except asyncio.CancelledError:
+            self._logger.debug("Writer task cancelled.")
+            raise
 
     def restart_ping_loop(self) -> None:
         """
@@ -256,6 +445,25 @@ class WebcastWSClient:
 
         self._ping_loop = asyncio.create_task(self._ping_loop_fn())
 
+    async def stop_ping_loop(self) -> None:
+        """
+        Stop the WebSocket ping loop & wait for it
+
+        """
+
+        if self._ping_loop is None:
+            return
+
+        if not self._ping_loop.done():
+            self._ping_loop.cancel()
+
+        try:
+            await self._ping_loop
+        except asyncio.CancelledError:
+            pass
+
+        self._ping_loop = None
+
     async def _ping_loop_fn(self) -> None:
         """
         Send a ping every 10 seconds to keep the connection alive
@@ -270,8 +478,8 @@ class WebcastWSClient:
         try:
             while self.connected:
 
-                # Send the ping
-                await self.send(message=self.PING_MESSAGE)
+                # Queue the ping for the writer
+                self.queue_send(message=self.PING_MESSAGE)
 
                 # Every 10 seconds
                 await asyncio.sleep(self.DEFAULT_PING_INTERVAL)
@@ -1,5 +1,8 @@
+import asyncio
 import logging
-from typing import Optional, Tuple, Union, Type, AsyncIterator, Dict, Any
+import time
+from concurrent.futures import Executor
+from typing import Optional, Tuple, Union, Type, AsyncIterator, Dict, Any, Callable, AbstractSet
 
 import httpx
 from python_socks import ProxyType, parse_proxy_url
@@ -9,8 +12,12 @@ from websockets_proxy import websockets_proxy
 from websockets_proxy.websockets_proxy import ProxyConnect
 
 from TikTokLive.client.errors import WebcastBlocked200Error
-from TikTokLive.client.ws.ws_utils import extract_webcast_response_message, build_webcast_uri
+from TikTokLive.client.instrumentation import Instrumentation, Stage
+from TikTokLive.client.ws.ws_sink import RawFrameSink
+from TikTokLive.client.ws.ws_utils import extract_webcast_response_message, build_webcast_uri, decode_webcast_push_frame, \
+    extract_webcast_push_frame
 from TikTokLive.proto import WebcastResponse, WebcastPushFrame
+from TikTokLive.proto.codec import ProtoCodec
 
 """Type hint for a WebcastProxy, which can be either an HTTPX Proxy or a Websockets Proxy"""
 WebcastProxy: Type = Union[httpx.Proxy, websockets_proxy.Proxy]
@@ -19,8 +26,9 @@ WebcastProxy: Type = Union[httpx.Proxy, websockets_proxy.Proxy]
 Type hint for a WebcastIterator, which yields a tuple of WebcastPushFrame and WebcastResponse.
 WebcastPushFrame is Optional because the first yielded item is from the initial response
 which is from /im/fetch (from the sign server), so it is not encapsulated by a WebcastPushFrame.
+WebcastResponse is Optional because it is not decoded when frames are only being archived (decode_frames=False).
 """
-WebcastIterator: Type = AsyncIterator[Tuple[Optional[WebcastPushFrame], WebcastResponse]]
+WebcastIterator: Type = AsyncIterator[Tuple[Optional[WebcastPushFrame], Optional[WebcastResponse]]]
 
 
 class WebcastConnect(Connect):
@@ -32,6 +40,12 @@ class WebcastConnect(Connect):
             base_uri_params: Dict[str, Any],
             base_uri_append_str: str,
             uri: Optional[str] = None,
+            decode_executor: Optional[Executor] = None,
+            raw_frame_sink: Optional[RawFrameSink] = None,
+            decode_frames: bool = True,
+            proto_codec: ProtoCodec = ProtoCodec.BETTERPROTO,
+            method_filter: Optional[Callable[[], Optional[AbstractSet[str]]]] = None,
+            instrumentation: Optional[Instrumentation] = None,
             **kwargs
     ):
 
@@ -47,6 +61,12 @@ class WebcastConnect(Connect):
         self.logger = self._logger = logger
         self._ws: Optional[WebSocketClientProtocol] = None
         self._initial_response: WebcastResponse = initial_webcast_response
+        self._decode_executor: Optional[Executor] = decode_executor
+        self._raw_frame_sink: Optional[RawFrameSink] = raw_frame_sink
+        self._decode_frames: bool = decode_frames
+        self._proto_codec: ProtoCodec = proto_codec
+        self._method_filter: Optional[Callable[[], Optional[AbstractSet[str]]]] = method_filter
+        self._instrumentation: Optional[Instrumentation] = instrumentation
 
     @property
     def ws(self) -> Optional[WebSocketClientProtocol]:
@@ -76,22 +96,41 @@ class WebcastConnect(Connect):
                     # Yield the first WebcastResponse
                     if first_connect:
                         first_connect = False
+
+                        # Archive it in a push frame, as it would have come from the WebSocket
+                        if self._raw_frame_sink is not None:
+                            self._raw_frame_sink(bytes(WebcastPushFrame(payload_type="msg", payload=bytes(self._initial_response))), time.time_ns())
+
+                        # In archive-only mode the initial messages are archived, not emitted
+                        if not self._decode_frames:
+                            self._initial_response.messages = []
+
                         yield None, self._initial_response
 
                     # "async for" yields "WebcastPushFrame" payloads as unparsed bytes
                     async for payload_bytes in protocol:
 
-                        # Extract push frame
-                        webcast_push_frame: WebcastPushFrame = WebcastPushFrame().parse(payload_bytes)
+                        # Hand the frame to the sink as-is
+                        if self._raw_frame_sink is not None:
+                            self._raw_frame_sink(payload_bytes, time.time_ns())
+
+                        if self._instrumentation is not None:
+                            self._instrumentation.record_frame(len(payload_bytes), time.time())
+
+                        # Archive-only mode, only the envelope is parsed (for the ack)
+                        if not self._decode_frames:
+                            yield extract_webcast_push_frame(payload_bytes, codec=self._proto_codec), None
+                            continue
+
+                        # Extract push frame & the WebcastResponse within
+                        webcast_push_frame, webcast_response = await self._decode_push_frame(payload_bytes)
 
                         # Only deal with messages
-                        if webcast_push_frame.payload_type != "msg":
+                        if webcast_response is None:
                             webcast_push_frame.payload = extract_webcast_response_message(webcast_push_frame, logger=self._logger)
-                            self._logger.debug(f"Received payload of type '{webcast_push_frame.payload_type}', not 'msg': {webcast_push_frame}")
+                            self._logger.debug("Received payload of type '%s', not 'msg': %s", webcast_push_frame.payload_type, webcast_push_frame)
                             continue
 
-                        # If it is of type msg, we can extract the WebcastResponse item within
-                        webcast_response: WebcastResponse = extract_webcast_response_message(webcast_push_frame, logger=self._logger)
                         yield webcast_push_frame, webcast_response
 
             except InvalidStatusCode as ex:
@@ -102,6 +141,44 @@ class WebcastConnect(Connect):
             finally:
                 self._ws = None
 
+    async def _decode_push_frame(self, payload_bytes: bytes) -> Tuple[WebcastPushFrame, Optional[WebcastResponse]]:
+        """
+        Decode a raw WebSocket payload, on the decode executor if one was provided. Frames are awaited one at a time,
+        so they come back in the order they were received. If there is a method filter, it is checked per frame
+        (listeners can change at any time) & only the wanted messages are decoded.
+
+        :param payload_bytes: The raw WebSocket payload
+        :return: The push frame, and its WebcastResponse if the frame is of type 'msg'
+
+        """
+
+        methods: Optional[AbstractSet[str]] = self._method_filter() if self._method_filter is not None else None
+
+        if self._decode_executor is None:
+            return decode_webcast_push_frame(payload_bytes, self._proto_codec, methods, self._instrumentation)
+
+        if self._instrumentation is None:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._decode_executor,
+                decode_webcast_push_frame,
+                payload_bytes,
+                self._proto_codec,
+                methods
+            )
+
+        # The hooks can't be shipped to the executor, so the round trip is timed as a whole
+        started_at: float = time.perf_counter()
+        decoded: Tuple[WebcastPushFrame, Optional[WebcastResponse]] = await asyncio.get_running_loop().run_in_executor(
+            self._decode_executor,
+            decode_webcast_push_frame,
+            payload_bytes,
+            self._proto_codec,
+            methods
+        )
+
+        self._instrumentation.record(Stage.PARSE, WebcastResponse.__name__, time.perf_counter() - started_at)
+        return decoded
+
 
 class WebcastProxyConnect(ProxyConnect, WebcastConnect):
     """
@@ -0,0 +1,180 @@
+import os
+import struct
+from pathlib import Path
+from typing import Callable, Type, Union, Iterator, Tuple, BinaryIO, Optional
+
+"""
+Type hint for a RawFrameSink, which receives every raw WebcastPushFrame payload as it comes off the WebSocket,
+before any decompression or parsing, along with the receive time in nanoseconds since the epoch.
+"""
+RawFrameSink: Type = Callable[[bytes, int], None]
+
+
+class FileFrameSink:
+    """
+    Append-only RawFrameSink that writes length-prefixed frame records to a file with buffered writes.
+
+    The file starts with a magic header, followed by one record per frame:
+    an 8-byte little-endian receive timestamp (ns), a 4-byte little-endian length, then the raw frame bytes.
+    Read it back with `read_frame_file`. Reopening an archive continues it, after dropping a partial last record.
+
+    """
+
+    MAGIC: bytes = b"TTLF\x01"
+    RECORD_HEADER: struct.Struct = struct.Struct("<qI")
+
+    def __init__(
+            self,
+            path: Union[str, os.PathLike],
+            buffer_size: int = 1024 * 1024
+    ):
+        """
+        Open (or continue) a frame archive
+
+        :param path: The path of the archive file
+        :param buffer_size: The write buffer size in bytes
+
+        """
+
+        self._path: Path = Path(path)
+        is_new: bool = not self._path.exists() or self._path.stat().st_size == 0
+
+        if not is_new:
+            with open(self._path, "r+b") as file:
+                if file.read(len(self.MAGIC)) != self.MAGIC:
+                    raise ValueError(f"'{self._path}' is not a TikTokLive frame archive.")
+
+                # Drop a record cut off by a crash, otherwise new records would be read as part of it
+                complete_size: int = self._complete_size(file)
+
+                if complete_size < self._path.stat().st_size:
+                    file.truncate(complete_size)
+
+        self._file: Optional[BinaryIO] = open(self._path, "ab", buffering=buffer_size)
+        self._frames_written: int = 0
+        self._bytes_written: int = 0
+
+        if is_new:
+            self._file.write(self.MAGIC)
+
+    @classmethod
+    def _complete_size(cls, file: BinaryIO) -> int:
+        """
+        Walk the records of an archive, from just after its magic header
+
+        :param file: The archive, positioned after the magic header
+        :return: The offset of the end of the last complete record
+
+        """
+
+        complete_size: int = file.tell()
+
+        while len(header := file.read(cls.RECORD_HEADER.size)) == cls.RECORD_HEADER.size:
+            _, length = cls.RECORD_HEADER.unpack(header)
+
+            # Seek past the payload, stopping if it runs past the end of the file
+            if file.seek(length, os.SEEK_CUR) > os.fstat(file.fileno()).st_size:
+                break
+
+            complete_size = file.tell()
+
+        return complete_size
+
+    def __call__(self, payload: bytes, received_at_ns: int) -> None:
+        """
+        Append a frame to the archive
+
+        :param payload: The raw WebcastPushFrame bytes
+        :param received_at_ns: The receive time, in nanoseconds since the epoch
+        :return: None
+
+        """
+
+        self._file.write(self.RECORD_HEADER.pack(received_at_ns, len(payload)))
+        self._file.write(payload)
+        self._frames_written += 1
+        self._bytes_written += self.RECORD_HEADER.size + len(payload)
+
+    def __enter__(self) -> "FileFrameSink":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    @property
+    def path(self) -> Path:
+        """
+        The path of the archive file
+
+        """
+
+        return self._path
+
+    @property
+    def frames_written(self) -> int:
+        """
+        The number of frames written by this sink
+
+        """
+
+        return self._frames_written
+
+    @property
+    def bytes_written(self) -> int:
+        """
+        The number of bytes written by this sink, including record headers
+
+        """
+
+        return self._bytes_written
+
+    def flush(self) -> None:
+        """
+        Flush buffered records to the file
+
+        :return: None
+
+        """
+
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        """
+        Flush & close the archive
+
+        :return: None
+
+        """
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_frame_file(path: Union[str, os.PathLike]) -> Iterator[Tuple[int, bytes]]:
+    """
+    Read the frames from an archive written by `FileFrameSink`
+
+    :param path: The path of the archive file
+    :return: Yields (receive timestamp in ns, raw WebcastPushFrame bytes) pairs
+
+    """
+
+    with open(path, "rb") as file:
+        if file.read(len(FileFrameSink.MAGIC)) != FileFrameSink.MAGIC:
+            raise ValueError(f"'{path}' is not a TikTokLive frame archive.")
+
+        while header := file.read(FileFrameSink.RECORD_HEADER.size):
+
+            # A partial record means the writer was interrupted mid-write
+            if len(header) < FileFrameSink.RECORD_HEADER.size:
+                return
+
+            received_at_ns, length = FileFrameSink.RECORD_HEADER.unpack(header)
+            payload: bytes = file.read(length)
+
+            if len(payload) < length:
+                return
+
+            yield received_at_ns, payload
@@ -1,10 +1,17 @@
 import logging
-from gzip import GzipFile
-from io import BytesIO
+import time
+import zlib
+from typing import Tuple, Optional, AbstractSet, List
 
 from TikTokLive.client.errors import InitialCursorMissingError, WebsocketURLMissingError
+from TikTokLive.client.instrumentation import Instrumentation, Stage
 from TikTokLive.client.logger import TikTokLiveLogHandler
-from TikTokLive.proto import WebcastPushFrame, WebcastResponse
+from TikTokLive.proto import WebcastPushFrame, WebcastResponse, WebcastResponseMessage
+from TikTokLive.proto.codec import ProtoCodec, parse_message
+from TikTokLive.proto.proto_wire import iter_fields, scan_message_method, RESPONSE_MESSAGES_FIELD, WIRE_LEN_DELIM
+
+"""zlib window bits that select the gzip container format (header + CRC32 trailer)"""
+GZIP_WBITS: int = zlib.MAX_WBITS | 16
 
 
 def build_webcast_uri(
@@ -52,7 +59,11 @@ def build_webcast_uri(
     return connect_uri
 
 
-def extract_webcast_push_frame(data: bytes, logger: logging.Logger = TikTokLiveLogHandler.get_logger()) -> WebcastPushFrame:
+def extract_webcast_push_frame(
+        data: bytes,
+        logger: logging.Logger = TikTokLiveLogHandler.get_logger(),
+        codec: ProtoCodec = ProtoCodec.BETTERPROTO
+) -> WebcastPushFrame:
     """
     Extract a WebcastPushFrame from a raw byte payload. This method will parse the payload
     and return a WebcastPushFrame object. This method is useful for extracting push frames
@@ -60,15 +71,49 @@ def extract_webcast_push_frame(data: bytes, logger: logging.Logger = TikTokLiveL
 
     :param data: Raw byte payload to extract from
     :param logger: Logger to use for logging
+    :param codec: The codec to decode the push frame with
     :return: WebcastPushFrame The extracted push frame
 
     """
 
     # Parse the push frame from the raw byte payload
-    return WebcastPushFrame().parse(data)
+    return parse_message(WebcastPushFrame, data, codec)
+
+
+def decode_webcast_push_frame(
+        data: bytes,
+        codec: ProtoCodec = ProtoCodec.BETTERPROTO,
+        methods: Optional[AbstractSet[str]] = None,
+        instrumentation: Optional[Instrumentation] = None
+) -> Tuple[WebcastPushFrame, Optional[WebcastResponse]]:
+    """
+    Decode a raw WebSocket payload into its WebcastPushFrame & (if it is of type 'msg') the WebcastResponse within.
+    This is a module-level function taking & returning picklable values so that it can be run in an executor.
+
+    :param data: Raw byte payload received from the WebSocket
+    :param codec: The codec to decode the frame with
+    :param methods: If set, only the WebcastResponseMessages with these methods are decoded (see `parse_webcast_response`)
+    :param instrumentation: Optional hooks to time the decompression & parsing with (not when run in an executor)
+    :return: The push frame, and its WebcastResponse if the frame is of type 'msg'
+
+    """
+
+    webcast_push_frame: WebcastPushFrame = extract_webcast_push_frame(data, codec=codec)
+
+    # Only 'msg' frames contain a WebcastResponse
+    if webcast_push_frame.payload_type != "msg":
+        return webcast_push_frame, None
 
+    return webcast_push_frame, extract_webcast_response_message(webcast_push_frame, codec=codec, methods=methods, instrumentation=instrumentation)
 
-def extract_webcast_response_message(push_frame: WebcastPushFrame, logger: logging.Logger = TikTokLiveLogHandler.get_logger()) -> WebcastResponse:
+
+def extract_webcast_response_message(
+        push_frame: WebcastPushFrame,
+        logger: logging.Logger = TikTokLiveLogHandler.get_logger(),
+        codec: ProtoCodec = ProtoCodec.BETTERPROTO,
+        methods: Optional[AbstractSet[str]] = None,
+        instrumentation: Optional[Instrumentation] = None
+) -> WebcastResponse:
     """
     Extract the WebcastResponse from a push frame. If compression is enabled on the WebSocket,
     then messages will come gzipped. This method will decompress the payload if necessary.
@@ -76,27 +121,109 @@ def extract_webcast_response_message(push_frame: WebcastPushFrame, logger: loggi
 
     :param push_frame: Push frame to extract from
     :param logger: Logger to use for logging
+    :param codec: The codec to decode the response with
+    :param methods: If set, only the WebcastResponseMessages with these methods are decoded
+    :param instrumentation: Optional hooks to time the decompression & parsing with
     :return: WebcastResponse The extracted response
 
     """
 
-    # If there is no compression header, return the payload parsed as-is
-    if not push_frame.headers or 'compress_type' not in push_frame.headers or push_frame.headers['compress_type'] == 'none':
-        return WebcastResponse().parse(push_frame.payload)
+    payload: bytes = push_frame.payload
+    compress_type: Optional[str] = push_frame.headers.get('compress_type', None) if push_frame.headers else None
+
+    # If the compress type is gzip, we need to decompress the payload
+    if compress_type == 'gzip':
+        if instrumentation is None:
+            payload = decompress_gzip_payload(payload)
+        else:
+            started_at: float = time.perf_counter()
+            payload = decompress_gzip_payload(payload)
+            instrumentation.record(Stage.DECOMPRESS, compress_type, time.perf_counter() - started_at)
 
     # If there is a compression type, but it's NOT gzip (should never happen, if it does, represents a TikTok update)
-    if push_frame.headers.get('compress_type', None) != 'gzip':
-        logger.error(f"Unknown compression type: {push_frame.headers.get('compress_type', None)}")
-        return WebcastResponse().parse(push_frame.payload)  # Just pray it works
+    elif compress_type not in (None, 'none'):
+        logger.error(f"Unknown compression type: {compress_type}")  # Parse it as-is & just pray it works
 
-    # If the compress type is gzip, we need to decompress the payload
-    gzip_file = GzipFile(fileobj=BytesIO(push_frame.payload))
+    if instrumentation is None:
+        return parse_webcast_response(payload, codec, methods)
+
+    # Parse the response from the (decompressed) data
+    parse_started_at: float = time.perf_counter()
+    webcast_response: WebcastResponse = parse_webcast_response(payload, codec, methods)
+    instrumentation.record(Stage.PARSE, WebcastResponse.__name__, time.perf_counter() - parse_started_at)
+    return webcast_response
+
+
+def parse_webcast_response(
+        data: bytes,
+        codec: ProtoCodec = ProtoCodec.BETTERPROTO,
+        methods: Optional[AbstractSet[str]] = None
+) -> WebcastResponse:
+    """
+    Parse a WebcastResponse. If methods are given, the messages are routed on the wire first & only those
+    with a wanted method are decoded. The rest are skipped without building any objects for them.
+
+    :param data: The serialized WebcastResponse
+    :param codec: The codec to decode the response with
+    :param methods: The WebcastResponseMessage methods to keep, or None to keep them all
+    :return: The WebcastResponse
+
+    """
+
+    if methods is None:
+        return parse_message(WebcastResponse, data, codec)
+
+    # Split the envelope (cursor, ack info, etc.) from the wanted messages
+    view: memoryview = memoryview(data)
+    envelope: bytearray = bytearray()
+    messages: List[memoryview] = []
+
+    for number, wire_type, value, start, end in iter_fields(view):
+        if number != RESPONSE_MESSAGES_FIELD or wire_type != WIRE_LEN_DELIM:
+            envelope += view[start:end]
+        elif scan_message_method(value)[0] in methods:
+            messages.append(value)
+
+    webcast_response: WebcastResponse = parse_message(WebcastResponse, bytes(envelope), codec)
+    webcast_response.messages = [parse_message(WebcastResponseMessage, bytes(message), codec) for message in messages]
+    return webcast_response
+
+
+def decompress_gzip_payload(payload: bytes) -> bytes:
+    """
+    Decompress a gzip payload with zlib directly. Unlike wrapping the payload in a `BytesIO` & `GzipFile`, this
+    does not copy the payload or allocate file objects per frame. The payload is read through a memoryview.
+    Concatenated gzip members are supported, matching the behaviour of `GzipFile.read`.
+
+    :param payload: The gzip-compressed payload
+    :return: The decompressed bytes
+
+    """
+
+    view: memoryview = memoryview(payload)
+    decompressor = zlib.decompressobj(GZIP_WBITS)
+    decompressed_bytes: bytes = decompressor.decompress(view)
+
+    # Same failure mode as GzipFile for a truncated payload
+    if not decompressor.eof:
+        raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+
+    # Single member (the norm for TikTok), nothing left to read
+    if not decompressor.unused_data:
+        return decompressed_bytes
+
+    # Multi-member payloads need one decompressor per member
+    chunks: list = [decompressed_bytes]
+    remaining: bytes = decompressor.unused_data
+
+    while remaining:
+        decompressor = zlib.decompressobj(GZIP_WBITS)
+        chunks.append(decompressor.decompress(remaining))
+
+        # Every member must be complete, not just the first
+        if not decompressor.eof:
+            raise EOFError("Compressed file ended before the end-of-stream marker was reached")
 
-    # Decompress it
-    try:
-        decompressed_bytes = gzip_file.read()
-    finally:
-        gzip_file.close()
+        remaining = decompressor.unused_data
 
-    # Parse the response from the decompressed data
-    return WebcastResponse().parse(decompressed_bytes)
+    return b"".join(chunks)
@@ -1,13 +1,42 @@
 import base64
+from dataclasses import dataclass
 from typing import Optional
 
 
+@dataclass(frozen=True)
+class EventLag:
+    """
+    How far behind TikTok's server an event was received & dispatched, in seconds (see `LagTracker`)
+
+    """
+
+    receive: float
+    """From the server creating the event (common.create_time) to the client receiving its WebcastResponse"""
+
+    dispatch: float
+    """From the server creating the event to the client dispatching it to the handlers"""
+
+
 class BaseEvent:
     """
     Base event emitted from the TikTokLiveClient
 
     """
 
+    def __init_subclass__(cls, **kwargs):
+        """
+        Give every event class built directly on a message its own betterproto metadata slot. betterproto caches the metadata
+        on the class it was first built for, so an event would otherwise inherit its message's (e.g. WebcastChatMessage's)
+        if that message was used first, and its `User` fields would be parsed as plain `User` instead of `ExtendedUser`.
+        Events derived from another event (e.g. FollowEvent) keep sharing their parent's.
+
+        """
+
+        super().__init_subclass__(**kwargs)
+
+        if not any(base is not BaseEvent and issubclass(base, BaseEvent) for base in cls.__bases__):
+            cls._betterproto_meta = None
+
     @property
     def type(self) -> str:
         """
@@ -58,3 +87,14 @@ class BaseEvent:
         """
 
         return len(self.bytes) if self.bytes else -1
+
+    @property
+    def lag(self) -> Optional[EventLag]:
+        """
+        The lag of the event, if the client tracks lag with stamping enabled & the event has a server timestamp
+
+        :return: The lag, or None
+
+        """
+
+        return self.__dict__.get("_lag")
@@ -2,11 +2,11 @@ from __future__ import annotations
 
 import base64
 from dataclasses import dataclass
-from typing import Type, Union, Optional
+from typing import Type, Union, Optional, List
 
 from TikTokLive.events.base_event import BaseEvent
-from TikTokLive.events.proto_events import SocialEvent, ControlEvent
-from TikTokLive.proto import WebcastResponseMessage
+from TikTokLive.events.proto_events import SocialEvent, ControlEvent, RoomUserSeqEvent
+from TikTokLive.proto import WebcastResponseMessage, ExtendedUser, ExtendedGiftStruct
 
 
 class WebsocketResponseEvent(WebcastResponseMessage, BaseEvent):
@@ -15,6 +15,26 @@ class WebsocketResponseEvent(WebcastResponseMessage, BaseEvent):
 
     """
 
+    @classmethod
+    def from_message(cls, message: WebcastResponseMessage) -> WebsocketResponseEvent:
+        """
+        Wrap a WebcastResponseMessage in the event class. The fields (including the payload) are shared
+        with the original message rather than copied through a to_dict/from_dict round-trip.
+
+        :param message: The message to wrap
+        :return: The event
+
+        """
+
+        return cls(
+            method=message.method,
+            payload=message.payload,
+            msg_id=message.msg_id,
+            msg_type=message.msg_type,
+            offset=message.offset,
+            is_history=message.is_history
+        )
+
 
 class UnknownEvent(WebsocketResponseEvent):
     """
@@ -35,6 +55,133 @@ class ConnectEvent(BaseEvent):
     room_id: int
 
 
+@dataclass()
+class ReconnectEvent(BaseEvent):
+    """
+    Thrown when a resumable session reconnects to the stream after the WebSocket dropped
+
+    """
+
+    unique_id: str
+    room_id: int
+    attempts: int
+    """The number of attempts it took to reconnect"""
+
+    gap: float
+    """How long (in seconds) the client was disconnected for"""
+
+
+@dataclass()
+class GiftStreakProgressEvent(BaseEvent):
+    """
+    Thrown (at most once per `progress_interval`) while a gift streak is ongoing, if the GiftStreakAggregator is set to emit progress events (`progress_interval` is not None)
+
+    """
+
+    user: ExtendedUser
+    to_user: ExtendedUser
+    gift: ExtendedGiftStruct
+    group_id: int
+
+    repeat_count: int
+    """The number of gifts sent in the streak so far"""
+
+    diamond_count: int
+    """The diamonds sent in the streak so far"""
+
+    gift_events: int
+    """The number of GiftEvents merged into the streak so far"""
+
+    duration: float
+    """How long (in seconds) the streak has lasted so far"""
+
+    @property
+    def value(self) -> float:
+        """
+        Get the USD value of the streak
+
+        :return: The value of the gifts
+
+        """
+
+        return self.diamond_count * 0.005  # 0.005 is the conversion
+
+
+@dataclass()
+class GiftStreakEndEvent(GiftStreakProgressEvent):
+    """
+    Thrown once per gift by the GiftStreakAggregator, with the totals of the streak.
+    Gifts that can't streak end right away, with a single GiftEvent merged.
+
+    """
+
+    timed_out: bool = False
+    """Whether the streak never received its repeat_end, & was ended by a timeout, eviction or disconnect"""
+
+
+@dataclass()
+class LikeBatchEvent(BaseEvent):
+    """
+    Thrown once per window by the EventCoalescer, with the LikeEvents received in it
+
+    """
+
+    likes: int
+    """The number of likes sent in the window"""
+
+    total: int
+    """The total likes of the stream, as of the latest LikeEvent"""
+
+    unique_users: int
+    """The number of distinct users that liked in the window"""
+
+    events: int
+    """The number of LikeEvents merged"""
+
+    window: float
+    """How long (in seconds) the window lasted"""
+
+
+@dataclass()
+class JoinBatchEvent(BaseEvent):
+    """
+    Thrown once per window by the EventCoalescer, with the JoinEvents received in it
+
+    """
+
+    users: List[ExtendedUser]
+    """The distinct users that joined in the window, in order, up to the coalescer's `max_users`"""
+
+    unique_users: int
+    """The number of distinct users that joined in the window, including those past `max_users`"""
+
+    member_count: int
+    """The number of viewers, as of the latest JoinEvent"""
+
+    events: int
+    """The number of JoinEvents merged"""
+
+    window: float
+    """How long (in seconds) the window lasted"""
+
+
+@dataclass()
+class RoomUserSeqBatchEvent(BaseEvent):
+    """
+    Thrown once per window by the EventCoalescer, with the latest RoomUserSeqEvent received in it
+
+    """
+
+    latest: RoomUserSeqEvent
+    """The latest viewer count & ranking snapshot"""
+
+    events: int
+    """The number of RoomUserSeqEvents merged"""
+
+    window: float
+    """How long (in seconds) the window lasted"""
+
+
 class DisconnectEvent(BaseEvent):
     """
     Thrown when disconnecting from a stream
@@ -96,23 +243,35 @@ CustomEvent: Type = Union[
     WebsocketResponseEvent,
     UnknownEvent,
     ConnectEvent,
+    ReconnectEvent,
     FollowEvent,
     ShareEvent,
     LiveEndEvent,
     LivePauseEvent,
     LiveUnpauseEvent,
     DisconnectEvent,
+    GiftStreakProgressEvent,
+    GiftStreakEndEvent,
+    LikeBatchEvent,
+    JoinBatchEvent,
+    RoomUserSeqBatchEvent,
 ]
 
 __all__ = [
     "WebsocketResponseEvent",
     "UnknownEvent",
     "ConnectEvent",
+    "ReconnectEvent",
     "FollowEvent",
     "ShareEvent",
     "LiveEndEvent",
     "LivePauseEvent",
     "LiveUnpauseEvent",
     "CustomEvent",
-    "DisconnectEvent"
+    "DisconnectEvent",
+    "GiftStreakProgressEvent",
+    "GiftStreakEndEvent",
+    "LikeBatchEvent",
+    "JoinBatchEvent",
+    "RoomUserSeqBatchEvent"
 ]
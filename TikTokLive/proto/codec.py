@@ -0,0 +1,360 @@
+import enum
+from typing import Type, TypeVar, Dict, Tuple, List, Optional, Any, FrozenSet, Callable
+
+import betterproto
+
+from TikTokLive.proto.proto_wire import WIRE_VARINT, WIRE_FIXED_64, WIRE_FIXED_32, WIRE_LEN_DELIM, WIRE_END_GROUP
+
+try:
+    from google.protobuf import descriptor_pb2, descriptor_pool, message_factory, unknown_fields
+    from google.protobuf.descriptor import Descriptor, FieldDescriptor
+    from google.protobuf.internal import api_implementation
+
+    # The pure-python protobuf runtime is slower than betterproto, so only the C runtimes count
+    SUPPORTS_UPB: bool = api_implementation.Type() in ("upb", "cpp")
+except ImportError:
+    SUPPORTS_UPB: bool = False
+
+_MessageType: Type = TypeVar('_MessageType', bound=betterproto.Message)
+
+
+class ProtoCodec(enum.Enum):
+    """
+    The backend used to decode protobuf messages
+
+    """
+
+    BETTERPROTO = "betterproto"
+    """The pure-python betterproto runtime (default)"""
+
+    UPB = "upb"
+    """The C (upb) google.protobuf runtime for the hot messages, falling back to betterproto for everything else"""
+
+
+"""The messages decoded by the upb codec. These dominate the CPU time spent decoding."""
+UPB_MESSAGES: FrozenSet[str] = frozenset(
+    {
+        "WebcastPushFrame",
+        "WebcastResponse",
+        "WebcastChatMessage",
+        "WebcastGiftMessage",
+        "WebcastLikeMessage",
+        "WebcastMemberMessage",
+    }
+)
+
+# Field plan kinds
+_SCALAR, _REPEATED_SCALAR, _MESSAGE, _REPEATED_MESSAGE, _MAP, _MESSAGE_MAP = range(6)
+
+"""A field plan entry, (betterproto field name, protobuf field name, kind, betterproto message class)"""
+_FieldPlan: Type = Tuple[str, str, int, Optional[type]]
+
+
+class _MessagePlan:
+    """
+    How to build a betterproto message of one class, computed once per class
+
+    """
+
+    __slots__ = ("constants", "factories", "messages", "groups", "fields")
+
+    def __init__(self):
+        self.constants: Dict[str, Any] = {}
+        """Immutable default values (scalars & enums)"""
+
+        self.factories: List[Tuple[str, Callable[[], Any]]] = []
+        """Default value factories for mutable values (lists & dicts)"""
+
+        self.messages: List[Tuple[str, type]] = []
+        """Message fields, which default to an empty message"""
+
+        self.groups: Dict[str, Dict[Optional[str], Optional[str]]] = {}
+        """The oneof groups, mapping protobuf field names to betterproto field names"""
+
+        self.fields: Dict[str, List[_FieldPlan]] = {}
+        """The fields to copy from a upb message, by protobuf message name"""
+
+
+class _UpbCodec:
+    """
+    Decodes messages with the upb runtime & converts them into the existing betterproto classes,
+    so events, properties & listeners work the same regardless of the codec.
+
+    Message classes are built at runtime from the serialized FileDescriptorSet in tiktok_proto_descriptor.py,
+    which is compiled from the same sources as tiktok_proto.py.
+
+    Unknown fields are carried over into `_unknown_fields`, so messages re-serialize like their betterproto counterparts.
+    upb keeps them decoded rather than as raw bytes, so they are re-encoded canonically: the bytes only differ from
+    betterproto's for fields that were sent with non-minimal (overlong) varints.
+
+    """
+
+    def __init__(self):
+        from TikTokLive.proto.tiktok_proto_descriptor import FILE_DESCRIPTOR_SET
+
+        self._pool: descriptor_pool.DescriptorPool = descriptor_pool.DescriptorPool()
+
+        for file_proto in descriptor_pb2.FileDescriptorSet.FromString(FILE_DESCRIPTOR_SET).file:
+            self._pool.Add(file_proto)
+
+        self._pb_classes: Dict[type, Optional[type]] = {}
+        self._plans: Dict[type, _MessagePlan] = {}
+
+    def pb_class(self, message_type: Type[_MessageType]) -> Optional[type]:
+        """
+        Get the upb message class for a betterproto class (or a subclass of one, such as an event)
+
+        :param message_type: The betterproto class
+        :return: The upb class, or None if the message isn't decoded with upb
+
+        """
+
+        if message_type in self._pb_classes:
+            return self._pb_classes[message_type]
+
+        pb_class: Optional[type] = None
+
+        for base in message_type.__mro__:
+            if base.__name__ in UPB_MESSAGES:
+                pb_class = message_factory.GetMessageClass(self._pool.FindMessageTypeByName(base.__name__))
+                break
+
+        self._pb_classes[message_type] = pb_class
+        return pb_class
+
+    def parse(self, message_type: Type[_MessageType], data: bytes) -> Optional[_MessageType]:
+        """
+        Decode a message with upb
+
+        :param message_type: The betterproto class to decode into
+        :param data: The serialized message
+        :return: The message, or None if the message isn't decoded with upb
+
+        """
+
+        pb_class: Optional[type] = self.pb_class(message_type)
+
+        if pb_class is None:
+            return None
+
+        return self.convert(message_type, pb_class.FromString(data), bool(data))
+
+    def convert(self, message_type: Type[_MessageType], pb_message: Any, on_wire: bool) -> _MessageType:
+        """
+        Convert a upb message into a betterproto message without going through the dataclass __init__
+
+        :param message_type: The betterproto class
+        :param pb_message: The upb message
+        :param on_wire: Whether the message was present on the wire
+        :return: The betterproto message
+
+        """
+
+        plan: _MessagePlan = self._plan(message_type)
+        fields: List[_FieldPlan] = plan.fields.get(pb_message.DESCRIPTOR.full_name) or self._plan_fields(plan, message_type, pb_message.DESCRIPTOR)
+        message: _MessageType = self.default(message_type, plan, skip_messages=True)
+        values: Dict[str, Any] = message.__dict__
+
+        for name, pb_name, kind, sub_type in fields:
+            value = getattr(pb_message, pb_name)
+
+            if kind == _SCALAR:
+                values[name] = value
+            elif kind == _MESSAGE:
+                values[name] = self.convert(sub_type, value, True) if pb_message.HasField(pb_name) else self.default(sub_type)
+            elif kind == _REPEATED_SCALAR:
+                values[name] = list(value)
+            elif kind == _REPEATED_MESSAGE:
+                values[name] = [self.convert(sub_type, item, True) for item in value]
+            elif kind == _MAP:
+                values[name] = dict(value)
+            else:
+                values[name] = {key: self.convert(sub_type, item, True) for key, item in value.items()}
+
+        # Message fields the upb descriptor doesn't know about
+        for name, sub_type in plan.messages:
+            if name not in values:
+                values[name] = self.default(sub_type)
+
+        for group, field_names in plan.groups.items():
+            values["_group_current"][group] = field_names.get(pb_message.WhichOneof(group))
+
+        # Fields newer than the schema, kept so the message re-serializes as it was received
+        unknown: Any = unknown_fields.UnknownFieldSet(pb_message)
+
+        if len(unknown):
+            values["_unknown_fields"] = self._encode_unknown(unknown)
+
+        values["_serialized_on_wire"] = on_wire
+        return message
+
+    def default(self, message_type: Type[_MessageType], plan: Optional[_MessagePlan] = None, skip_messages: bool = False) -> _MessageType:
+        """
+        Build an empty message, equivalent to (but much cheaper than) message_type()
+
+        :param message_type: The betterproto class
+        :param plan: The plan of the class, if already known
+        :param skip_messages: Leave message fields unset, for the caller to fill in
+        :return: The empty message
+
+        """
+
+        plan = plan or self._plan(message_type)
+        message: _MessageType = message_type.__new__(message_type)
+        values: Dict[str, Any] = message.__dict__
+        values.update(plan.constants)
+
+        for name, factory in plan.factories:
+            values[name] = factory()
+
+        if not skip_messages:
+            for name, sub_type in plan.messages:
+                values[name] = self.default(sub_type)
+
+        values["_serialized_on_wire"] = False
+        values["_unknown_fields"] = b""
+        values["_group_current"] = dict.fromkeys(plan.groups)
+        return message
+
+    def _plan(self, message_type: type) -> _MessagePlan:
+        """
+        Get (or build, once) the plan for a betterproto class
+
+        :param message_type: The betterproto class
+        :return: The plan
+
+        """
+
+        if (plan := self._plans.get(message_type)) is not None:
+            return plan
+
+        # noinspection PyProtectedMember
+        meta = message_type()._betterproto
+        plan = _MessagePlan()
+
+        for name, default_gen in meta.default_gen.items():
+            if default_gen in (list, dict):
+                plan.factories.append((name, default_gen))
+            elif meta.meta_by_field_name[name].proto_type == betterproto.TYPE_MESSAGE:
+                plan.messages.append((name, meta.cls_by_field[name]))
+            else:
+                plan.constants[name] = default_gen()
+
+            if group := meta.meta_by_field_name[name].group:
+                plan.groups.setdefault(group, {})
+
+        self._plans[message_type] = plan
+        return plan
+
+    def _plan_fields(self, plan: _MessagePlan, message_type: type, descriptor: "Descriptor") -> List[_FieldPlan]:
+        """
+        Build (once) the fields to copy from a upb message onto a betterproto class, matched by field number
+
+        :param plan: The plan of the betterproto class
+        :param message_type: The betterproto class
+        :param descriptor: The upb message descriptor
+        :return: The field plan
+
+        """
+
+        # noinspection PyProtectedMember
+        meta = message_type()._betterproto
+        fields: List[_FieldPlan] = []
+
+        for field in descriptor.fields:
+            name: Optional[str] = meta.field_name_by_number.get(field.number)
+
+            if name is None:
+                continue
+
+            is_message: bool = field.type == FieldDescriptor.TYPE_MESSAGE
+
+            if field.message_type is not None and field.message_type.GetOptions().map_entry:
+                is_message = field.message_type.fields_by_name["value"].type == FieldDescriptor.TYPE_MESSAGE
+                fields.append((name, field.name, _MESSAGE_MAP if is_message else _MAP, meta.cls_by_field.get(name + ".value")))
+            elif self._is_repeated(field):
+                fields.append((name, field.name, _REPEATED_MESSAGE if is_message else _REPEATED_SCALAR, meta.cls_by_field.get(name)))
+            else:
+                fields.append((name, field.name, _MESSAGE if is_message else _SCALAR, meta.cls_by_field.get(name)))
+
+            if field.containing_oneof is not None:
+                plan.groups.setdefault(field.containing_oneof.name, {})[field.name] = name
+
+        plan.fields[descriptor.full_name] = fields
+        return fields
+
+    @classmethod
+    def _encode_unknown(cls, unknown: Any) -> bytes:
+        """
+        Re-encode upb's unknown fields into wire format, in the order they were received
+
+        :param unknown: The UnknownFieldSet of a upb message
+        :return: The serialized fields
+
+        """
+
+        encoded: bytearray = bytearray()
+
+        for field in unknown:
+            encoded += betterproto.encode_varint(field.field_number << 3 | field.wire_type)
+
+            if field.wire_type == WIRE_VARINT:
+                encoded += betterproto.encode_varint(field.data)
+            elif field.wire_type == WIRE_FIXED_64:
+                encoded += field.data.to_bytes(8, "little")
+            elif field.wire_type == WIRE_FIXED_32:
+                encoded += field.data.to_bytes(4, "little")
+            elif field.wire_type == WIRE_LEN_DELIM:
+                encoded += betterproto.encode_varint(len(field.data)) + field.data
+            else:
+                # A (deprecated) group, nested unknown fields closed by an end-group tag
+                encoded += cls._encode_unknown(field.data)
+                encoded += betterproto.encode_varint(field.field_number << 3 | WIRE_END_GROUP)
+
+        return bytes(encoded)
+
+    @classmethod
+    def _is_repeated(cls, field: "FieldDescriptor") -> bool:
+        """Newer protobuf releases replace FieldDescriptor.label with is_repeated"""
+
+        if hasattr(field, "is_repeated"):
+            return field.is_repeated
+
+        return field.label == FieldDescriptor.LABEL_REPEATED
+
+
+_upb_codec: Optional[_UpbCodec] = None
+
+
+def get_upb_codec() -> Optional[_UpbCodec]:
+    """
+    Get the (lazily built) upb codec
+
+    :return: The codec, or None if the C protobuf runtime isn't installed
+
+    """
+
+    global _upb_codec
+
+    if _upb_codec is None and SUPPORTS_UPB:
+        _upb_codec = _UpbCodec()
+
+    return _upb_codec
+
+
+def parse_message(message_type: Type[_MessageType], data: bytes, codec: ProtoCodec = ProtoCodec.BETTERPROTO) -> _MessageType:
+    """
+    Decode a message with the given codec, falling back to betterproto for messages (or runtimes) upb doesn't cover
+
+    :param message_type: The betterproto class (or event class) to decode into
+    :param data: The serialized message
+    :param codec: The codec to use
+    :return: The decoded message
+
+    """
+
+    if codec == ProtoCodec.UPB and (upb_codec := get_upb_codec()) is not None:
+        if (message := upb_codec.parse(message_type, data)) is not None:
+            return message
+
+    return message_type().parse(data)
@@ -10,8 +10,8 @@ import betterproto
 
 from TikTokLive.proto import *
 from TikTokLive.proto import User, BadgeStruct
-from TikTokLive.proto.proto_utils import badge_match_user, SUBSCRIBER_BADGE_PATTERN, MODERATOR_BADGE_PATTERN, \
-    TOP_GIFTER_BADGE_PATTERN, MEMBER_LEVEL_BADGE_PATTERN, GIFTER_LEVEL_BADGE_PATTERN
+from TikTokLive.proto.proto_utils import badge_index_user, BadgeIndex, SUBSCRIBER_BADGE, MODERATOR_BADGE, \
+    TOP_GIFTER_BADGE, MEMBER_LEVEL_BADGE, GIFTER_LEVEL_BADGE
 
 # "MessageType" is a proto enum field.
 # This underscore is the difference between life & death, because if you shadow the proto field,
@@ -48,15 +48,24 @@ class ExtendedUser(User):
     @classmethod
     def from_user(cls, user: User, **kwargs) -> ExtendedUser:
         """
-        Convert a user to an ExtendedUser object
+        Get an ExtendedUser view of a user. The view shares the user's fields instead of copying them,
+        so it costs one object regardless of the user's badges & images, and changes show through both ways.
 
         :param user: Original user object
-        :param kwargs: Any kwargs to pass
+        :param kwargs: Any kwargs to pass to `to_dict`, to get an independent copy instead
         :return: ExtendedUser instance
 
         """
 
-        return ExtendedUser(**user.to_pydict(**kwargs))
+        if kwargs:
+            return ExtendedUser().from_dict(user.to_dict(**kwargs))
+
+        if isinstance(user, ExtendedUser):
+            return user
+
+        view: ExtendedUser = ExtendedUser.__new__(ExtendedUser)
+        view.__dict__ = user.__dict__
+        return view
 
     @property
     def unique_id(self) -> str:
@@ -83,6 +92,25 @@ class ExtendedUser(User):
 
         return (self.follow_info.follow_status or 0) >= 2
 
+    @property
+    def badge_index(self) -> BadgeIndex:
+        """
+        Retrieve the user's badges, classified in a single pass on first access & cached on the user.
+        The index is rebuilt if `badge_list` is reassigned, but not if it is modified in place.
+
+        :return: The first (badge, level) of each kind of badge the user has
+
+        """
+
+        # Kept out of the fields, so it is never serialized & doesn't mark the user as set
+        cached: Optional[Tuple[List[BadgeStruct], BadgeIndex]] = self.__dict__.get("_badge_index")
+
+        if cached is None or cached[0] is not self.badge_list:
+            cached = (self.badge_list, badge_index_user(user=self))
+            self.__dict__["_badge_index"] = cached
+
+        return cached[1]
+
     @property
     def subscriber_badge(self) -> Optional[BadgeStruct]:
         """
@@ -92,12 +120,8 @@ class ExtendedUser(User):
 
         """
 
-        matches: List[Tuple[re.Match, BadgeStruct]] = badge_match_user(
-            user=self,
-            p=SUBSCRIBER_BADGE_PATTERN
-        )
-
-        return matches[0] if matches else None
+        entry: Optional[Tuple[BadgeStruct, Optional[str]]] = self.badge_index.get(SUBSCRIBER_BADGE)
+        return entry[0] if entry else None
 
     @property
     def is_subscriber(self) -> bool:
@@ -108,7 +132,7 @@ class ExtendedUser(User):
 
         """
 
-        return bool(self.subscriber_badge)
+        return SUBSCRIBER_BADGE in self.badge_index
 
     @property
     def is_moderator(self) -> bool:
@@ -119,12 +143,7 @@ class ExtendedUser(User):
 
         """
 
-        return bool(
-            badge_match_user(
-                user=self,
-                p=MODERATOR_BADGE_PATTERN
-            )
-        )
+        return MODERATOR_BADGE in self.badge_index
 
     @property
     def is_top_gifter(self) -> bool:
@@ -135,12 +154,7 @@ class ExtendedUser(User):
 
         """
 
-        return bool(
-            badge_match_user(
-                user=self,
-                p=TOP_GIFTER_BADGE_PATTERN
-            )
-        )
+        return TOP_GIFTER_BADGE in self.badge_index
 
     @property
     def member_level(self) -> Optional[int]:
@@ -150,15 +164,8 @@ class ExtendedUser(User):
         :return: The parsed member level badge
         """
 
-        matches: list[tuple[re.Match, BadgeStruct]] = badge_match_user(
-            user=self,
-            p=MEMBER_LEVEL_BADGE_PATTERN
-        )
-
-        if len(matches) > 0:
-            return int(matches[0][0].group(1))
-
-        return None
+        entry: Optional[Tuple[BadgeStruct, Optional[str]]] = self.badge_index.get(MEMBER_LEVEL_BADGE)
+        return int(entry[1]) if entry else None
 
     @property
     def member_rank(self) -> Optional[str]:
@@ -169,15 +176,8 @@ class ExtendedUser(User):
 
         """
 
-        matches: list[tuple[re.Match, BadgeStruct]] = badge_match_user(
-            user=self,
-            p=MEMBER_LEVEL_BADGE_PATTERN
-        )
-
-        if len(matches) > 0:
-            return matches[0][1].combine.str
-
-        return None
+        entry: Optional[Tuple[BadgeStruct, Optional[str]]] = self.badge_index.get(MEMBER_LEVEL_BADGE)
+        return entry[0].combine.str if entry else None
 
     @property
     def gifter_level(self) -> Optional[int]:
@@ -188,15 +188,8 @@ class ExtendedUser(User):
 
         """
 
-        matches: list[tuple[re.Match, BadgeStruct]] = badge_match_user(
-            user=self,
-            p=GIFTER_LEVEL_BADGE_PATTERN
-        )
-
-        if len(matches) > 0:
-            return int(matches[0][1].combine.str)
-
-        return None
+        entry: Optional[Tuple[BadgeStruct, Optional[str]]] = self.badge_index.get(GIFTER_LEVEL_BADGE)
+        return int(entry[0].combine.str) if entry else None
 
 
 @proto_extension
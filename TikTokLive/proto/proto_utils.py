@@ -1,8 +1,11 @@
 import re
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Dict, Type, Iterator
 
 from TikTokLive.proto import User, BadgeStruct, BadgeStructBadgeDisplayType
 
+"""Type hint for a badge index, the first (badge, level) of each kind of badge"""
+BadgeIndex: Type = Dict[str, Tuple[BadgeStruct, Optional[str]]]
+
 
 def badge_match_user(user: User, p: re.Pattern) -> List[Tuple[re.Match, BadgeStruct]]:
     """
@@ -45,37 +48,66 @@ def badge_match(badge: BadgeStruct, p: re.Pattern) -> Optional[re.Match]:
 
     """
 
+    for string in badge_strings(badge=badge):
+        match: Optional[re.Match] = p.search(string=string)
+
+        if match:
+            return match
+
+    return None
+
+
+def badge_strings(badge: BadgeStruct) -> Iterator[str]:
+    """
+    Get the strings that identify ANY type of TikTok badge (its text and/or image URLs), in the order they are searched
+
+    :param badge: The badge
+    :return: The badge's strings
+
+    """
+
     if badge.display_type == BadgeStructBadgeDisplayType.BADGEDISPLAYTYPE_STRING:
-        match: Optional[re.Match] = p.search(string=badge.str.str)
-        return match
+        yield badge.str.str
 
-    if badge.display_type == BadgeStructBadgeDisplayType.BADGEDISPLAYTYPE_TEXT:
-        match: Optional[re.Match] = p.search(string=badge.text.default_pattern)
-        return match
+    elif badge.display_type == BadgeStructBadgeDisplayType.BADGEDISPLAYTYPE_TEXT:
+        yield badge.text.default_pattern
 
-    if badge.display_type == BadgeStructBadgeDisplayType.BADGEDISPLAYTYPE_IMAGE:
+    elif badge.display_type == BadgeStructBadgeDisplayType.BADGEDISPLAYTYPE_IMAGE:
+        yield from badge.image.image.url_list
 
-        for image_url in badge.image.image.url_list:
-            match: Optional[re.Match] = p.search(string=image_url)
-            if match:
-                return match
+    elif badge.display_type == BadgeStructBadgeDisplayType.BADGEDISPLAYTYPE_COMBINE:
+        yield badge.combine.str
+        yield from badge.combine.icon.url_list
 
-        return None
 
-    if badge.display_type == BadgeStructBadgeDisplayType.BADGEDISPLAYTYPE_COMBINE:
+def badge_index_user(user: User) -> BadgeIndex:
+    """
+    Classify all of a user's badges in a single pass over them, stopping looking for a kind once it is found
 
-        match: Optional[re.Match] = p.search(string=badge.combine.str)
-        if match:
-            return match
+    :param user: The user to analyze
+    :return: The first badge of each kind the user has, & the level it carries (if any), keyed by kind
 
-        for image_url in badge.combine.icon.url_list:
-            match: Optional[re.Match] = p.search(string=image_url)
-            if match:
-                return match
+    """
 
-        return None
+    index: BadgeIndex = {}
 
-    return None
+    for badge in user.badge_list:
+        for string in badge_strings(badge=badge):
+            for kind, pattern in BADGE_PATTERNS:
+
+                # The first badge of each kind wins, like the first match of `badge_match_user`
+                if kind in index:
+                    continue
+
+                match: Optional[re.Match] = pattern.search(string)
+
+                if match:
+                    index[kind] = (badge, match.group(1) if kind in LEVEL_BADGES else None)
+
+        if len(index) == len(BADGE_PATTERNS):
+            break
+
+    return index
 
 
 SUBSCRIBER_BADGE_PATTERN: re.Pattern = re.compile("/sub_")
@@ -83,3 +115,22 @@ MODERATOR_BADGE_PATTERN: re.Pattern = re.compile("moderator", flags=re.IGNORECAS
 TOP_GIFTER_BADGE_PATTERN: re.Pattern = re.compile("/new_top_gifter", flags=re.IGNORECASE)
 MEMBER_LEVEL_BADGE_PATTERN: re.Pattern = re.compile("fans_badge_icon_lv(\\d+)_v")
 GIFTER_LEVEL_BADGE_PATTERN: re.Pattern = re.compile("grade_badge_icon_lite_lv(\\d+)_v")
+
+"""The kinds of badge in a badge index"""
+SUBSCRIBER_BADGE: str = "subscriber"
+MODERATOR_BADGE: str = "moderator"
+TOP_GIFTER_BADGE: str = "top_gifter"
+MEMBER_LEVEL_BADGE: str = "member_level"
+GIFTER_LEVEL_BADGE: str = "gifter_level"
+
+"""The kinds of badge whose pattern captures a level"""
+LEVEL_BADGES: Tuple[str, ...] = (MEMBER_LEVEL_BADGE, GIFTER_LEVEL_BADGE)
+
+"""The pattern of each kind of badge, in the order they are tried"""
+BADGE_PATTERNS: Tuple[Tuple[str, re.Pattern], ...] = (
+    (SUBSCRIBER_BADGE, SUBSCRIBER_BADGE_PATTERN),
+    (MODERATOR_BADGE, MODERATOR_BADGE_PATTERN),
+    (TOP_GIFTER_BADGE, TOP_GIFTER_BADGE_PATTERN),
+    (MEMBER_LEVEL_BADGE, MEMBER_LEVEL_BADGE_PATTERN),
+    (GIFTER_LEVEL_BADGE, GIFTER_LEVEL_BADGE_PATTERN),
+)
@@ -0,0 +1,123 @@
+from typing import Tuple, Iterator, Union, Optional, Type
+
+"""Protobuf wire types"""
+WIRE_VARINT: int = 0
+WIRE_FIXED_64: int = 1
+WIRE_LEN_DELIM: int = 2
+WIRE_START_GROUP: int = 3
+WIRE_END_GROUP: int = 4
+WIRE_FIXED_32: int = 5
+
+"""Field numbers of WebcastResponse.messages & of WebcastResponseMessage.method/payload"""
+RESPONSE_MESSAGES_FIELD: int = 1
+MESSAGE_METHOD_FIELD: int = 1
+MESSAGE_PAYLOAD_FIELD: int = 2
+
+"""Type hint for a scanned field, (field number, wire type, value, start offset, end offset)"""
+ScannedField: Type = Tuple[int, int, Union[int, memoryview], int, int]
+
+
+def read_varint(data: memoryview, pos: int) -> Tuple[int, int]:
+    """
+    Read a varint from a buffer
+
+    :param data: The buffer
+    :param pos: The offset of the varint
+    :return: The value & the offset after the varint
+
+    """
+
+    result: int = 0
+    shift: int = 0
+
+    while True:
+        byte: int = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+
+        if not byte & 0x80:
+            return result, pos
+
+        shift += 7
+
+        if shift >= 70:
+            raise ValueError("Malformed varint, more than 10 bytes long.")
+
+
+def iter_fields(data: memoryview) -> Iterator[ScannedField]:
+    """
+    Walk the top-level fields of a serialized message without decoding them.
+    Length-delimited values are returned as memoryview slices of the buffer, so nothing is copied.
+
+    :param data: The serialized message
+    :return: Yields (field number, wire type, value, start offset, end offset) for each field
+
+    """
+
+    pos: int = 0
+    end: int = len(data)
+
+    while pos < end:
+        start: int = pos
+        key, pos = read_varint(data, pos)
+        number, wire_type = key >> 3, key & 0x7
+
+        if wire_type == WIRE_VARINT:
+            value, pos = read_varint(data, pos)
+        elif wire_type == WIRE_LEN_DELIM:
+            length, pos = read_varint(data, pos)
+            value = data[pos:pos + length]
+            pos += length
+        elif wire_type == WIRE_FIXED_64:
+            value = int.from_bytes(data[pos:pos + 8], "little")
+            pos += 8
+        elif wire_type == WIRE_FIXED_32:
+            value = int.from_bytes(data[pos:pos + 4], "little")
+            pos += 4
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type} for field {number}.")
+
+        if pos > end:
+            raise ValueError(f"Truncated message, field {number} runs past the end of the buffer.")
+
+        yield number, wire_type, value, start, pos
+
+
+def scan_message_method(message: memoryview) -> Tuple[Optional[str], Optional[memoryview]]:
+    """
+    Read the method & payload of a serialized WebcastResponseMessage
+
+    :param message: The serialized WebcastResponseMessage
+    :return: The method & the payload (as a memoryview), None for those missing
+
+    """
+
+    method: Optional[str] = None
+    payload: Optional[memoryview] = None
+
+    for number, wire_type, value, _, _ in iter_fields(message):
+        if wire_type != WIRE_LEN_DELIM:
+            continue
+
+        if number == MESSAGE_METHOD_FIELD:
+            method = str(value, "utf-8")
+        elif number == MESSAGE_PAYLOAD_FIELD:
+            payload = value
+
+    return method, payload
+
+
+def scan_webcast_response(data: Union[bytes, memoryview]) -> Iterator[Tuple[str, memoryview]]:
+    """
+    Walk a serialized WebcastResponse & yield the method & payload of each message,
+    without building any message objects. Use it to route messages before decoding them.
+
+    :param data: The serialized WebcastResponse
+    :return: Yields (method, payload) pairs. The payloads are memoryviews into `data`.
+
+    """
+
+    for number, wire_type, value, _, _ in iter_fields(memoryview(data)):
+        if number == RESPONSE_MESSAGES_FIELD and wire_type == WIRE_LEN_DELIM:
+            method, payload = scan_message_method(value)
+            yield method or "", payload if payload is not None else memoryview(b"")
@@ -0,0 +1,1107 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: data.proto, enums.proto, webcast.proto
+# Serialized FileDescriptorSet for the upb codec, see TikTokLive/proto/codec.py
+
+FILE_DESCRIPTOR_SET: bytes = bytes.fromhex(
+    "0afd310a0b656e756d732e70726f746f2a85010a0b417564697453746174757312160a124155444954535441545553554e4b4e4f574e1000"
+    "12130a0f415544495453544154555350415353100112150a1141554449545354415455534641494c4544100212180a144155444954535441"
+    "545553524556494557494e47100312180a144155444954535441545553464f5242494444454e10042a3a0a09456d6f74655479706512130a"
+    "0f454d4f5445545950454e4f524d414c100012180a14454d4f54455459504557495448535449434b455210012a5b0a0d436f6e74656e7453"
+    "6f7572636512180a14434f4e54454e54534f55524345554e4b4e4f574e100012170a13434f4e54454e54534f555243454e4f524d414c1001"
+    "12170a13434f4e54454e54534f5552434543414d45524110022a520a10456d6f74655072697661746554797065121d0a19454d4f54455f50"
+    "5249564154455f545950455f4e4f524d414c1000121f0a1b454d4f54455f505249564154455f545950455f5355425f5741564510012a290a"
+    "08546578745479706512100a0c444953504c41595f544558541000120b0a07434f4e54454e5410012a720a194c696e6b6d69634170706c69"
+    "6572536f727453657474696e6712250a214c494e4b4d49435f4150504c4945525f534f52545f53455454494e475f4e4f4e451000122e0a2a"
+    "4c494e4b4d49435f4150504c4945525f534f52545f53455454494e475f42595f474946545f53434f524510012a7c0a134c696e6b4d696342"
+    "6174746c6553746174757312170a13424154544c455f41524d595f554e4b4e4f574e100012100a0c41524d595f4f4e474f494e4710011211"
+    "0a0d41524d595f46494e4953484544100212120a0e424154544c455f4f4e474f494e47100412130a0f424154544c455f46494e4953484544"
+    "10052a2a0a10486173687461674e616d657370616365120a0a06474c4f42414c1000120a0a0647414d494e4710012a370a0b416772656553"
+    "746174757312110a0d41475245455f554e4b4e4f574e100012090a0541475245451001120a0a0652454a45435410022afd010a0d4b69636b"
+    "6f7574526561736f6e121a0a164b49434b4f55545f524541534f4e5f554e4b4e4f574e100012260a224b49434b4f55545f524541534f4e5f"
+    "46495253545f4652414d455f54494d454f55541001121a0a164b49434b4f55545f524541534f4e5f42595f484f5354100212260a224b4943"
+    "4b4f55545f524541534f4e5f5254435f4c4f53545f434f4e4e454354494f4e1003121c0a184b49434b4f55545f524541534f4e5f42595f50"
+    "554e4953481004121b0a174b49434b4f55545f524541534f4e5f42595f41444d494e100512290a254b49434b4f55545f524541534f4e5f48"
+    "4f53545f52454d4f56455f414c4c5f47554553545310062a5a0a0b47726f757053746174757312180a1447524f55505f5354415455535f55"
+    "4e4b4e4f574e100012180a1447524f55505f5354415455535f57414954494e47100112170a1347524f55505f5354415455535f4c494e4b45"
+    "4410032a83020a0c427573696e6573734361736512140a10425553494e4553535f4e4f545f534554100012150a114150504c595f42495a5f"
+    "434f4e54454e54100112160a12494e564954455f42495a5f434f4e54454e54100212150a115245504c595f42495a5f434f4e54454e541003"
+    "12160a125045524d49545f42495a5f434f4e54454e541004121b0a174a4f494e5f4449524543545f42495a5f434f4e54454e54100512180a"
+    "144b49434b5f4f55545f42495a5f434f4e54454e541006121b0a174c4953545f4348414e47455f42495a5f434f4e54454e54100b12160a12"
+    "4d554c54495f4c4956455f434f4e54454e54106412130a0e434f484f53545f434f4e54454e5410c8012aae080a0b5265706c795374617475"
+    "7312180a145245504c595f5354415455535f554e4b4e4f574e100012160a125245504c595f5354415455535f4147524545100112220a1e52"
+    "45504c595f5354415455535f5245465553455f504552534f4e414c4c59100212280a245245504c595f5354415455535f5245465553455f54"
+    "5950455f4e4f545f535550504f52541003122d0a295245504c595f5354415455535f5245465553455f50524f43455353494e475f494e5649"
+    "544154494f4e100412220a1e5245504c595f5354415455535f5245465553455f42595f54494d454f5554100512210a1d5245504c595f5354"
+    "415455535f5245465553455f455843455054494f4e1006122c0a285245504c595f5354415455535f5245465553455f53595354454d5f4e4f"
+    "545f535550504f525445441007122a0a265245504c595f5354415455535f5245465553455f535542545950455f444946464552454e434510"
+    "0812220a1e5245504c595f5354415455535f5245465553455f494e5f4d4943524f4f4d100912270a235245504c595f5354415455535f5245"
+    "465553455f4e4f545f4c4f41445f504c5547494e100a12260a225245504c595f5354415455535f5245465553455f494e5f4d554c54495f47"
+    "55455354100b12220a1e5245504c595f5354415455535f5245465553455f50415553455f4c495645100c12320a2e5245504c595f53544154"
+    "55535f5245465553455f4f50454e5f43414d4552415f4449414c4f475f53484f57494e47100d12250a215245504c595f5354415455535f52"
+    "45465553455f445241575f4755455353494e47100e12270a235245504c595f5354415455535f5245465553455f52414e444f4d5f4d415443"
+    "48494e47100f122b0a275245504c595f5354415455535f5245465553455f494e5f4d415443485f50524f43455353494e47101012330a2f52"
+    "45504c595f5354415455535f5245465553455f494e5f4d4943524f4f4d5f464f525f4d554c54495f434f484f5354101112270a235245504c"
+    "595f5354415455535f5245465553455f434f484f53545f46494e4953484544101212250a215245504c595f5354415455535f524546555345"
+    "5f4e4f545f434f4e4e4543544544101312240a205245504c595f5354415455535f5245465553455f4c494e4b4d49435f46554c4c10141228"
+    "0a245245504c595f5354415455535f5245465553455f4152435f494e434f4d50415449424c451015122f0a2b5245504c595f535441545553"
+    "5f5245465553455f50524f43455353494e475f4f544845525f494e564954451016122e0a2a5245504c595f5354415455535f524546555345"
+    "5f50524f43455353494e475f4f544845525f4150504c59101712280a245245504c595f5354415455535f5245465553455f494e5f414e4348"
+    "4f525f434f484f5354101812250a215245504c595f5354415455535f5245465553455f544f5049435f50414952494e4710192a5a0a0d5375"
+    "627363726962655479706512160a12535542534352494245545950455f4f4e4345100012160a12535542534352494245545950455f415554"
+    "4f100112190a15535542534352494245545950455f44454641554c5410642ac5010a124f6c64537562736372696265537461747573121c0a"
+    "184f4c445355425343524942455354415455535f46495253541000121c0a184f4c445355425343524942455354415455535f524553554210"
+    "0112270a234f4c445355425343524942455354415455535f535542494e4752414345504552494f441002122a0a264f4c4453554253435249"
+    "42455354415455535f5355424e4f54494e4752414345504552494f441003121e0a1a4f4c445355425343524942455354415455535f444546"
+    "41554c5410642afb010a115375627363726962696e67537461747573121d0a195355425343524942494e475354415455535f554e4b4e4f57"
+    "4e1000121a0a165355425343524942494e475354415455535f4f4e43451001121c0a185355425343524942494e475354415455535f434952"
+    "434c45100212220a1e5355425343524942494e475354415455535f434952434c4543414e43454c1003121c0a185355425343524942494e47"
+    "5354415455535f524546554e44100412230a1f5355425343524942494e475354415455535f494e4752414345504552494f44100512260a22"
+    "5355425343524942494e475354415455535f4e4f54494e4752414345504552494f4410062a710a0d4c696e6b6d6963537461747573120b0a"
+    "0744697361626c651000120a0a06456e61626c65100112120a0e4a7573745f466f6c6c6f77696e67100212110a0d4d756c74695f4c696e6b"
+    "696e67100312200a1c4d756c74695f4c696e6b696e675f4f6e6c795f466f6c6c6f77696e6710042a3e0a134d656d6265724d657373616765"
+    "416374696f6e120b0a07554e4b4e4f574e1000120a0a064a4f494e45441001120e0a0a5355425343524942454410032a790a0d436f6e7472"
+    "6f6c416374696f6e12180a14436f6e74726f6c416374696f6e554e4b4e4f574e100012110a0d53545245414d5f504155534544100112130a"
+    "0f53545245414d5f554e504155534544100212100a0c53545245414d5f454e444544100312140a1053545245414d5f53555350454e444544"
+    "10042abb030a144c696e6b4c617965724d6573736167655479706512120a0e4c696e6b65725f556e6b6e6f776e100012110a0d4c696e6b65"
+    "725f437265617465100112110a0d4c696e6b65725f496e76697465100212100a0c4c696e6b65725f4170706c79100312110a0d4c696e6b65"
+    "725f5065726d6974100412100a0c4c696e6b65725f5265706c79100512130a0f4c696e6b65725f4b69636b5f4f7574100612170a134c696e"
+    "6b65725f43616e63656c5f4170706c79100712180a144c696e6b65725f43616e63656c5f496e76697465100812100a0c4c696e6b65725f4c"
+    "65617665100912110a0d4c696e6b65725f46696e697368100a12160a124c696e6b65725f4c6973745f4368616e6765100b12160a124c696e"
+    "6b65725f4a6f696e5f446972656374100c12150a114c696e6b65725f4a6f696e5f47726f7570100d12170a134c696e6b65725f5065726d69"
+    "745f47726f7570100e12170a134c696e6b65725f43616e63656c5f47726f7570100f12160a124c696e6b65725f4c656176655f47726f7570"
+    "1010121b0a174c696e6b65725f5032505f47726f75705f4368616e6765101112170a134c696e6b65725f47726f75705f4368616e67651012"
+    "2a90020a0b426172726167655479706512170a1342617272616765547970655f556e6b6e6f776e100012100a0c45436f6d4f72646572696e"
+    "671001120e0a0a45436f6d427579696e671002120a0a064e6f726d616c1003120d0a095375627363726962651004120d0a094576656e7456"
+    "696577100512130a0f4576656e7452656769737465726564100612110a0d537562736372696265476966741007120f0a0b55736572557067"
+    "72616465100812210a1d477261646555736572456e7472616e63654e6f74696669636174696f6e100912140a1046616e734c6576656c5570"
+    "6772616465100a12150a1146616e734c6576656c456e7472616e6365100b12130a0f47616d65506172746e657273686970100c2afb010a14"
+    "456e76656c6f7065427573696e6573735479706512170a13427573696e65737354797065556e6b6e6f776e1000121b0a17427573696e6573"
+    "7354797065557365724469616d6f6e641001121f0a1b427573696e65737354797065506c6174666f726d4469616d6f6e641002121d0a1942"
+    "7573696e65737354797065506c6174666f726d5368656c6c100312160a12427573696e65737354797065506f7274616c1004121d0a194275"
+    "73696e65737354797065506c6174666f726d4d657263681005121a0a16427573696e65737354797065456f594469616d6f6e641006121a0a"
+    "16427573696e6573735479706546616e436c756247744d10072a6c0a18456e76656c6f7065466f6c6c6f7753686f77537461747573121d0a"
+    "19456e76656c6f7065466f6c6c6f7753686f77556e6b6e6f776e100012160a12456e76656c6f7065466f6c6c6f7753686f77100112190a15"
+    "456e76656c6f7065466f6c6c6f774e6f7453686f7710022a5e0a0f456e76656c6f7065446973706c6179121a0a16456e76656c6f70654469"
+    "73706c6179556e6b6e6f776e100012160a12456e76656c6f7065446973706c61794e6577100112170a13456e76656c6f7065446973706c61"
+    "794869646510022ae7030a11436f6d6d6f6e436f6e74656e7443617365121a0a16434f4d4d4f4e5f434f4e54454e545f4e4f545f53455410"
+    "00121a0a164352454154455f4348414e4e454c5f434f4e54454e54106412170a134c4953545f4348414e47455f434f4e54454e5410661212"
+    "0a0e494e564954455f434f4e54454e54106712110a0d4150504c595f434f4e54454e54106812180a145045524d49545f4150504c595f434f"
+    "4e54454e54106912180a145245504c595f494e564954455f434f4e54454e54106a12140a104b49434b5f4f55545f434f4e54454e54106b12"
+    "180a1443414e43454c5f4150504c595f434f4e54454e54106c12190a1543414e43454c5f494e564954455f434f4e54454e54106d12110a0d"
+    "4c454156455f434f4e54454e54106e12120a0e46494e4953485f434f4e54454e54106f12170a134a4f494e5f4449524543545f434f4e5445"
+    "4e54107012160a124a4f494e5f47524f55505f434f4e54454e54107112180a145045524d49545f47524f55505f434f4e54454e5410721218"
+    "0a1443414e43454c5f47524f55505f434f4e54454e54107312170a134c454156455f47524f55505f434f4e54454e541074121c0a18503250"
+    "5f47524f55505f4348414e47455f434f4e54454e54107512180a1447524f55505f4348414e47455f434f4e54454e5410762a99060a0f4c69"
+    "6e6b4d6573736167655479706512170a13545950455f4c494e4b45525f554e4b4e4f574e100012160a12545950455f4c494e4b45525f4352"
+    "45415445100112150a11545950455f4c494e4b45525f434c4f5345100212160a12545950455f4c494e4b45525f494e56495445100312150a"
+    "11545950455f4c494e4b45525f4150504c59100412150a11545950455f4c494e4b45525f5245504c59100512150a11545950455f4c494e4b"
+    "45525f454e544552100612150a11545950455f4c494e4b45525f4c45415645100712160a12545950455f4c494e4b45525f5045524d495410"
+    "08121d0a19545950455f4c494e4b45525f43414e43454c5f494e56495445100912230a1f545950455f4c494e4b45525f57414954494e475f"
+    "4c4953545f4348414e4745100a12220a1e545950455f4c494e4b45525f4c494e4b45445f4c4953545f4348414e4745100b121b0a17545950"
+    "455f4c494e4b45525f5550444154455f55534552100c12180a14545950455f4c494e4b45525f4b49434b5f4f5554100d121c0a1854595045"
+    "5f4c494e4b45525f43414e43454c5f4150504c59100e12140a10545950455f4c494e4b45525f4d555445100f12150a11545950455f4c494e"
+    "4b45525f4d41544348101012230a1f545950455f4c494e4b45525f5550444154455f555345525f53455454494e471011121e0a1a54595045"
+    "5f4c494e4b45525f4d49435f4944585f555044415445101212180a14545950455f4c494e4b45525f4c454156455f5632101312260a225459"
+    "50455f4c494e4b45525f57414954494e475f4c4953545f4348414e47455f5632101412250a21545950455f4c494e4b45525f4c494e4b4544"
+    "5f4c4953545f4348414e47455f5632101512220a1e545950455f4c494e4b45525f434f484f53545f4c4953545f4348414e47451016121c0a"
+    "18545950455f4c494e4b45525f4d454449415f4348414e47451017121d0a19545950455f4c494e4b45525f4143434550545f4e4f54494345"
+    "1018121c0a18545950455f4c494e4b45525f5359535f4b49434b5f4f55541065121b0a17545950455f4c494e4b4d49435f555345525f544f"
+    "41535410662aa3040a0b4d65737361676554797065121a0a164d455353414745545950455f535542535543434553531000121e0a1a4d4553"
+    "53414745545950455f414e43484f5252454d494e444552100112230a1f4d455353414745545950455f454e544552524f4f4d455850495245"
+    "534f4f4e100212250a214d455353414745545950455f535542474f414c435245415445544f414e43484f52100312290a254d455353414745"
+    "545950455f535542474f414c434f4d504c455445544f41554449454e4345100412270a234d455353414745545950455f535542474f414c43"
+    "4f4d504c455445544f414e43484f52100512280a244d455353414745545950455f5355424749465454494b544f4b32555345524e4f544943"
+    "451006122a0a264d455353414745545950455f5355424749465454494b544f4b32414e43484f524e4f54494345100712290a254d45535341"
+    "4745545950455f53554247494654545245434549564553454e444e4f544943451008122d0a294d455353414745545950455f535542474946"
+    "5453454e4453554343454544524f4f4d4d4553534147451009122e0a2a4d455353414745545950455f5355424749465453454e4453554343"
+    "454544414e43484f524e4f54494345100a122e0a2a4d455353414745545950455f535542474946544c4f5756455253494f4e555047524144"
+    "454e4f54494345100b12280a244d455353414745545950455f5355424749465455534552425559415554484e4f54494345100c2a430a0553"
+    "63656e6512110a0d5343454e455f554e4b4e4f574e100012110a0d5343454e455f434f5f484f5354100212140a105343454e455f4d554c54"
+    "495f4c4956451004620670726f746f330abf84020a0a646174612e70726f746f1a0b656e756d732e70726f746f228d0a0a06436f6d6d6f6e"
+    "12160a066d6574686f6418012001280952066d6574686f6412140a056d7367496418022001280352056d7367496412160a06726f6f6d4964"
+    "1803200128035206726f6f6d4964121e0a0a63726561746554696d65180420012803520a63726561746554696d6512180a076d6f6e69746f"
+    "7218052001280552076d6f6e69746f72121c0a09697353686f774d73671806200128085209697353686f774d7367121a0a08646573637269"
+    "62651807200128095208646573637269626512270a0b646973706c61795465787418082001280b32052e54657874520b646973706c617954"
+    "657874121a0a08666f6c64547970651809200128035208666f6c645479706512260a0e616e63686f72466f6c6454797065180a2001280352"
+    "0e616e63686f72466f6c645479706512240a0d7072696f7269747953636f7265180b20012803520d7072696f7269747953636f726512140a"
+    "056c6f674964180c2001280952056c6f674964122c0a116d736750726f6365737346696c7465724b180d2001280952116d736750726f6365"
+    "737346696c7465724b122c0a116d736750726f6365737346696c74657256180e2001280952116d736750726f6365737346696c7465725612"
+    "180a0766726f6d496463180f20012809520766726f6d49646312140a05746f4964631810200128095205746f496463122c0a1166696c7465"
+    "724d7367546167734c697374181120032809521166696c7465724d7367546167734c69737412280a0373656918122001280b32162e436f6d"
+    "6d6f6e2e4c6976654d657373616765534549520373656912390a0c646570656e64526f6f74496418132001280b32152e436f6d6d6f6e2e4c"
+    "6976654d6573736167654944520c646570656e64526f6f74496412310a08646570656e64496418142001280b32152e436f6d6d6f6e2e4c69"
+    "76654d65737361676549445208646570656e64496412300a13616e63686f725072696f7269747953636f72651815200128035213616e6368"
+    "6f725072696f7269747953636f726512320a14726f6f6d4d657373616765486561744c6576656c1816200128035214726f6f6d4d65737361"
+    "6765486561744c6576656c12260a0e666f6c6454797065466f72576562181720012803520e666f6c6454797065466f7257656212320a1461"
+    "6e63686f72466f6c6454797065466f725765621818200128035214616e63686f72466f6c6454797065466f7257656212260a0e636c69656e"
+    "7453656e6454696d65181920012803520e636c69656e7453656e6454696d6512460a1064697370617463685374726174656779181a200128"
+    "0e321a2e436f6d6d6f6e2e494d446973706174636853747261746567795210646973706174636853747261746567791a610a0e4c6976654d"
+    "65737361676553454912310a08756e69717565496418012001280b32152e436f6d6d6f6e2e4c6976654d65737361676549445208756e6971"
+    "75654964121c0a0974696d657374616d70180220012803520974696d657374616d701a510a0d4c6976654d6573736167654944121c0a0970"
+    "72696d617279496418012001280952097072696d617279496412220a0c6d6573736167655363656e65180220012809520c6d657373616765"
+    "5363656e6522660a12494d4469737061746368537472617465677912200a1c494d5f44495350415443485f53545241544547595f44454641"
+    "554c541000122e0a2a494d5f44495350415443485f53545241544547595f4259504153535f44495350415443485f5155455545100122b207"
+    "0a045465787412100a036b657918012001280952036b657912260a0e64656661756c745061747465726e180220012809520e64656661756c"
+    "745061747465726e12360a0d64656661756c74466f726d617418032001280b32102e546578742e54657874466f726d6174520d6465666175"
+    "6c74466f726d6174122f0a0a7069656365734c69737418042003280b320f2e546578742e546578745069656365520a7069656365734c6973"
+    "741aab020a0954657874506965636512120a047479706518012001280552047479706512280a06666f726d617418022001280b32102e5465"
+    "78742e54657874466f726d61745206666f726d617412200a0b737472696e6756616c7565180b20012809520b737472696e6756616c756512"
+    "330a097573657256616c756518152001280b32132e546578742e54657874506965636555736572480052097573657256616c756512330a09"
+    "6769667456616c756518162001280b32132e546578742e54657874506965636547696674480052096769667456616c756512430a0f706174"
+    "7465726e52656656616c756518182001280b32192e546578742e5465787450696563655061747465726e526566520f7061747465726e5265"
+    "6656616c7565420f0a0d746578745069656365547970651afa010a0a54657874466f726d617412140a05636f6c6f72180120012809520563"
+    "6f6c6f7212120a04626f6c641802200128085204626f6c6412160a066974616c696318032001280852066974616c696312160a0677656967"
+    "6874180420012805520677656967687412200a0b6974616c6963416e676c65180520012805520b6974616c6963416e676c65121a0a08666f"
+    "6e7453697a651806200128055208666f6e7453697a65122e0a1275736548656967684c69676874436f6c6f72180720012808521275736548"
+    "656967684c69676874436f6c6f7212240a0d75736552656d6f7465436c6f72180820012808520d75736552656d6f7465436c6f721a410a0d"
+    "5465787450696563654769667412160a06676966744964180120012805520667696674496412180a07636f6c6f7249641804200128035207"
+    "636f6c6f7249641a4f0a135465787450696563655061747465726e52656612100a036b657918012001280952036b657912260a0e64656661"
+    "756c745061747465726e180220012809520e64656661756c745061747465726e1a480a0d5465787450696563655573657212190a04757365"
+    "7218012001280b32052e55736572520475736572121c0a0977697468436f6c6f6e180220012808520977697468436f6c6f6e22590a05496d"
+    "61676512180a0775726c4c697374180120032809520775726c4c69737412160a066578747261731802200128095206657874726173121e0a"
+    "0a6973416e696d61746564180920012808520a6973416e696d6174656422bc110a0b4261646765537472756374123f0a0b646973706c6179"
+    "5479706518012001280e321d2e42616467655374727563742e4261646765446973706c617954797065520b646973706c617954797065122f"
+    "0a05696d61676518142001280b32172e42616467655374727563742e496d616765426164676548005205696d616765122c0a047465787418"
+    "152001280b32162e42616467655374727563742e5465787442616467654800520474657874122c0a0373747218162001280b32182e426164"
+    "67655374727563742e537472696e6742616467654800520373747212350a07636f6d62696e6518172001280b32192e426164676553747275"
+    "63742e436f6d62696e65426164676548005207636f6d62696e651a99050a0c436f6d62696e654261646765121a0a0469636f6e1802200128"
+    "0b32062e496d616765520469636f6e122a0a047465787418032001280b32162e42616467655374727563742e546578744261646765520474"
+    "65787412100a03737472180420012809520373747212490a1070726f66696c654361726450616e656c18072001280b321d2e426164676553"
+    "74727563742e50726f66696c654361726450616e656c521070726f66696c654361726450616e656c12430a0a6261636b67726f756e64180b"
+    "2001280b32232e42616467655374727563742e436f6d62696e6542616467654261636b67726f756e64520a6261636b67726f756e6412530a"
+    "126261636b67726f756e644461726b4d6f6465180c2001280b32232e42616467655374727563742e436f6d62696e6542616467654261636b"
+    "67726f756e6452126261636b67726f756e644461726b4d6f6465122a0a1069636f6e4175746f4d6972726f726564180d2001280852106963"
+    "6f6e4175746f4d6972726f72656412360a166261636b67726f756e644175746f4d6972726f726564180e2001280852166261636b67726f75"
+    "6e644175746f4d6972726f72656412340a157075626c696353637265656e53686f775374796c65180f2001280552157075626c6963536372"
+    "65656e53686f775374796c6512340a15706572736f6e616c4361726453686f775374796c651810200128055215706572736f6e616c436172"
+    "6453686f775374796c6512480a1f72616e6b6c6973744f6e6c696e6541756469656e636553686f775374796c65181120012805521f72616e"
+    "6b6c6973744f6e6c696e6541756469656e636553686f775374796c6512300a136d756c7469477565737453686f775374796c651812200128"
+    "0552136d756c7469477565737453686f775374796c651aa4010a0e50726f66696c65436f6e74656e74121e0a0a757365436f6e74656e7418"
+    "0120012808520a757365436f6e74656e7412330a0869636f6e4c69737418022003280b32172e42616467655374727563742e49636f6e436f"
+    "6e666967520869636f6e4c697374123d0a0c6e756d626572436f6e66696718032001280b32192e42616467655374727563742e4e756d6265"
+    "72436f6e666967520c6e756d626572436f6e6669671a540a1050726f6a656374696f6e436f6e66696712240a0d75736550726f6a65637469"
+    "6f6e180120012808520d75736550726f6a656374696f6e121a0a0469636f6e18022001280b32062e496d616765520469636f6e1a6b0a0c4e"
+    "756d626572436f6e66696712160a066e756d62657218012001280352066e756d62657212430a0a6261636b67726f756e6418032001280b32"
+    "232e42616467655374727563742e436f6d62696e6542616467654261636b67726f756e64520a6261636b67726f756e641ada010a1050726f"
+    "66696c654361726450616e656c12360a167573654e657750726f66696c65436172645374796c6518012001280852167573654e657750726f"
+    "66696c65436172645374796c6512490a1070726f6a656374696f6e436f6e66696718032001280b321d2e42616467655374727563742e5072"
+    "6f6a656374696f6e436f6e666967521070726f6a656374696f6e436f6e66696712430a0e70726f66696c65436f6e74656e7418042001280b"
+    "321b2e42616467655374727563742e50726f66696c65436f6e74656e74520e70726f66696c65436f6e74656e741a92010a16436f6d62696e"
+    "6542616467654261636b67726f756e64121c0a05696d61676518012001280b32062e496d6167655205696d61676512300a136261636b6772"
+    "6f756e64436f6c6f72436f646518022001280952136261636b67726f756e64436f6c6f72436f646512280a0f626f72646572436f6c6f7243"
+    "6f6465180320012809520f626f72646572436f6c6f72436f64651a2a0a0a496d6167654261646765121c0a05696d61676518022001280b32"
+    "062e496d6167655205696d6167651a330a0954657874426164676512260a0e64656661756c745061747465726e180320012809520e646566"
+    "61756c745061747465726e1a6d0a0a49636f6e436f6e666967121a0a0469636f6e18012001280b32062e496d616765520469636f6e12430a"
+    "0a6261636b67726f756e6418022001280b32232e42616467655374727563742e436f6d62696e6542616467654261636b67726f756e64520a"
+    "6261636b67726f756e641a1f0a0b537472696e67426164676512100a03737472180220012809520373747222470a08446174614361736512"
+    "100a0c444154415f4e4f545f534554100012090a05494d414745101412080a0454455854101512070a035354521016120b0a07434f4d4249"
+    "4e45101722a2010a104261646765446973706c617954797065121c0a184241444745444953504c4159545950455f554e4b4e4f574e100012"
+    "1a0a164241444745444953504c4159545950455f494d414745100112190a154241444745444953504c4159545950455f544558541002121b"
+    "0a174241444745444953504c4159545950455f535452494e471003121c0a184241444745444953504c4159545950455f434f4d42494e4510"
+    "0422440a08506f736974696f6e12130a0f504f534954494f4e554e4b4e4f574e100012100a0c504f534954494f4e4c454654100112110a0d"
+    "504f534954494f4e52494748541002420b0a0962616467655479706522960d0a0a47696674537472756374121c0a05696d61676518012001"
+    "280b32062e496d6167655205696d616765121a0a08646573637269626518022001280952086465736372696265121a0a086475726174696f"
+    "6e18042001280352086475726174696f6e120e0a02696418052001280352026964121e0a0a666f724c696e6b6d6963180720012808520a66"
+    "6f724c696e6b6d696312140a05636f6d626f180a200128085205636f6d626f12120a0474797065180b2001280552047479706512220a0c64"
+    "69616d6f6e64436f756e74180c20012805520c6469616d6f6e64436f756e74122e0a126973446973706c617965644f6e50616e656c180d20"
+    "01280852126973446973706c617965644f6e50616e656c12280a0f7072696d6172794566666563744964180e20012803520f7072696d6172"
+    "794566666563744964122c0a0d676966744c6162656c49636f6e180f2001280b32062e496d616765520d676966744c6162656c49636f6e12"
+    "120a046e616d6518102001280952046e616d65121a0a0469636f6e18152001280b32062e496d616765520469636f6e121e0a0a676f6c6445"
+    "6666656374181820012809520a676f6c64456666656374122a0a0c70726576696577496d616765182f2001280b32062e496d616765520c70"
+    "726576696577496d61676512450a0f6769667450616e656c42616e6e657218302001280b321b2e476966745374727563742e476966745061"
+    "6e656c42616e6e6572520f6769667450616e656c42616e6e657212280a0f697342726f61646361737447696674183120012808520f697342"
+    "726f6164636173744769667412280a0f697345666665637442656676696577183220012808520f6973456666656374426566766965771222"
+    "0a0c697352616e646f6d47696674183320012808520c697352616e646f6d47696674121c0a096973426f7847696674183420012808520969"
+    "73426f784769667412280a0f63616e507574496e47696674426f78183520012808520f63616e507574496e47696674426f781ad0010a0f47"
+    "69667450616e656c42616e6e657212270a0b646973706c61795465787418012001280b32052e54657874520b646973706c61795465787412"
+    "220a086c65667449636f6e18022001280b32062e496d61676552086c65667449636f6e121c0a09736368656d6155726c1803200128095209"
+    "736368656d6155726c122c0a116267436f6c6f7256616c7565734c69737418052003280952116267436f6c6f7256616c7565734c69737412"
+    "240a0d62616e6e65724c796e7855726c180620012809520d62616e6e65724c796e7855726c1a9b020a144769667452616e646f6d45666665"
+    "6374496e666f12570a1572616e646f6d4769667450616e656c42616e6e657218012001280b32212e476966745374727563742e52616e646f"
+    "6d4769667450616e656c42616e6e6572521572616e646f6d4769667450616e656c42616e6e657212240a0d6566666563744964734c697374"
+    "180220032803520d6566666563744964734c69737412180a07686f73744b65791803200128095207686f73744b657912200a0b6175646965"
+    "6e63654b6579180420012809520b61756469656e63654b657912480a1072616e646f6d47696674427562626c6518052001280b321c2e4769"
+    "66745374727563742e52616e646f6d47696674427562626c65521072616e646f6d47696674427562626c651a6a0a1052616e646f6d476966"
+    "74427562626c6512200a0b646973706c617954657874180120012809520b646973706c61795465787412340a1169636f6e44796e616d6963"
+    "45666665637418022001280b32062e496d616765521169636f6e44796e616d69634566666563741acb020a1552616e646f6d476966745061"
+    "6e656c42616e6e657212200a076267496d61676518012001280b32062e496d61676552076267496d616765122a0a0c73686164696e67496d"
+    "61676518022001280b32062e496d616765520c73686164696e67496d616765121c0a097461726765744e756d180320012803520974617267"
+    "65744e756d121e0a0a636f6c6c6563744e756d180420012803520a636f6c6c6563744e756d12200a0b646973706c61795465787418052001"
+    "2809520b646973706c61795465787412220a086c65667449636f6e18062001280b32062e496d61676552086c65667449636f6e121c0a0973"
+    "6368656d6155726c1807200128095209736368656d6155726c122c0a116267436f6c6f7256616c7565734c69737418082003280952116267"
+    "436f6c6f7256616c7565734c69737412140a05726f756e641809200128035205726f756e6422b2540a0455736572120e0a02696418012001"
+    "280352026964121a0a086e69636b6e616d6518032001280952086e69636b6e616d6512260a0e62696f4465736372697074696f6e18052001"
+    "2809520e62696f4465736372697074696f6e12280a0b6176617461725468756d6218092001280b32062e496d616765520b61766174617254"
+    "68756d62122a0a0c6176617461724d656469756d180a2001280b32062e496d616765520c6176617461724d656469756d12280a0b61766174"
+    "61724c61726765180b2001280b32062e496d616765520b6176617461724c61726765121a0a087665726966696564180c2001280852087665"
+    "72696669656412160a06737461747573180f200128055206737461747573121e0a0a63726561746554696d65181020012803520a63726561"
+    "746554696d65121e0a0a6d6f6469667954696d65181120012803520a6d6f6469667954696d6512160a067365637265741812200128055206"
+    "73656372657412260a0e73686172655172636f6465557269181320012809520e73686172655172636f6465557269122e0a0e626164676549"
+    "6d6167654c69737418152003280b32062e496d616765520e6261646765496d6167654c69737412300a0a666f6c6c6f77496e666f18162001"
+    "280b32102e557365722e466f6c6c6f77496e666f520a666f6c6c6f77496e666f122a0a08706179477261646518172001280b320e2e557365"
+    "722e506179477261646552087061794772616465122a0a0866616e73436c756218182001280b320e2e557365722e46616e73436c75625208"
+    "66616e73436c756212240a06626f7264657218192001280b320c2e557365722e426f726465725206626f72646572121c0a09737065636961"
+    "6c4964181a2001280952097370656369616c4964122a0a0c617661746172426f72646572181b2001280b32062e496d616765520c61766174"
+    "6172426f72646572121c0a056d6564616c181c2001280b32062e496d61676552056d6564616c12340a117265616c54696d6549636f6e734c"
+    "697374181d2003280b32062e496d61676552117265616c54696d6549636f6e734c697374123a0a146e65775265616c54696d6549636f6e73"
+    "4c697374181e2003280b32062e496d61676552146e65775265616c54696d6549636f6e734c697374121a0a08746f705669704e6f181f2001"
+    "28035208746f705669704e6f122a0a08757365724174747218202001280b320e2e557365722e557365724174747252087573657241747472"
+    "12270a076f776e526f6f6d18212001280b320d2e557365722e4f776e526f6f6d52076f776e526f6f6d121a0a0870617953636f7265182220"
+    "012803520870617953636f726512200a0b7469636b6574436f756e74182320012803520b7469636b6574436f756e7412320a0c6c696e6b4d"
+    "6963537461747318252001280e320e2e4c696e6b6d6963537461747573520c6c696e6b4d69635374617473121c0a09646973706c61794964"
+    "1826200128095209646973706c6179496412360a1677697468436f6d6d657263655065726d697373696f6e18272001280852167769746843"
+    "6f6d6d657263655065726d697373696f6e12300a1377697468467573696f6e53686f70456e74727918282001280852137769746846757369"
+    "6f6e53686f70456e74727912410a1277656263617374416e63686f724c6576656c182a2001280b32112e557365722e416e63686f724c6576"
+    "656c521277656263617374416e63686f724c6576656c12280a0f7665726966696564436f6e74656e74182b20012809520f76657269666965"
+    "64436f6e74656e7412330a0b617574686f725374617473182c2001280b32112e557365722e417574686f725374617473520b617574686f72"
+    "537461747312270a0b746f7046616e734c697374182d2003280b32052e55736572520b746f7046616e734c69737412160a06736563556964"
+    "182e200128095206736563556964121a0a0875736572526f6c65182f20012805520875736572526f6c65123a0a0e61637469766974795265"
+    "7761726418312001280b32122e557365722e4163746976697479496e666f520e6163746976697479526577617264122a0a0c706572736f6e"
+    "616c4361726418342001280b32062e496d616765520c706572736f6e616c4361726412480a1261757468656e7469636174696f6e496e666f"
+    "18352001280b32182e557365722e41757468656e7469636174696f6e496e666f521261757468656e7469636174696f6e496e666f12380a13"
+    "6d656469614261646765496d6167654c69737418392003280b32062e496d61676552136d656469614261646765496d6167654c6973741242"
+    "0a1c636f6d6d6572636557656263617374436f6e6669674964734c697374183c20032803521c636f6d6d6572636557656263617374436f6e"
+    "6669674964734c697374122c0a0a626f726465724c697374183d2003280b320c2e557365722e426f72646572520a626f726465724c697374"
+    "123c0a0e636f6d626f4261646765496e666f183e2001280b32142e557365722e436f6d626f4261646765496e666f520e636f6d626f426164"
+    "6765496e666f12390a0d737562736372696265496e666f183f2001280b32132e557365722e537562736372696265496e666f520d73756273"
+    "6372696265496e666f122a0a0962616467654c69737418402003280b320c2e4261646765537472756374520962616467654c697374122c0a"
+    "116d696e74547970654c6162656c4c69737418412003280352116d696e74547970654c6162656c4c69737412360a0c66616e73436c756249"
+    "6e666f18422001280b32122e557365722e46616e73436c7562496e666f520c66616e73436c7562496e666f12310a13616c6c6f7746696e64"
+    "4279436f6e746163747318ea07200128085213616c6c6f7746696e644279436f6e7461637473123b0a18616c6c6f774f7468657273446f77"
+    "6e6c6f6164566964656f18eb07200128085218616c6c6f774f7468657273446f776e6c6f6164566964656f12510a23616c6c6f774f746865"
+    "7273446f776e6c6f61645768656e53686172696e67566964656f18ec07200128085223616c6c6f774f7468657273446f776e6c6f61645768"
+    "656e53686172696e67566964656f12350a15616c6c6f77536861726553686f7750726f66696c6518ed07200128085215616c6c6f77536861"
+    "726553686f7750726f66696c65122d0a11616c6c6f7753686f77496e476f7373697018ee07200128085211616c6c6f7753686f77496e476f"
+    "73736970122d0a11616c6c6f7753686f774d79416374696f6e18ef07200128085211616c6c6f7753686f774d79416374696f6e12310a1361"
+    "6c6c6f77537472616e6765436f6d6d656e7418f007200128085213616c6c6f77537472616e6765436f6d6d656e7412370a16616c6c6f7755"
+    "6e666f6c6c6f776572436f6d6d656e7418f107200128085216616c6c6f77556e666f6c6c6f776572436f6d6d656e7412290a0f616c6c6f77"
+    "5573654c696e6b6d696318f20720012808520f616c6c6f775573654c696e6b6d696312340a0b616e63686f724c6576656c18f3072001280b"
+    "32112e557365722e416e63686f724c6576656c520b616e63686f724c6576656c12250a096176617461724a706718f4072001280b32062e49"
+    "6d61676552096176617461724a7067121b0a086267496d6755726c18f5072001280952086267496d6755726c12210a0b626c6f636b537461"
+    "74757318f80720012805520b626c6f636b53746174757312290a0f636f6d6d656e74526573747269637418f90720012805520f636f6d6d65"
+    "6e74526573747269637412250a0d636f6e7374656c6c6174696f6e18fa0720012809520d636f6e7374656c6c6174696f6e12230a0c646973"
+    "61626c65496368617418fb0720012805520c64697361626c65496368617412270a0e656e61626c654963686174496d6718fc072001280352"
+    "0e656e61626c654963686174496d6712110a0365787018fd0720012805520365787012270a0e66616e5469636b6574436f756e7418fe0720"
+    "012803520e66616e5469636b6574436f756e74122b0a10666f6c64537472616e6765724368617418ff07200128085210666f6c6453747261"
+    "6e6765724368617412230a0c666f6c6c6f7753746174757318800820012803520c666f6c6c6f77537461747573122d0a1169636861745265"
+    "73747269637454797065188308200128055211696368617452657374726963745479706512150a0569645374721884082001280952056964"
+    "537472121f0a0a6973466f6c6c6f77657218850820012808520a6973466f6c6c6f77657212210a0b6973466f6c6c6f77696e671886082001"
+    "2808520b6973466f6c6c6f77696e67122b0a106e65656450726f66696c6547756964651887082001280852106e65656450726f66696c6547"
+    "75696465121d0a0970617953636f72657318880820012803520970617953636f726573122d0a1170757368436f6d6d656e74537461747573"
+    "18890820012808521170757368436f6d6d656e74537461747573121b0a087075736844696767188a08200128085208707573684469676712"
+    "1f0a0a70757368466f6c6c6f77188b0820012808520a70757368466f6c6c6f77122b0a1070757368467269656e64416374696f6e188c0820"
+    "012808521070757368467269656e64416374696f6e121d0a09707573684963686174188d08200128085209707573684963686174121f0a0a"
+    "70757368537461747573188e0820012808520a7075736853746174757312250a0d70757368566964656f506f7374188f0820012808520d70"
+    "757368566964656f506f7374122f0a1270757368566964656f5265636f6d6d656e6418900820012808521270757368566964656f5265636f"
+    "6d6d656e6412260a0573746174731891082001280b320f2e557365722e5573657253746174735205737461747312270a0e76657269666965"
+    "64526561736f6e18930820012809520e7665726966696564526561736f6e12410a1b776974684361724d616e6167656d656e745065726d69"
+    "7373696f6e18940820012808521b776974684361724d616e6167656d656e745065726d697373696f6e12420a117570636f6d696e67457665"
+    "6e744c6973741895082003280b32132e557365722e4c6976654576656e74496e666f52117570636f6d696e674576656e744c697374121b0a"
+    "0873636d4c6162656c18960820012809520873636d4c6162656c12460a1165636f6d6d65726365456e7472616e63651897082001280b3217"
+    "2e557365722e45636f6d6d65726365456e7472616e6365521165636f6d6d65726365456e7472616e636512190a076973426c6f636b189808"
+    "2001280852076973426c6f636b1ace030a0d4c6976654576656e74496e666f12180a076576656e74496418012001280352076576656e7449"
+    "64121c0a09737461727454696d651802200128035209737461727454696d65121a0a086475726174696f6e18032001280352086475726174"
+    "696f6e12140a057469746c6518042001280952057469746c6512200a0b6465736372697074696f6e180520012809520b6465736372697074"
+    "696f6e12240a0d68617353756273637269626564180620012808520d6861735375627363726962656412200a0b6973506169644576656e74"
+    "180720012808520b6973506169644576656e7412220a0c7469636b6574416d6f756e74180820012803520c7469636b6574416d6f756e7412"
+    "1c0a097061794d6574686f6418092001280352097061794d6574686f641a490a0d57616c6c65745061636b61676512140a05696170496418"
+    "01200128095205696170496412220a0c757364507269636553686f77180220012809520c757364507269636553686f77225c0a0e4576656e"
+    "745061794d6574686f6412190a154556454e545041594d4554484f44494e56414c4944100012170a134556454e545041594d4554484f4443"
+    "4f494e53100112160a124556454e545041594d4554484f444341534810021a500a0c4163746976697479496e666f121c0a05626164676518"
+    "012001280b32062e496d6167655205626164676512220a0873746f727974616718022001280b32062e496d616765520873746f7279746167"
+    "1ae1040a0b416e63686f724c6576656c12140a056c6576656c18012001280352056c6576656c121e0a0a657870657269656e636518022001"
+    "2803520a657870657269656e6365123c0a196c6f77657374457870657269656e6365546869734c6576656c18032001280352196c6f776573"
+    "74457870657269656e6365546869734c6576656c123e0a1a68696768657374457870657269656e6365546869734c6576656c180420012803"
+    "521a68696768657374457870657269656e6365546869734c6576656c12300a137461736b5374617274457870657269656e63651805200128"
+    "0352137461736b5374617274457870657269656e636512240a0d7461736b537461727454696d65180620012803520d7461736b5374617274"
+    "54696d6512360a167461736b4465637265617365457870657269656e636518072001280352167461736b4465637265617365457870657269"
+    "656e636512320a147461736b546172676574457870657269656e636518082001280352147461736b546172676574457870657269656e6365"
+    "12200a0b7461736b456e6454696d65180920012803520b7461736b456e6454696d6512300a0f70726f66696c654469616c6f674267180a20"
+    "01280b32062e496d616765520f70726f66696c654469616c6f67426712380a1370726f66696c654469616c6f6742674261636b180b200128"
+    "0b32062e496d616765521370726f66696c654469616c6f6742674261636b12260a0a73746167654c6576656c180c2001280b32062e496d61"
+    "6765520a73746167654c6576656c12240a09736d616c6c49636f6e180d2001280b32062e496d6167655209736d616c6c49636f6e1aaa010a"
+    "1241757468656e7469636174696f6e496e666f12220a0c637573746f6d566572696679180120012809520c637573746f6d56657269667912"
+    "360a16656e7465727072697365566572696679526561736f6e1802200128095216656e7465727072697365566572696679526561736f6e12"
+    "380a1361757468656e7469636174696f6e426164676518032001280b32062e496d616765521361757468656e7469636174696f6e42616467"
+    "651ac1020a0b417574686f72537461747312280a0f766964656f546f74616c436f756e74180120012803520f766964656f546f74616c436f"
+    "756e7412300a13766964656f546f74616c506c6179436f756e741802200128035213766964656f546f74616c506c6179436f756e7412320a"
+    "14766964656f546f74616c5368617265436f756e741803200128035214766964656f546f74616c5368617265436f756e7412340a15766964"
+    "656f546f74616c536572696573436f756e741804200128035215766964656f546f74616c536572696573436f756e7412320a147661726965"
+    "747953686f77506c6179436f756e7418052001280352147661726965747953686f77506c6179436f756e7412380a17766964656f546f7461"
+    "6c4661766f72697465436f756e741806200128035217766964656f546f74616c4661766f72697465436f756e741a8c020a06426f72646572"
+    "121a0a0469636f6e18012001280b32062e496d616765520469636f6e12140a056c6576656c18022001280352056c6576656c12160a06736f"
+    "757263651803200128095206736f7572636512400a1770726f66696c654465636f726174696f6e526962626f6e18042001280b32062e496d"
+    "616765521770726f66696c654465636f726174696f6e526962626f6e12340a156176617461724261636b67726f756e64436f6c6f72180720"
+    "01280952156176617461724261636b67726f756e64436f6c6f7212400a1b6176617461724261636b67726f756e64426f72646572436f6c6f"
+    "72180820012809521b6176617461724261636b67726f756e64426f72646572436f6c6f721a4c0a0e436f6d626f4261646765496e666f121a"
+    "0a0469636f6e18012001280b32062e496d616765520469636f6e121e0a0a636f6d626f436f756e74180220012803520a636f6d626f436f75"
+    "6e741af00e0a1145636f6d6d65726365456e7472616e636512480a0c656e7472616e63655479706518012001280e32242e557365722e4563"
+    "6f6d6d65726365456e7472616e63652e456e7472616e636554797065520c656e7472616e63655479706512450a0b63726561746f72547970"
+    "6518022001280e32232e557365722e45636f6d6d65726365456e7472616e63652e43726561746f7254797065520b63726561746f72547970"
+    "6512160a06736368656d611803200128095206736368656d6112540a1073686f70456e7472616e6365496e666f18042001280b32282e5573"
+    "65722e45636f6d6d65726365456e7472616e63652e53686f70456e7472616e6365496e666f521073686f70456e7472616e6365496e666f12"
+    "600a1473686f7763617365456e7472616e6365496e666f18052001280b322c2e557365722e45636f6d6d65726365456e7472616e63652e53"
+    "686f7763617365456e7472616e6365496e666f521473686f7763617365456e7472616e6365496e666f1aa00a0a1053686f70456e7472616e"
+    "6365496e666f12160a0673686f704964180120012809520673686f704964121a0a0873686f704e616d65180220012809520873686f704e61"
+    "6d65121e0a0a73686f70526174696e67180320012809520a73686f70526174696e6712530a0a73746f72654c6162656c18042001280b3233"
+    "2e557365722e45636f6d6d65726365456e7472616e63652e53686f70456e7472616e6365496e666f2e53746f72654c6162656c520a73746f"
+    "72654c6162656c12280a0f666f726d6174536f6c64436f756e74180520012809520f666f726d6174536f6c64436f756e74121c0a09736f6c"
+    "64436f756e741806200128035209736f6c64436f756e74122c0a116578705261746550657263656e74696c65180720012805521165787052"
+    "61746550657263656e74696c65122c0a1165787052617465546f70446973706c6179180820012809521165787052617465546f7044697370"
+    "6c6179122a0a1072617465446973706c61795374796c65180920012805521072617465446973706c61795374796c6512340a1573686f7752"
+    "6174654e6f744170706c696361626c65180a20012808521573686f77526174654e6f744170706c696361626c651adc060a0a53746f72654c"
+    "6162656c126c0a0d6f6666696369616c4c6162656c18012001280b32462e557365722e45636f6d6d65726365456e7472616e63652e53686f"
+    "70456e7472616e6365496e666f2e53746f72654c6162656c2e53746f72654f6666696369616c4c6162656c520d6f6666696369616c4c6162"
+    "656c121e0a0a6973427974656d616c6c180220012808520a6973427974656d616c6c1ab5040a1253746f72654f6666696369616c4c616265"
+    "6c127f0a0f6c6162656c496d6167654c6967687418012001280b32552e557365722e45636f6d6d65726365456e7472616e63652e53686f70"
+    "456e7472616e6365496e666f2e53746f72654c6162656c2e53746f72654f6666696369616c4c6162656c2e53686f704c6162656c496d6167"
+    "65520f6c6162656c496d6167654c69676874127d0a0e6c6162656c496d6167654461726b18022001280b32552e557365722e45636f6d6d65"
+    "726365456e7472616e63652e53686f70456e7472616e6365496e666f2e53746f72654c6162656c2e53746f72654f6666696369616c4c6162"
+    "656c2e53686f704c6162656c496d616765520e6c6162656c496d6167654461726b121c0a096c6162656c5479706518032001280352096c61"
+    "62656c5479706512220a0c6c6162656c54797065537472180420012809520c6c6162656c547970655374721adc010a0e53686f704c616265"
+    "6c496d61676512160a06686569676874180120012805520668656967687412140a05776964746818022001280552057769647468121a0a08"
+    "6d696e657479706518032001280952086d696e6574797065121a0a087468756d6255726918042001280952087468756d6255726912220a0c"
+    "7468756d625572694c697374180520032809520c7468756d625572694c69737412100a03757269180620012809520375726912180a077572"
+    "6c4c697374180720032809520775726c4c69737412140a05636f6c6f721808200128095205636f6c6f722287010a1353746f72654272616e"
+    "644c6162656c5479706512080a044e4f4e451000120c0a084f4646494349414c1001120e0a0a415554484f52495a4544100212210a1d5354"
+    "4f52455f4252414e445f4c4142454c5f545950455f424c55455f56100312250a2153544f52455f4252414e445f4c4142454c5f545950455f"
+    "544f505f43484f49434510041a5e0a1453686f7763617365456e7472616e6365496e666f12280a0f666f726d6174536f6c64436f756e7418"
+    "0120012809520f666f726d6174536f6c64436f756e74121c0a09736f6c64436f756e741802200128035209736f6c64436f756e7422420a0b"
+    "43726561746f7254797065120d0a09554e444546494e45441000120c0a084f4646494349414c1001120a0a064d41524b45541002120a0a06"
+    "4e4f524d414c100322330a0c456e7472616e636554797065120b0a0750524f46494c451000120c0a0853484f5743415345100112080a0453"
+    "484f5010021ad7030a0846616e73436c7562122f0a046461746118012001280b321b2e557365722e46616e73436c75622e46616e73436c75"
+    "62446174615204646174611ae2020a0c46616e73436c756244617461121a0a08636c75624e616d651801200128095208636c75624e616d65"
+    "12140a056c6576656c18022001280552056c6576656c125e0a127573657246616e73436c756253746174757318032001280e322e2e557365"
+    "722e46616e73436c75622e46616e73436c7562446174612e5573657246616e73436c756253746174757352127573657246616e73436c7562"
+    "53746174757312320a14617661696c61626c65476966744964734c6973741805200328035214617661696c61626c65476966744964734c69"
+    "7374121a0a08616e63686f7249641806200128035208616e63686f72496422310a09426164676549636f6e120b0a07554e4b4e4f574e1000"
+    "12080a0449434f4e1001120d0a09534d414c4c49434f4e1002223d0a125573657246616e73436c7562537461747573120d0a094e4f544a4f"
+    "494e45441000120a0a064143544956451001120c0a08494e414354495645100222350a0f5072656665726e7469616c5479706512130a0f50"
+    "5245534f4e414c50524f46494c451000120d0a094f54484552524f4f4d10011aa6010a0c46616e73436c7562496e666f121e0a0a6973536c"
+    "656570696e67180120012808520a6973536c656570696e67121c0a0966616e734c6576656c180220012803520966616e734c6576656c121c"
+    "0a0966616e7353636f7265180320012803520966616e7353636f7265121c0a05626164676518042001280b32062e496d6167655205626164"
+    "6765121c0a0966616e73436f756e74180520012803520966616e73436f756e741a9e010a0a466f6c6c6f77496e666f12260a0e666f6c6c6f"
+    "77696e67436f756e74180120012803520e666f6c6c6f77696e67436f756e7412240a0d666f6c6c6f776572436f756e74180220012803520d"
+    "666f6c6c6f776572436f756e7412220a0c666f6c6c6f77537461747573180320012803520c666f6c6c6f77537461747573121e0a0a707573"
+    "68537461747573180420012803520a707573685374617475731a530a074f776e526f6f6d12200a0b726f6f6d4964734c6973741801200328"
+    "03520b726f6f6d4964734c69737412260a0e726f6f6d4964735374724c697374180220032809520e726f6f6d4964735374724c6973741af4"
+    "070a08506179477261646512280a0b6469616d6f6e6449636f6e18022001280b32062e496d616765520b6469616d6f6e6449636f6e12120a"
+    "046e616d6518032001280952046e616d65121a0a0469636f6e18042001280b32062e496d616765520469636f6e121a0a086e6578744e616d"
+    "6518052001280952086e6578744e616d6512140a056c6576656c18062001280352056c6576656c12220a086e65787449636f6e1807200128"
+    "0b32062e496d61676552086e65787449636f6e12240a0d67726164654465736372696265180d20012809520d677261646544657363726962"
+    "65123e0a0d677261646549636f6e4c697374180e2003280b32182e557365722e50617947726164652e477261646549636f6e520d67726164"
+    "6549636f6e4c69737412260a0e73637265656e4368617454797065180f20012803520e73637265656e4368617454797065121e0a06696d49"
+    "636f6e18102001280b32062e496d6167655206696d49636f6e12300a0f696d49636f6e576974684c6576656c18112001280b32062e496d61"
+    "6765520f696d49636f6e576974684c6576656c12220a086c69766549636f6e18122001280b32062e496d61676552086c69766549636f6e12"
+    "360a126e6577496d49636f6e576974684c6576656c18132001280b32062e496d61676552126e6577496d49636f6e576974684c6576656c12"
+    "280a0b6e65774c69766549636f6e18142001280b32062e496d616765520b6e65774c69766549636f6e122e0a12757067726164654e656564"
+    "436f6e73756d651815200128035212757067726164654e656564436f6e73756d6512260a0e6e65787450726976696c656765731816200128"
+    "09520e6e65787450726976696c6567657312260a0a6261636b67726f756e6418172001280b32062e496d616765520a6261636b67726f756e"
+    "64122e0a0e6261636b67726f756e644261636b18182001280b32062e496d616765520e6261636b67726f756e644261636b12140a0573636f"
+    "7265181920012803520573636f726512210a0b677261646542616e6e657218e90720012809520b677261646542616e6e657212310a0f7072"
+    "6f66696c654469616c6f67426718ea072001280b32062e496d616765520f70726f66696c654469616c6f67426712390a1370726f66696c65"
+    "4469616c6f6742674261636b18eb072001280b32062e496d616765521370726f66696c654469616c6f6742674261636b1a7b0a0947726164"
+    "6549636f6e121a0a0469636f6e18012001280b32062e496d616765520469636f6e12200a0b69636f6e4469616d6f6e64180220012803520b"
+    "69636f6e4469616d6f6e6412140a056c6576656c18032001280352056c6576656c121a0a086c6576656c53747218042001280952086c6576"
+    "656c5374721a5e0a0e537562736372696265426164676512240a096f726967696e496d6718032001280b32062e496d61676552096f726967"
+    "696e496d6712260a0a70726576696577496d6718042001280b32062e496d616765520a70726576696577496d671a93030a0d537562736372"
+    "696265496e666f12240a0d7175616c696669636174696f6e180120012808520d7175616c696669636174696f6e12200a0b69735375627363"
+    "72696265180220012808520b6973537562736372696265122a0a05626164676518032001280b32142e557365722e53756273637269626542"
+    "6164676552056261646765122e0a12656e61626c65537562736372697074696f6e1804200128085212656e61626c65537562736372697074"
+    "696f6e12280a0f73756273637269626572436f756e74180520012803520f73756273637269626572436f756e7412280a0f6973496e477261"
+    "6365506572696f64180620012808520f6973496e4772616365506572696f6412320a14697353756273637269626564546f416e63686f7218"
+    "07200128085214697353756273637269626564546f416e63686f7212280a0f757365724769667453756241757468180920012808520f7573"
+    "65724769667453756241757468122c0a11616e63686f724769667453756241757468180a200128085211616e63686f724769667453756241"
+    "7574681a86010a08557365724174747212180a0769734d75746564180120012808520769734d7574656412180a07697341646d696e180220"
+    "0128085207697341646d696e12220a0c6973537570657241646d696e180320012808520c6973537570657241646d696e12220a0c6d757465"
+    "4475726174696f6e180420012803520c6d7574654475726174696f6e1ac3030a09557365725374617473120e0a0269641801200128035202"
+    "696412140a0569645374721802200128095205696453747212260a0e666f6c6c6f77696e67436f756e74180320012803520e666f6c6c6f77"
+    "696e67436f756e7412240a0d666f6c6c6f776572436f756e74180420012803520d666f6c6c6f776572436f756e7412200a0b7265636f7264"
+    "436f756e74180520012803520b7265636f7264436f756e7412240a0d746f74616c4475726174696f6e180620012803520d746f74616c4475"
+    "726174696f6e12300a136461696c7946616e5469636b6574436f756e7418072001280352136461696c7946616e5469636b6574436f756e74"
+    "12200a0b6461696c79496e636f6d65180820012803520b6461696c79496e636f6d65121c0a096974656d436f756e74180920012803520969"
+    "74656d436f756e74122c0a116661766f726974654974656d436f756e74180a2001280352116661766f726974654974656d436f756e741232"
+    "0a146469616d6f6e64436f6e73756d6564436f756e74180c2001280352146469616d6f6e64436f6e73756d6564436f756e7412260a0e7475"
+    "77656e4974656d436f756e74180d20012803520e747577656e4974656d436f756e7422a2020a05456d6f746512180a07656d6f7465496418"
+    "01200128095207656d6f74654964121c0a05696d61676518022001280b32062e496d6167655205696d616765122e0a0b6175646974537461"
+    "74757318032001280e320c2e4175646974537461747573520b617564697453746174757312120a0475756964180420012809520475756964"
+    "12280a09656d6f74655479706518052001280e320a2e456d6f7465547970655209656d6f74655479706512340a0d636f6e74656e74536f75"
+    "72636518062001280e320e2e436f6e74656e74536f75726365520d636f6e74656e74536f75726365123d0a10656d6f746550726976617465"
+    "5479706518072001280e32112e456d6f746550726976617465547970655210656d6f7465507269766174655479706522d5010a0f50756e69"
+    "73684576656e74496e666f121e0a0a70756e69736854797065180120012809520a70756e6973685479706512220a0c70756e697368526561"
+    "736f6e180220012809520c70756e697368526561736f6e121a0a0870756e6973684964180320012809520870756e697368496412220a0c76"
+    "696f6c6174696f6e556964180420012803520c76696f6c6174696f6e55696412220a0c70756e697368547970654964180520012805520c70"
+    "756e697368547970654964121a0a086475726174696f6e18062001280352086475726174696f6e225b0a094d736746696c746572121a0a08"
+    "69734769667465721801200128085208697347696674657212320a14697353756273637269626564546f416e63686f721802200128085214"
+    "697353756273637269626564546f416e63686f7222b4020a0c557365724964656e7469747912300a1369734769667447697665724f66416e"
+    "63686f72180120012808521369734769667447697665724f66416e63686f7212320a146973537562736372696265724f66416e63686f7218"
+    "022001280852146973537562736372696265724f66416e63686f7212400a1b69734d757475616c466f6c6c6f77696e6757697468416e6368"
+    "6f72180320012808521b69734d757475616c466f6c6c6f77696e6757697468416e63686f72122e0a126973466f6c6c6f7765724f66416e63"
+    "686f7218042001280852126973466f6c6c6f7765724f66416e63686f7212300a1369734d6f64657261746f724f66416e63686f7218052001"
+    "2808521369734d6f64657261746f724f66416e63686f72121a0a086973416e63686f7218062001280852086973416e63686f7222c5060a04"
+    "476f616c120e0a0269641801200128035202696412200a0b6465736372697074696f6e180520012809520b6465736372697074696f6e1220"
+    "0a0b6175646974537461747573180620012805520b6175646974537461747573121c0a09737461727454696d651808200128035209737461"
+    "727454696d65121e0a0a65787069726554696d65180920012803520a65787069726554696d6512260a0e7265616c46696e69736854696d65"
+    "180a20012803520e7265616c46696e69736854696d6512410a10636f6e7472696275746f72734c697374180b2003280b32152e476f616c2e"
+    "476f616c436f6e7472696275746f725210636f6e7472696275746f72734c697374122e0a12636f6e7472696275746f72734c656e67746818"
+    "0c200128055212636f6e7472696275746f72734c656e67746812140a056964537472180d2001280952056964537472122a0a106175646974"
+    "4465736372697074696f6e180e20012809521061756469744465736372697074696f6e12250a057374617473180f2001280b320f2e476f61"
+    "6c2e476f616c5374617473520573746174731a570a09476f616c5374617473121e0a0a746f74616c436f696e73180120012803520a746f74"
+    "616c436f696e73122a0a10746f74616c436f6e7472696275746f721802200128035210746f74616c436f6e7472696275746f721acd020a0f"
+    "476f616c436f6e7472696275746f7212160a067573657249641801200128035206757365724964121e0a0661766174617218022001280b32"
+    "062e496d6167655206617661746172121c0a09646973706c617949641803200128095209646973706c6179496412140a0573636f72651804"
+    "20012803520573636f7265121c0a09757365724964537472180520012809520975736572496453747212160a06696e526f6f6d1806200128"
+    "085206696e526f6f6d121a0a086973467269656e6418072001280852086973467269656e64122a0a0962616467654c69737418082003280b"
+    "320c2e4261646765537472756374520962616467654c69737412240a0d666f6c6c6f7742794f776e6572180920012808520d666f6c6c6f77"
+    "42794f776e6572122a0a10697346697374436f6e74726962757465180a200128085210697346697374436f6e74726962757465222d0a0949"
+    "6e64696361746f7212100a036b657918012001280952036b6579120e0a026f7018022001280352026f70227e0a0752616e6b696e6712120a"
+    "047479706518012001280952047479706512140a056c6162656c18022001280952056c6162656c12220a05636f6c6f7218032001280b320c"
+    "2e54696b546f6b436f6c6f725205636f6c6f7212250a0764657461696c7318042003280b320b2e56616c75654c6162656c52076465746169"
+    "6c7322490a0b54696b546f6b436f6c6f7212140a05636f6c6f721801200128095205636f6c6f72120e0a0269641804200128045202696412"
+    "140a05646174613118062001280d5205646174613122660a0a56616c75654c6162656c12120a046461746118012001280d52046461746112"
+    "140a056c6162656c18022001280952056c6162656c12160a066c6162656c3218032001280952066c6162656c3212160a066c6162656c3318"
+    "0b2001280952066c6162656c33228a010a0e4d65737361676544657461696c7312140a05646174613118012001280d520564617461311222"
+    "0a05636f6c6f7218022001280b320c2e54696b546f6b436f6c6f725205636f6c6f72121a0a0863617465676f7279180b2001280952086361"
+    "7465676f727912220a047573657218152001280b320e2e55736572436f6e7461696e657252047573657222400a0d55736572436f6e746169"
+    "6e657212190a047573657218012001280b32052e5573657252047573657212140a05646174613118022001280d5205646174613122d5010a"
+    "0d44617461436f6e7461696e657212140a0564617461311801200128045205646174613112140a05646174613218022001280d5205646174"
+    "613212140a05646174613318032001280d5205646174613312140a05646174613418042001280d5205646174613412140a05646174613518"
+    "052001280d5205646174613512140a05646174613618062001280d5205646174613612140a05646174613718072001280d52056461746137"
+    "12140a05646174613818082001280d5205646174613812140a05646174613918092001280d5205646174613922740a1254696d655374616d"
+    "70436f6e7461696e6572121e0a0a74696d657374616d7031180120012804520a74696d657374616d7031121e0a0a74696d657374616d7032"
+    "180220012804520a74696d657374616d7032121e0a0a74696d657374616d7033180320012804520a74696d657374616d7033228c010a114d"
+    "656d6265724d6573736167654461746112120a047479706518012001280952047479706512140a056c6162656c18022001280952056c6162"
+    "656c12220a05636f6c6f7218032001280b320c2e54696b546f6b436f6c6f725205636f6c6f7212290a0764657461696c7318042003280b32"
+    "0f2e4d65737361676544657461696c73520764657461696c7322cb010a124c696e6b4d696341726d6965734974656d73121e0a0a686f7374"
+    "557365724964180120012804520a686f7374557365724964124a0a0c626174746c6547726f75707318022003280b32262e4c696e6b4d6963"
+    "41726d6965734974656d732e4c696e6b4d696341726d69657347726f7570520c626174746c6547726f7570731a490a124c696e6b4d696341"
+    "726d69657347726f7570121b0a05757365727318012003280b32052e557365725205757365727312160a06706f696e747318022001280d52"
+    "06706f696e747322b4010a10506f6c6c5374617274436f6e74656e74121c0a09537461727454696d65180120012803520953746172745469"
+    "6d6512180a07456e6454696d651802200128035207456e6454696d65122f0a0a4f7074696f6e4c69737418032003280b320f2e506f6c6c4f"
+    "7074696f6e496e666f520a4f7074696f6e4c69737412140a055469746c6518042001280952055469746c6512210a084f70657261746f7218"
+    "052001280b32052e5573657252084f70657261746f72227e0a0e506f6c6c456e64436f6e74656e7412180a07456e64547970651801200128"
+    "055207456e6454797065122f0a0a4f7074696f6e4c69737418022003280b320f2e506f6c6c4f7074696f6e496e666f520a4f7074696f6e4c"
+    "69737412210a084f70657261746f7218032001280b32052e5573657252084f70657261746f72229b010a0e506f6c6c4f7074696f6e496e66"
+    "6f12140a05566f7465731801200128055205566f74657312260a0e446973706c6179436f6e74656e74180220012809520e446973706c6179"
+    "436f6e74656e74121c0a094f7074696f6e49647818032001280552094f7074696f6e496478122d0a0c566f7465557365724c697374180420"
+    "03280b32092e566f746555736572520c566f7465557365724c69737422680a08566f74655573657212160a06557365724964180120012803"
+    "5206557365724964121a0a084e69636b4e616d6518022001280952084e69636b4e616d6512280a0b4176617461725468756d621803200128"
+    "0b32062e496d616765520b4176617461725468756d6222490a16506f6c6c557064617465566f746573436f6e74656e74122f0a0a4f707469"
+    "6f6e4c69737418022003280b320f2e506f6c6c4f7074696f6e496e666f520a4f7074696f6e4c697374228d010a0d5573657246616e546963"
+    "6b657412160a065573657249641801200128035206557365724964121c0a0946616e5469636b6574180220012803520946616e5469636b65"
+    "7412280a0f4d61746368546f74616c53636f7265180320012803520f4d61746368546f74616c53636f7265121c0a094d6174636852616e6b"
+    "18042001280552094d6174636852616e6b22f4010a1a46616e5469636b6574526f6f6d4e6f74696365436f6e74656e74123c0a1155736572"
+    "46616e5469636b65744c69737418012003280b320e2e5573657246616e5469636b657452115573657246616e5469636b65744c6973741234"
+    "0a15546f74616c4c696e6b4d696346616e5469636b65741802200128035215546f74616c4c696e6b4d696346616e5469636b657412180a07"
+    "4d61746368496418032001280352074d617463684964121c0a094576656e7454696d6518042001280352094576656e7454696d65122a0a10"
+    "46616e5469636b657449636f6e55726c180520012809521046616e5469636b657449636f6e55726c22770a194c696e6b6572416363657074"
+    "4e6f74696365436f6e74656e74121e0a0a66726f6d557365724964180120012803520a66726f6d557365724964121e0a0a66726f6d526f6f"
+    "6d4964180220012803520a66726f6d526f6f6d4964121a0a08746f5573657249641803200128035208746f557365724964228d010a134c69"
+    "6e6b657243616e63656c436f6e74656e74121e0a0a66726f6d557365724964180120012803520a66726f6d557365724964121a0a08746f55"
+    "73657249641802200128035208746f557365724964121e0a0a63616e63656c54797065180320012803520a63616e63656c54797065121a0a"
+    "08616374696f6e49641804200128035208616374696f6e4964228d030a084c6973745573657212190a047573657218012001280b32052e55"
+    "736572520475736572121c0a096c696e6b6d6963496418022001280352096c696e6b6d6963496412220a0c6c696e6b6d6963496453747218"
+    "0320012809520c6c696e6b6d69634964537472121e0a0a6c696e6b537461747573180420012803520a6c696e6b537461747573122e0a086c"
+    "696e6b5479706518052001280e32122e4c697374557365722e4c696e6b5479706552086c696e6b5479706512220a0c75736572506f736974"
+    "696f6e180620012805520c75736572506f736974696f6e12240a0d73696c656e6365537461747573180720012805520d73696c656e636553"
+    "7461747573121e0a0a6d6f6469667954696d65180820012803520a6d6f6469667954696d65121a0a086c696e6b6572496418092001280352"
+    "086c696e6b65724964121a0a08726f6c6554797065180a200128055208726f6c655479706522320a084c696e6b5479706512100a0c4c494e"
+    "4b5f554e4b4e4f574e100012090a05415544494f100112090a05564944454f100222140a124c696e6b6572436c6f7365436f6e74656e7422"
+    "6d0a134c696e6b6572437265617465436f6e74656e7412180a076f776e6572496418012001280352076f776e6572496412200a0b6f776e65"
+    "72526f6f6d4964180220012803520b6f776e6572526f6f6d4964121a0a086c696e6b5479706518032001280352086c696e6b5479706522c2"
+    "010a124c696e6b6572456e746572436f6e74656e7412330a0f6c696e6b656455736572734c69737418012003280b32092e4c697374557365"
+    "72520f6c696e6b656455736572734c69737412300a13616e63686f724d756c74694c697665456e756d1802200128055213616e63686f724d"
+    "756c74694c697665456e756d12450a11616e63686f7253657474696e67496e666f18032001280b32172e4c696e6b6d696355736572536574"
+    "74696e67496e666f5211616e63686f7253657474696e67496e666f22d2020a134c696e6b6572496e76697465436f6e74656e74121e0a0a66"
+    "726f6d557365724964180120012803520a66726f6d557365724964121e0a0a66726f6d526f6f6d4964180220012803520a66726f6d526f6f"
+    "6d496412220a0c746f527463457874496e666f180320012809520c746f527463457874496e666f12260a0e7274634a6f696e4368616e6e65"
+    "6c180420012808520e7274634a6f696e4368616e6e656c12160a0676656e646f72180520012803520676656e646f7212240a0d7365634672"
+    "6f6d557365724964180620012809520d73656346726f6d55736572496412260a0e746f4c696e6b6d69634964537472180720012809520e74"
+    "6f4c696e6b6d6963496453747212210a0866726f6d5573657218082001280b32052e55736572520866726f6d5573657212260a0e72657175"
+    "697265644d6963496478180920012803520e72657175697265644d6963496478226c0a144c696e6b65724b69636b4f7574436f6e74656e74"
+    "121e0a0a66726f6d557365724964180120012803520a66726f6d55736572496412340a0d6b69636b6f7574526561736f6e18022001280e32"
+    "0e2e4b69636b6f7574526561736f6e520d6b69636b6f7574526561736f6e2296010a124c696e6b65724c65617665436f6e74656e7412160a"
+    "06757365724964180120012803520675736572496412220a0c6c696e6b6d69634964537472180220012809520c6c696e6b6d696349645374"
+    "7212220a0c73656e644c65617665556964180320012803520c73656e644c6561766555696412200a0b6c65617665526561736f6e18042001"
+    "2803520b6c65617665526561736f6e221f0a1d4c696e6b65724c696e6b65644c6973744368616e6765436f6e74656e7422190a17436f686f"
+    "73744c6973744368616e6765436f6e74656e7422aa010a174c696e6b65724c6973744368616e6765436f6e74656e74122b0a0b6c696e6b65"
+    "64557365727318012003280b32092e4c69737455736572520b6c696e6b65645573657273122d0a0c6170706c696564557365727318022003"
+    "280b32092e4c69737455736572520c6170706c696564557365727312330a0f636f6e6e656374696e67557365727318032003280b32092e4c"
+    "69737455736572520f636f6e6e656374696e675573657273229c010a184c696e6b65724d656469614368616e6765436f6e74656e74120e0a"
+    "026f7018012001280352026f70121a0a08746f5573657249641802200128035208746f557365724964121a0a08616e63686f724964180320"
+    "0128035208616e63686f72496412160a06726f6f6d49641804200128035206726f6f6d496412200a0b6368616e67655363656e6518052001"
+    "2803520b6368616e67655363656e65221b0a194c696e6b65724d6963496478557064617465436f6e74656e7422430a114c696e6b65724d75"
+    "7465436f6e74656e7412160a06757365724964180120012803520675736572496412160a0673746174757318022001280352067374617475"
+    "7322af010a184c696e6b657252616e646f6d4d61746368436f6e74656e7412190a047573657218012001280b32052e557365725204757365"
+    "7212160a06726f6f6d49641802200128035206726f6f6d4964121e0a0a696e7669746554797065180320012803520a696e76697465547970"
+    "6512180a076d61746368496418042001280952076d61746368496412260a0e696e6e65724368616e6e656c4964180520012803520e696e6e"
+    "65724368616e6e656c496422f0050a124c696e6b65725265706c79436f6e74656e74121e0a0a66726f6d557365724964180120012803520a"
+    "66726f6d557365724964121e0a0a66726f6d526f6f6d4964180220012803520a66726f6d526f6f6d496412510a1366726f6d557365724c69"
+    "6e6b6d6963496e666f18032001280b321f2e4c696e6b65725265706c79436f6e74656e742e4c696e6b6d6963496e666f521366726f6d5573"
+    "65724c696e6b6d6963496e666f121a0a08746f5573657249641804200128035208746f557365724964124d0a11746f557365724c696e6b6d"
+    "6963496e666f18052001280b321f2e4c696e6b65725265706c79436f6e74656e742e4c696e6b6d6963496e666f5211746f557365724c696e"
+    "6b6d6963496e666f121a0a086c696e6b5479706518062001280352086c696e6b5479706512200a0b7265706c795374617475731807200128"
+    "03520b7265706c7953746174757312340a0d6c696e6b657253657474696e6718082001280b320e2e4c696e6b657253657474696e67520d6c"
+    "696e6b657253657474696e6712210a0866726f6d5573657218092001280b32052e55736572520866726f6d55736572121d0a06746f557365"
+    "72180a2001280b32052e557365725206746f557365721aa5020a0b4c696e6b6d6963496e666f121c0a096163636573734b65791801200128"
+    "0952096163636573734b6579121c0a096c696e6b4d6963496418022001280352096c696e6b4d69634964121a0a086a6f696e61626c651803"
+    "2001280852086a6f696e61626c6512260a0e636f6e666c75656e636554797065180420012805520e636f6e666c75656e636554797065121e"
+    "0a0a727463457874496e666f180520012809520a727463457874496e666f121a0a0872746341707049641806200128095208727463417070"
+    "4964121e0a0a7274634170705369676e180720012809520a7274634170705369676e12220a0c6c696e6b6d69634964537472180820012809"
+    "520c6c696e6b6d6963496453747212160a0676656e646f72180920012803520676656e646f7222c5010a0d4c696e6b657253657474696e67"
+    "12260a0e4d61784d656d6265724c696d6974180120012803520e4d61784d656d6265724c696d6974121a0a084c696e6b5479706518022001"
+    "280352084c696e6b5479706512140a055363656e6518032001280352055363656e6512200a0b4f776e657255736572496418042001280352"
+    "0b4f776e657255736572496412200a0b4f776e6572526f6f6d4964180520012803520b4f776e6572526f6f6d496412160a0656656e646f72"
+    "180620012803520656656e646f7222550a174c696e6b65725379734b69636b4f7574436f6e74656e7412160a067573657249641801200128"
+    "03520675736572496412220a0c6c696e6b6d69634964537472180220012809520c6c696e6b6d6963496453747222720a174c696e6b6d6963"
+    "55736572546f617374436f6e74656e7412160a06757365724964180120012803520675736572496412160a06726f6f6d4964180220012803"
+    "5206726f6f6d496412270a0b646973706c61795465787418032001280b32052e54657874520b646973706c61795465787422550a174c696e"
+    "6b657255706461746555736572436f6e74656e74121e0a0a66726f6d557365724964180120012803520a66726f6d557365724964121a0a08"
+    "746f5573657249641802200128035208746f55736572496422200a1e4c696e6b65725570646174655573657253657474696e67436f6e7465"
+    "6e7422200a1e4c696e6b657257616974696e674c6973744368616e6765436f6e74656e7422aa020a164c696e6b6d69635573657253657474"
+    "696e67496e666f12160a06757365724964180120012803520675736572496412160a066c61796f757418022001280352066c61796f757412"
+    "1c0a096669784d69634e756d18032001280352096669784d69634e756d12320a14616c6c6f775265717565737446726f6d55736572180420"
+    "0128035214616c6c6f775265717565737446726f6d5573657212420a1c616c6c6f775265717565737446726f6d466f6c6c6f7765724f6e6c"
+    "79180520012803521c616c6c6f775265717565737446726f6d466f6c6c6f7765724f6e6c79124a0a126170706c696572536f727453657474"
+    "696e6718072001280e321a2e4c696e6b6d69634170706c696572536f727453657474696e6752126170706c696572536f727453657474696e"
+    "6722380a06506c6179657212160a06726f6f6d49641801200128035206726f6f6d496412160a067573657249641802200128035206757365"
+    "72496422df010a0b416c6c4c6973745573657212320a0a6c696e6b65644c69737418022003280b32122e4c696e6b4c617965724c69737455"
+    "736572520a6c696e6b65644c69737412340a0b6170706c6965644c69737418032003280b32122e4c696e6b4c617965724c69737455736572"
+    "520b6170706c6965644c69737412340a0b696e76697465644c69737418042003280b32122e4c696e6b4c617965724c69737455736572520b"
+    "696e76697465644c69737412300a0972656164794c69737418052003280b32122e4c696e6b4c617965724c69737455736572520972656164"
+    "794c69737422d5010a114c696e6b4c617965724c6973745573657212190a047573657218012001280b32052e55736572520475736572121c"
+    "0a096c696e6b6d6963496418022001280352096c696e6b6d69634964121b0a03706f7318032001280b32092e506f736974696f6e5203706f"
+    "7312260a0e6c696e6b656454696d654e616e6f180420012803520e6c696e6b656454696d654e616e6f121e0a0a61707056657273696f6e18"
+    "0520012809520a61707056657273696f6e12220a0c6d616769634e756d62657231180720012803520c6d616769634e756d6265723122410a"
+    "08506f736974696f6e12120a047479706518012001280552047479706512210a046c696e6b18022001280b320d2e4c696e6b506f73697469"
+    "6f6e52046c696e6b223c0a0c4c696e6b506f736974696f6e121a0a08706f736974696f6e1801200128055208706f736974696f6e12100a03"
+    "6f707418022001280552036f707422460a0b47726f7570506c61796572121c0a096368616e6e656c496418012001280352096368616e6e65"
+    "6c496412190a047573657218022001280b32052e55736572520475736572224b0a0944534c436f6e66696712220a0c7363656e6556657273"
+    "696f6e180120012805520c7363656e6556657273696f6e121a0a086c61796f7574496418022001280952086c61796f75744964226c0a1347"
+    "726f75704368616e6e656c416c6c5573657212260a0e67726f75704368616e6e656c4964180120012803520e67726f75704368616e6e656c"
+    "4964122d0a08757365724c69737418022003280b32112e47726f75704368616e6e656c557365725208757365724c6973742285020a104772"
+    "6f75704368616e6e656c55736572121c0a096368616e6e656c496418012001280352096368616e6e656c496412240a067374617475731802"
+    "2001280e320c2e47726f75705374617475735206737461747573121d0a047479706518032001280e32092e54657874547970655204747970"
+    "6512260a07616c6c5573657218042001280b320c2e416c6c4c697374557365725207616c6c55736572121a0a086a6f696e54696d65180520"
+    "01280352086a6f696e54696d65121e0a0a6c696e6b656454696d65180620012803520a6c696e6b656454696d65122a0a096f776e65725573"
+    "657218072001280b320c2e47726f7570506c6179657252096f776e65725573657222ab060a0c5254434578747261496e666f124f0a136c69"
+    "7665527463456e67696e65436f6e66696718012001280b321d2e5254434578747261496e666f2e525443456e67696e65436f6e6669675213"
+    "6c697665527463456e67696e65436f6e66696712550a156c697665527463566964656f506172616d4c69737418022003280b321f2e525443"
+    "4578747261496e666f2e5254434c697665566964656f506172616d52156c697665527463566964656f506172616d4c69737412410a0d7274"
+    "63426974726174654d617018032001280b321b2e5254434578747261496e666f2e525443426974726174654d6170520d7274634269747261"
+    "74654d617012160a06727463467073180420012805520672746346707312240a0d727463427573696e6573734964180820012809520d7274"
+    "63427573696e6573734964122e0a12696e746572616374436c69656e7454797065180a200128055212696e746572616374436c69656e7454"
+    "7970651a8b010a0f525443456e67696e65436f6e666967121a0a08727463417070496418012001280952087274634170704964121c0a0972"
+    "74635573657249641802200128095209727463557365724964121a0a08727463546f6b656e1803200128095208727463546f6b656e12220a"
+    "0c7274634368616e6e656c4964180420012803520c7274634368616e6e656c49641a680a115254434c697665566964656f506172616d121e"
+    "0a0a73747261746567794964180120012805520a7374726174656779496412330a06706172616d7318022001280b321b2e52544345787472"
+    "61496e666f2e525443566964656f506172616d5206706172616d731a710a0d525443566964656f506172616d12140a057769647468180120"
+    "0128055205776964746812160a06686569676874180220012805520668656967687412100a03667073180320012805520366707312200a0b"
+    "626974726174654b627073180420012805520b626974726174654b6270731a570a0d525443426974726174654d617012100a037878311801"
+    "20012805520378783112100a03787832180220012805520378783212100a03787833180320012805520378783312100a0378783418042001"
+    "28055203787834225d0a144372656174654368616e6e656c436f6e74656e74121d0a056f776e657218012001280b32072e506c6179657252"
+    "056f776e657212260a0e6f776e65724c696e6b4d69634964180220012809520e6f776e65724c696e6b4d6963496422540a114c6973744368"
+    "616e6765436f6e74656e74121d0a047479706518012001280e32092e546578745479706552047479706512200a046c69737418022001280b"
+    "320c2e416c6c4c6973745573657252046c69737422a0090a104d756c74694c697665436f6e74656e74124e0a10696e7669746542697a436f"
+    "6e74656e7418022001280b32222e4d756c74694c697665436f6e74656e742e496e7669746542697a436f6e74656e745210696e7669746542"
+    "697a436f6e74656e74124b0a0f7265706c7942697a436f6e74656e7418032001280b32212e4d756c74694c697665436f6e74656e742e5265"
+    "706c7942697a436f6e74656e74520f7265706c7942697a436f6e74656e74124e0a107065726d697442697a436f6e74656e7418042001280b"
+    "32222e4d756c74694c697665436f6e74656e742e5065726d697442697a436f6e74656e7452107065726d697442697a436f6e74656e741251"
+    "0a116b69636b4f757442697a436f6e74656e7418062001280b32232e4d756c74694c697665436f6e74656e742e4b69636b4f757442697a43"
+    "6f6e74656e7452116b69636b4f757442697a436f6e74656e741a97020a10496e7669746542697a436f6e74656e7412450a11616e63686f72"
+    "53657474696e67496e666f18012001280b32172e4c696e6b6d69635573657253657474696e67496e666f5211616e63686f7253657474696e"
+    "67496e666f12220a0c696e76697465536f75726365180220012803520c696e76697465536f7572636512310a106f70657261746f72557365"
+    "72496e666f18032001280b32052e5573657252106f70657261746f7255736572496e666f12340a156f70657261746f724c696e6b41646d69"
+    "6e5479706518042001280352156f70657261746f724c696e6b41646d696e54797065122f0a0f696e766974656555736572496e666f180520"
+    "01280b32052e55736572520f696e766974656555736572496e666f1a8c010a0f5265706c7942697a436f6e74656e74121a0a086c696e6b54"
+    "79706518012001280552086c696e6b5479706512300a1369735475726e4f6666496e7669746174696f6e180220012805521369735475726e"
+    "4f6666496e7669746174696f6e122b0a0d7265706c7955736572496e666f18032001280b32052e55736572520d7265706c7955736572496e"
+    "666f1aec010a105065726d697442697a436f6e74656e7412450a11616e63686f7253657474696e67496e666f18012001280b32172e4c696e"
+    "6b6d69635573657253657474696e67496e666f5211616e63686f7253657474696e67496e666f12280a0f65787069726554696d657374616d"
+    "70180220012803520f65787069726554696d657374616d7012310a106f70657261746f7255736572496e666f18032001280b32052e557365"
+    "7252106f70657261746f7255736572496e666f12340a156f70657261746f724c696e6b41646d696e5479706518042001280352156f706572"
+    "61746f724c696e6b41646d696e547970651ab3010a114b69636b4f757442697a436f6e74656e7412310a106f70657261746f725573657249"
+    "6e666f18012001280b32052e5573657252106f70657261746f7255736572496e666f12340a156f70657261746f724c696e6b41646d696e54"
+    "79706518022001280352156f70657261746f724c696e6b41646d696e5479706512350a126b69636b506c6179657255736572496e666f1803"
+    "2001280b32052e5573657252126b69636b506c6179657255736572496e666f22e0020a0d496e76697465436f6e74656e7412210a07696e76"
+    "69746f7218012001280b32072e506c617965725207696e7669746f72123b0a11696e7669746565527463457874496e666f18022001280b32"
+    "0d2e5254434578747261496e666f5211696e7669746565527463457874496e666f122a0a10696e7669746f724c696e6b4d69634964180320"
+    "0128095210696e7669746f724c696e6b4d69634964122a0a10696e76697465654c696e6b4d696349641804200128095210696e7669746565"
+    "4c696e6b4d6963496412180a0769734f776e6572180520012808520769734f776e6572121b0a03706f7318062001280b32092e506f736974"
+    "696f6e5203706f73121c0a0364736c18072001280b320a2e44534c436f6e666967520364736c121f0a07696e766974656518082001280b32"
+    "052e557365725207696e766974656512210a086f70657261746f7218092001280b32052e5573657252086f70657261746f72225d0a0c4170"
+    "706c79436f6e74656e7412210a076170706c69657218012001280b32072e506c6179657252076170706c696572122a0a106170706c696572"
+    "4c696e6b4d6963496418022001280952106170706c6965724c696e6b4d6963496422d0020a125065726d69744170706c79436f6e74656e74"
+    "12230a087065726d6974657218012001280b32072e506c6179657252087065726d69746572122c0a117065726d697465724c696e6b4d6963"
+    "496418022001280952117065726d697465724c696e6b4d6963496412290a0a6170706c696572506f7318032001280b32092e506f73697469"
+    "6f6e520a6170706c696572506f73122e0a0b7265706c7953746174757318042001280e320c2e5265706c79537461747573520b7265706c79"
+    "537461747573121c0a0364736c18052001280b320a2e44534c436f6e666967520364736c121f0a076170706c69657218062001280b32052e"
+    "5573657252076170706c69657212210a086f70657261746f7218072001280b32052e5573657252086f70657261746f72122a0a106170706c"
+    "6965724c696e6b4d6963496418082001280952106170706c6965724c696e6b4d6963496422f7010a125265706c79496e76697465436f6e74"
+    "656e7412210a07696e766974656518012001280b32072e506c617965725207696e7669746565122e0a0b7265706c79537461747573180220"
+    "01280e320c2e5265706c79537461747573520b7265706c79537461747573122a0a10696e76697465654c696e6b4d69634964180320012809"
+    "5210696e76697465654c696e6b4d6963496412290a0a696e7669746565506f7318042001280b32092e506f736974696f6e520a696e766974"
+    "6565506f7312370a12696e766974654f70657261746f725573657218052001280b32072e506c617965725212696e766974654f7065726174"
+    "6f7255736572226b0a0e4b69636b4f7574436f6e74656e7412230a086f66666c696e657218012001280b32072e506c6179657252086f6666"
+    "6c696e657212340a0d6b69636b6f7574526561736f6e18022001280e320e2e4b69636b6f7574526561736f6e520d6b69636b6f7574526561"
+    "736f6e22630a1243616e63656c4170706c79436f6e74656e7412210a076170706c69657218012001280b32072e506c617965725207617070"
+    "6c696572122a0a106170706c6965724c696e6b4d6963496418022001280952106170706c6965724c696e6b4d6963496422d5010a1343616e"
+    "63656c496e76697465436f6e74656e7412210a07696e7669746f7218012001280b32072e506c617965725207696e7669746f72122a0a1069"
+    "6e7669746f724c696e6b4d696349641802200128095210696e7669746f724c696e6b4d69634964122a0a10696e76697465654c696e6b4d69"
+    "6349641803200128095210696e76697465654c696e6b4d6963496412200a0b696e766974655365714964180420012803520b696e76697465"
+    "536571496412210a07696e766974656518052001280b32072e506c617965725207696e766974656522510a0c4c65617665436f6e74656e74"
+    "121f0a066c656176657218012001280b32072e506c6179657252066c656176657212200a0b6c65617665526561736f6e180220012803520b"
+    "6c65617665526561736f6e22590a1446696e6973684368616e6e656c436f6e74656e74121d0a056f776e657218012001280b32072e506c61"
+    "79657252056f776e657212220a0c66696e697368526561736f6e180220012803520c66696e697368526561736f6e22690a114a6f696e4469"
+    "72656374436f6e74656e74122a0a066a6f696e657218012001280b32122e4c696e6b4c617965724c6973745573657252066a6f696e657212"
+    "280a08616c6c557365727318022001280b320c2e416c6c4c697374557365725208616c6c5573657273228b010a154c656176654a6f696e47"
+    "726f7570436f6e74656e7412280a086f70657261746f7218012001280b320c2e47726f7570506c6179657252086f70657261746f7212260a"
+    "0e67726f75704368616e6e656c4964180220012803520e67726f75704368616e6e656c496412200a0b6c65617665536f7572636518032001"
+    "2809520b6c65617665536f757263652280020a165065726d69744a6f696e47726f7570436f6e74656e7412280a08617070726f7665721801"
+    "2001280b320c2e47726f7570506c617965725208617070726f766572122e0a0b616772656553746174757318022001280e320c2e41677265"
+    "65537461747573520b6167726565537461747573121d0a047479706518032001280e32092e546578745479706552047479706512390a1067"
+    "726f7570457874496e666f4c69737418042003280b320d2e5254434578747261496e666f521067726f7570457874496e666f4c6973741232"
+    "0a0967726f75705573657218052001280b32142e47726f75704368616e6e656c416c6c55736572520967726f757055736572228f010a1643"
+    "616e63656c4a6f696e47726f7570436f6e74656e74122c0a0a6c65617665724c69737418012003280b320c2e47726f7570506c6179657252"
+    "0a6c65617665724c69737412280a086f70657261746f7218022001280b320c2e47726f7570506c6179657252086f70657261746f72121d0a"
+    "047479706518032001280e32092e54657874547970655204747970652286010a1550325047726f75704368616e6765436f6e74656e741239"
+    "0a1067726f7570457874496e666f4c69737418012003280b320d2e5254434578747261496e666f521067726f7570457874496e666f4c6973"
+    "7412320a0967726f75705573657218022001280b32142e47726f75704368616e6e656c416c6c55736572520967726f75705573657222e912"
+    "0a0f427573696e657373436f6e74656e74121e0a0a6f7665724c656e677468180120012803520a6f7665724c656e677468123d0a106d756c"
+    "74694c697665436f6e74656e7418642001280b32112e4d756c74694c697665436f6e74656e7452106d756c74694c697665436f6e74656e74"
+    "12450a0d636f686f7374436f6e74656e7418c8012001280b321e2e427573696e657373436f6e74656e742e436f686f7374436f6e74656e74"
+    "520d636f686f7374436f6e74656e741a670a0d436f686f7374436f6e74656e7412560a136a6f696e47726f757042697a436f6e74656e7418"
+    "012001280b32242e427573696e657373436f6e74656e742e4a6f696e47726f757042697a436f6e74656e7452136a6f696e47726f75704269"
+    "7a436f6e74656e741ac2020a134a6f696e47726f757042697a436f6e74656e7412340a1566726f6d526f6f6d416765526573747269637465"
+    "64180120012805521566726f6d526f6f6d41676552657374726963746564122e0a0766726f6d54616718022001280b32142e427573696e65"
+    "7373436f6e74656e742e546167520766726f6d546167123d0a066469616c6f6718032001280b32252e427573696e657373436f6e74656e74"
+    "2e50657263657074696f6e4469616c6f67496e666f52066469616c6f6712300a0a70756e697368496e666f18042001280b32102e50756e69"
+    "73684576656e74496e666f520a70756e697368496e666f12540a116a6f696e47726f75704d7367457874726118652001280b32262e427573"
+    "696e657373436f6e74656e742e4a6f696e47726f75704d657373616765457874726152116a6f696e47726f75704d736745787472611a550a"
+    "0354616712180a0774616754797065180120012805520774616754797065121a0a0874616756616c7565180220012809520874616756616c"
+    "756512180a07746167546578741803200128095207746167546578741aad040a1450657263657074696f6e4469616c6f67496e666f121a0a"
+    "0869636f6e54797065180120012803520869636f6e54797065121b0a057469746c6518022001280b32052e5465787452057469746c651221"
+    "0a087375625469746c6518032001280b32052e5465787452087375625469746c6512310a10616476696365416374696f6e54657874180420"
+    "01280b32052e546578745210616476696365416374696f6e5465787412330a1164656661756c74416374696f6e5465787418052001280b32"
+    "052e54657874521164656661756c74416374696f6e54657874122e0a1276696f6c6174696f6e44657461696c55726c180620012809521276"
+    "696f6c6174696f6e44657461696c55726c12140a057363656e6518072001280552057363656e6512220a0c74617267657455736572496418"
+    "0820012803520c74617267657455736572496412220a0c746172676574526f6f6d4964180920012803520c746172676574526f6f6d496412"
+    "240a0d636f756e74446f776e54696d65180a20012803520d636f756e74446f776e54696d6512220a0c73686f77466565646261636b180b20"
+    "012808520c73686f77466565646261636b125b0a13666565646261636b4f7074696f6e734c697374180c2003280b32292e427573696e6573"
+    "73436f6e74656e742e50657263657074696f6e466565646261636b4f7074696f6e5213666565646261636b4f7074696f6e734c697374121c"
+    "0a09706f6c696379546970180d200128035209706f6c6963795469701a4a0a1850657263657074696f6e466565646261636b4f7074696f6e"
+    "120e0a02696418012001280352026964121e0a0a636f6e74656e744b6579180220012809520a636f6e74656e744b65791ae7060a154a6f69"
+    "6e47726f75704d6573736167654578747261121e0a0a736f7572636554797065180120012803520a736f757263655479706512470a056578"
+    "74726118022001280b32312e427573696e657373436f6e74656e742e4a6f696e47726f75704d65737361676545787472612e526976616c45"
+    "787472615205657874726112590a0e6f7468657255736572734c69737418032003280b32312e427573696e657373436f6e74656e742e4a6f"
+    "696e47726f75704d65737361676545787472612e526976616c4578747261520e6f7468657255736572734c6973741a89050a0a526976616c"
+    "4578747261121c0a0975736572436f756e74180420012803520975736572436f756e7412280a0b6176617461725468756d6218052001280b"
+    "32062e496d616765520b6176617461725468756d62121c0a09646973706c617949641806200128095209646973706c6179496412740a1261"
+    "757468656e7469636174696f6e496e666f18072001280b32442e427573696e657373436f6e74656e742e4a6f696e47726f75704d65737361"
+    "676545787472612e526976616c45787472612e41757468656e7469636174696f6e496e666f521261757468656e7469636174696f6e496e66"
+    "6f121a0a086e69636b6e616d6518082001280952086e69636b6e616d6512220a0c666f6c6c6f77537461747573180920012803520c666f6c"
+    "6c6f7753746174757312320a0768617368746167180a2001280b32182e427573696e657373436f6e74656e742e4861736874616752076861"
+    "7368746167123e0a0b746f70486f7374496e666f180b2001280b321c2e427573696e657373436f6e74656e742e546f70486f7374496e666f"
+    "520b746f70486f7374496e666f12160a06757365724964180c20012803520675736572496412260a0e6973426573745465616d6d61746518"
+    "0d20012808520e6973426573745465616d6d6174651aaa010a1241757468656e7469636174696f6e496e666f12220a0c637573746f6d5665"
+    "72696679180120012809520c637573746f6d56657269667912360a16656e7465727072697365566572696679526561736f6e180220012809"
+    "5216656e7465727072697365566572696679526561736f6e12380a1361757468656e7469636174696f6e426164676518032001280b32062e"
+    "496d616765521361757468656e7469636174696f6e42616467651a7e0a0748617368746167120e0a0269641801200128035202696412140a"
+    "057469746c6518022001280952057469746c65121c0a05696d61676518032001280b32062e496d6167655205696d616765122f0a096e616d"
+    "65737061636518042001280e32112e486173687461674e616d65737061636552096e616d6573706163651a450a0b546f70486f7374496e66"
+    "6f121a0a0872616e6b54797065180120012809520872616e6b54797065121a0a08746f70496e6465781802200128035208746f70496e6465"
+    "78228f010a104a6f696e47726f7570436f6e74656e7412320a0967726f75705573657218012001280b32142e47726f75704368616e6e656c"
+    "416c6c55736572520967726f75705573657212280a086a6f696e5573657218022001280b320c2e47726f7570506c6179657252086a6f696e"
+    "55736572121d0a047479706518032001280e32092e5465787454797065520474797065620670726f746f330a88ab010a0d77656263617374"
+    "2e70726f746f1a0a646174612e70726f746f1a0b656e756d732e70726f746f22cc020a1057656263617374507573684672616d6512140a05"
+    "53657149641801200128045205536571496412140a054c6f67496418022001280452054c6f67496412180a07536572766963651803200128"
+    "0452075365727669636512160a064d6574686f6418042001280452064d6574686f6412380a076865616465727318052003280b321e2e5765"
+    "6263617374507573684672616d652e48656164657273456e74727952076865616465727312280a0f5061796c6f6164456e636f64696e6718"
+    "0620012809520f5061796c6f6164456e636f64696e6712200a0b5061796c6f616454797065180720012809520b5061796c6f616454797065"
+    "12180a075061796c6f616418082001280c52075061796c6f61641a3a0a0c48656164657273456e74727912100a036b657918012001280952"
+    "036b657912140a0576616c7565180220012809520576616c75653a02380122ea050a0f57656263617374526573706f6e736512340a086d65"
+    "73736167657318012003280b32182e57656263617374526573706f6e73652e4d65737361676552086d6573736167657312160a0663757273"
+    "6f721802200128095206637572736f7212240a0d6665746368496e74657276616c180320012803520d6665746368496e74657276616c1210"
+    "0a036e6f7718042001280352036e6f7712200a0b696e7465726e616c457874180520012809520b696e7465726e616c457874121c0a096665"
+    "746368547970651806200128055209666574636854797065124c0a0e726f757465506172616d734d617018072003280b32242e5765626361"
+    "7374526573706f6e73652e526f757465506172616d734d6170456e747279520e726f757465506172616d734d6170122c0a11686561727442"
+    "6561744475726174696f6e18082001280352116865617274426561744475726174696f6e121a0a086e6565647341636b1809200128085208"
+    "6e6565647341636b121e0a0a70757368536572766572180a20012809520a7075736853657276657212180a0769734669727374180b200128"
+    "0852076973466972737412320a14686973746f7279436f6d6d656e74437572736f72180c200128095214686973746f7279436f6d6d656e74"
+    "437572736f7212240a0d686973746f72794e6f4d6f7265180d20012808520d686973746f72794e6f4d6f72651a410a13526f757465506172"
+    "616d734d6170456e74727912100a036b657918012001280952036b657912140a0576616c7565180220012809520576616c75653a0238011a"
+    "a1010a074d65737361676512160a066d6574686f6418012001280952066d6574686f6412180a077061796c6f616418022001280c52077061"
+    "796c6f616412140a056d7367496418032001280352056d7367496412180a076d73675479706518042001280552076d73675479706512160a"
+    "066f666673657418052001280352066f6666736574121c0a096973486973746f727918062001280852096973486973746f727922ae080a12"
+    "57656263617374476966744d657373616765121f0a06636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e12160a0667"
+    "6966744964180220012803520667696674496412260a0e66616e5469636b6574436f756e74180320012803520e66616e5469636b6574436f"
+    "756e74121e0a0a67726f7570436f756e74180420012805520a67726f7570436f756e7412200a0b726570656174436f756e74180520012805"
+    "520b726570656174436f756e74121e0a0a636f6d626f436f756e74180620012805520a636f6d626f436f756e7412190a0475736572180720"
+    "01280b32052e55736572520475736572121d0a06746f5573657218082001280b32052e557365725206746f55736572121c0a097265706561"
+    "74456e641809200128055209726570656174456e6412180a0767726f75704964180b20012803520767726f7570496412280a0f696e636f6d"
+    "655461736b6769667473180c20012803520f696e636f6d655461736b6769667473122e0a12726f6f6d46616e5469636b6574436f756e7418"
+    "0d200128035212726f6f6d46616e5469636b6574436f756e74121f0a0467696674180f2001280b320b2e4769667453747275637452046769"
+    "667412140a056c6f67496418102001280952056c6f674964121a0a0873656e6454797065181120012803520873656e645479706512220a0c"
+    "6d6f6e69746f724578747261181620012809520c6d6f6e69746f72457874726112180a07636f6c6f7249641818200128035207636f6c6f72"
+    "496412200a0b6973466972737453656e74181920012808520b6973466972737453656e7412180a076f726465724964181c2001280952076f"
+    "72646572496412310a0c757365724964656e7469747918202001280b320d2e557365724964656e74697479520c757365724964656e746974"
+    "7912500a107573657247696674526563696576657218172001280b32242e57656263617374476966744d6573736167652e55736572476966"
+    "7452656369657665725210757365724769667452656369657665721a4a0a105573657247696674526563696576657212160a067573657249"
+    "641801200128035206757365724964121e0a0a6465766963654e616d65180a20012809520a6465766963654e616d651a82010a0e47696674"
+    "494d5072696f7269747912260a0e717565756553697a65734c697374180120032803520e717565756553697a65734c697374122c0a117365"
+    "6c6651756575655072696f72697479180220012803521173656c6651756575655072696f72697479121a0a087072696f7269747918032001"
+    "280352087072696f726974791a660a105075626c696341726561436f6d6d6f6e12240a09757365724c6162656c18012001280b32062e496d"
+    "6167655209757365724c6162656c122c0a1175736572436f6e73756d65496e526f6f6d180220012803521175736572436f6e73756d65496e"
+    "526f6f6d22dc010a0b526f6f6d4d657373616765121f0a06636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e12180a"
+    "07636f6e74656e741802200128095207636f6e74656e74122a0a1073757070726f744c616e64736361706518032001280852107375707072"
+    "6f744c616e64736361706512160a06736f757263651804200128035206736f75726365121a0a0469636f6e18052001280b32062e496d6167"
+    "65520469636f6e12140a057363656e6518062001280952057363656e65121c0a09697357656c636f6d651807200128085209697357656c63"
+    "6f6d65224f0a1257656263617374526f6f6d4d657373616765121f0a06636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d"
+    "6f6e12180a07636f6e74656e741802200128095207636f6e74656e7422b60a0a1557656263617374426172726167654d657373616765121f"
+    "0a06636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e12390a056576656e7418022001280b32232e57656263617374"
+    "426172726167654d6573736167652e426172726167654576656e7452056576656e74123c0a076d73675479706518032001280e32222e5765"
+    "6263617374426172726167654d6573736167652e426172726167655479706552076d736754797065121a0a0469636f6e18042001280b3206"
+    "2e496d616765520469636f6e121f0a07636f6e74656e7418052001280b32052e546578745207636f6e74656e74121a0a086475726174696f"
+    "6e18062001280552086475726174696f6e12260a0a6261636b67726f756e6418072001280b32062e496d616765520a6261636b67726f756e"
+    "6412240a09726967687449636f6e18082001280b32062e496d6167655209726967687449636f6e12580a0e75736572477261646550617261"
+    "6d18642001280b32302e57656263617374426172726167654d6573736167652e426172726167655479706555736572477261646550617261"
+    "6d520e757365724772616465506172616d12580a0e66616e734c6576656c506172616d18652001280b32302e576562636173744261727261"
+    "67654d6573736167652e426172726167655479706546616e734c6576656c506172616d520e66616e734c6576656c506172616d12640a1273"
+    "756273637269626547696674506172616d18662001280b32342e57656263617374426172726167654d6573736167652e4261727261676554"
+    "79706553756273637269626547696674506172616d521273756273637269626547696674506172616d1a98010a1942617272616765547970"
+    "65557365724772616465506172616d12220a0c63757272656e744772616465180120012805520c63757272656e74477261646512240a0d64"
+    "6973706c6179436f6e666967180220012805520d646973706c6179436f6e66696712160a0675736572496418032001280952067573657249"
+    "6412190a047573657218042001280b32052e557365725204757365721a80010a19426172726167655479706546616e734c6576656c506172"
+    "616d12220a0c63757272656e744772616465180120012805520c63757272656e74477261646512240a0d646973706c6179436f6e66696718"
+    "0220012805520d646973706c6179436f6e66696712190a047573657218042001280b32052e557365725204757365721a6f0a1d4261727261"
+    "67655479706553756273637269626547696674506172616d12220a0c67696674537562436f756e74180120012803520c6769667453756243"
+    "6f756e74122a0a1073686f7747696674537562436f756e74180220012808521073686f7747696674537562436f756e741a2c0a0c42617272"
+    "6167654576656e74121c0a096576656e744e616d6518012001280952096576656e744e616d652284020a0b4261727261676554797065120b"
+    "0a07554e4b4e4f574e100012100a0c45434f4d4f52444552494e471001120e0a0a45434f4d425559494e471002120a0a064e4f524d414c10"
+    "03120d0a095355425343524942451004120d0a094556454e5456494557100512130a0f4556454e5452454749535445524544100612110a0d"
+    "535542534352494245474946541007120f0a0b5553455255504752414445100812210a1d475241444555534552454e5452414e43454e4f54"
+    "494649434154494f4e100912140a1046414e534c4556454c55504752414445100a12150a1146414e534c4556454c454e5452414e4345100b"
+    "12130a0f47414d45504152544e455253484950100c22db010a155765626361737443617074696f6e4d657373616765121f0a06636f6d6d6f"
+    "6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e121c0a0974696d655374616d70180220012804520974696d655374616d701244"
+    "0a0b63617074696f6e4461746118042001280b32222e5765626361737443617074696f6e4d6573736167652e43617074696f6e4461746152"
+    "0b63617074696f6e446174611a3d0a0b43617074696f6e44617461121a0a086c616e677561676518012001280952086c616e677561676512"
+    "120a04746578741802200128095204746578742284070a1257656263617374436861744d657373616765121f0a06636f6d6d6f6e18012001"
+    "280b32072e436f6d6d6f6e5206636f6d6d6f6e12190a047573657218022001280b32052e5573657252047573657212180a07636f6e74656e"
+    "741803200128095207636f6e74656e7412280a0f76697369626c65546f53656e646572180420012808520f76697369626c65546f53656e64"
+    "657212300a0f6261636b67726f756e64496d61676518052001280b32062e496d616765520f6261636b67726f756e64496d61676512300a13"
+    "66756c6c53637265656e54657874436f6c6f72180620012809521366756c6c53637265656e54657874436f6c6f7212340a116261636b6772"
+    "6f756e64496d616765563218072001280b32062e496d61676552116261636b67726f756e64496d616765563212240a0967696674496d6167"
+    "65180a2001280b32062e496d616765520967696674496d616765121c0a09696e70757454797065180b200128055209696e70757454797065"
+    "121d0a06617455736572180c2001280b32052e55736572520661745573657212420a0a656d6f7465734c697374180d2003280b32222e5765"
+    "6263617374436861744d6573736167652e456d6f746557697468496e646578520a656d6f7465734c69737412280a0f636f6e74656e744c61"
+    "6e6775616765180e20012809520f636f6e74656e744c616e677561676512260a0e717569636b436861745363656e65181020012805520e71"
+    "7569636b436861745363656e6512360a16636f6d6d756e697479466c61676765645374617475731811200128055216636f6d6d756e697479"
+    "466c616767656453746174757312310a0c557365724964656e7469747918122001280b320d2e557365724964656e74697479520c55736572"
+    "4964656e7469747912610a14436f6d6d656e745175616c69747953636f72657318132003280b322d2e57656263617374436861744d657373"
+    "6167652e436f6d6d656e745175616c69747953636f726573456e7472795214436f6d6d656e745175616c69747953636f7265731a470a1943"
+    "6f6d6d656e745175616c69747953636f726573456e74727912100a036b657918012001280552036b657912140a0576616c75651802200128"
+    "09520576616c75653a0238011a440a0e456d6f746557697468496e64657812140a05696e6465781801200128035205696e646578121c0a05"
+    "656d6f746518022001280b32062e456d6f74655205656d6f74652285050a1557656263617374436f6e74726f6c4d657373616765121f0a06"
+    "636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e12260a06616374696f6e18022001280e320e2e436f6e74726f6c41"
+    "6374696f6e5206616374696f6e12120a047469707318032001280952047469707312320a05657874726118042001280b321c2e5765626361"
+    "7374436f6e74726f6c4d6573736167652e457874726152056578747261123d0a1670657263657074696f6e41756469656e63655465787418"
+    "062001280b32052e54657874521670657263657074696f6e41756469656e63655465787412300a0a70756e697368496e666f18072001280b"
+    "32102e50756e6973684576656e74496e666f520a70756e697368496e666f12230a09666c6f61745465787418082001280b32052e54657874"
+    "5209666c6f617454657874121e0a0a666c6f61745374796c65180920012805520a666c6f61745374796c651aa4020a054578747261121e0a"
+    "0a62616e496e666f55726c180120012809520a62616e496e666f55726c121a0a08726561736f6e4e6f1802200128035208726561736f6e4e"
+    "6f121b0a057469746c6518032001280b32052e5465787452057469746c65122f0a0f76696f6c6174696f6e526561736f6e18042001280b32"
+    "052e54657874520f76696f6c6174696f6e526561736f6e121f0a07636f6e74656e7418052001280b32052e546578745207636f6e74656e74"
+    "12270a0b676f744974427574746f6e18062001280b32052e54657874520b676f744974427574746f6e122f0a0f62616e44657461696c4275"
+    "74746f6e18072001280b32052e54657874520f62616e44657461696c427574746f6e12160a06736f757263651808200128095206736f7572"
+    "636522d8010a1757656263617374456d6f7465436861744d657373616765121f0a06636f6d6d6f6e18012001280b32072e436f6d6d6f6e52"
+    "06636f6d6d6f6e12190a047573657218022001280b32052e5573657252047573657212240a09656d6f74654c69737418032003280b32062e"
+    "456d6f74655209656d6f74654c69737412280a096d736746696c74657218042001280b320a2e4d736746696c74657252096d736746696c74"
+    "657212310a0c757365724964656e7469747918052001280b320d2e557365724964656e74697479520c757365724964656e7469747922a605"
+    "0a1657656263617374456e76656c6f70654d657373616765121f0a06636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f"
+    "6e12480a0c656e76656c6f7065496e666f18022001280b32242e57656263617374456e76656c6f70654d6573736167652e456e76656c6f70"
+    "65496e666f520c656e76656c6f7065496e666f122a0a07646973706c617918032001280e32102e456e76656c6f7065446973706c61795207"
+    "646973706c61791af4030a0c456e76656c6f7065496e666f121e0a0a656e76656c6f70654964180120012809520a656e76656c6f70654964"
+    "12390a0c627573696e6573735479706518022001280e32152e456e76656c6f7065427573696e65737354797065520c627573696e65737354"
+    "79706512200a0b656e76656c6f7065496463180320012809520b656e76656c6f706549646312220a0c73656e64557365724e616d65180420"
+    "012809520c73656e64557365724e616d6512220a0c6469616d6f6e64436f756e74180520012805520c6469616d6f6e64436f756e7412200a"
+    "0b70656f706c65436f756e74180620012805520b70656f706c65436f756e74121a0a08756e7061636b41741807200128055208756e706163"
+    "6b4174121e0a0a73656e64557365724964180820012809520a73656e64557365724964122e0a0e73656e6455736572417661746172180920"
+    "01280b32062e496d616765520e73656e6455736572417661746172121a0a086372656174654174180a200128095208637265617465417412"
+    "160a06726f6f6d4964180b200128095206726f6f6d496412450a10666f6c6c6f7753686f77537461747573180c2001280e32192e456e7665"
+    "6c6f7065466f6c6c6f7753686f775374617475735210666f6c6c6f7753686f7753746174757312160a06736b696e4964180d200128055206"
+    "736b696e496422e2030a1857656263617374476f616c5570646174654d657373616765121f0a06636f6d6d6f6e18012001280b32072e436f"
+    "6d6d6f6e5206636f6d6d6f6e12280a09696e64696361746f7218022001280b320a2e496e64696361746f725209696e64696361746f721219"
+    "0a04676f616c18032001280b32052e476f616c5204676f616c12240a0d636f6e7472696275746f724964180420012803520d636f6e747269"
+    "6275746f72496412340a11636f6e7472696275746f7241766174617218052001280b32062e496d6167655211636f6e7472696275746f7241"
+    "766174617212320a14636f6e7472696275746f72446973706c617949641806200128095214636f6e7472696275746f72446973706c617949"
+    "6412280a0f636f6e74726962757465436f756e74180920012803520f636f6e74726962757465436f756e7412280a0f636f6e747269627574"
+    "6553636f7265180a20012803520f636f6e7472696275746553636f726512280a0f67696674526570656174436f756e74180b20012803520f"
+    "67696674526570656174436f756e74122a0a10636f6e7472696275746f724964537472180c200128095210636f6e7472696275746f724964"
+    "53747212100a0370696e180d20012808520370696e12140a05756e70696e180e200128085205756e70696e2293010a165765626361737449"
+    "6d44656c6574654d657373616765121f0a06636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e122a0a1064656c6574"
+    "654d73674964734c697374180220032803521064656c6574654d73674964734c697374122c0a1164656c657465557365724964734c697374"
+    "180320032803521164656c657465557365724964734c69737422510a1a57656263617374496e526f6f6d42616e6e65724d65737361676512"
+    "1f0a0668656164657218012001280b32072e436f6d6d6f6e520668656164657212120a046a736f6e18022001280952046a736f6e227c0a12"
+    "576562636173744c696b654d657373616765121f0a06636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e12140a0563"
+    "6f756e741802200128055205636f756e7412140a05746f74616c1803200128055205746f74616c12190a047573657218052001280b32052e"
+    "5573657252047573657222bc030a1957656263617374526f6f6d557365725365714d657373616765121f0a06636f6d6d6f6e18012001280b"
+    "32072e436f6d6d6f6e5206636f6d6d6f6e12440a0972616e6b734c69737418022003280b32262e57656263617374526f6f6d557365725365"
+    "714d6573736167652e436f6e7472696275746f72520972616e6b734c69737412140a05746f74616c1803200128035205746f74616c12160a"
+    "06706f705374721804200128095206706f7053747212440a0973656174734c69737418052003280b32262e57656263617374526f6f6d5573"
+    "65725365714d6573736167652e436f6e7472696275746f72520973656174734c697374121e0a0a706f70756c617269747918062001280352"
+    "0a706f70756c6172697479121c0a09746f74616c557365721807200128055209746f74616c55736572121c0a09616e6f6e796d6f75731808"
+    "200128035209616e6f6e796d6f75731a680a0b436f6e7472696275746f7212140a0573636f7265180120012805520573636f726512190a04"
+    "7573657218022001280b32052e5573657252047573657212120a0472616e6b180320012805520472616e6b12140a0564656c746118042001"
+    "2803520564656c7461229a020a1457656263617374536f6369616c4d657373616765121f0a06636f6d6d6f6e18012001280b32072e436f6d"
+    "6d6f6e5206636f6d6d6f6e12190a047573657218022001280b32052e55736572520475736572121c0a097368617265547970651803200128"
+    "03520973686172655479706512160a06616374696f6e1804200128035206616374696f6e12200a0b73686172655461726765741805200128"
+    "09520b736861726554617267657412200a0b666f6c6c6f77436f756e74180620012805520b666f6c6c6f77436f756e74122c0a1173686172"
+    "65446973706c61795374796c6518072001280352117368617265446973706c61795374796c65121e0a0a7368617265436f756e7418082001"
+    "2805520a7368617265436f756e7422e2020a17576562636173745375624e6f746966794d657373616765121f0a06636f6d6d6f6e18012001"
+    "280b32072e436f6d6d6f6e5206636f6d6d6f6e12190a047573657218022001280b32052e55736572520475736572121a0a087375624d6f6e"
+    "746818042001280352087375624d6f6e746812340a0d7375627363726962655479706518052001280e320e2e537562736372696265547970"
+    "65520d7375627363726962655479706512430a126f6c6453756273637269626553746174757318062001280e32132e4f6c64537562736372"
+    "69626553746174757352126f6c6453756273637269626553746174757312400a117375627363726962696e6753746174757318082001280e"
+    "32122e5375627363726962696e6753746174757352117375627363726962696e6753746174757312160a06697353656e6418092001280852"
+    "06697353656e64121a0a086973437573746f6d180a2001280852086973437573746f6d22ed060a185765626361737452616e6b5570646174"
+    "654d657373616765121f0a06636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e12460a0b757064617465734c697374"
+    "18022003280b32242e5765626361737452616e6b5570646174654d6573736167652e52616e6b557064617465520b757064617465734c6973"
+    "74121c0a0967726f757054797065180320012803520967726f757054797065121a0a087072696f7269747918052001280352087072696f72"
+    "69747912410a08746162734c69737418062003280b32252e5765626361737452616e6b5570646174654d6573736167652e52616e6b546162"
+    "496e666f5208746162734c69737412300a136973416e696d6174696f6e4c6f6f70506c617918072001280852136973416e696d6174696f6e"
+    "4c6f6f70506c617912300a13616e696d6174696f6e4c6f6f70466f724f66661808200128085213616e696d6174696f6e4c6f6f70466f724f"
+    "66661a88010a0b52616e6b546162496e666f121a0a0872616e6b54797065180120012803520872616e6b5479706512140a057469746c6518"
+    "022001280952057469746c6512230a097469746c655465787418032001280b32052e5465787452097469746c655465787412220a0c6c6973"
+    "744c796e7854797065180420012803520c6c6973744c796e78547970651afb020a0a52616e6b557064617465121a0a0872616e6b54797065"
+    "180120012803520872616e6b54797065121c0a096f776e657252616e6b18022001280352096f776e657252616e6b122d0a0e64656661756c"
+    "74436f6e74656e7418032001280b32052e54657874520e64656661756c74436f6e74656e7412340a1573686f77456e7472616e6365416e69"
+    "6d6174696f6e180520012808521573686f77456e7472616e6365416e696d6174696f6e121c0a09636f756e74646f776e1806200128035209"
+    "636f756e74646f776e122e0a1272656c6174656454616252616e6b54797065180820012803521272656c6174656454616252616e6b547970"
+    "6512320a1472657175657374466972737453686f7754797065180920012803521472657175657374466972737453686f7754797065122a0a"
+    "10737570706f7274656456657273696f6e180a200128035210737570706f7274656456657273696f6e12200a0b6f776e65726f6e72616e6b"
+    "180b20012808520b6f776e65726f6e72616e6b22f6090a14576562636173744d656d6265724d657373616765121f0a06636f6d6d6f6e1801"
+    "2001280b32072e436f6d6d6f6e5206636f6d6d6f6e12190a047573657218022001280b32052e5573657252047573657212200a0b6d656d62"
+    "6572436f756e74180320012805520b6d656d626572436f756e7412210a086f70657261746f7218042001280b32052e5573657252086f7065"
+    "7261746f7212220a0c6973536574546f41646d696e180520012808520c6973536574546f41646d696e121c0a096973546f70557365721806"
+    "2001280852096973546f7055736572121c0a0972616e6b53636f7265180720012803520972616e6b53636f7265121c0a09746f7055736572"
+    "4e6f1808200128035209746f70557365724e6f121c0a09656e746572547970651809200128035209656e74657254797065122c0a06616374"
+    "696f6e180a2001280e32142e4d656d6265724d657373616765416374696f6e5206616374696f6e122c0a11616374696f6e44657363726970"
+    "74696f6e180b200128095211616374696f6e4465736372697074696f6e12160a06757365724964180c20012803520675736572496412460a"
+    "0c656666656374436f6e666967180d2001280b32222e576562636173744d656d6265724d6573736167652e456666656374436f6e66696752"
+    "0c656666656374436f6e66696712160a06706f70537472180e200128095206706f7053747212500a11656e746572456666656374436f6e66"
+    "6967180f2001280b32222e576562636173744d656d6265724d6573736167652e456666656374436f6e6669675211656e7465724566666563"
+    "74436f6e66696712300a0f6261636b67726f756e64496d61676518102001280b32062e496d616765520f6261636b67726f756e64496d6167"
+    "6512340a116261636b67726f756e64496d616765563218112001280b32062e496d61676552116261636b67726f756e64496d616765563212"
+    "330a11616e63686f72446973706c61795465787418122001280b32052e546578745211616e63686f72446973706c617954657874122c0a11"
+    "636c69656e74456e746572536f757263651813200128095211636c69656e74456e746572536f7572636512280a0f636c69656e74456e7465"
+    "7254797065181420012809520f636c69656e74456e74657254797065122a0a10636c69656e744c697665526561736f6e1815200128095210"
+    "636c69656e744c697665526561736f6e12260a0e616374696f6e4475726174696f6e181620012803520e616374696f6e4475726174696f6e"
+    "12240a0d75736572536861726554797065181720012809520d757365725368617265547970651aab020a0c456666656374436f6e66696712"
+    "120a0474797065180120012803520474797065121a0a0469636f6e18022001280b32062e496d616765520469636f6e121c0a096176617461"
+    "72506f731803200128035209617661746172506f7312190a047465787418042001280b32052e5465787452047465787412220a0874657874"
+    "49636f6e18052001280b32062e496d61676552087465787449636f6e121a0a087374617954696d6518062001280552087374617954696d65"
+    "12200a0b616e696d41737365744964180720012803520b616e696d41737365744964121c0a05626164676518082001280b32062e496d6167"
+    "655205626164676512320a14666c657853657474696e6741727261794c6973741809200328035214666c657853657474696e674172726179"
+    "4c69737422c0020a1257656263617374506f6c6c4d657373616765121f0a06636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f"
+    "6d6d6f6e122e0a0b6d6573736167655479706518022001280e320c2e4d65737361676554797065520b6d6573736167655479706512160a06"
+    "706f6c6c49641803200128035206706f6c6c496412350a0c7374617274436f6e74656e7418042001280b32112e506f6c6c5374617274436f"
+    "6e74656e74520c7374617274436f6e74656e74122f0a0a656e64436f6e74656e7418052001280b320f2e506f6c6c456e64436f6e74656e74"
+    "520a656e64436f6e74656e74123d0a0d757064617465436f6e74656e7418062001280b32172e506f6c6c557064617465566f746573436f6e"
+    "74656e74520d757064617465436f6e74656e74121a0a08706f6c6c4b696e641807200128055208706f6c6c4b696e642289020a1957656263"
+    "6173745175657374696f6e4e65774d657373616765121f0a06636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e1244"
+    "0a0764657461696c7318022001280b322a2e576562636173745175657374696f6e4e65774d6573736167652e5175657374696f6e44657461"
+    "696c73520764657461696c731a84010a0f5175657374696f6e44657461696c73120e0a0269641801200128045202696412120a0474657874"
+    "180220012809520474657874121c0a0974696d655374616d70180420012804520974696d655374616d7012190a047573657218052001280b"
+    "32052e5573657252047573657212140a05646174613118142001280d5205646174613122b7020a165765626361737452616e6b546578744d"
+    "657373616765121f0a06636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e12140a057363656e651802200128055205"
+    "7363656e6512320a146f776e65724964784265666f726555706461746518032001280352146f776e65724964784265666f72655570646174"
+    "6512300a136f776e6572496478416674657255706461746518042001280352136f776e65724964784166746572557064617465122f0a0f73"
+    "656c6647657442616467654d736718052001280b32052e54657874520f73656c6647657442616467654d736712310a106f74686572476574"
+    "42616467654d736718062001280b32052e5465787452106f7468657247657442616467654d7367121c0a0963757255736572496418072001"
+    "2803520963757255736572496422d5050a1857656263617374486f75726c7952616e6b4d657373616765121f0a06636f6d6d6f6e18012001"
+    "280b32072e436f6d6d6f6e5206636f6d6d6f6e123b0a046461746118022001280b32272e57656263617374486f75726c7952616e6b4d6573"
+    "736167652e52616e6b436f6e7461696e657252046461746112140a05646174613218032001280d520564617461321ac4040a0d52616e6b43"
+    "6f6e7461696e657212140a05646174613118012001280d5205646174613112550a0b72616e6b696e676461746118022001280b32332e5765"
+    "6263617374486f75726c7952616e6b4d6573736167652e52616e6b436f6e7461696e65722e52616e6b696e6744617461520b72616e6b696e"
+    "676461746112140a05646174613218032001280d5205646174613212240a0872616e6b696e677318042001280b32082e52616e6b696e6752"
+    "0872616e6b696e677312580a0c72616e6b696e67646174613218052001280b32342e57656263617374486f75726c7952616e6b4d65737361"
+    "67652e52616e6b436f6e7461696e65722e52616e6b696e674461746132520c72616e6b696e67646174613212140a05646174613318062001"
+    "280d5205646174613312140a05646174613418072001280d520564617461341a5f0a0b52616e6b696e674461746112140a05646174613118"
+    "012001280d5205646174613112240a0872616e6b6461746118022001280b32082e52616e6b696e67520872616e6b6461746112140a056461"
+    "746132180320012809520564617461321aa2010a0c52616e6b696e67446174613212140a05646174613118012001280d5205646174613112"
+    "140a05646174613218022001280d5205646174613212240a0872616e6b6461746118032001280b32082e52616e6b696e67520872616e6b64"
+    "61746112140a0564617461331804200128095205646174613312140a05646174613418052001280d5205646174613412140a056461746135"
+    "18062001280d520564617461352296030a14576562636173744c696e6b4d696341726d696573121f0a06636f6d6d6f6e18012001280b3207"
+    "2e436f6d6d6f6e5206636f6d6d6f6e120e0a0269641802200128045202696412350a0b626174746c654974656d7318032003280b32132e4c"
+    "696e6b4d696341726d6965734974656d73520b626174746c654974656d7312100a036964321804200128045203696432121e0a0a74696d65"
+    "5374616d7031180520012804520a74696d655374616d7031121e0a0a74696d655374616d7032180620012804520a74696d655374616d7032"
+    "12380a0c626174746c6553746174757318072001280e32142e4c696e6b4d6963426174746c65537461747573520c626174746c6553746174"
+    "757312140a0564617461311808200128045205646174613112140a0564617461321809200128045205646174613212140a05646174613318"
+    "0a2001280d52056461746133121c0a05496d616765180b2001280b32062e496d6167655205496d61676512140a056461746134180c200128"
+    "0d5205646174613412140a056461746135180d2001280d5205646174613522ae030a20576562636173744c696e6b4d6963426174746c6550"
+    "756e69736846696e697368121f0a0648656164657218012001280b32072e436f6d6d6f6e520648656164657212100a034964311802200128"
+    "045203496431121c0a0954696d657374616d70180320012804520954696d657374616d7012140a05446174613418042001280d5205446174"
+    "613412100a03496432180520012804520349643212550a05446174613618062001280b323f2e576562636173744c696e6b4d696342617474"
+    "6c6550756e69736846696e6973682e4c696e6b4d6963426174746c6550756e69736846696e69736844617461520544617461361ab9010a1d"
+    "4c696e6b4d6963426174746c6550756e69736846696e6973684461746112100a034964321801200128045203496432121c0a0954696d6573"
+    "74616d70180220012804520954696d657374616d7012140a05446174613318032001280d5205446174613312100a03496431180420012804"
+    "520349643112140a05446174613518052001280d5205446174613512140a05446174613618062001280d5205446174613612140a05446174"
+    "613818082001280d5205446174613822c3030a1f576562636173744c696e6b6d6963426174746c655461736b4d657373616765121f0a0648"
+    "656164657218012001280b32072e436f6d6d6f6e520648656164657212140a05446174613218022001280d52054461746132124c0a054461"
+    "74613318032001280b32362e576562636173744c696e6b6d6963426174746c655461736b4d6573736167652e4c696e6b6d6963426174746c"
+    "655461736b4461746152054461746133124d0a05446174613518052001280b32372e576562636173744c696e6b6d6963426174746c655461"
+    "736b4d6573736167652e4c696e6b6d6963426174746c655461736b4461746132520544617461351a5e0a154c696e6b6d6963426174746c65"
+    "5461736b4461746112450a05446174613118012001280b322f2e576562636173744c696e6b6d6963426174746c655461736b4d6573736167"
+    "652e426174746c655461736b44617461520544617461311a260a0e426174746c655461736b4461746112140a05446174613118012001280d"
+    "520544617461311a440a164c696e6b6d6963426174746c655461736b446174613212140a05446174613118012001280d5205446174613112"
+    "140a05446174613218022001280d5205446174613222c9120a14576562636173744c696e6b4d6963426174746c65121f0a06636f6d6d6f6e"
+    "18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e120e0a02696418022001280452026964124d0a0c626174746c65436f6e66696718"
+    "032001280b32292e576562636173744c696e6b4d6963426174746c652e4c696e6b4d6963426174746c65436f6e666967520c626174746c65"
+    "436f6e66696712380a0c626174746c6553746174757318042001280e32142e4c696e6b4d6963426174746c65537461747573520c62617474"
+    "6c6553746174757312440a0764657461696c7318052003280b322a2e576562636173744c696e6b4d6963426174746c652e4c696e6b4d6963"
+    "426174746c6544657461696c73520764657461696c73124d0a0a7669657765725465616d18092003280b322d2e576562636173744c696e6b"
+    "4d6963426174746c652e4c696e6b4d6963426174746c65546f7056696577657273520a7669657765725465616d12430a08686f7374546561"
+    "6d180a2003280b32272e576562636173744c696e6b4d6963426174746c652e4c696e6b4d6963426174746c65486f73745208686f73745465"
+    "616d12470a087465616d44617461180d2003280b322b2e576562636173744c696e6b4d6963426174746c652e4c696e6b4d6963426174746c"
+    "655465616d4461746152087465616d4461746112240a0d756e6b6e6f776e446174613136181020012804520d756e6b6e6f776e4461746131"
+    "3612430a0b686f73744461746132763218112003280b32212e576562636173744c696e6b4d6963426174746c652e486f7374327632446174"
+    "61520b686f7374446174613276321a95020a0b486f737432763244617461121e0a0a7465616d4e756d62657218012001280d520a7465616d"
+    "4e756d62657212460a08686f73746461746118022003280b322a2e576562636173744c696e6b4d6963426174746c652e486f737432763244"
+    "6174612e486f7374446174615208686f73746461746112220a0c756e6b6e6f776e446174613318032001280d520c756e6b6e6f776e446174"
+    "613312200a0b746f74616c506f696e747318042001280d520b746f74616c506f696e74731a580a08486f73744461746112160a06686f7374"
+    "49641801200128045206686f7374496412160a06706f696e747318022001280d5206706f696e7473121c0a09686f73744964537472180320"
+    "0128095209686f737449645374721aaf010a134c696e6b4d6963426174746c65436f6e66696712100a036964311801200128045203696431"
+    "121c0a0974696d657374616d70180220012804520974696d657374616d7012140a05646174613118032001280d5205646174613112100a03"
+    "696432180420012804520369643212140a05646174613218052001280d5205646174613212140a05646174613318062001280d5205646174"
+    "613312140a05646174613418082001280d520564617461341a6c0a154c696e6b4d6963426174746c655465616d4461746112160a06746561"
+    "6d496418012001280452067465616d4964123b0a046461746118022001280b32272e576562636173744c696e6b4d6963426174746c652e4c"
+    "696e6b4d6963426174746c65446174615204646174611a7f0a114c696e6b4d6963426174746c6544617461120e0a02696418012001280452"
+    "02696412140a05646174613118022001280d52056461746131121c0a0977696e53747265616b18032001280d520977696e53747265616b12"
+    "140a05646174613318052001280d5205646174613312100a0375726c180620012809520375726c1af3010a144c696e6b4d6963426174746c"
+    "6544657461696c73120e0a0269641801200128045202696412600a0773756d6d61727918022001280b32462e576562636173744c696e6b4d"
+    "6963426174746c652e4c696e6b4d6963426174746c6544657461696c732e4c696e6b4d6963426174746c6544657461696c7353756d6d6172"
+    "79520773756d6d6172791a690a1b4c696e6b4d6963426174746c6544657461696c7353756d6d617279120e0a026964180120012804520269"
+    "6412220a0c756e6b6e6f776e446174613218022001280d520c756e6b6e6f776e446174613212160a06706f696e747318032001280d520670"
+    "6f696e74731ace030a174c696e6b4d6963426174746c65546f7056696577657273120e0a02696418012001280452026964125e0a0b766965"
+    "77657247726f757018022003280b323c2e576562636173744c696e6b4d6963426174746c652e4c696e6b4d6963426174746c65546f705669"
+    "65776572732e546f7056696577657247726f7570520b76696577657247726f75701ac2020a0e546f7056696577657247726f7570125e0a06"
+    "76696577657218012003280b32462e576562636173744c696e6b4d6963426174746c652e4c696e6b4d6963426174746c65546f7056696577"
+    "6572732e546f7056696577657247726f75702e546f70566965776572520676696577657212160a06706f696e747318022001280d5206706f"
+    "696e747312280a0f686f737449644f725465616d4e756d180320012809520f686f737449644f725465616d4e756d1a8d010a09546f705669"
+    "65776572120e0a0269641801200128045202696412160a06706f696e747318022001280d5206706f696e7473121c0a0970726f66696c6549"
+    "64180320012809520970726f66696c654964121e0a06696d6167657318042003280b32062e496d6167655206696d61676573121a0a087374"
+    "72696e6749641806200128095208737472696e6749641ae8020a114c696e6b4d6963426174746c65486f7374120e0a026964180120012804"
+    "52026964124f0a09686f737447726f757018022003280b32312e576562636173744c696e6b4d6963426174746c652e4c696e6b4d69634261"
+    "74746c65486f73742e486f737447726f75705209686f737447726f75701af1010a09486f737447726f7570124a0a04686f73741801200328"
+    "0b32362e576562636173744c696e6b4d6963426174746c652e4c696e6b4d6963426174746c65486f73742e486f737447726f75702e486f73"
+    "745204686f737412160a06706f696e747318022001280d5206706f696e747312160a06686f737449641803200128095206686f737449641a"
+    "680a04486f7374120e0a02696418012001280452026964121c0a0970726f66696c654964180220012809520970726f66696c654964121e0a"
+    "06696d6167657318032003280b32062e496d6167655206696d6167657312120a046e616d6518042001280952046e616d65228f010a1d5765"
+    "62636173744c696e6b4d696346616e5469636b65744d6574686f64121f0a06636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f"
+    "6d6d6f6e124d0a1346616e5469636b6574526f6f6d4e6f7469636518022001280b321b2e46616e5469636b6574526f6f6d4e6f7469636543"
+    "6f6e74656e74521346616e5469636b6574526f6f6d4e6f7469636522bb030a14576562636173744c696e6b4d69634d6574686f64121f0a06"
+    "636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e122e0a0b6d6573736167655479706518022001280e320c2e4d6573"
+    "7361676554797065520b6d65737361676554797065121c0a096163636573734b657918032001280952096163636573734b657912280a0f61"
+    "6e63686f724c696e6b6d69634964180420012803520f616e63686f724c696e6b6d6963496412160a06757365724964180520012803520675"
+    "7365724964121c0a0966616e5469636b6574180620012803520966616e5469636b657412340a15746f74616c4c696e6b4d696346616e5469"
+    "636b65741807200128035215746f74616c4c696e6b4d696346616e5469636b6574121c0a096368616e6e656c496418082001280352096368"
+    "616e6e656c496412160a066c61796f757418092001280352066c61796f757412160a0676656e646f72180a20012803520676656e646f7212"
+    "1c0a0964696d656e73696f6e180b20012803520964696d656e73696f6e12140a057468656d65180c2001280952057468656d65121c0a0969"
+    "6e76697465556964180d200128035209696e766974655569642297020a17576562636173744c697665496e74726f4d657373616765121f0a"
+    "06636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e12160a06726f6f6d49641802200128035206726f6f6d4964122e"
+    "0a0b617564697453746174757318032001280e320c2e4175646974537461747573520b617564697453746174757312180a07636f6e74656e"
+    "741804200128095207636f6e74656e7412190a04686f737418052001280b32052e557365725204686f7374121c0a09696e74726f4d6f6465"
+    "1806200128055209696e74726f4d6f646512240a0662616467657318072003280b320c2e4261646765537472756374520662616467657312"
+    "1a0a086c616e677561676518082001280952086c616e677561676522cb010a2057656263617374556e617574686f72697a65644d656d6265"
+    "724d657373616765121f0a06636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e12160a06616374696f6e1802200128"
+    "055206616374696f6e122d0a0e6e69636b4e616d6550726566697818032001280b32052e54657874520e6e69636b4e616d65507265666978"
+    "121a0a086e69636b4e616d6518042001280952086e69636b4e616d6512230a09656e7465725465787418052001280b32052e546578745209"
+    "656e746572546578742296050a17576562636173744d73674465746563744d657373616765121f0a06636f6d6d6f6e18012001280b32072e"
+    "436f6d6d6f6e5206636f6d6d6f6e121e0a0a64657465637454797065180220012805520a6465746563745479706512550a10747269676765"
+    "72436f6e646974696f6e18032001280b32292e576562636173744d73674465746563744d6573736167652e54726967676572436f6e646974"
+    "696f6e521074726967676572436f6e646974696f6e123d0a0874696d65496e666f18042001280b32212e576562636173744d736744657465"
+    "63744d6573736167652e54696d65496e666f520874696d65496e666f121c0a09747269676765724279180520012805520974726967676572"
+    "4279121e0a0a66726f6d526567696f6e180620012809520a66726f6d526567696f6e1a80010a0854696d65496e666f12240a0d636c69656e"
+    "7453746172744d73180120012803520d636c69656e7453746172744d7312240a0d6170695265637654696d654d73180220012803520d6170"
+    "695265637654696d654d7312280a0f61706953656e64546f476f696d4d73180320012803520f61706953656e64546f476f696d4d731ae201"
+    "0a1054726967676572436f6e646974696f6e122a0a1075706c696e6b44657465637448747470180120012808521075706c696e6b44657465"
+    "63744874747012340a1575706c696e6b446574656374576562536f636b6574180220012808521575706c696e6b446574656374576562536f"
+    "636b657412220a0c6465746563745032504d7367180320012808520c6465746563745032504d736712240a0d646574656374526f6f6d4d73"
+    "67180420012808520d646574656374526f6f6d4d736712220a0c687474704f7074696d697a65180520012808520c687474704f7074696d69"
+    "7a6522d0050a1d576562636173744f65634c69766553686f7070696e674d657373616765121f0a06636f6d6d6f6e18012001280b32072e43"
+    "6f6d6d6f6e5206636f6d6d6f6e12140a05646174613118022001280d52056461746131124b0a0873686f704461746118042001280b322f2e"
+    "576562636173744f65634c69766553686f7070696e674d6573736167652e4c69766553686f7070696e6744617461520873686f7044617461"
+    "12350a0b73686f7054696d696e677318052001280b32132e54696d655374616d70436f6e7461696e6572520b73686f7054696d696e677312"
+    "4c0a0764657461696c7318092001280b32322e576562636173744f65634c69766553686f7070696e674d6573736167652e4c69766553686f"
+    "7070696e6744657461696c73520764657461696c731a90020a104c69766553686f7070696e674461746112140a057469746c651801200128"
+    "0952057469746c6512200a0b7072696365537472696e67180220012809520b7072696365537472696e67121a0a08696d61676555726c1803"
+    "200128095208696d61676555726c12180a0773686f7055726c180420012809520773686f7055726c12140a05646174613118062001280452"
+    "056461746131121a0a0873686f704e616d65180720012809520873686f704e616d6512140a05646174613218082001280452056461746132"
+    "121a0a0873686f7055726c32180920012809520873686f7055726c3212140a056461746133180a200128045205646174613312140a056461"
+    "746134180b20012804520564617461341a92010a134c69766553686f7070696e6744657461696c7312100a03696431180120012809520369"
+    "643112140a0564617461311803200128095205646174613112140a05646174613218042001280d52056461746132121c0a0974696d657374"
+    "616d70180520012804520974696d657374616d70121f0a046461746118062001280b320b2e56616c75654c6162656c52046461746122a601"
+    "0a1557656263617374526f6f6d50696e4d657373616765121f0a06636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e"
+    "12240a0d70696e6e65644d65737361676518022001280c520d70696e6e65644d65737361676512280a0f6f726967696e616c4d7367547970"
+    "65181e20012809520f6f726967696e616c4d736754797065121c0a0974696d657374616d70181f20012804520974696d657374616d702251"
+    "0a145765626361737453797374656d4d657373616765121f0a06636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e12"
+    "180a076d65737361676518022001280952076d65737361676522d10d0a12576562636173744c696e6b4d657373616765121f0a06636f6d6d"
+    "6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e12320a0b4d6573736167655479706518022001280e32102e4c696e6b4d6573"
+    "7361676554797065520b4d65737361676554797065121a0a084c696e6b6572496418032001280352084c696e6b65724964121c0a05536365"
+    "6e6518042001280e32062e5363656e6552055363656e65123a0a0d496e76697465436f6e74656e7418052001280b32142e4c696e6b657249"
+    "6e76697465436f6e74656e74520d496e76697465436f6e74656e7412370a0c5265706c79436f6e74656e7418062001280b32132e4c696e6b"
+    "65725265706c79436f6e74656e74520c5265706c79436f6e74656e74123a0a0d437265617465436f6e74656e7418072001280b32142e4c69"
+    "6e6b6572437265617465436f6e74656e74520d437265617465436f6e74656e7412370a0c436c6f7365436f6e74656e7418082001280b3213"
+    "2e4c696e6b6572436c6f7365436f6e74656e74520c436c6f7365436f6e74656e7412370a0c456e746572436f6e74656e7418092001280b32"
+    "132e4c696e6b6572456e746572436f6e74656e74520c456e746572436f6e74656e7412370a0c4c65617665436f6e74656e74180a2001280b"
+    "32132e4c696e6b65724c65617665436f6e74656e74520c4c65617665436f6e74656e74123a0a0d43616e63656c436f6e74656e74180b2001"
+    "280b32142e4c696e6b657243616e63656c436f6e74656e74520d43616e63656c436f6e74656e74123d0a0e4b69636b4f7574436f6e74656e"
+    "74180c2001280b32152e4c696e6b65724b69636b4f7574436f6e74656e74520e4b69636b4f7574436f6e74656e7412580a174c696e6b6564"
+    "4c6973744368616e6765436f6e74656e74180d2001280b321e2e4c696e6b65724c696e6b65644c6973744368616e6765436f6e74656e7452"
+    "174c696e6b65644c6973744368616e6765436f6e74656e7412460a1155706461746555736572436f6e74656e74180e2001280b32182e4c69"
+    "6e6b657255706461746555736572436f6e74656e74521155706461746555736572436f6e74656e74125b0a1857616974696e674c69737443"
+    "68616e6765436f6e74656e74180f2001280b321f2e4c696e6b657257616974696e674c6973744368616e6765436f6e74656e745218576169"
+    "74696e674c6973744368616e6765436f6e74656e7412340a0b4d757465436f6e74656e7418102001280b32122e4c696e6b65724d75746543"
+    "6f6e74656e74520b4d757465436f6e74656e7412490a1252616e646f6d4d61746368436f6e74656e7418112001280b32192e4c696e6b6572"
+    "52616e646f6d4d61746368436f6e74656e74521252616e646f6d4d61746368436f6e74656e74125b0a185570646174655573657253657474"
+    "696e67436f6e74656e7418122001280b321f2e4c696e6b65725570646174655573657253657474696e67436f6e74656e7452185570646174"
+    "655573657253657474696e67436f6e74656e74124c0a134d6963496478557064617465436f6e74656e7418132001280b321a2e4c696e6b65"
+    "724d6963496478557064617465436f6e74656e7452134d6963496478557064617465436f6e74656e7412460a114c6973744368616e676543"
+    "6f6e74656e7418142001280b32182e4c696e6b65724c6973744368616e6765436f6e74656e7452114c6973744368616e6765436f6e74656e"
+    "7412520a17436f686f73744c6973744368616e6765436f6e74656e7418152001280b32182e436f686f73744c6973744368616e6765436f6e"
+    "74656e745217436f686f73744c6973744368616e6765436f6e74656e7412490a124d656469614368616e6765436f6e74656e741816200128"
+    "0b32192e4c696e6b65724d656469614368616e6765436f6e74656e7452124d656469614368616e6765436f6e74656e74124c0a1341636365"
+    "70744e6f74696365436f6e74656e7418172001280b321a2e4c696e6b65724163636570744e6f74696365436f6e74656e7452134163636570"
+    "744e6f74696365436f6e74656e7412460a115379734b69636b4f7574436f6e74656e7418652001280b32182e4c696e6b65725379734b6963"
+    "6b4f7574436f6e74656e7452115379734b69636b4f7574436f6e74656e7412440a1055736572546f617374436f6e74656e7418662001280b"
+    "32182e4c696e6b6d696355736572546f617374436f6e74656e74521055736572546f617374436f6e74656e7412150a05657874726118c801"
+    "200128095205657874726112290a0f65787069726554696d657374616d7018c90120012803520f65787069726554696d657374616d701225"
+    "0a0d7472616e73666572457874726118ca0120012809520d7472616e73666572457874726122c00a0a17576562636173744c696e6b4c6179"
+    "65724d657373616765121f0a06636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e122e0a0b6d657373616765547970"
+    "6518022001280e320c2e4d65737361676554797065520b6d65737361676554797065121c0a096368616e6e656c4964180320012803520963"
+    "68616e6e656c4964121c0a057363656e6518042001280e32062e5363656e6552057363656e6512490a146372656174654368616e6e656c43"
+    "6f6e74656e7418642001280b32152e4372656174654368616e6e656c436f6e74656e7452146372656174654368616e6e656c436f6e74656e"
+    "7412400a116c6973744368616e6765436f6e74656e7418662001280b32122e4c6973744368616e6765436f6e74656e7452116c6973744368"
+    "616e6765436f6e74656e7412340a0d696e76697465436f6e74656e7418672001280b320e2e496e76697465436f6e74656e74520d696e7669"
+    "7465436f6e74656e7412310a0c6170706c79436f6e74656e7418682001280b320d2e4170706c79436f6e74656e74520c6170706c79436f6e"
+    "74656e7412430a127065726d69744170706c79436f6e74656e7418692001280b32132e5065726d69744170706c79436f6e74656e74521270"
+    "65726d69744170706c79436f6e74656e7412430a127265706c79496e76697465436f6e74656e74186a2001280b32132e5265706c79496e76"
+    "697465436f6e74656e7452127265706c79496e76697465436f6e74656e7412370a0e6b69636b4f7574436f6e74656e74186b2001280b320f"
+    "2e4b69636b4f7574436f6e74656e74520e6b69636b4f7574436f6e74656e7412430a1263616e63656c4170706c79436f6e74656e74186c20"
+    "01280b32132e43616e63656c4170706c79436f6e74656e74521263616e63656c4170706c79436f6e74656e7412460a1363616e63656c496e"
+    "76697465436f6e74656e74186d2001280b32142e43616e63656c496e76697465436f6e74656e74521363616e63656c496e76697465436f6e"
+    "74656e7412310a0c6c65617665436f6e74656e74186e2001280b320d2e4c65617665436f6e74656e74520c6c65617665436f6e74656e7412"
+    "3b0a0d66696e697368436f6e74656e74186f2001280b32152e46696e6973684368616e6e656c436f6e74656e74520d66696e697368436f6e"
+    "74656e7412400a116a6f696e446972656374436f6e74656e7418702001280b32122e4a6f696e446972656374436f6e74656e7452116a6f69"
+    "6e446972656374436f6e74656e74123d0a106a6f696e47726f7570436f6e74656e7418712001280b32112e4a6f696e47726f7570436f6e74"
+    "656e7452106a6f696e47726f7570436f6e74656e7412470a127065726d697447726f7570436f6e74656e7418722001280b32172e5065726d"
+    "69744a6f696e47726f7570436f6e74656e7452127065726d697447726f7570436f6e74656e7412470a1263616e63656c47726f7570436f6e"
+    "74656e7418732001280b32172e43616e63656c4a6f696e47726f7570436f6e74656e74521263616e63656c47726f7570436f6e74656e7412"
+    "440a116c6561766547726f7570436f6e74656e7418742001280b32162e4c656176654a6f696e47726f7570436f6e74656e7452116c656176"
+    "6547726f7570436f6e74656e74124c0a1570327047726f75704368616e6765436f6e74656e7418752001280b32162e50325047726f757043"
+    "68616e6765436f6e74656e74521570327047726f75704368616e6765436f6e74656e74123b0a0f627573696e657373436f6e74656e7418c8"
+    "012001280b32102e427573696e657373436f6e74656e74520f627573696e657373436f6e74656e7422a4010a11526f6f6d5665726966794d"
+    "657373616765121f0a06636f6d6d6f6e18012001280b32072e436f6d6d6f6e5206636f6d6d6f6e12160a06616374696f6e18022001280552"
+    "06616374696f6e12180a07636f6e74656e741803200128095207636f6e74656e74121e0a0a6e6f7469636554797065180420012803520a6e"
+    "6f7469636554797065121c0a09636c6f7365526f6f6d1805200128085209636c6f7365526f6f6d620670726f746f33"
+)
@@ -0,0 +1,106 @@
+import argparse
+import asyncio
+import dataclasses
+import json
+import signal
+import sys
+from typing import List, Type, Optional
+
+import betterproto
+
+import TikTokLive.events as tiktok_events
+from TikTokLive.events import Event
+from TikTokLive.runner.supervisor import ShardedRunner, DEFAULT_EVENTS, RunnerStats
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m TikTokLive.runner",
+        description="Watch many TikTok LIVE rooms across several worker processes. Events are printed as JSON lines."
+    )
+
+    parser.add_argument("rooms", nargs="*", help="The unique_ids of the creators to watch")
+    parser.add_argument("-f", "--rooms-file", help="A file with one unique_id per line")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="The number of worker processes (default: CPU count)")
+    parser.add_argument("-e", "--events", nargs="+", default=[event.get_type() for event in DEFAULT_EVENTS], help="The events to forward, by class name")
+    parser.add_argument("-s", "--stats-interval", type=float, default=10.0, help="How often (in seconds) to print stats to stderr, 0 to disable")
+    parser.add_argument("--max-restarts", type=int, default=3, help="Restarts allowed per worker within a minute before its rooms are rebalanced")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Don't print the events, only the stats")
+
+    return parser.parse_args(args)
+
+
+def event_to_json(unique_id: str, event: Event) -> str:
+    """Serialize an event as a JSON line"""
+
+    if isinstance(event, betterproto.Message):
+        data: dict = event.to_dict()
+    elif dataclasses.is_dataclass(event):
+        data: dict = dataclasses.asdict(event)
+    else:
+        data: dict = {}
+
+    return json.dumps({"unique_id": unique_id, "type": event.type, "event": data}, default=str)
+
+
+async def print_stats(runner: ShardedRunner, interval: float) -> None:
+    """Print the runner's throughput over each interval"""
+
+    previous: RunnerStats = runner.stats
+
+    while True:
+        await asyncio.sleep(interval)
+        current: RunnerStats = runner.stats
+        elapsed: float = (current.uptime - previous.uptime) or interval
+
+        print(
+            f"[runner] {current.alive}/{current.workers} workers, {current.rooms} rooms, "
+            f"{(current.events - previous.events) / elapsed:,.0f} events/s, "
+            f"{(current.bytes - previous.bytes) / elapsed / 1024:,.1f} KiB/s, "
+            f"{current.events:,} events total, {current.restarts} restarts, {current.rebalances} rebalances",
+            file=sys.stderr
+        )
+
+        previous = current
+
+
+async def main(args: argparse.Namespace) -> None:
+    rooms: List[str] = list(args.rooms)
+
+    if args.rooms_file:
+        with open(args.rooms_file) as file:
+            rooms.extend(line.strip() for line in file if line.strip() and not line.startswith("#"))
+
+    if not rooms:
+        raise SystemExit("No rooms to watch, pass unique_ids or a --rooms-file.")
+
+    events: List[Type[Event]] = [getattr(tiktok_events, name) for name in args.events]
+    runner: ShardedRunner = ShardedRunner(workers=args.workers, events=events, max_restarts=args.max_restarts)
+
+    if not args.quiet:
+        for event in events:
+            runner.add_listener(event, lambda e, unique_id: print(event_to_json(unique_id, e)))
+
+    # Stop cleanly on Ctrl+C & SIGTERM
+    stop: asyncio.Event = asyncio.Event()
+
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal_number, stop.set)
+        except NotImplementedError:
+            pass
+
+    await runner.start(rooms)
+    stats_task: Optional[asyncio.Task] = asyncio.create_task(print_stats(runner, args.stats_interval)) if args.stats_interval > 0 else None
+
+    try:
+        await stop.wait()
+    finally:
+        if stats_task is not None:
+            stats_task.cancel()
+
+        await runner.stop()
+
+
+if __name__ == '__main__':
+    asyncio.run(main(parse_args()))
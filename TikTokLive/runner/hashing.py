@@ -0,0 +1,104 @@
+import bisect
+import hashlib
+from typing import List, Dict, Iterable, Tuple
+
+
+class ConsistentHashRing:
+    """
+    Assigns keys (rooms) to nodes (workers) so that adding or removing a node only moves the keys of that node.
+    Each node is placed on the ring many times (virtual nodes), which evens out the share of keys per node.
+
+    """
+
+    def __init__(self, nodes: Iterable[int] = (), replicas: int = 128):
+        """
+        Create a hash ring
+
+        :param nodes: The initial nodes
+        :param replicas: The number of virtual nodes per node
+
+        """
+
+        if replicas < 1:
+            raise ValueError("Each node needs at least one virtual node.")
+
+        self._replicas: int = replicas
+        self._hashes: List[int] = []
+        self._owners: Dict[int, int] = {}
+
+        for node in nodes:
+            self.add(node)
+
+    @classmethod
+    def hash(cls, key: str) -> int:
+        """
+        Hash a key onto the ring. Stable across processes & runs, unlike the built-in `hash`.
+        BLAKE2b is used as it is always available, whereas MD5 is blocked on FIPS-enabled hosts.
+
+        :param key: The key
+        :return: A 64-bit position on the ring
+
+        """
+
+        return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+    @property
+    def nodes(self) -> Tuple[int, ...]:
+        """
+        The nodes on the ring
+
+        """
+
+        return tuple(sorted(set(self._owners.values())))
+
+    def add(self, node: int) -> None:
+        """
+        Place a node on the ring
+
+        :param node: The node
+        :return: None
+
+        """
+
+        for replica in range(self._replicas):
+            point: int = self.hash(f"{node}:{replica}")
+
+            # Collisions are astronomically unlikely, but the first owner keeps the point
+            if point in self._owners:
+                continue
+
+            bisect.insort(self._hashes, point)
+            self._owners[point] = node
+
+    def remove(self, node: int) -> None:
+        """
+        Take a node off the ring. Its keys move to the next nodes on the ring, the others don't move.
+
+        :param node: The node
+        :return: None
+
+        """
+
+        self._hashes = [point for point in self._hashes if self._owners[point] != node]
+        self._owners = {point: owner for point, owner in self._owners.items() if owner != node}
+
+    def get(self, key: str) -> int:
+        """
+        Get the node a key belongs to
+
+        :param key: The key
+        :return: The node
+
+        """
+
+        if not self._hashes:
+            raise LookupError("The hash ring has no nodes.")
+
+        index: int = bisect.bisect(self._hashes, self.hash(key)) % len(self._hashes)
+        return self._owners[self._hashes[index]]
+
+    def __contains__(self, node: int) -> bool:
+        return node in self._owners.values()
+
+    def __len__(self) -> int:
+        return len(self.nodes)
@@ -0,0 +1,531 @@
+import asyncio
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from asyncio import AbstractEventLoop
+from collections import deque
+from dataclasses import dataclass, field
+from logging import Logger
+from multiprocessing.connection import Connection, wait
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from typing import Optional, Dict, Any, Iterable, Type, List, Set, Deque, Union, Tuple
+
+from pyee.base import Handler
+
+from TikTokLive.client.client import TikTokLiveClient
+from TikTokLive.client.dispatch import EventDispatcher
+from TikTokLive.client.filters import EventFilter, EventPredicate
+from TikTokLive.client.ingest import OverflowPolicy
+from TikTokLive.client.logger import TikTokLiveLogHandler, LogLevel
+from TikTokLive.client.stream import EventStream
+from TikTokLive.events import Event, EventHandler, CommentEvent, GiftEvent, LikeEvent, JoinEvent, FollowEvent, \
+    ShareEvent, ConnectEvent, DisconnectEvent, LiveEndEvent
+from TikTokLive.runner.hashing import ConsistentHashRing
+from TikTokLive.runner.worker import run_worker, CMD_ADD, CMD_REMOVE, CMD_STOP, MSG_EVENTS, MSG_STATS
+
+"""The events forwarded by default"""
+DEFAULT_EVENTS: Tuple[Type[Event], ...] = (
+    ConnectEvent, DisconnectEvent, LiveEndEvent, CommentEvent, GiftEvent, LikeEvent, JoinEvent, FollowEvent, ShareEvent
+)
+
+
+@dataclass
+class WorkerStats:
+    """
+    A snapshot of one worker (shard) of a ShardedRunner
+
+    """
+
+    worker_id: int
+    pid: Optional[int]
+    alive: bool
+    retired: bool
+    rooms: int
+    events: int
+    bytes: int
+    restarts: int
+    pool: Optional[Dict[str, int]]
+    """The latest PoolStats reported by the worker, as a dict"""
+
+
+@dataclass
+class RunnerStats:
+    """
+    A snapshot of a ShardedRunner
+
+    """
+
+    workers: int
+    alive: int
+    rooms: int
+    events: int
+    bytes: int
+    restarts: int
+    rebalances: int
+    uptime: float
+    events_per_second: float
+    bytes_per_second: float
+    shards: List[WorkerStats] = field(default_factory=list)
+
+
+class _WorkerHandle:
+    """The supervisor's end of a worker process"""
+
+    def __init__(self, worker_id: int):
+        self.worker_id: int = worker_id
+        self.process: Optional[BaseProcess] = None
+        self.commands: Optional[Connection] = None
+        self.events: Optional[Connection] = None
+        self.rooms: Set[str] = set()
+        self.event_count: int = 0
+        self.byte_count: int = 0
+        self.restarts: int = 0
+        self.restart_times: Deque[float] = deque()
+        self.pool_stats: Optional[Dict[str, int]] = None
+        self.retired: bool = False
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+
+class ShardedRunner(EventDispatcher):
+    """
+    Runs rooms across several worker processes, so that decoding & dispatch use more than one core.
+    Rooms are assigned to workers by consistent hashing of their unique_id, each worker runs its share in a
+    TikTokLiveClientPool on its own event loop, & events are forwarded to this process over pipes, in pickled batches.
+
+    Crashed workers are restarted with their rooms. A worker that keeps crashing is retired, and its rooms are
+    rebalanced onto the remaining workers (only its rooms move).
+    Listeners receive the event & the unique_id of the room it came from.
+
+    """
+
+    def __init__(
+            self,
+            workers: Optional[int] = None,
+            events: Iterable[Type[Event]] = DEFAULT_EVENTS,
+            start_kwargs: Optional[Dict[str, Any]] = None,
+            pool_kwargs: Optional[Dict[str, Any]] = None,
+            max_restarts: int = 3,
+            restart_window: float = 60.0,
+            replicas: int = 128,
+            batch_size: int = 256,
+            flush_interval: float = 0.05,
+            stats_interval: float = 5.0,
+            mp_context: Optional[str] = "spawn"
+    ):
+        """
+        Create a sharded runner
+
+        :param workers: The number of worker processes, defaults to the CPU count
+        :param events: The events to forward from the workers. Only these can be listened to.
+        :param start_kwargs: Kwargs to pass to `TikTokLiveClient.start` for every room. They must be picklable.
+        :param pool_kwargs: Kwargs to create each worker's TikTokLiveClientPool with. They must be picklable.
+        :param max_restarts: The number of restarts allowed per worker within the restart window, before it is retired
+        :param restart_window: The restart window, in seconds
+        :param replicas: The number of virtual nodes per worker on the hash ring
+        :param batch_size: The number of events a worker sends at once
+        :param flush_interval: The longest (in seconds) an event waits in a worker for its batch to fill up
+        :param stats_interval: How often (in seconds) workers report their pool stats
+        :param mp_context: The multiprocessing start method. "spawn" by default, as the supervisor runs a reader thread,
+                           and forking a process with threads is unsafe.
+
+        """
+
+        super().__init__()
+
+        self._logger: Logger = TikTokLiveLogHandler.get_logger(
+            level=LogLevel.ERROR
+        )
+
+        self._worker_count: int = workers or os.cpu_count() or 1
+        self._event_types: List[str] = [event.get_type() for event in events]
+        self._max_restarts: int = max_restarts
+        self._restart_window: float = restart_window
+        self._context: BaseContext = multiprocessing.get_context(mp_context)
+        self._worker_options: Dict[str, Any] = {
+            "event_types": self._event_types,
+            "start_kwargs": start_kwargs or {},
+            "pool_kwargs": pool_kwargs or {},
+            "batch_size": batch_size,
+            "flush_interval": flush_interval,
+            "stats_interval": stats_interval
+        }
+
+        # Shards
+        self._ring: ConsistentHashRing = ConsistentHashRing(range(self._worker_count), replicas=replicas)
+        self._handles: Dict[int, _WorkerHandle] = {worker_id: _WorkerHandle(worker_id) for worker_id in range(self._worker_count)}
+        self._rooms: Dict[str, int] = {}
+        self._rebalances: int = 0
+
+        # State
+        self._loop: Optional[AbstractEventLoop] = None
+        self._reader: Optional[threading.Thread] = None
+        self._watch_lock: threading.Lock = threading.Lock()
+        self._watch: Dict[Any, Tuple[str, int, Any]] = {}
+        self._wakeup_reader, self._wakeup_writer = self._context.Pipe(duplex=False)
+        self._stopping: bool = False
+        self._reading: bool = False
+        self._started_at: Optional[float] = None
+        self._stopped: asyncio.Event = asyncio.Event()
+
+    def add_listener(
+            self,
+            event: Type[Event],
+            f: EventHandler,
+            where: Optional[Union[EventPredicate, EventFilter]] = None,
+            concurrency: Optional[int] = None,
+            ordered: bool = False,
+            max_queued: Optional[int] = None
+    ) -> Handler:
+        """
+        Method that can be used to register a Python function as an event listener for every room
+
+        :param event: The event to listen to
+        :param f: The function to handle the event, called with the event & the unique_id of its room
+        :param where: An optional filter on the event, run once per event for all the listeners sharing it
+        :param concurrency: The maximum number of calls of a coroutine handler in flight. Events past it wait in a queue.
+        :param ordered: With a concurrency limit, handle the events of each user one at a time, in order
+        :param max_queued: With a concurrency limit, the maximum number of waiting events. Events past it are dropped.
+        :return: The generated `pyee.Handler` object
+
+        """
+
+        event_type: str = event if isinstance(event, str) else event.get_type()
+
+        # Listening to an event the workers don't forward is always a mistake
+        if event_type not in self._event_types:
+            raise ValueError(f"'{event_type}' is not forwarded by the workers. Pass it in the runner's events.")
+
+        return super().add_listener(
+            event=event_type, f=f, where=where, concurrency=concurrency, ordered=ordered, max_queued=max_queued
+        )
+
+    def events(
+            self,
+            *events: Type[Event],
+            maxsize: int = 1_000,
+            policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    ) -> EventStream:
+        """
+        Consume the events of every room with `async for`, as `(event, unique_id)` tuples
+
+        :param events: The event types to receive
+        :param maxsize: The maximum number of queued events
+        :param policy: What to do when the consumer falls behind. The workers can't be made to wait, so it must drop events.
+        :return: The stream, an async iterator of `(event, unique_id)` tuples
+
+        """
+
+        if policy not in (OverflowPolicy.DROP_OLDEST, OverflowPolicy.DROP_NEWEST):
+            raise ValueError("A runner's event streams must use OverflowPolicy.DROP_OLDEST or OverflowPolicy.DROP_NEWEST.")
+
+        return super().events(*events, maxsize=maxsize, policy=policy)
+
+    async def start(self, rooms: Iterable[str] = ()) -> None:
+        """
+        Start the workers
+
+        :param rooms: The rooms (unique_ids) to connect to
+        :return: None
+
+        """
+
+        if self._loop is not None:
+            raise RuntimeError("The runner has already been started.")
+
+        self._loop = asyncio.get_running_loop()
+        self._started_at = time.monotonic()
+
+        for unique_id in rooms:
+            unique_id = TikTokLiveClient.parse_unique_id(unique_id)
+            worker_id: int = self._ring.get(unique_id)
+            self._rooms[unique_id] = worker_id
+            self._handles[worker_id].rooms.add(unique_id)
+
+        for handle in self._handles.values():
+            self._spawn(handle)
+
+        self._reading = True
+        self._reader = threading.Thread(target=self._read_loop, name="TikTokLive-runner-reader", daemon=True)
+        self._reader.start()
+
+    async def run(self, rooms: Iterable[str] = ()) -> None:
+        """
+        Start the workers & wait until the runner is stopped
+
+        :param rooms: The rooms (unique_ids) to connect to
+        :return: None
+
+        """
+
+        await self.start(rooms)
+        await self._stopped.wait()
+
+    def add(self, unique_id: str) -> int:
+        """
+        Add a room to the worker it hashes to
+
+        :param unique_id: The username of the creator to connect to
+        :return: The worker the room was assigned to
+
+        """
+
+        unique_id = TikTokLiveClient.parse_unique_id(unique_id)
+
+        if unique_id in self._rooms:
+            return self._rooms[unique_id]
+
+        worker_id: int = self._ring.get(unique_id)
+        self._rooms[unique_id] = worker_id
+        self._handles[worker_id].rooms.add(unique_id)
+        self._send(self._handles[worker_id], CMD_ADD, unique_id)
+        return worker_id
+
+    def remove(self, unique_id: str) -> None:
+        """
+        Remove a room from its worker. Does nothing if the room was never added (or already removed), like `add`.
+
+        :param unique_id: The username of the creator
+        :return: None
+
+        """
+
+        unique_id = TikTokLiveClient.parse_unique_id(unique_id)
+
+        if unique_id not in self._rooms:
+            return
+
+        handle: _WorkerHandle = self._handles[self._rooms.pop(unique_id)]
+        handle.rooms.discard(unique_id)
+        self._send(handle, CMD_REMOVE, unique_id)
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        Stop the workers, waiting for them to disconnect & send their last events
+
+        :param timeout: How long (in seconds) to wait for each worker before terminating it
+        :return: None
+
+        """
+
+        if self._stopping or self._loop is None:
+            return
+
+        self._stopping = True
+
+        for handle in self._handles.values():
+            self._send(handle, CMD_STOP, None)
+
+        for handle in self._handles.values():
+            if handle.process is None:
+                continue
+
+            await self._loop.run_in_executor(None, handle.process.join, timeout)
+
+            if handle.process.is_alive():
+                self._logger.warning(f"Worker {handle.worker_id} did not stop in time, terminating it.")
+                handle.process.terminate()
+                await self._loop.run_in_executor(None, handle.process.join)
+
+        # Stop the reader once it has read everything the workers sent
+        self._reading = False
+        self._wakeup_writer.send_bytes(b"")
+        await self._loop.run_in_executor(None, self._reader.join)
+        await asyncio.sleep(0)
+
+        for handle in self._handles.values():
+            for connection in (handle.commands, handle.events):
+                if connection is not None and not connection.closed:
+                    connection.close()
+
+        self._stopped.set()
+
+    @property
+    def assignments(self) -> Dict[str, int]:
+        """
+        The worker of each room
+
+        """
+
+        return dict(self._rooms)
+
+    @property
+    def stats(self) -> RunnerStats:
+        """
+        A snapshot of the workers & the throughput of the events forwarded to this process
+
+        """
+
+        shards: List[WorkerStats] = [
+            WorkerStats(
+                worker_id=handle.worker_id,
+                pid=handle.process.pid if handle.process is not None else None,
+                alive=handle.alive,
+                retired=handle.retired,
+                rooms=len(handle.rooms),
+                events=handle.event_count,
+                bytes=handle.byte_count,
+                restarts=handle.restarts,
+                pool=handle.pool_stats
+            )
+            for handle in self._handles.values()
+        ]
+
+        uptime: float = time.monotonic() - self._started_at if self._started_at is not None else 0.0
+        events: int = sum(shard.events for shard in shards)
+        byte_count: int = sum(shard.bytes for shard in shards)
+
+        return RunnerStats(
+            workers=len(shards),
+            alive=sum(shard.alive for shard in shards),
+            rooms=len(self._rooms),
+            events=events,
+            bytes=byte_count,
+            restarts=sum(shard.restarts for shard in shards),
+            rebalances=self._rebalances,
+            uptime=uptime,
+            events_per_second=events / uptime if uptime else 0.0,
+            bytes_per_second=byte_count / uptime if uptime else 0.0,
+            shards=shards
+        )
+
+    def _spawn(self, handle: _WorkerHandle) -> None:
+        """Start (or restart) a worker process with its rooms"""
+
+        commands_reader, commands_writer = self._context.Pipe(duplex=False)
+        events_reader, events_writer = self._context.Pipe(duplex=False)
+
+        process: BaseProcess = self._context.Process(
+            target=run_worker,
+            args=(handle.worker_id, sorted(handle.rooms), commands_reader, events_writer, self._worker_options),
+            name=f"TikTokLive-worker-{handle.worker_id}",
+            daemon=True
+        )
+
+        process.start()
+
+        # Close the child's ends, so that a dead worker reads as EOF
+        commands_reader.close()
+        events_writer.close()
+
+        # The old events pipe is closed by the reader thread, once it has read it to the end
+        if handle.commands is not None:
+            handle.commands.close()
+
+        handle.process, handle.commands, handle.events = process, commands_writer, events_reader
+
+        with self._watch_lock:
+            self._watch[events_reader] = (MSG_EVENTS, handle.worker_id, events_reader)
+            self._watch[process.sentinel] = ("exit", handle.worker_id, process)
+
+        self._wakeup_writer.send_bytes(b"")
+
+    def _send(self, handle: _WorkerHandle, command: str, unique_id: Optional[str]) -> None:
+        """Send a command to a worker, unless it is down (it gets its rooms when restarted)"""
+
+        if handle.commands is None or not handle.alive:
+            return
+
+        try:
+            handle.commands.send((command, unique_id))
+        except (BrokenPipeError, OSError):
+            pass
+
+    def _read_loop(self) -> None:
+        """The reader thread. Waits on every worker's pipe & process, and hands what it reads to the event loop."""
+
+        while self._reading:
+            with self._watch_lock:
+                watch: Dict[Any, Tuple[str, int, Any]] = dict(self._watch)
+
+            for ready in wait([self._wakeup_reader, *watch]):
+                if ready is self._wakeup_reader:
+                    self._wakeup_reader.recv_bytes()
+                    continue
+
+                kind, worker_id, source = watch[ready]
+
+                # Events & stats
+                if kind == MSG_EVENTS:
+                    try:
+                        data: bytes = ready.recv_bytes()
+                    except (EOFError, OSError):
+                        with self._watch_lock:
+                            self._watch.pop(ready, None)
+
+                        ready.close()
+                        continue
+
+                    self._loop.call_soon_threadsafe(self._on_message, worker_id, data)
+                    continue
+
+                # The worker exited
+                with self._watch_lock:
+                    self._watch.pop(ready, None)
+
+                self._loop.call_soon_threadsafe(self._on_exit, worker_id, source)
+
+    def _on_message(self, worker_id: int, data: bytes) -> None:
+        """Decode & emit a batch of events, or record a stats report"""
+
+        handle: _WorkerHandle = self._handles[worker_id]
+        kind, body = pickle.loads(data)
+
+        if kind == MSG_STATS:
+            handle.pool_stats = body
+            return
+
+        handle.event_count += len(body)
+        handle.byte_count += len(data)
+
+        for unique_id, event in body:
+            self.emit_event(event, unique_id)
+
+    def _on_exit(self, worker_id: int, process: BaseProcess) -> None:
+        """Restart a worker that died, or retire it & rebalance its rooms if it keeps dying"""
+
+        handle: _WorkerHandle = self._handles[worker_id]
+
+        if self._stopping or handle.process is not process:
+            return
+
+        now: float = time.monotonic()
+
+        while handle.restart_times and now - handle.restart_times[0] > self._restart_window:
+            handle.restart_times.popleft()
+
+        if len(handle.restart_times) < self._max_restarts:
+            self._logger.warning(f"Worker {worker_id} exited with code {process.exitcode}, restarting it.")
+            handle.restart_times.append(now)
+            handle.restarts += 1
+            self._spawn(handle)
+            return
+
+        # Crash loop, retire the worker
+        self._logger.error(f"Worker {worker_id} restarted {self._max_restarts} times in {self._restart_window}s, retiring it.")
+        self._ring.remove(worker_id)
+        handle.retired = True
+
+        if not len(self._ring):
+            self._logger.error(f"No workers left, {len(handle.rooms)} rooms are not being watched.")
+            return
+
+        self._rebalance(handle)
+
+    def _rebalance(self, handle: _WorkerHandle) -> None:
+        """Move the rooms of a retired worker to the workers they now hash to"""
+
+        self._rebalances += 1
+        rooms: Set[str] = handle.rooms
+        handle.rooms = set()
+
+        for unique_id in rooms:
+            worker_id: int = self._ring.get(unique_id)
+            self._rooms[unique_id] = worker_id
+            self._handles[worker_id].rooms.add(unique_id)
+            self._send(self._handles[worker_id], CMD_ADD, unique_id)
@@ -0,0 +1,33 @@
+from TikTokLive.client.client import TikTokLiveClient
+from TikTokLive.client.logger import LogLevel
+from TikTokLive.client.ws.ws_sink import FileFrameSink, read_frame_file
+from TikTokLive.events import ConnectEvent, DisconnectEvent
+
+client: TikTokLiveClient = TikTokLiveClient(
+    unique_id="@tv_asahi_news"
+)
+
+# Append-only archive of the raw WebSocket frames
+sink: FileFrameSink = FileFrameSink("tv_asahi_news.ttlf")
+
+
+@client.on(ConnectEvent)
+async def on_connect(event: ConnectEvent):
+    client.logger.info(f"Archiving @{event.unique_id}...")
+
+
+@client.on(DisconnectEvent)
+async def on_disconnect(_: DisconnectEvent):
+    sink.close()
+    client.logger.info(f"Archived {sink.frames_written} frames ({sink.bytes_written} bytes).")
+
+    # Frames can be read back later for analysis
+    for received_at_ns, payload in read_frame_file(sink.path):
+        pass
+
+
+if __name__ == '__main__':
+    client.logger.setLevel(LogLevel.INFO.value)
+
+    # Don't decode anything, just archive the frames as they arrive
+    client.run(raw_frame_sink=sink, decode_frames=False)
@@ -0,0 +1,80 @@
+import random
+import time
+from typing import List, Any, Dict, Callable, Tuple
+
+from TikTokLive.proto import ExtendedUser, BadgeStruct, BadgeStructBadgeDisplayType, BadgeStructImageBadge, Image, User
+from TikTokLive.proto.proto_utils import badge_match_user, SUBSCRIBER_BADGE_PATTERN, MODERATOR_BADGE_PATTERN, \
+    TOP_GIFTER_BADGE_PATTERN, MEMBER_LEVEL_BADGE_PATTERN, GIFTER_LEVEL_BADGE_PATTERN
+from frames import build_user
+
+"""Badges some viewers carry on top of the gifter & member level ones"""
+EXTRA_BADGES: List[BadgeStruct] = [
+    BadgeStruct(
+        display_type=BadgeStructBadgeDisplayType.BADGEDISPLAYTYPE_IMAGE,
+        image=BadgeStructImageBadge(image=Image(url_list=[f"https://p16-webcast.tiktokcdn.com/{name}.png"]))
+    )
+    for name in ("webcast/sub_badge_lv3", "Moderator_badge", "new_top_gifter_no1", "webcast/fan_club_v2")
+]
+
+"""The badge properties of ExtendedUser"""
+PROPERTIES: Tuple[str, ...] = (
+    "is_subscriber", "is_moderator", "is_top_gifter", "member_level", "member_rank", "gifter_level", "subscriber_badge"
+)
+
+
+def scan_properties(user: User) -> Dict[str, Any]:
+    """The previous implementation, every property scans all of the badges with its own pattern"""
+
+    subscriber = badge_match_user(user, SUBSCRIBER_BADGE_PATTERN)
+    member = badge_match_user(user, MEMBER_LEVEL_BADGE_PATTERN)
+    gifter = badge_match_user(user, GIFTER_LEVEL_BADGE_PATTERN)
+
+    return {
+        "is_subscriber": bool(subscriber),
+        "is_moderator": bool(badge_match_user(user, MODERATOR_BADGE_PATTERN)),
+        "is_top_gifter": bool(badge_match_user(user, TOP_GIFTER_BADGE_PATTERN)),
+        "member_level": int(member[0][0].group(1)) if member else None,
+        "member_rank": member[0][1].combine.str if member else None,
+        "gifter_level": int(gifter[0][1].combine.str) if gifter else None,
+        "subscriber_badge": subscriber[0][1] if subscriber else None,
+    }
+
+
+def index_properties(user: User) -> Dict[str, Any]:
+    """The badge index, built once per user"""
+
+    extended: ExtendedUser = ExtendedUser.from_user(user)
+    return {name: getattr(extended, name) for name in PROPERTIES}
+
+
+def bench(name: str, users: List[User], fn: Callable[[User], Dict[str, Any]]) -> None:
+    start: float = time.perf_counter()
+
+    for user in users:
+        fn(user)
+
+    elapsed: float = time.perf_counter() - start
+    print(f"{name:<16} {elapsed / len(users) * 1e6:>10,.2f} us/user (7 properties)")
+
+
+def main() -> None:
+    rng: random.Random = random.Random(1)
+    users: List[User] = []
+
+    for _ in range(5_000):
+        user: User = build_user(rng)
+        user.badge_list.extend(rng.sample(EXTRA_BADGES, rng.randrange(len(EXTRA_BADGES) + 1)))
+        users.append(user)
+
+    for user in users[:500]:
+        assert scan_properties(user) == index_properties(user)
+
+    # Fresh copies, so the index is built in the timed loop
+    copies: List[User] = [ExtendedUser().from_dict(user.to_dict()) for user in users]
+    bench("scan", users, scan_properties)
+    bench("index", copies, index_properties)
+    bench("index, cached", copies, index_properties)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+import asyncio
+import gc
+import os
+import subprocess
+import sys
+import tracemalloc
+from typing import List, Tuple
+
+import httpx
+
+from TikTokLive import TikTokLiveClient, TikTokLiveClientPool
+from TikTokLive.client.pool import PooledTikTokLiveClient
+
+"""A keep-alive HTTP server, run in a subprocess so that its sockets aren't counted"""
+SERVER: str = """
+import sys
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+print(server.server_address[1], flush=True)
+server.serve_forever()
+"""
+
+
+def rss() -> int:
+    """The resident memory of this process, in bytes. Unlike tracemalloc, it includes OpenSSL's TLS contexts."""
+
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def open_fds() -> int:
+    """The number of file descriptors open in this process"""
+
+    return len(os.listdir("/proc/self/fd"))
+
+
+async def join_requests(clients: List[TikTokLiveClient], url: str) -> None:
+    """
+    Make one request per room through each client's HTTP transport, like joining does,
+    so that the connections they keep alive are counted
+
+    """
+
+    responses: List[httpx.Response] = await asyncio.gather(*(client.web.httpx_client.get(url) for client in clients))
+    assert all(response.status_code == 200 for response in responses)
+
+
+async def independent_clients(rooms: int, url: str) -> Tuple[List[TikTokLiveClient], None]:
+    clients: List[TikTokLiveClient] = [TikTokLiveClient(unique_id=f"room{i}") for i in range(rooms)]
+    await join_requests(clients, url)
+    return clients, None
+
+
+async def pooled_clients(rooms: int, url: str) -> Tuple[List[TikTokLiveClient], TikTokLiveClientPool]:
+    pool: TikTokLiveClientPool = TikTokLiveClientPool()
+
+    # Built as pool.add does, without starting the (network-bound) connection
+    clients: List[TikTokLiveClient] = [
+        PooledTikTokLiveClient(
+            pool,
+            f"room{i}",
+            web_kwargs={"httpx_client": pool.httpx_client, "curl_cffi_client": None, "signer": pool.signer}
+        )
+        for i in range(rooms)
+    ]
+
+    # Parity check, every room must go through the shared transport & signer
+    assert all(client.web.httpx_client is pool.httpx_client and client.web.signer is pool.signer for client in clients)
+    await join_requests(clients, url)
+    return clients, pool
+
+
+async def measure(name: str, rooms: int, url: str, factory) -> None:
+    gc.collect()
+    fds_before: int = open_fds()
+    rss_before: int = rss()
+    tracemalloc.start()
+
+    clients, pool = await factory(rooms, url)
+
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    resident: int = rss() - rss_before
+    fds: int = open_fds() - fds_before
+
+    print(
+        f"{name:<22} {rooms:>4} rooms  {memory / rooms / 1024:>7.1f} KiB/room (Python)  "
+        f"{resident / rooms / 1024:>7.1f} KiB/room (RSS)  {fds / rooms:>5.2f} FDs/room ({fds:>4})"
+    )
+
+    for client in clients:
+        await client.close()
+
+    if pool is not None:
+        await pool.close()
+
+
+async def main() -> None:
+    server: subprocess.Popen = subprocess.Popen([sys.executable, "-c", SERVER], stdout=subprocess.PIPE, text=True)
+
+    try:
+        url: str = f"http://127.0.0.1:{server.stdout.readline().strip()}/"
+
+        # Warm up the imports & caches, so the first run isn't charged for them
+        await measure("warm-up", 1, url, independent_clients)
+
+        for rooms in (10, 50, 200):
+            # The pool goes first, so it can't reuse memory freed by the independent clients
+            await measure("client pool", rooms, url, pooled_clients)
+            await measure("independent clients", rooms, url, independent_clients)
+    finally:
+        server.terminate()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+import random
+import time
+from typing import List, Tuple, Union
+
+from TikTokLive import TikTokLiveClient
+from TikTokLive.client.coalesce import EventCoalescer
+from TikTokLive.events import LikeEvent, JoinEvent, LikeBatchEvent, JoinBatchEvent
+from frames import build_payload
+
+"""Events per second in a popular room, & how long to simulate it for"""
+RATE: int = 500
+SECONDS: int = 10
+
+
+def build_events(rng: random.Random) -> List[Tuple[float, Union[LikeEvent, JoinEvent]]]:
+    """Build a stream of likes & joins as (arrival time, event) pairs"""
+
+    likes: List[LikeEvent] = [LikeEvent().parse(build_payload("WebcastLikeMessage", rng)) for _ in range(200)]
+    joins: List[JoinEvent] = [JoinEvent().parse(build_payload("WebcastMemberMessage", rng)) for _ in range(200)]
+
+    return [
+        (i / RATE, rng.choice(likes) if rng.random() < 0.6 else rng.choice(joins))
+        for i in range(RATE * SECONDS)
+    ]
+
+
+def main() -> None:
+    events: List[Tuple[float, Union[LikeEvent, JoinEvent]]] = build_events(random.Random(1))
+    calls: List[int] = [0]
+
+    def handler(_) -> None:
+        calls[0] += 1
+
+    client: TikTokLiveClient = TikTokLiveClient(unique_id="@bench")
+
+    for event_type in (LikeEvent, JoinEvent, LikeBatchEvent, JoinBatchEvent):
+        client.add_listener(event_type, handler)
+
+    # Every event emitted on its own
+    start: float = time.perf_counter()
+
+    for _, event in events:
+        client.emit(event.type, event)
+
+    elapsed: float = time.perf_counter() - start
+    print(f"{'individual':<24} {calls[0]:>8,} handler calls {elapsed / len(events) * 1e6:>8.2f} us/event")
+
+    # Coalesced in 250ms windows, on a simulated clock
+    now: List[float] = [0.0]
+    coalescer: EventCoalescer = EventCoalescer(window=0.25, clock=lambda: now[0])
+    calls[0] = 0
+    likes: int = 0
+
+    start = time.perf_counter()
+
+    for now[0], event in events:
+        for batch_event in coalescer.feed(event):
+            client.emit(batch_event.type, batch_event)
+            likes += batch_event.likes if isinstance(batch_event, LikeBatchEvent) else 0
+
+    elapsed = time.perf_counter() - start
+    likes += sum(batch.likes for batch in coalescer.flush() if isinstance(batch, LikeBatchEvent))
+
+    assert coalescer.merged == len(events)
+    assert likes == sum(event.count for _, event in events if isinstance(event, LikeEvent))
+    print(f"{'coalesced (250ms)':<24} {calls[0]:>8,} handler calls {elapsed / len(events) * 1e6:>8.2f} us/event")
+
+
+if __name__ == '__main__':
+    main()
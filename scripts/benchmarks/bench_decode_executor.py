@@ -0,0 +1,67 @@
+import asyncio
+import statistics
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import List, Optional
+
+from TikTokLive import TikTokLiveClient
+from TikTokLive.client.ws.ws_utils import decode_webcast_push_frame
+from frames import build_push_frames
+
+
+async def measure_loop_lag(samples: List[float], interval: float = 0.001) -> None:
+    """Record how late a periodic timer fires, a proxy for how starved other coroutines on the loop are"""
+
+    while True:
+        expected: float = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, time.perf_counter() - expected))
+
+
+async def bench(name: str, frames: List[bytes], executor: Optional[Executor]) -> None:
+    client: TikTokLiveClient = TikTokLiveClient(unique_id="@bench")
+    client._decode_executor = executor
+    loop = asyncio.get_running_loop()
+
+    lag_samples: List[float] = []
+    lag_task: asyncio.Task = loop.create_task(measure_loop_lag(lag_samples))
+    event_count: int = 0
+    start: float = time.perf_counter()
+
+    # Mirrors WebcastConnect._decode_push_frame & TikTokLiveClient._ws_client_loop
+    for frame in frames:
+        if executor is None:
+            _, webcast_response = decode_webcast_push_frame(frame)
+        else:
+            _, webcast_response = await loop.run_in_executor(executor, decode_webcast_push_frame, frame)
+
+        async for _ in client._parse_webcast_response(webcast_response):
+            event_count += 1
+
+        # Yield to the loop between frames, as the WebSocket read would
+        await asyncio.sleep(0)
+
+    elapsed: float = time.perf_counter() - start
+    lag_task.cancel()
+
+    lag_ms: List[float] = sorted(sample * 1000 for sample in lag_samples) or [0.0]
+    print(
+        f"{name:<24} {len(frames) / elapsed:>8,.1f} frames/s {event_count / elapsed:>8,.0f} events/s  "
+        f"loop lag p50 {statistics.median(lag_ms):>7.2f} ms  p99 {lag_ms[int(len(lag_ms) * 0.99)]:>7.2f} ms  max {lag_ms[-1]:>7.2f} ms"
+    )
+
+
+async def main() -> None:
+    frames: List[bytes] = build_push_frames(count=100, unique=50)
+
+    await bench("inline (default)", frames, None)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        await bench("thread pool", frames, executor)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        await bench("process pool (2)", frames, executor)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+import asyncio
+import time
+from typing import List, Callable
+
+from pyee.asyncio import AsyncIOEventEmitter
+
+from TikTokLive.client.dispatch import EventDispatcher
+from TikTokLive.events import CommentEvent
+
+"""The number of events emitted per run"""
+EVENTS: int = 100_000
+
+
+def make_handlers(count: int, calls: List[int], coroutine: bool) -> List[Callable]:
+    """Build distinct handlers, as a handler is only registered once per event"""
+
+    handlers: List[Callable] = []
+
+    for _ in range(count):
+        if coroutine:
+            async def handler(event: CommentEvent) -> None:
+                calls[0] += 1
+        else:
+            def handler(event: CommentEvent) -> None:
+                calls[0] += 1
+
+        handlers.append(handler)
+
+    return handlers
+
+
+async def bench(emitter: AsyncIOEventEmitter, handlers: List[Callable], emit: Callable[[CommentEvent], bool]) -> float:
+    """Emit the events & wait for the coroutine handlers, returning the events per second"""
+
+    for handler in handlers:
+        emitter.add_listener(CommentEvent.get_type(), handler)
+
+    event: CommentEvent = CommentEvent(content="hello world")
+    start: float = time.perf_counter()
+
+    for _ in range(EVENTS):
+        emit(event)
+
+    await emitter.wait_for_complete()
+    return EVENTS / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    print(f"{'handlers':<16} {'pyee emit':>14} {'dispatcher emit':>16} {'emit_event':>14}")
+
+    for count, coroutine in ((0, False), (1, False), (5, False), (1, True), (5, True)):
+        rates: List[float] = []
+        totals: List[int] = []
+
+        for kind in ("pyee", "emit", "emit_event"):
+            calls: List[int] = [0]
+            emitter: AsyncIOEventEmitter = AsyncIOEventEmitter() if kind == "pyee" else EventDispatcher()
+
+            if kind == "emit_event":
+                emit = emitter.emit_event
+            else:
+                emit = lambda event: emitter.emit(event.type, event)
+
+            rates.append(await bench(emitter, make_handlers(count, calls, coroutine), emit))
+            totals.append(calls[0])
+
+        assert totals[0] == totals[1] == totals[2] == count * EVENTS
+        name: str = f"{count} {'async' if coroutine else 'sync'}"
+        print(f"{name:<16} {rates[0]:>10,.0f} ev/s {rates[1]:>12,.0f} ev/s {rates[2]:>10,.0f} ev/s")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
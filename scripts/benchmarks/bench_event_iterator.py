@@ -0,0 +1,105 @@
+import asyncio
+import time
+from typing import List
+
+from TikTokLive.client.dispatch import EventDispatcher
+from TikTokLive.client.ingest import OverflowPolicy
+from TikTokLive.client.stream import EventStream
+from TikTokLive.events import CommentEvent, GiftEvent, LikeEvent
+
+"""The number of events emitted per run"""
+EVENTS: int = 200_000
+
+"""The number of events per simulated WebcastResponse"""
+RESPONSE_SIZE: int = 20
+
+"""The maximum number of events a publisher sends at once"""
+BATCH_SIZE: int = 500
+
+
+def make_events() -> List[object]:
+    """A mix of the three subscribed event types, reusing one event of each (building betterproto messages is slow)"""
+
+    kinds: List[object] = [CommentEvent(), GiftEvent(), LikeEvent()]
+    return [kinds[i % 3] for i in range(EVENTS)]
+
+
+async def bench_callback_queue(events: List[object]) -> dict:
+    """A coroutine handler per event pushing to an unbounded asyncio.Queue, drained by a publisher"""
+
+    dispatcher: EventDispatcher = EventDispatcher()
+    queue: asyncio.Queue = asyncio.Queue()
+    published: List[int] = [0]
+    peak: List[int] = [0]
+
+    async def handler(event: object) -> None:
+        await queue.put(event)
+        peak[0] = max(peak[0], queue.qsize())
+
+    for event_type in (CommentEvent, GiftEvent, LikeEvent):
+        dispatcher.add_listener(event_type, handler)
+
+    async def publisher() -> None:
+        while published[0] < EVENTS:
+            batch: List[object] = [await queue.get()]
+
+            while not queue.empty() and len(batch) < BATCH_SIZE:
+                batch.append(queue.get_nowait())
+
+            published[0] += len(batch)
+
+    task: asyncio.Task = asyncio.create_task(publisher())
+    start: float = time.perf_counter()
+
+    for index in range(0, EVENTS, RESPONSE_SIZE):
+        for event in events[index:index + RESPONSE_SIZE]:
+            dispatcher.emit_event(event)
+
+        await asyncio.sleep(0)
+
+    await task
+    return {"rate": EVENTS / (time.perf_counter() - start), "published": published[0], "peak": peak[0]}
+
+
+async def bench_stream(events: List[object], maxsize: int) -> dict:
+    """An EventStream with BLOCK, waited on after each response like the client does, drained with get_batch"""
+
+    dispatcher: EventDispatcher = EventDispatcher()
+    stream: EventStream = dispatcher.events(CommentEvent, GiftEvent, LikeEvent, maxsize=maxsize, policy=OverflowPolicy.BLOCK)
+    published: List[int] = [0]
+
+    async def publisher() -> None:
+        while published[0] < EVENTS:
+            published[0] += len(await stream.get_batch(BATCH_SIZE))
+
+    task: asyncio.Task = asyncio.create_task(publisher())
+    start: float = time.perf_counter()
+
+    for index in range(0, EVENTS, RESPONSE_SIZE):
+        for event in events[index:index + RESPONSE_SIZE]:
+            dispatcher.emit_event(event)
+
+        await dispatcher.wait_for_streams()
+
+    await task
+    stream.close()
+    return {"rate": EVENTS / (time.perf_counter() - start), "published": published[0], "peak": stream.high_water_mark}
+
+
+async def main() -> None:
+    events: List[object] = make_events()
+
+    callback: dict = await bench_callback_queue(events)
+    stream: dict = await bench_stream(events, maxsize=1_000)
+
+    # Parity: every event reaches the publisher, and the stream stays within a response of its bound
+    assert callback["published"] == stream["published"] == EVENTS
+    assert stream["peak"] <= 1_000 + RESPONSE_SIZE
+
+    print(f"{'consumer':<32} {'events/s':>12} {'peak queued':>12}")
+    print(f"{'callback -> asyncio.Queue':<32} {callback['rate']:>12,.0f} {callback['peak']:>12,}")
+    print(f"{'EventStream (BLOCK, 1000)':<32} {stream['rate']:>12,.0f} {stream['peak']:>12,}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
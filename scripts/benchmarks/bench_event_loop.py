@@ -0,0 +1,103 @@
+import asyncio
+import time
+from typing import List, Tuple, Dict
+
+import httpx
+import websockets
+
+from TikTokLive import TikTokLiveClient
+from TikTokLive.client.loop import EventLoopRunner, SUPPORTS_UVLOOP
+from TikTokLive.events import CommentEvent, GiftEvent, LikeEvent
+from TikTokLive.proto import WebcastResponse
+from frames import build_push_frames
+
+
+async def serve_frames(frames: List[bytes]) -> Tuple[websockets.WebSocketServer, str]:
+    """A local WebSocket server that sends every frame, then waits for the client to leave"""
+
+    async def handler(websocket) -> None:
+        for frame in frames:
+            await websocket.send(frame)
+
+        await websocket.wait_closed()
+
+    # Acks aren't read, so don't let them back up
+    server: websockets.WebSocketServer = await websockets.serve(handler, "127.0.0.1", 0, max_queue=None)
+    return server, f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}/"
+
+
+async def read_room(frames: List[bytes], decode_frames: bool) -> Tuple[int, float]:
+    """
+    Read the frames through the client's WebSocket & dispatch path, like a live room.
+    Once every frame is in, the reader is cancelled, which must also stop the ping & writer tasks.
+
+    :return: The number of events emitted & the elapsed time
+    """
+
+    server, uri = await serve_frames(frames)
+    client: TikTokLiveClient = TikTokLiveClient(unique_id="@bench", ws_kwargs={"uri": uri})
+    done: asyncio.Event = asyncio.Event()
+    counts: Dict[str, int] = {"frames": 0, "responses": 0, "events": 0}
+
+    for event_type in (CommentEvent, GiftEvent, LikeEvent):
+        client.add_listener(event_type, lambda _: counts.__setitem__("events", counts["events"] + 1))
+
+    def frame_sink(_: bytes, __: int) -> None:
+        counts["frames"] += 1
+
+        # Archive-only mode doesn't yield the frames, so they are counted here
+        if not decode_frames and counts["frames"] == len(frames) + 1:
+            done.set()
+
+    async def read() -> None:
+        async for webcast_response in client.ws.connect(
+                room_id=1,
+                cookies=httpx.Cookies(),
+                user_agent="bench",
+                initial_webcast_response=WebcastResponse(is_first=True),
+                raw_frame_sink=frame_sink,
+                decode_frames=decode_frames
+        ):
+            counts["responses"] += 1
+            await client._dispatch_webcast_response(webcast_response)
+
+            if counts["responses"] == len(frames) + 1:
+                done.set()
+
+    start: float = time.perf_counter()
+    reader: asyncio.Task = asyncio.create_task(read())
+    await done.wait()
+    elapsed: float = time.perf_counter() - start
+
+    reader.cancel()
+    await asyncio.gather(reader, return_exceptions=True)
+    server.close()
+    await server.wait_closed()
+
+    # Parity check, every frame must come through (plus the initial response), & the ping/writer tasks must be gone
+    assert counts["frames"] == len(frames) + 1
+    assert client.ws._ping_loop is None and client.ws._writer_task is None
+
+    return counts["events"], elapsed
+
+
+def bench(name: str, use_uvloop: bool, frames: List[bytes]) -> None:
+    with EventLoopRunner(use_uvloop=use_uvloop) as runner:
+        for decode_frames in (False, True):
+            runner.run(read_room(frames, decode_frames))  # Warm-up
+            events, elapsed = min((runner.run(read_room(frames, decode_frames)) for _ in range(3)), key=lambda result: result[1])
+            mode: str = "decode & dispatch" if decode_frames else "archive-only"
+            print(f"{name:<10} {mode:<18} {len(frames) / elapsed:>10,.0f} frames/s  {events / elapsed:>10,.0f} events/s")
+
+        # Nothing may be left behind on the loop
+        assert not [task for task in asyncio.all_tasks(runner.loop) if not task.done()]
+
+
+if __name__ == '__main__':
+    push_frames: List[bytes] = build_push_frames(count=300, unique=100)
+    bench("asyncio", False, push_frames)
+
+    if SUPPORTS_UVLOOP:
+        bench("uvloop", True, push_frames)
+    else:
+        print("uvloop is not installed, type \"pip install TikTokLive[uvloop]\" to compare.")
@@ -0,0 +1,73 @@
+import random
+import time
+import tracemalloc
+from typing import List, Callable, Tuple
+
+from TikTokLive.proto import User, ExtendedUser
+from frames import build_user
+
+"""The ExtendedUser properties compared between the two conversions"""
+PROPERTIES: Tuple[str, ...] = (
+    "unique_id", "is_friend", "subscriber_badge", "is_subscriber", "is_moderator",
+    "is_top_gifter", "member_level", "member_rank", "gifter_level"
+)
+
+
+def from_user_copy(user: User) -> ExtendedUser:
+    """A dict round-trip, which rebuilds every nested message (badges, images...)"""
+
+    return ExtendedUser().from_dict(user.to_dict())
+
+
+def check_parity(users: List[User]) -> None:
+    """The view must expose the same properties & serialize identically to the copy"""
+
+    for user in users:
+        copy: ExtendedUser = from_user_copy(user)
+        view: ExtendedUser = ExtendedUser.from_user(user)
+
+        for name in PROPERTIES:
+            assert getattr(copy, name) == getattr(view, name), name
+
+        assert copy.to_dict() == view.to_dict()
+        assert bytes(view) == bytes(user)
+
+
+def bench_time(name: str, users: List[User], fn: Callable[[User], ExtendedUser]) -> None:
+    start: float = time.perf_counter()
+
+    for user in users:
+        fn(user)
+
+    elapsed: float = time.perf_counter() - start
+    print(f"{name:<12} {elapsed / len(users) * 1e6:>10,.2f} us/user")
+
+
+def bench_memory(name: str, users: List[User], fn: Callable[[User], ExtendedUser]) -> None:
+    tracemalloc.start()
+    before: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+    converted: List[ExtendedUser] = [fn(user) for user in users]
+    after: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    size: int = sum(stat.size_diff for stat in stats)
+    count: int = sum(stat.count_diff for stat in stats)
+
+    print(f"{name:<12} {size / len(converted):>10,.0f} bytes/user {count / len(converted):>10,.1f} allocations/user")
+
+
+def main() -> None:
+    rng: random.Random = random.Random(1)
+    users: List[User] = [build_user(rng) for _ in range(2_000)]
+
+    check_parity(users[:200])
+
+    bench_time("dict copy", users, from_user_copy)
+    bench_time("view", users, ExtendedUser.from_user)
+    bench_memory("dict copy", users, from_user_copy)
+    bench_memory("view", users, ExtendedUser.from_user)
+
+
+if __name__ == '__main__':
+    main()
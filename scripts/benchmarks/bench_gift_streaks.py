@@ -0,0 +1,71 @@
+import random
+import time
+from typing import List, Tuple
+
+from TikTokLive.client.streaks import GiftStreakAggregator
+from TikTokLive.events import GiftEvent, GiftStreakEndEvent, GiftStreakProgressEvent
+from TikTokLive.proto import ExtendedUser, ExtendedGiftStruct
+
+
+def build_streaks(rng: random.Random, count: int) -> Tuple[List[Tuple[float, GiftEvent]], int]:
+    """
+    Build the GiftEvents of interleaved combo streaks, as a room sees them
+
+    :param rng: Random number generator
+    :param count: The number of streaks
+    :return: The (arrival time, event) pairs in arrival order, & the number of gifts sent in total
+
+    """
+
+    gift: ExtendedGiftStruct = ExtendedGiftStruct(id=5655, name="Rose", diamond_count=1, type=1)
+    arrivals: List[Tuple[float, GiftEvent]] = []
+    total: int = 0
+
+    for group_id in range(count):
+        user: ExtendedUser = ExtendedUser(id=rng.getrandbits(60), display_id=f"viewer_{group_id}")
+        length: int = min(int(rng.expovariate(1 / 15)) + 1, 200)
+        start: float = rng.uniform(0, 600)
+        total += length
+
+        # One GiftEvent per combo (~4 per second), the last one with repeat_end
+        for repeat_count in range(1, length + 1):
+            event: GiftEvent = GiftEvent(user=user, gift=gift, gift_id=gift.id, group_id=group_id, repeat_count=repeat_count)
+            arrivals.append((start + repeat_count * 0.25, event))
+
+        arrivals.append((start + length * 0.25 + 0.1, GiftEvent(user=user, gift=gift, gift_id=gift.id, group_id=group_id, repeat_count=length, repeat_end=1)))
+
+    arrivals.sort(key=lambda arrival: arrival[0])
+    return arrivals, total
+
+
+def main() -> None:
+    arrivals, total = build_streaks(random.Random(1), count=2_000)
+    events: List[GiftEvent] = [event for _, event in arrivals]
+
+    for progress_interval in (None, 1.0):
+
+        # Replay the arrival times on a simulated clock
+        now: List[float] = [0.0]
+        aggregator: GiftStreakAggregator = GiftStreakAggregator(progress_interval=progress_interval, clock=lambda: now[0])
+        emitted: List[GiftStreakProgressEvent] = []
+
+        start: float = time.perf_counter()
+
+        for now[0], event in arrivals:
+            emitted.extend(aggregator.feed(event))
+
+        elapsed: float = time.perf_counter() - start
+        emitted.extend(aggregator.flush())
+
+        ended: List[GiftStreakEndEvent] = [event for event in emitted if isinstance(event, GiftStreakEndEvent)]
+        assert len(ended) == 2_000 and not any(event.timed_out for event in ended)
+        assert sum(event.repeat_count for event in ended) == sum(event.diamond_count for event in ended) == total
+
+        print(
+            f"progress {'off' if progress_interval is None else f'every {progress_interval}s'}: {len(events):,} GiftEvents in -> {len(emitted):,} events out "
+            f"({len(events) / len(emitted):.1f}x fewer), {elapsed / len(events) * 1e6:.2f} us/GiftEvent"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+import asyncio
+import time
+import tracemalloc
+from typing import List, Optional
+
+from TikTokLive.client.dispatch import EventDispatcher
+from TikTokLive.events import GiftEvent
+from TikTokLive.proto import ExtendedUser
+
+"""The number of events in the burst"""
+EVENTS: int = 5_000
+
+"""How long the simulated DB write of each event takes, in seconds"""
+HANDLER_DELAY: float = 0.002
+
+"""The number of distinct gifters, spread over the lanes of an ordered pool"""
+USERS: int = 64
+
+
+async def bench(concurrency: Optional[int], ordered: bool = False) -> dict:
+    """Emit a burst of GiftEvents to one slow handler, returning the peak tasks & memory & the handled count"""
+
+    dispatcher: EventDispatcher = EventDispatcher()
+    handled: List[int] = [0]
+
+    async def write(event: GiftEvent) -> None:
+        await asyncio.sleep(HANDLER_DELAY)
+        handled[0] += 1
+
+    dispatcher.on(GiftEvent, write, concurrency=concurrency, ordered=ordered)
+    events: List[GiftEvent] = [GiftEvent(user=ExtendedUser(id=user_id)) for user_id in range(USERS)]
+
+    tracemalloc.start()
+    start: float = time.perf_counter()
+
+    for index in range(EVENTS):
+        dispatcher.emit_event(events[index % USERS])
+
+    peak_tasks: int = len(asyncio.all_tasks()) - 1
+    await dispatcher.wait_for_complete()
+
+    elapsed: float = time.perf_counter() - start
+    peak_memory: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {"tasks": peak_tasks, "memory": peak_memory, "handled": handled[0], "elapsed": elapsed}
+
+
+async def main() -> None:
+    runs: dict = {
+        "unbounded (pyee-style)": await bench(None),
+        "concurrency=8": await bench(8),
+        "concurrency=8, ordered": await bench(8, ordered=True),
+    }
+
+    # Parity: every event is handled, whatever the limit
+    assert all(run["handled"] == EVENTS for run in runs.values())
+
+    print(f"{'listener':<26} {'peak tasks':>11} {'peak memory':>13} {'burst drained in':>17}")
+
+    for name, run in runs.items():
+        print(f"{name:<26} {run['tasks']:>11,} {run['memory'] / 1024:>10,.0f} KB {run['elapsed']:>16.2f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
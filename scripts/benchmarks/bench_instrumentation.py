@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import time
+from typing import List, Optional, AsyncIterator, Type
+
+from TikTokLive import TikTokLiveClient
+from TikTokLive.client.instrumentation import HistogramInstrumentation, Instrumentation, PrometheusExporter, Stage
+from TikTokLive.client.ws.ws_utils import decode_webcast_push_frame
+from TikTokLive.events import CommentEvent, GiftEvent, LikeEvent, Event, ReconnectEvent
+from TikTokLive.proto import WebcastResponse
+from frames import build_push_frames
+
+"""The number of times the decoded events are replayed per run"""
+ROUNDS: int = 20
+
+
+class ReplayClient(TikTokLiveClient):
+    """Replays already decoded events, to time the dispatch loop without the decoding"""
+
+    replay: List[List[Event]] = []
+
+    async def _parse_webcast_response(self, webcast_response: WebcastResponse, reconnect_event: Optional[ReconnectEvent] = None) -> AsyncIterator[Event]:
+        for event in self.replay[webcast_response.fetch_type]:
+            yield event
+
+
+class FStringDebugClient(ReplayClient):
+    """The dispatch loop as it was, formatting a debug log line per event whether or not it is emitted"""
+
+    async def _dispatch_webcast_response(self, webcast_response: WebcastResponse) -> None:
+        async for event in self._parse_webcast_response(webcast_response):
+            self._logger.debug(f"Received Event '{event.type}' [{event.size} bytes]")
+            self._dispatch_event(event)
+
+        await self.wait_for_streams()
+
+
+async def decode(frames: List[bytes], instrumentation: Instrumentation) -> List[List[Event]]:
+    """Decode the frames into events with a real client, timing every stage"""
+
+    client: TikTokLiveClient = TikTokLiveClient(unique_id="@bench")
+    client._instrumentation = instrumentation
+    responses: List[List[Event]] = []
+
+    for frame in frames:
+        instrumentation.record_frame(len(frame), time.time())
+        _, webcast_response = decode_webcast_push_frame(frame, instrumentation=instrumentation)
+        responses.append([event async for event in client._parse_webcast_response(webcast_response)])
+
+    return responses
+
+
+async def bench(client_type: Type[ReplayClient], instrumentation: Optional[Instrumentation]) -> dict:
+    """Dispatch the replayed events to 3 sync handlers, returning the events per second & the handler calls"""
+
+    client: ReplayClient = client_type(unique_id="@bench")
+    client._instrumentation = instrumentation
+    client._logger.setLevel(logging.INFO)
+    calls: List[int] = [0]
+
+    def handler(_) -> None:
+        calls[0] += 1
+
+    for event_type in (CommentEvent, GiftEvent, LikeEvent):
+        client.add_listener(event_type, handler)
+
+    responses: List[WebcastResponse] = [WebcastResponse(fetch_type=index) for index in range(len(client.replay))]
+    events: int = ROUNDS * sum(len(events) for events in client.replay)
+    start: float = time.perf_counter()
+
+    for _ in range(ROUNDS):
+        for response in responses:
+            await client._dispatch_webcast_response(response)
+
+    return {"rate": events / (time.perf_counter() - start), "calls": calls[0]}
+
+
+async def main() -> None:
+    pipeline: HistogramInstrumentation = HistogramInstrumentation()
+    ReplayClient.replay = await decode(build_push_frames(count=300), pipeline)
+    dispatch: HistogramInstrumentation = HistogramInstrumentation()
+
+    runs: dict = {
+        "f-string debug log (before)": await bench(FStringDebugClient, None),
+        "instrumentation disabled": await bench(ReplayClient, None),
+        "HistogramInstrumentation": await bench(ReplayClient, dispatch),
+    }
+
+    # Parity: instrumentation doesn't change what the handlers receive, and every handler call was recorded
+    assert len({run["calls"] for run in runs.values()}) == 1
+    assert sum(
+        histogram.count for (stage, _), histogram in dispatch.histograms.items() if stage == Stage.HANDLER
+    ) == runs["HistogramInstrumentation"]["calls"]
+
+    print(f"{'dispatch loop':<30} {'events/s':>12}")
+
+    for name, run in runs.items():
+        print(f"{name:<30} {run['rate']:>12,.0f}")
+
+    print()
+    print(f"{'stage':<10} {'key':<22} {'count':>8} {'mean':>10} {'p99 <=':>10}")
+
+    for (stage, key), histogram in sorted(pipeline.histograms.items(), key=lambda item: (item[0][0].value, item[0][1])):
+        print(f"{stage.value:<10} {key:<22} {histogram.count:>8,} {histogram.mean * 1e6:>8.1f}us {histogram.quantile(0.99) * 1e6:>8.0f}us")
+
+    print()
+    print("\n".join(PrometheusExporter(pipeline, labels={"room": "bench"}).render().splitlines()[:4]), "...")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
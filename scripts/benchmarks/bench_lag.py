@@ -0,0 +1,109 @@
+import asyncio
+import time
+from typing import List, AsyncIterator, Optional
+
+from TikTokLive import TikTokLiveClient
+from TikTokLive.client.lag import LagTracker
+from TikTokLive.client.ws.ws_utils import extract_webcast_response_message
+from TikTokLive.events import CommentEvent, GiftEvent, LikeEvent, Event, ReconnectEvent
+from TikTokLive.proto import WebcastResponse, WebcastPushFrame
+from frames import build_push_frames
+
+"""The number of times the decoded events are replayed per run"""
+ROUNDS: int = 20
+
+
+class ReplayClient(TikTokLiveClient):
+    """Replays already decoded events, to time the dispatch loop without the decoding"""
+
+    replay: List[List[Event]] = []
+
+    async def _parse_webcast_response(self, webcast_response: WebcastResponse, reconnect_event: Optional[ReconnectEvent] = None) -> AsyncIterator[Event]:
+        for event in self.replay[webcast_response.fetch_type]:
+            yield event
+
+
+def stamp(responses: List[WebcastResponse], replay: List[List[Event]]) -> None:
+    """Make the server send the responses & create their events just now"""
+
+    for response in responses:
+        response.now = int(time.time() * 1000)
+
+        for event in replay[response.fetch_type]:
+            event.common.create_time = response.now
+
+
+async def bench(lag: Optional[LagTracker], handler_delay: float = 0.0) -> dict:
+    """Receive & dispatch the replayed responses to 3 sync handlers, returning the events per second & the handler calls"""
+
+    client: ReplayClient = ReplayClient(unique_id="@bench")
+    client._lag = lag
+    calls: List[int] = [0]
+    stamped: List[int] = [0]
+
+    def handler(event: Event) -> None:
+        calls[0] += 1
+        stamped[0] += event.lag is not None
+
+        # A busy handler, so the room falls behind
+        if handler_delay:
+            time.sleep(handler_delay)
+
+    for event_type in (CommentEvent, GiftEvent, LikeEvent):
+        client.add_listener(event_type, handler)
+
+    responses: List[WebcastResponse] = [WebcastResponse(fetch_type=index) for index in range(len(client.replay))]
+    rounds: int = ROUNDS if not handler_delay else 1
+    stamp(responses, client.replay)
+    start: float = time.perf_counter()
+
+    for _ in range(rounds):
+        for response in responses:
+
+            # Restamping costs more than tracking, so only the slow run's timestamps are kept current
+            if handler_delay:
+                stamp([response], client.replay)
+
+            if lag is not None:
+                lag.received(response)
+
+            await client._dispatch_webcast_response(response)
+
+    events: int = rounds * sum(len(events) for events in client.replay)
+    return {"rate": events / (time.perf_counter() - start), "calls": calls[0], "stamped": stamped[0]}
+
+
+async def main() -> None:
+    ReplayClient.replay = [
+        [event async for event in TikTokLiveClient(unique_id="@bench")._parse_webcast_response(
+            extract_webcast_response_message(WebcastPushFrame().parse(frame))
+        )]
+        for frame in build_push_frames(count=300)
+    ]
+
+    off: dict = await bench(None)
+    tracked: dict = await bench(LagTracker())
+    stamped: dict = await bench(LagTracker(stamp_events=True))
+
+    # Parity: tracking doesn't change what the handlers receive, and only stamping stamps
+    assert off["calls"] == tracked["calls"] == stamped["calls"]
+    assert tracked["stamped"] == 0 and stamped["stamped"] == stamped["calls"]
+
+    print(f"{'lag tracking':<24} {'events/s':>12}")
+    print(f"{'off':<24} {off['rate']:>12,.0f}")
+    print(f"{'track_lag':<24} {tracked['rate']:>12,.0f}")
+    print(f"{'track_lag + stamp_lag':<24} {stamped['rate']:>12,.0f}")
+
+    # A 200us handler: the events of a response wait behind the earlier ones, so the dispatch lag climbs
+    slow: LagTracker = LagTracker()
+    await bench(slow, handler_delay=0.0002)
+
+    print()
+    print(f"{'slow handler':<12} {'p50':>10} {'p90':>10} {'p99':>10}")
+
+    for measure, values in slow.snapshot().items():
+        print(f"{measure:<12}", *(f"{value * 1000:>8.2f}ms" for value in values.values()))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,68 @@
+import asyncio
+import time
+from typing import List
+
+from TikTokLive import TikTokLiveClient
+from TikTokLive.events import GiftEvent
+from TikTokLive.proto import ExtendedGiftStruct
+
+"""The number of async handlers per event, & the number of events"""
+HANDLERS: int = 5
+EVENTS: int = 20_000
+
+
+def build_events() -> List[GiftEvent]:
+    """One gift in ten is worth 100 diamonds or more"""
+
+    return [GiftEvent(gift=ExtendedGiftStruct(diamond_count=500 if i % 10 == 0 else 1)) for i in range(EVENTS)]
+
+
+async def bench(name: str, client: TikTokLiveClient, events: List[GiftEvent], calls: List[int]) -> None:
+    start: float = time.perf_counter()
+
+    for event in events:
+        client.emit(event.type, event)
+
+    # Let the scheduled handler tasks run
+    while len(asyncio.all_tasks()) > 1:
+        await asyncio.sleep(0)
+
+    elapsed: float = time.perf_counter() - start
+    print(f"{name:<28} {len(events) / elapsed:>10,.0f} events/s {calls[0]:>8,} handled")
+
+
+async def main() -> None:
+    events: List[GiftEvent] = build_events()
+
+    # Every handler checks the event itself, so a task is created just to return
+    calls: List[int] = [0]
+    client: TikTokLiveClient = TikTokLiveClient(unique_id="@bench")
+
+    # Distinct handlers, as a handler is only registered once per event
+    for _ in range(HANDLERS):
+        async def check_in_handler(event: GiftEvent) -> None:
+            if event.gift.diamond_count >= 100:
+                calls[0] += 1
+
+        client.add_listener(GiftEvent, check_in_handler)
+
+    await bench("filter in the handlers", client, events, calls)
+    checked: int = calls[0]
+
+    # The handlers share one where= filter, evaluated once per event
+    calls = [0]
+    client = TikTokLiveClient(unique_id="@bench")
+    big = lambda event: event.gift.diamond_count >= 100
+
+    for _ in range(HANDLERS):
+        async def handler(event: GiftEvent) -> None:
+            calls[0] += 1
+
+        client.add_listener(GiftEvent, handler, where=big)
+
+    await bench("where= filter", client, events, calls)
+    assert calls[0] == checked == HANDLERS * EVENTS // 10
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
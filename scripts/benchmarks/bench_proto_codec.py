@@ -0,0 +1,79 @@
+import timeit
+from typing import List, Tuple, Type
+
+from TikTokLive.client.ws.ws_utils import decode_webcast_push_frame
+from TikTokLive.events.proto_events import EVENT_MAPPINGS, ProtoEvent
+from TikTokLive.proto import WebcastPushFrame, WebcastResponse
+from TikTokLive.proto.codec import ProtoCodec, SUPPORTS_UPB, UPB_MESSAGES, parse_message
+from frames import build_push_frames
+
+
+def check_parity(frames: List[bytes]) -> List[Tuple[Type[ProtoEvent], bytes]]:
+    """
+    Decode every frame & message with both codecs. The messages must re-serialize to the same bytes,
+    convert to the same dicts & have the same (event) class.
+
+    :return: The (event type, payload) pairs of the hot messages
+    """
+
+    payloads: List[Tuple[Type[ProtoEvent], bytes]] = []
+
+    for frame in frames:
+        expected_frame, expected_response = decode_webcast_push_frame(frame, ProtoCodec.BETTERPROTO)
+        actual_frame, actual_response = decode_webcast_push_frame(frame, ProtoCodec.UPB)
+
+        for expected, actual in ((expected_frame, actual_frame), (expected_response, actual_response)):
+            assert type(expected) is type(actual)
+            assert bytes(expected) == bytes(actual)
+            assert expected.to_dict() == actual.to_dict()
+
+        for message in expected_response.messages:
+            event_type: Type[ProtoEvent] = EVENT_MAPPINGS[message.method]
+            expected: ProtoEvent = parse_message(event_type, message.payload, ProtoCodec.BETTERPROTO)
+            actual: ProtoEvent = parse_message(event_type, message.payload, ProtoCodec.UPB)
+
+            assert type(expected) is type(actual)
+            assert bytes(expected) == bytes(actual)
+            assert expected.to_dict() == actual.to_dict()
+
+            if message.method in UPB_MESSAGES:
+                payloads.append((event_type, message.payload))
+
+    return payloads
+
+
+def bench(name: str, count: int, fn) -> None:
+    best: float = min(timeit.repeat(fn, number=1, repeat=5))
+    print(f"{name:<40} {count / best:>10,.0f} /s  {best / count * 1e6:>9.1f} us")
+
+
+if __name__ == '__main__':
+
+    if not SUPPORTS_UPB:
+        raise SystemExit("The C (upb) protobuf runtime is not installed, type \"pip install TikTokLive[upb]\".")
+
+    frames: List[bytes] = build_push_frames(count=200, unique=100)
+    hot_payloads: List[Tuple[Type[ProtoEvent], bytes]] = check_parity(frames)
+    print(f"Parity OK for {len(frames)} frames & {len(hot_payloads)} hot messages\n")
+
+    for codec in ProtoCodec:
+        bench(
+            f"{codec.value}, push frame + response",
+            len(frames),
+            lambda: [decode_webcast_push_frame(frame, codec) for frame in frames]
+        )
+
+    for codec in ProtoCodec:
+        bench(
+            f"{codec.value}, hot messages",
+            len(hot_payloads),
+            lambda: [parse_message(event_type, payload, codec) for event_type, payload in hot_payloads]
+        )
+
+    # The envelopes alone, without the nested messages
+    push_frame: bytes = frames[0]
+    response: bytes = bytes(decode_webcast_push_frame(push_frame)[1])
+
+    for codec in ProtoCodec:
+        bench(f"{codec.value}, WebcastPushFrame", 1000, lambda: [parse_message(WebcastPushFrame, push_frame, codec) for _ in range(1000)])
+        bench(f"{codec.value}, WebcastResponse", 1000, lambda: [parse_message(WebcastResponse, response, codec) for _ in range(1000)])
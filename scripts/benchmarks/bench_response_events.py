@@ -0,0 +1,64 @@
+import asyncio
+import time
+from typing import List, Optional, Type
+
+from TikTokLive import TikTokLiveClient
+from TikTokLive.events import Event, WebsocketResponseEvent, UnknownEvent
+from TikTokLive.events.proto_events import EVENT_MAPPINGS, ProtoEvent
+from TikTokLive.proto import WebcastResponse, WebcastResponseMessage, WebcastPushFrame
+from TikTokLive.client.ws.ws_utils import extract_webcast_response_message
+from frames import build_push_frames
+
+
+async def parse_message_eager(client: TikTokLiveClient, message: WebcastResponseMessage) -> List[Event]:
+    """The previous implementation, which always built the wrapper events with a dict round-trip"""
+
+    event_type: Optional[Type[ProtoEvent]] = EVENT_MAPPINGS.get(message.method)
+    response_event: Event = WebsocketResponseEvent().from_dict(message.to_dict())
+
+    if event_type is None:
+        return [response_event, UnknownEvent().from_dict(message.to_dict())]
+
+    proto_event: ProtoEvent = event_type().parse(message.payload)
+    custom_event: Optional[Event] = await client.handle_custom_event(message, proto_event)
+    return [custom_event, response_event, proto_event] if custom_event else [response_event, proto_event]
+
+
+async def bench(name: str, messages: List[WebcastResponseMessage], fn) -> None:
+    start: float = time.perf_counter()
+
+    for message in messages:
+        await fn(message)
+
+    elapsed: float = time.perf_counter() - start
+    print(f"{name:<40} {len(messages) / elapsed:>10,.0f} messages/s")
+
+
+async def main() -> None:
+    client: TikTokLiveClient = TikTokLiveClient(unique_id="@bench")
+
+    responses: List[WebcastResponse] = [
+        extract_webcast_response_message(WebcastPushFrame().parse(frame))
+        for frame in build_push_frames(count=300)
+    ]
+
+    messages: List[WebcastResponseMessage] = [message for response in responses for message in response.messages]
+
+    # Unmapped methods skip the proto decode, so they isolate the cost of the wrapper events
+    unknown: List[WebcastResponseMessage] = [
+        WebcastResponseMessage(method="WebcastUnmappedMessage", payload=message.payload, msg_id=message.msg_id)
+        for message in messages
+    ]
+
+    await bench("eager, mapped methods", messages, lambda m: parse_message_eager(client, m))
+    await bench("lazy, mapped methods", messages, client._parse_webcast_response_message)
+    await bench("eager, unmapped methods", unknown, lambda m: parse_message_eager(client, m))
+    await bench("lazy, unmapped methods", unknown, client._parse_webcast_response_message)
+
+    client.add_listener(WebsocketResponseEvent, lambda _: None)
+    client.add_listener(UnknownEvent, lambda _: None)
+    await bench("lazy + listeners, unmapped methods", unknown, client._parse_webcast_response_message)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
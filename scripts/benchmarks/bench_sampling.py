@@ -0,0 +1,63 @@
+import asyncio
+import time
+from typing import List, Optional
+
+from TikTokLive import TikTokLiveClient
+from TikTokLive.client.sampling import EventSampler, RateLimit, Sample
+from TikTokLive.client.ws.ws_utils import extract_webcast_response_message
+from TikTokLive.events import CommentEvent, LikeEvent
+from TikTokLive.proto import WebcastResponse, WebcastPushFrame
+from frames import build_push_frames
+
+
+async def bench(name: str, responses: List[WebcastResponse], sampler: Optional[EventSampler]) -> int:
+    """Dispatch the responses to a comment & a like handler, returning the number of handler calls"""
+
+    client: TikTokLiveClient = TikTokLiveClient(unique_id="@bench")
+    client.decode_unsubscribed_events = False
+    client._sampler = sampler
+    calls: List[int] = [0]
+
+    def handler(_) -> None:
+        calls[0] += 1
+
+    client.add_listener(CommentEvent, handler)
+    client.add_listener(LikeEvent, handler)
+
+    # The responses are consumed by the filters, so work on copies
+    copies: List[WebcastResponse] = [WebcastResponse(messages=list(response.messages)) for response in responses]
+    messages: int = sum(len(response.messages) for response in copies)
+
+    start: float = time.perf_counter()
+
+    for response in copies:
+        await client._dispatch_webcast_response(response)
+
+    elapsed: float = time.perf_counter() - start
+    print(f"{name:<32} {messages / elapsed:>10,.0f} messages/s {calls[0]:>8,} handler calls")
+    return calls[0]
+
+
+async def main() -> None:
+    responses: List[WebcastResponse] = [
+        extract_webcast_response_message(WebcastPushFrame().parse(frame))
+        for frame in build_push_frames(count=300)
+    ]
+
+    comments: int = sum(1 for response in responses for message in response.messages if message.method == "WebcastChatMessage")
+    likes: int = sum(1 for response in responses for message in response.messages if message.method == "WebcastLikeMessage")
+
+    assert await bench("no sampler", responses, None) == comments + likes
+
+    # A rate the run can't reach, so only the 1 in 10 likes are dropped & the counts are exact
+    sampler: EventSampler = EventSampler({CommentEvent: RateLimit(10 ** 9), LikeEvent: Sample(10)})
+    assert await bench("sampler, comments & 1/10 likes", responses, sampler) == comments + (likes + 9) // 10
+    assert sampler.dropped_total == likes - (likes + 9) // 10
+
+    sampler = EventSampler({CommentEvent: RateLimit(20), LikeEvent: Sample(10)})
+    await bench("sampler, 20 comments/s & 1/10", responses, sampler)
+    print(f"dropped: {sampler.dropped}")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+import sys
+import timeit
+from typing import List, Tuple, FrozenSet
+
+from TikTokLive.client.ws.ws_utils import decompress_gzip_payload, parse_webcast_response
+from TikTokLive.proto import WebcastPushFrame, WebcastResponse
+from TikTokLive.proto.proto_wire import scan_webcast_response
+from frames import build_push_frames, load_push_frames
+
+
+def full_parse(response: bytes) -> List[Tuple[str, bytes]]:
+    """The full parse, every message is materialized before routing"""
+
+    return [(message.method, message.payload) for message in WebcastResponse().parse(response).messages]
+
+
+def wire_scan(response: bytes) -> List[Tuple[str, memoryview]]:
+    """The wire-level scan, nothing is materialized"""
+
+    return list(scan_webcast_response(response))
+
+
+if __name__ == '__main__':
+
+    # Pass the path of a FileFrameSink archive to run on recorded traffic
+    frames: List[bytes] = load_push_frames(sys.argv[1]) if len(sys.argv) > 1 else build_push_frames(count=500)
+    responses: List[bytes] = []
+
+    for frame in frames:
+        push_frame: WebcastPushFrame = WebcastPushFrame().parse(frame)
+
+        if push_frame.payload_type == "msg":
+            responses.append(decompress_gzip_payload(push_frame.payload) if push_frame.headers.get("compress_type") == "gzip" else push_frame.payload)
+
+    # A client listening to chat & gifts only
+    methods: FrozenSet[str] = frozenset({"WebcastChatMessage", "WebcastGiftMessage"})
+
+    # Parity check, the scan must see the same messages as the full parse
+    for response in responses:
+        assert [(method, bytes(payload)) for method, payload in wire_scan(response)] == full_parse(response)
+
+        expected: WebcastResponse = WebcastResponse().parse(response)
+        expected.messages = [message for message in expected.messages if message.method in methods]
+        assert bytes(parse_webcast_response(response, methods=methods)) == bytes(expected)
+
+    message_count: int = sum(len(full_parse(response)) for response in responses)
+    print(f"{len(responses)} responses, {message_count} messages\n")
+
+    for name, fn in (
+            ("full parse", full_parse),
+            ("wire scan", wire_scan),
+            ("full parse, then filter", lambda r: [m for m in WebcastResponse().parse(r).messages if m.method in methods]),
+            ("projected parse (chat & gift)", lambda r: parse_webcast_response(r, methods=methods).messages),
+    ):
+        best: float = min(timeit.repeat(lambda: [fn(response) for response in responses], number=1, repeat=5))
+        print(f"{name:<32} {len(responses) / best:>10,.0f} responses/s  {message_count / best:>12,.0f} messages/s")
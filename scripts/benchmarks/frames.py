@@ -0,0 +1,183 @@
+import gzip
+import random
+import os
+from typing import List, Optional, Union
+
+from TikTokLive.proto import (
+    WebcastPushFrame, WebcastResponse, WebcastResponseMessage, WebcastChatMessage, WebcastGiftMessage,
+    WebcastLikeMessage, WebcastMemberMessage, WebcastRoomUserSeqMessage, WebcastSocialMessage, Common, User, Image,
+    BadgeStruct, BadgeStructBadgeDisplayType, BadgeStructCombineBadge, BadgeStructImageBadge, GiftStruct, Text,
+    UserFollowInfo
+)
+from TikTokLive.client.ws.ws_sink import read_frame_file
+
+"""The mix of message types in a busy room, roughly as observed on recorded traffic"""
+TRAFFIC_MIX: List[str] = [
+    *["WebcastLikeMessage"] * 35,
+    *["WebcastMemberMessage"] * 25,
+    *["WebcastChatMessage"] * 20,
+    *["WebcastGiftMessage"] * 10,
+    *["WebcastSocialMessage"] * 5,
+    *["WebcastRoomUserSeqMessage"] * 5,
+]
+
+
+def build_user(rng: random.Random) -> User:
+    """
+    Build a user with a realistic amount of nested data (avatars & badges)
+
+    :param rng: Random number generator
+    :return: The user
+
+    """
+
+    user_id: int = rng.randrange(10 ** 17, 10 ** 18)
+    avatar: Image = Image(url_list=[f"https://p16-sign.tiktokcdn.com/avatar/{user_id}~{i}.webp" for i in range(3)])
+
+    return User(
+        id=user_id,
+        nickname=f"viewer {user_id % 10000}",
+        display_id=f"viewer_{user_id}",
+        sec_uid=f"MS4wLjABAAAA{user_id:x}",
+        avatar_thumb=avatar,
+        avatar_medium=avatar,
+        avatar_large=avatar,
+        follow_info=UserFollowInfo(following_count=rng.randrange(1000), follower_count=rng.randrange(10000)),
+        badge_list=[
+            BadgeStruct(
+                display_type=BadgeStructBadgeDisplayType.BADGEDISPLAYTYPE_COMBINE,
+                combine=BadgeStructCombineBadge(
+                    str=str(rng.randrange(1, 50)),
+                    icon=Image(url_list=[f"https://p16-webcast.tiktokcdn.com/grade_badge_icon_lite_lv{rng.randrange(1, 50)}_v1.png"])
+                )
+            ),
+            BadgeStruct(
+                display_type=BadgeStructBadgeDisplayType.BADGEDISPLAYTYPE_IMAGE,
+                image=BadgeStructImageBadge(image=Image(url_list=["https://p16-webcast.tiktokcdn.com/fans_badge_icon_lv12_v0.png"]))
+            ),
+        ]
+    )
+
+
+def build_payload(method: str, rng: random.Random) -> bytes:
+    """
+    Build the serialized payload of a WebcastResponseMessage for the given method
+
+    :param method: The proto message name
+    :param rng: Random number generator
+    :return: The serialized message
+
+    """
+
+    common: Common = Common(method=method, msg_id=rng.getrandbits(62), room_id=7300000000000000000, create_time=1700000000000)
+
+    if method == "WebcastChatMessage":
+        return bytes(WebcastChatMessage(common=common, user=build_user(rng), content="hello world " * rng.randrange(1, 4)))
+
+    if method == "WebcastGiftMessage":
+        return bytes(
+            WebcastGiftMessage(
+                common=common,
+                gift_id=5655,
+                repeat_count=rng.randrange(1, 20),
+                repeat_end=rng.randrange(2),
+                group_id=rng.getrandbits(40),
+                user=build_user(rng),
+                gift=GiftStruct(id=5655, name="Rose", diamond_count=1, type=1, image=Image(url_list=["https://p16-webcast.tiktokcdn.com/rose.png"]))
+            )
+        )
+
+    if method == "WebcastLikeMessage":
+        return bytes(WebcastLikeMessage(common=common, count=rng.randrange(1, 16), total=rng.randrange(10 ** 6), user=build_user(rng)))
+
+    if method == "WebcastMemberMessage":
+        return bytes(WebcastMemberMessage(common=common, user=build_user(rng), member_count=rng.randrange(10 ** 4), action=1))
+
+    if method == "WebcastSocialMessage":
+        common.display_text = Text(key="pm_main_follow_message_viewer_2")
+        return bytes(WebcastSocialMessage(common=common, user=build_user(rng), action=1, follow_count=rng.randrange(10 ** 4)))
+
+    if method == "WebcastRoomUserSeqMessage":
+        return bytes(WebcastRoomUserSeqMessage(common=common, total=rng.randrange(10 ** 4), total_user=rng.randrange(10 ** 5)))
+
+    raise ValueError(f"No payload builder for '{method}'")
+
+
+def build_webcast_response(rng: random.Random, messages_per_response: int) -> WebcastResponse:
+    """
+    Build a WebcastResponse containing a random mix of messages
+
+    :param rng: Random number generator
+    :param messages_per_response: Number of messages in the response
+    :return: The response
+
+    """
+
+    messages: List[WebcastResponseMessage] = []
+
+    for _ in range(messages_per_response):
+        method: str = rng.choice(TRAFFIC_MIX)
+        messages.append(WebcastResponseMessage(method=method, payload=build_payload(method, rng), msg_id=rng.getrandbits(62)))
+
+    return WebcastResponse(
+        messages=messages,
+        cursor=f"t-{rng.getrandbits(40)}",
+        fetch_interval=1000,
+        now=1700000000000,
+        internal_ext="internal_src:dim|wss_push_room_id:7300000000000000000|wss_push_did:0",
+        needs_ack=True
+    )
+
+
+def build_push_frames(
+        count: int = 1000,
+        messages_per_response: int = 10,
+        compress: bool = True,
+        unique: int = 100,
+        seed: Optional[int] = 0
+) -> List[bytes]:
+    """
+    Build a list of serialized WebcastPushFrame payloads, as they would be received from the WebSocket.
+    Serializing with betterproto is slow, so only `unique` distinct frames are built & then repeated.
+
+    :param count: Number of frames
+    :param messages_per_response: Number of messages per WebcastResponse
+    :param compress: Whether to gzip the payloads (as with compress_ws_events=True)
+    :param unique: Number of distinct frames to build
+    :param seed: Seed for the random number generator
+    :return: The serialized push frames
+
+    """
+
+    rng: random.Random = random.Random(seed)
+    frames: List[bytes] = []
+
+    for log_id in range(min(count, unique)):
+        payload: bytes = bytes(build_webcast_response(rng, messages_per_response))
+
+        frames.append(
+            bytes(
+                WebcastPushFrame(
+                    seq_id=log_id,
+                    log_id=log_id,
+                    payload_type="msg",
+                    payload_encoding="pb",
+                    headers={"compress_type": "gzip"} if compress else {},
+                    payload=gzip.compress(payload) if compress else payload
+                )
+            )
+        )
+
+    return [frames[i % len(frames)] for i in range(count)]
+
+
+def load_push_frames(path: Union[str, os.PathLike]) -> List[bytes]:
+    """
+    Load recorded WebcastPushFrame payloads from an archive written by `FileFrameSink`
+
+    :param path: The path of the archive file
+    :return: The serialized push frames
+
+    """
+
+    return [payload for _, payload in read_frame_file(path)]
@@ -1,5 +1,5 @@
 from pathlib import Path
-from convert import compile_proto_python
+from convert import compile_proto_python, compile_proto_descriptor
 from preprocess import pre_process_proto_dir
 
 if __name__ == '__main__':
@@ -19,3 +19,15 @@ if __name__ == '__main__':
         out_fn="tiktok_proto.py"
     )
 
+    # Then the descriptor set for the optional upb codec, from the same sources
+    pre_process_proto_dir(
+        dir_in=current_dir.joinpath("./src").resolve(),
+        dir_out=current_dir.joinpath("./dist_upb").resolve(),
+        convert_int_maps=False
+    )
+
+    compile_proto_descriptor(
+        in_fp=current_dir.joinpath("./dist_upb/webcast.proto").resolve(),
+        out_fd=current_dir.parent.parent.joinpath("./TikTokLive/proto"),
+        out_fn="tiktok_proto_descriptor.py"
+    )
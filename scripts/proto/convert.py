@@ -47,3 +47,58 @@ def compile_proto_python(in_fp: Path, out_fd: Path, out_fn: str):
     logger.info(f"Successfully moved the protobuf file to '{out_fd}'.")
     logger.info("Finished the protobuf compiler...")
 
+
+
+def build_descriptor_command(out_fp: Path, in_fn: str) -> List[str]:
+    return (
+        [
+            "protoc",
+            "-I.",
+            "--include_imports",
+            f"--descriptor_set_out={out_fp}",
+            in_fn
+        ]
+    )
+
+
+def compile_proto_descriptor(in_fp: Path, out_fd: Path, out_fn: str):
+    """
+    Compile the protos into a serialized FileDescriptorSet, embedded in a python module.
+    The upb codec builds its message classes from it at runtime, so the generated module
+    doesn't depend on a specific protobuf version the way *_pb2.py files do.
+
+    :param in_fp: The entry proto file
+    :param out_fd: The output directory
+    :param out_fn: The output module name
+    :return: None
+
+    """
+
+    logger.info("Beginning proto descriptor compile script...")
+
+    descriptor_fp: Path = in_fp.parent.joinpath("descriptor_set.bin")
+    command: List[str] = build_descriptor_command(descriptor_fp, in_fp.name)
+    logger.info(f"Executing compilation command: {' '.join(command)}")
+
+    result: CompletedProcess = subprocess.run(command, capture_output=True, cwd=in_fp.parent)
+
+    if result.returncode:
+        logger.error("Failed to generate proto descriptor...")
+        raise RuntimeError(result.stderr.decode('utf-8'))
+
+    descriptor: bytes = descriptor_fp.read_bytes()
+    os.remove(descriptor_fp)
+
+    with open(out_fd.joinpath(out_fn), "w", encoding="utf-8") as file:
+        file.write("# Generated by the protocol buffer compiler.  DO NOT EDIT!\n")
+        file.write("# sources: data.proto, enums.proto, webcast.proto\n")
+        file.write("# Serialized FileDescriptorSet for the upb codec, see TikTokLive/proto/codec.py\n\n")
+        file.write("FILE_DESCRIPTOR_SET: bytes = bytes.fromhex(\n")
+
+        hex_descriptor: str = descriptor.hex()
+        for idx in range(0, len(hex_descriptor), 112):
+            file.write(f"    \"{hex_descriptor[idx:idx + 112]}\"\n")
+
+        file.write(")\n")
+
+    logger.info(f"Successfully wrote the proto descriptor to '{out_fd.joinpath(out_fn)}'.")
@@ -86,27 +86,27 @@ def remove_proto_package(text_line: str) -> str:
     return text_line[text_line.find(";") + 1:]
 
 
-def pre_process_proto_file(fp_in: Path, dir_out: Path) -> Path:
+def pre_process_proto_file(fp_in: Path, dir_out: Path, convert_int_maps: bool = True) -> Path:
     """
     Preprocess a proto file for betterproto building
 
     :param fp_in: Proto file to read
     :param dir_out: Where to drop the output
+    :param convert_int_maps: Whether to convert int32-keyed maps. The upb codec keeps them, as protobuf handles int keys.
     :return: None
 
     """
 
     processed_text: PreprocessChain = PreprocessChain()
     fp_out: Path = dir_out.joinpath(fp_in.name)
+    steps: List[Callable[[str], str]] = [strip_proto_comments, remove_proto_package]
+
+    if convert_int_maps:
+        steps.insert(1, convert_proto_int_maps)
 
     with open(file=fp_in, mode="r", encoding="utf-8") as file:
         for unprocessed_line in file:
-            processed_text.append(
-                unprocessed_line,
-                strip_proto_comments,
-                convert_proto_int_maps,
-                remove_proto_package
-            )
+            processed_text.append(unprocessed_line, *steps)
 
     with open(file=fp_out, mode="w", encoding='utf-8') as file:
         file.write(str(processed_text))
@@ -114,12 +114,13 @@ def pre_process_proto_file(fp_in: Path, dir_out: Path) -> Path:
     return fp_out
 
 
-def pre_process_proto_dir(dir_in: Path, dir_out: Path) -> List[Path]:
+def pre_process_proto_dir(dir_in: Path, dir_out: Path, convert_int_maps: bool = True) -> List[Path]:
     """
     Preprocess a directory of proto for betterproto building
 
     :param dir_in: Input directory
     :param dir_out: Output directory
+    :param convert_int_maps: Whether to convert int32-keyed maps
     :return: Files created in the process
 
     """
@@ -131,7 +132,8 @@ def pre_process_proto_dir(dir_in: Path, dir_out: Path) -> List[Path]:
         files_created.append(
             pre_process_proto_file(
                 fp_in=fp_in,
-                dir_out=dir_out
+                dir_out=dir_out,
+                convert_int_maps=convert_int_maps
             )
         )
 
@@ -31,11 +31,19 @@ if __name__ == '__main__':
         extras_require={
             "interactive": [
                 "curl_cffi==v0.8.0b7",
+            ],
+            "upb": [
+                "protobuf>=4.24.0",
+            ],
+            "uvloop": [
+                "uvloop>=0.17.0; sys_platform != 'win32'",
             ]
         },
         install_requires=[
             "httpx>=0.26.0",
-            "pyee>=9.0.4",
+
+            # The event dispatcher overrides pyee internals (_events, _add_event_handler, etc.), tested on 10 to 13
+            "pyee>=10.0.0,<14",
             "ffmpy>=0.3.0",
             "websockets_proxy==0.1.3",
 
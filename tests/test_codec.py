@@ -0,0 +1,209 @@
+"""
+Parity tests between the betterproto & upb codecs
+"""
+import dataclasses
+import gzip
+import random
+from typing import Any, List, Type
+
+import betterproto
+import pytest
+
+from TikTokLive.client.ws.ws_utils import decode_webcast_push_frame
+from TikTokLive import proto
+from TikTokLive.events import CommentEvent, GiftEvent, LikeEvent, JoinEvent
+from TikTokLive.proto import (
+    WebcastPushFrame, WebcastResponse, WebcastResponseMessage, WebcastChatMessage, WebcastGiftMessage,
+    WebcastLikeMessage, WebcastMemberMessage, Common, User, Image, GiftStruct
+)
+from TikTokLive.proto.codec import ProtoCodec, SUPPORTS_UPB, parse_message
+
+pytestmark = pytest.mark.skipif(not SUPPORTS_UPB, reason="The C protobuf runtime is not installed")
+
+# Unknown fields of every wire type (varint, len-delim, fixed32, fixed64), numbered past any known field
+UNKNOWN_FIELDS: bytes = (
+        betterproto.encode_varint(536_870_001 << 3 | 0) + betterproto.encode_varint(150)
+        + betterproto.encode_varint(536_870_002 << 3 | 2) + b"\x05extra"
+        + betterproto.encode_varint(536_870_003 << 3 | 5) + b"\x01\x02\x03\x04"
+        + betterproto.encode_varint(536_870_004 << 3 | 1) + bytes(range(8))
+)
+
+
+def build_user(rng: random.Random, unknown: bool = False) -> User:
+    """Build a user with nested messages, optionally carrying unknown fields"""
+
+    user: User = User(
+        id=rng.randrange(10 ** 17, 10 ** 18),
+        nickname="viewer",
+        display_id="viewer_1",
+        avatar_thumb=Image(url_list=["https://example.com/a.webp", "https://example.com/b.webp"])
+    )
+
+    if unknown:
+        user.avatar_thumb._unknown_fields = UNKNOWN_FIELDS
+        user._unknown_fields = UNKNOWN_FIELDS
+
+    return user
+
+
+def build_messages(rng: random.Random, unknown: bool = False) -> List[WebcastResponseMessage]:
+    """Build one message of each type decoded by upb"""
+
+    def common(method: str) -> Common:
+        return Common(method=method, msg_id=rng.getrandbits(62), room_id=7300000000000000000, create_time=1700000000000)
+
+    messages: List[betterproto.Message] = [
+        WebcastChatMessage(common=common("WebcastChatMessage"), user=build_user(rng, unknown), content="hello 👋"),
+        WebcastGiftMessage(
+            common=common("WebcastGiftMessage"),
+            gift_id=5655,
+            repeat_count=3,
+            group_id=rng.getrandbits(40),
+            user=build_user(rng, unknown),
+            gift=GiftStruct(id=5655, name="Rose", diamond_count=1, type=1)
+        ),
+        WebcastLikeMessage(common=common("WebcastLikeMessage"), count=15, total=123456, user=build_user(rng, unknown)),
+        WebcastMemberMessage(common=common("WebcastMemberMessage"), user=build_user(rng, unknown), member_count=42, action=1),
+    ]
+
+    if unknown:
+        for message in messages:
+            message._unknown_fields = UNKNOWN_FIELDS
+
+    return [
+        WebcastResponseMessage(method=type(message).__name__, payload=bytes(message), msg_id=rng.getrandbits(62))
+        for message in messages
+    ]
+
+
+def build_push_frame(unknown: bool = False, compress: bool = False, seed: int = 0) -> bytes:
+    """Build a serialized WebcastPushFrame, as received from the WebSocket"""
+
+    rng: random.Random = random.Random(seed)
+    response: WebcastResponse = WebcastResponse(
+        messages=build_messages(rng, unknown),
+        cursor="t-1",
+        fetch_interval=1000,
+        now=1700000000000,
+        internal_ext="internal_src:dim",
+        needs_ack=True
+    )
+
+    if unknown:
+        response._unknown_fields = UNKNOWN_FIELDS
+
+    payload: bytes = bytes(response)
+    frame: WebcastPushFrame = WebcastPushFrame(
+        seq_id=1,
+        log_id=2,
+        payload_type="msg",
+        payload_encoding="pb",
+        headers={"compress_type": "gzip"} if compress else {},
+        payload=gzip.compress(payload) if compress else payload
+    )
+
+    if unknown:
+        frame._unknown_fields = UNKNOWN_FIELDS
+
+    return bytes(frame)
+
+
+def assert_same_message(expected: Any, actual: Any, path: str = "") -> None:
+    """Compare two messages field by field, recursively, including their unknown fields & oneof state"""
+
+    if not isinstance(expected, betterproto.Message):
+        assert expected == actual, path
+        return
+
+    assert type(expected) is type(actual), path
+    assert expected._unknown_fields == actual._unknown_fields, f"{path}._unknown_fields"
+    assert expected._serialized_on_wire == actual._serialized_on_wire, f"{path}._serialized_on_wire"
+    assert expected._group_current == actual._group_current, f"{path}._group_current"
+
+    for field in dataclasses.fields(expected):
+        expected_value: Any = expected.__dict__[field.name]
+        actual_value: Any = actual.__dict__[field.name]
+        field_path: str = f"{path}.{field.name}"
+
+        if isinstance(expected_value, list):
+            assert len(expected_value) == len(actual_value), field_path
+            for index, (expected_item, actual_item) in enumerate(zip(expected_value, actual_value)):
+                assert_same_message(expected_item, actual_item, f"{field_path}[{index}]")
+        elif isinstance(expected_value, dict):
+            assert expected_value.keys() == actual_value.keys(), field_path
+            for key in expected_value:
+                assert_same_message(expected_value[key], actual_value[key], f"{field_path}[{key!r}]")
+        else:
+            assert_same_message(expected_value, actual_value, field_path)
+
+
+def assert_codecs_agree(message_type: Type[betterproto.Message], data: bytes) -> None:
+    """Decode with both codecs & compare the results field by field & byte for byte"""
+
+    expected: betterproto.Message = parse_message(message_type, data, ProtoCodec.BETTERPROTO)
+    actual: betterproto.Message = parse_message(message_type, data, ProtoCodec.UPB)
+
+    assert_same_message(expected, actual, message_type.__name__)
+    assert bytes(expected) == bytes(actual)
+
+
+class TestCodecParity:
+    """The upb codec decodes into the same betterproto objects as betterproto itself"""
+
+    @pytest.mark.parametrize("unknown", [False, True], ids=["known", "unknown_fields"])
+    @pytest.mark.parametrize("seed", range(5))
+    def test_push_frames(self, unknown: bool, seed: int):
+        """Test push frames, responses & every upb message agree"""
+
+        data: bytes = build_push_frame(unknown=unknown, seed=seed)
+        assert_codecs_agree(WebcastPushFrame, data)
+
+        frame: WebcastPushFrame = parse_message(WebcastPushFrame, data)
+        assert_codecs_agree(WebcastResponse, frame.payload)
+
+        for message in parse_message(WebcastResponse, frame.payload).messages:
+            assert_codecs_agree(getattr(proto, message.method), message.payload)
+
+    @pytest.mark.parametrize(
+        "event_type, method",
+        [
+            (CommentEvent, "WebcastChatMessage"),
+            (GiftEvent, "WebcastGiftMessage"),
+            (LikeEvent, "WebcastLikeMessage"),
+            (JoinEvent, "WebcastMemberMessage"),
+        ]
+    )
+    def test_events(self, event_type: Type[betterproto.Message], method: str):
+        """Test events (subclasses of the upb messages) agree, with unknown fields"""
+
+        rng: random.Random = random.Random(1)
+
+        for message in build_messages(rng, unknown=True):
+            if message.method == method:
+                assert_codecs_agree(event_type, message.payload)
+
+    def test_unknown_fields_round_trip(self):
+        """Test unknown fields survive a decode & re-encode with upb, as they do with betterproto"""
+
+        data: bytes = build_push_frame(unknown=True)
+        decoded: WebcastPushFrame = parse_message(WebcastPushFrame, data, ProtoCodec.UPB)
+
+        assert decoded._unknown_fields == UNKNOWN_FIELDS
+        assert bytes(decoded) == data
+
+    def test_empty_message(self):
+        """Test an empty payload agrees, including the not-on-wire state"""
+
+        assert_codecs_agree(WebcastChatMessage, b"")
+
+    @pytest.mark.parametrize("compress", [False, True], ids=["plain", "gzip"])
+    def test_decode_webcast_push_frame(self, compress: bool):
+        """Test the full frame decode path agrees for both codecs"""
+
+        data: bytes = build_push_frame(unknown=True, compress=compress)
+        expected_frame, expected_response = decode_webcast_push_frame(data, codec=ProtoCodec.BETTERPROTO)
+        actual_frame, actual_response = decode_webcast_push_frame(data, codec=ProtoCodec.UPB)
+
+        assert_same_message(expected_frame, actual_frame)
+        assert_same_message(expected_response, actual_response)
+        assert bytes(expected_response) == bytes(actual_response)
@@ -0,0 +1,149 @@
+"""
+Tests for per-listener concurrency limits (handler pools)
+"""
+import asyncio
+from typing import List, Tuple
+
+import pytest
+
+from TikTokLive.client.concurrency import HandlerPool
+from TikTokLive.client.dispatch import EventDispatcher
+from TikTokLive.events import CommentEvent
+from TikTokLive.proto import User
+
+
+def comment(user_id: int, content: str) -> CommentEvent:
+    """Build a comment from a user"""
+
+    return CommentEvent(user=User(id=user_id), content=content)
+
+
+class TestHandlerPool:
+    """Test the limits, ordering & queueing of a handler pool"""
+
+    def test_concurrency_limit(self):
+        """Test no more than `concurrency` calls run at once & every event is handled"""
+
+        async def run() -> Tuple[int, int]:
+            dispatcher: EventDispatcher = EventDispatcher()
+            running: List[int] = [0]
+            peak: List[int] = [0]
+
+            async def handler(event: CommentEvent) -> None:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+                await asyncio.sleep(0.001)
+                running[0] -= 1
+
+            dispatcher.add_listener(CommentEvent, handler, concurrency=3)
+            pool: HandlerPool = dispatcher.handler_pool(CommentEvent, handler)
+
+            for index in range(20):
+                dispatcher.emit_event(comment(index, str(index)))
+
+            assert (pool.in_flight, pool.queued) == (3, 17)
+            await dispatcher.wait_for_complete()
+            return peak[0], pool.handled
+
+        assert asyncio.run(run()) == (3, 20)
+
+    def test_ordered_lanes(self):
+        """Test each user's events are handled one at a time & in order, while users run in parallel"""
+
+        async def run() -> List[Tuple[int, str]]:
+            dispatcher: EventDispatcher = EventDispatcher()
+            handled: List[Tuple[int, str]] = []
+            running_users: set = set()
+
+            async def handler(event: CommentEvent) -> None:
+                assert event.user.id not in running_users
+                running_users.add(event.user.id)
+                await asyncio.sleep(0.001 * (event.user.id % 3))
+                handled.append((event.user.id, event.content))
+                running_users.discard(event.user.id)
+
+            dispatcher.add_listener(CommentEvent, handler, concurrency=4, ordered=True)
+
+            for index in range(10):
+                for user_id in (1, 2, 3):
+                    dispatcher.emit_event(comment(user_id, str(index)))
+
+            await dispatcher.wait_for_complete()
+            return handled
+
+        handled: List[Tuple[int, str]] = asyncio.run(run())
+
+        assert len(handled) == 30
+
+        for user_id in (1, 2, 3):
+            assert [content for handled_user, content in handled if handled_user == user_id] == [str(index) for index in range(10)]
+
+    def test_max_queued_drops(self):
+        """Test events past `max_queued` are dropped & counted"""
+
+        async def run() -> Tuple[int, int, int]:
+            dispatcher: EventDispatcher = EventDispatcher()
+
+            async def handler(event: CommentEvent) -> None:
+                await asyncio.sleep(0)
+
+            dispatcher.add_listener(CommentEvent, handler, concurrency=1, max_queued=2)
+            pool: HandlerPool = dispatcher.handler_pool(CommentEvent, handler)
+
+            for index in range(10):
+                dispatcher.emit_event(comment(index, str(index)))
+
+            await dispatcher.wait_for_complete()
+            return pool.handled, pool.dropped, pool.queued
+
+        assert asyncio.run(run()) == (3, 7, 0)
+
+    def test_failed_start_keeps_lane_moving(self):
+        """Test a call that fails to start (raises synchronously) doesn't stall the events queued behind it"""
+
+        async def run() -> Tuple[List[str], List[Exception], int, int]:
+            dispatcher: EventDispatcher = EventDispatcher()
+            handled: List[str] = []
+            errors: List[Exception] = []
+            dispatcher.add_listener("error", errors.append)
+
+            async def coroutine(event: CommentEvent) -> None:
+                await asyncio.sleep(0)
+                handled.append(event.content)
+
+            def handler(event: CommentEvent):
+                if event.content.startswith("bad"):
+                    raise RuntimeError(event.content)
+                return coroutine(event)
+
+            # Registered as a coroutine function, but fails before creating its coroutine for some events
+            pool: HandlerPool = HandlerPool(dispatcher, coroutine, concurrency=1)
+            pool.handler = handler
+
+            for content in ("ok-1", "bad-1", "bad-2", "ok-2", "bad-3"):
+                pool(CommentEvent(content=content))
+
+            await dispatcher.wait_for_complete()
+            return handled, errors, pool.queued, pool.in_flight
+
+        handled, errors, queued, in_flight = asyncio.run(run())
+
+        assert handled == ["ok-1", "ok-2"]
+        assert [str(error) for error in errors] == ["bad-1", "bad-2", "bad-3"]
+        assert (queued, in_flight) == (0, 0)
+
+    @pytest.mark.parametrize("kwargs", [{"concurrency": 0}, {"concurrency": 1, "max_queued": -1}])
+    def test_invalid_limits(self, kwargs: dict):
+        """Test the limits are validated"""
+
+        async def handler(event: CommentEvent) -> None:
+            pass
+
+        with pytest.raises(ValueError):
+            HandlerPool(EventDispatcher(), handler, **kwargs)
+
+    def test_sync_handler_rejected(self):
+        """Test concurrency limits only apply to coroutine handlers"""
+
+        with pytest.raises(ValueError):
+            EventDispatcher().add_listener(CommentEvent, lambda event: None, concurrency=2)
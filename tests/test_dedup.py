@@ -0,0 +1,112 @@
+"""
+Tests for the msg_id deduplicator
+"""
+from typing import List
+
+import pytest
+
+from TikTokLive.client.dedup import MessageDeduplicator
+from TikTokLive.proto import WebcastResponseMessage
+
+
+class FakeClock:
+    """A clock advanced by hand"""
+
+    def __init__(self):
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestMessageDeduplicator:
+    """Test duplicate detection, expiry & eviction"""
+
+    def test_duplicates(self):
+        """Test a msg_id is only let through once"""
+
+        dedup: MessageDeduplicator = MessageDeduplicator(clock=FakeClock())
+
+        assert not dedup.seen(1)
+        assert dedup.seen(1)
+        assert not dedup.seen(2)
+        assert (dedup.hits, dedup.misses, dedup.size) == (1, 2, 2)
+
+    def test_filter_keeps_messages_without_id(self):
+        """Test filtering a response's messages, keeping those without a msg_id"""
+
+        dedup: MessageDeduplicator = MessageDeduplicator(clock=FakeClock())
+        messages: List[WebcastResponseMessage] = [
+            WebcastResponseMessage(method="WebcastChatMessage", msg_id=1),
+            WebcastResponseMessage(method="WebcastChatMessage", msg_id=1),
+            WebcastResponseMessage(method="WebcastChatMessage"),
+            WebcastResponseMessage(method="WebcastChatMessage"),
+        ]
+
+        assert [message.msg_id for message in dedup.filter(messages)] == [1, 0, 0]
+
+    def test_ttl_expiry(self):
+        """Test msg_ids are forgotten once their bucket is older than the TTL"""
+
+        clock: FakeClock = FakeClock()
+        dedup: MessageDeduplicator = MessageDeduplicator(ttl=10, buckets=10, clock=clock)
+
+        dedup.seen(1)
+        clock.now = 5
+        dedup.seen(2)
+
+        clock.now = 10
+        assert not dedup.seen(1)
+        assert dedup.seen(2)
+        assert dedup.evicted == 0
+
+    def test_eviction_within_one_bucket(self):
+        """Test the size limit evicts the oldest msg_ids one at a time, not the whole (current) bucket"""
+
+        dedup: MessageDeduplicator = MessageDeduplicator(max_size=100, clock=FakeClock())
+
+        for msg_id in range(150):
+            dedup.seen(msg_id)
+
+        assert dedup.size == 100
+        assert dedup.evicted == 50
+
+        # The latest 100 are still remembered, the 50 oldest were evicted
+        assert all(dedup.seen(msg_id) for msg_id in range(50, 150))
+        assert not dedup.seen(0)
+
+    def test_eviction_across_buckets(self):
+        """Test the size limit evicts the oldest bucket first, then moves on to the next one"""
+
+        clock: FakeClock = FakeClock()
+        dedup: MessageDeduplicator = MessageDeduplicator(ttl=100, max_size=4, buckets=10, clock=clock)
+
+        for msg_id in (1, 2):
+            dedup.seen(msg_id)
+
+        clock.now = 20
+
+        for msg_id in (3, 4, 5, 6, 7):
+            dedup.seen(msg_id)
+
+        assert dedup.size == 4
+        assert dedup.evicted == 3
+        assert all(dedup.seen(msg_id) for msg_id in (4, 5, 6, 7))
+
+    def test_clear(self):
+        """Test clearing forgets the msg_ids but keeps the counters"""
+
+        dedup: MessageDeduplicator = MessageDeduplicator(clock=FakeClock())
+        dedup.seen(1)
+        dedup.clear()
+
+        assert dedup.size == 0
+        assert not dedup.seen(1)
+        assert dedup.misses == 2
+
+    @pytest.mark.parametrize("kwargs", [{"ttl": 0}, {"max_size": 0}, {"buckets": 0}])
+    def test_invalid_arguments(self, kwargs: dict):
+        """Test the limits must be positive"""
+
+        with pytest.raises(ValueError):
+            MessageDeduplicator(**kwargs)
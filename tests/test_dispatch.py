@@ -0,0 +1,241 @@
+"""
+Tests for the event dispatcher's compatibility with pyee & its where= filter groups
+"""
+import asyncio
+from typing import List, Any
+
+import pyee
+import pytest
+
+from TikTokLive.client.dispatch import EventDispatcher
+from TikTokLive.client.filters import EventFilter
+from TikTokLive.events import CommentEvent, LikeEvent
+
+
+class TestDispatcher:
+    """Test the dispatcher behaves like the pyee emitter it replaces"""
+
+    def test_sync_and_async_handlers(self):
+        """Test sync handlers run during the emit & coroutine handlers are scheduled, in registration order"""
+
+        async def run() -> List[str]:
+            dispatcher: EventDispatcher = EventDispatcher()
+            calls: List[str] = []
+
+            async def async_handler(event: CommentEvent) -> None:
+                calls.append(f"async {event.content}")
+
+            dispatcher.add_listener(CommentEvent, lambda event: calls.append(f"sync {event.content}"))
+            dispatcher.on(CommentEvent)(async_handler)
+
+            assert dispatcher.emit_event(CommentEvent(content="a"))
+            assert calls == ["sync a"]
+
+            await dispatcher.wait_for_complete()
+            return calls
+
+        assert asyncio.run(run()) == ["sync a", "async a"]
+
+    def test_emit_by_name_with_args_and_kwargs(self):
+        """Test emitting by name passes the positional & keyword arguments through"""
+
+        dispatcher: EventDispatcher = EventDispatcher()
+        received: List[Any] = []
+        dispatcher.add_listener("custom", lambda *args, **kwargs: received.append((args, kwargs)))
+
+        assert dispatcher.emit("custom", 1, 2, key="value")
+        assert received == [((1, 2), {"key": "value"})]
+
+    def test_extra_args(self):
+        """Test emit_event passes extra arguments after the event (e.g. the pool's client)"""
+
+        dispatcher: EventDispatcher = EventDispatcher()
+        received: List[Any] = []
+        dispatcher.add_listener(CommentEvent, lambda event, client: received.append(client))
+
+        dispatcher.emit_event(CommentEvent(), "client")
+        assert received == ["client"]
+
+    def test_once(self):
+        """Test a `once` listener is called a single time"""
+
+        dispatcher: EventDispatcher = EventDispatcher()
+        calls: List[CommentEvent] = []
+        dispatcher.once(CommentEvent.get_type(), calls.append)
+
+        dispatcher.emit_event(CommentEvent())
+        dispatcher.emit_event(CommentEvent())
+
+        assert len(calls) == 1
+        assert dispatcher.listeners(CommentEvent.get_type()) == []
+
+    def test_remove_listener_invalidates_table(self):
+        """Test adding & removing listeners after emitting rebuilds the cached dispatch table"""
+
+        dispatcher: EventDispatcher = EventDispatcher()
+        first: List[CommentEvent] = []
+        second: List[CommentEvent] = []
+
+        dispatcher.add_listener(CommentEvent, first.append)
+        dispatcher.emit_event(CommentEvent())
+
+        dispatcher.add_listener(CommentEvent, second.append)
+        dispatcher.emit_event(CommentEvent())
+
+        dispatcher.remove_listener(CommentEvent.get_type(), first.append)
+        dispatcher.emit_event(CommentEvent())
+
+        dispatcher.remove_all_listeners()
+        assert not dispatcher.emit_event(CommentEvent())
+        assert (len(first), len(second)) == (2, 2)
+
+    def test_listeners_by_class(self):
+        """Test listeners only receive their own event class"""
+
+        dispatcher: EventDispatcher = EventDispatcher()
+        comments: List[CommentEvent] = []
+        dispatcher.add_listener(CommentEvent, comments.append)
+
+        assert not dispatcher.emit_event(LikeEvent())
+        assert dispatcher.has_listener(CommentEvent) and not dispatcher.has_listener(LikeEvent)
+        assert comments == []
+
+    def test_error_routing(self):
+        """Test the exceptions of sync & coroutine handlers are emitted as `error`, without stopping the other handlers"""
+
+        async def run() -> List[str]:
+            dispatcher: EventDispatcher = EventDispatcher()
+            errors: List[str] = []
+            calls: List[str] = []
+            dispatcher.add_listener("error", lambda ex: errors.append(str(ex)))
+
+            def sync_handler(event: CommentEvent) -> None:
+                raise ValueError("sync")
+
+            async def async_handler(event: CommentEvent) -> None:
+                raise ValueError("async")
+
+            dispatcher.add_listener(CommentEvent, sync_handler)
+            dispatcher.add_listener(CommentEvent, async_handler)
+            dispatcher.add_listener(CommentEvent, lambda event: calls.append("after"))
+
+            dispatcher.emit_event(CommentEvent())
+            await dispatcher.wait_for_complete()
+
+            assert calls == ["after"]
+            return errors
+
+        assert asyncio.run(run()) == ["sync", "async"]
+
+    def test_unhandled_error(self):
+        """Test an error without an `error` listener is raised, as with pyee"""
+
+        dispatcher: EventDispatcher = EventDispatcher()
+
+        def handler(event: CommentEvent) -> None:
+            raise ValueError("unhandled")
+
+        dispatcher.add_listener(CommentEvent, handler)
+
+        with pytest.raises(ValueError):
+            dispatcher.emit_event(CommentEvent())
+
+        # Renamed from PyeeException in pyee 12
+        with pytest.raises(getattr(pyee, "PyeeError", None) or pyee.PyeeException):
+            dispatcher.emit("error", "not an exception")
+
+
+class TestWhereFilters:
+    """Test where= filters & their listener groups"""
+
+    def test_filter(self):
+        """Test rejected events never reach the handler, & coroutine handlers aren't created for them"""
+
+        async def run() -> List[str]:
+            dispatcher: EventDispatcher = EventDispatcher()
+            calls: List[str] = []
+
+            async def handler(event: CommentEvent) -> None:
+                calls.append(event.content)
+
+            dispatcher.add_listener(CommentEvent, handler, where=lambda event: event.content.startswith("!"))
+
+            for content in ("!a", "b", "!c"):
+                dispatcher.emit_event(CommentEvent(content=content))
+
+            assert len(dispatcher._waiting) == 2
+            await dispatcher.wait_for_complete()
+            return calls
+
+        assert asyncio.run(run()) == ["!a", "!c"]
+
+    def test_group_evaluates_once(self):
+        """Test listeners sharing a predicate form one group, evaluated once per event"""
+
+        dispatcher: EventDispatcher = EventDispatcher()
+        evaluated: List[str] = []
+        calls: List[str] = []
+
+        def predicate(event: CommentEvent) -> bool:
+            evaluated.append(event.content)
+            return event.content == "yes"
+
+        dispatcher.add_listener(CommentEvent, lambda event: calls.append("first"), where=predicate)
+        dispatcher.add_listener(CommentEvent, lambda event: calls.append("second"), where=predicate)
+        dispatcher.add_listener(CommentEvent, lambda event: calls.append("unfiltered"))
+
+        dispatcher.emit_event(CommentEvent(content="yes"))
+        dispatcher.emit_event(CommentEvent(content="no"))
+
+        assert evaluated == ["yes", "no"]
+        assert calls == ["first", "second", "unfiltered", "unfiltered"]
+        assert dispatcher._filters[predicate].rejected == 1
+
+    def test_separate_groups(self):
+        """Test different predicates are separate groups, & an EventFilter can be shared explicitly"""
+
+        dispatcher: EventDispatcher = EventDispatcher()
+        where: EventFilter = EventFilter.keywords(["hello"])
+        calls: List[str] = []
+
+        dispatcher.add_listener(CommentEvent, lambda event: calls.append("a"), where=where)
+        dispatcher.add_listener(CommentEvent, lambda event: calls.append("b"), where=where)
+        dispatcher.add_listener(CommentEvent, lambda event: calls.append("c"), where=lambda event: True)
+
+        dispatcher.emit_event(CommentEvent(content="hello there"))
+        dispatcher.emit_event(CommentEvent(content="bye"))
+
+        assert calls == ["a", "b", "c", "c"]
+        assert (where.evaluated, where.rejected) == (2, 1)
+
+    def test_filter_before_pool(self):
+        """Test a filtered listener with a concurrency limit only queues the events it accepts"""
+
+        async def run() -> int:
+            dispatcher: EventDispatcher = EventDispatcher()
+
+            async def handler(event: CommentEvent) -> None:
+                await asyncio.sleep(0)
+
+            dispatcher.add_listener(CommentEvent, handler, where=lambda event: event.content == "keep", concurrency=1)
+
+            for content in ("keep", "drop", "keep", "drop"):
+                dispatcher.emit_event(CommentEvent(content=content))
+
+            queued: int = dispatcher.handler_pool(CommentEvent, handler).queued
+            await dispatcher.wait_for_complete()
+            return queued
+
+        assert asyncio.run(run()) == 1
+
+    def test_remove_filtered_listener(self):
+        """Test a filtered listener is removed by its original function"""
+
+        dispatcher: EventDispatcher = EventDispatcher()
+        calls: List[CommentEvent] = []
+
+        dispatcher.add_listener(CommentEvent, calls.append, where=lambda event: True)
+        dispatcher.remove_listener(CommentEvent.get_type(), calls.append)
+
+        assert not dispatcher.emit_event(CommentEvent())
+        assert calls == []
@@ -0,0 +1,56 @@
+"""
+Tests for `where=` listener filters
+"""
+from typing import List
+
+import pytest
+
+from TikTokLive.client.filters import EventFilter
+from TikTokLive.events import CommentEvent
+
+
+def comments(*contents: str) -> List[CommentEvent]:
+    """Build comment events"""
+
+    return [CommentEvent(content=content) for content in contents]
+
+
+class TestKeywordFilter:
+    """Test EventFilter.keywords"""
+
+    def test_whole_words(self):
+        """Test words match on their own, not within longer words"""
+
+        where: EventFilter = EventFilter.keywords(["rose", "gg"])
+
+        assert [where.matches(event) for event in comments("a Rose!", "GG", "roses", "eggs", "")] == [True, True, False, False, False]
+
+    def test_case_sensitive(self):
+        """Test case-sensitive matching"""
+
+        where: EventFilter = EventFilter.keywords(["GG"], case_sensitive=True)
+
+        assert [where.matches(event) for event in comments("GG", "gg")] == [True, False]
+
+    def test_symbols_and_emoji(self):
+        """Test words starting or ending with non-word characters still match"""
+
+        where: EventFilter = EventFilter.keywords(["#tag", "🔥", "c++"])
+
+        assert [where.matches(event) for event in comments("love #tag", "🔥🔥", "i use c++ daily", "#tags", "a#tag")] == [
+            True, True, True, False, False
+        ]
+
+    def test_attribute(self):
+        """Test matching on another attribute, & events without it"""
+
+        where: EventFilter = EventFilter.keywords(["x"], attribute="missing")
+
+        assert not where.matches(CommentEvent(content="x"))
+
+    @pytest.mark.parametrize("words", [[], [""], ["ok", ""]])
+    def test_empty_words(self, words: List[str]):
+        """Test an empty word list (or an empty word, which would match everything) is rejected"""
+
+        with pytest.raises(ValueError):
+            EventFilter.keywords(words)
@@ -0,0 +1,201 @@
+"""
+Tests for the ingest queue between the WebSocket reader & the dispatcher
+"""
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from TikTokLive.client.ingest import IngestQueue, OverflowPolicy, ReceivedResponse
+from TikTokLive.events import LikeEvent, DisconnectEvent, ReconnectEvent
+from TikTokLive.proto import WebcastResponse, WebcastResponseMessage
+
+
+def response(*methods: str, is_first: bool = False) -> ReceivedResponse:
+    """Build a received response with one message per method"""
+
+    return ReceivedResponse(WebcastResponse(messages=[WebcastResponseMessage(method=method) for method in methods], is_first=is_first))
+
+
+async def drain(queue: IngestQueue) -> List[List[str]]:
+    """Read the queued responses, as lists of methods"""
+
+    queue.close()
+    drained: List[List[str]] = []
+
+    while (received := await queue.get()) is not None:
+        drained.append([message.method for message in received.webcast_response.messages])
+
+    return drained
+
+
+class TestIngestQueue:
+    """Test the sizing & overflow policies of the ingest queue"""
+
+    def test_fifo_and_depth(self):
+        """Test responses are delivered in order & the depth counts messages"""
+
+        async def run() -> List[List[str]]:
+            queue: IngestQueue = IngestQueue(maxsize=10)
+            await queue.put(response("a", "b"))
+            await queue.put(response("c"))
+
+            assert (queue.depth, queue.high_water_mark) == (3, 3)
+            return await drain(queue)
+
+        assert asyncio.run(run()) == [["a", "b"], ["c"]]
+
+    def test_drop_newest(self):
+        """Test DROP_NEWEST discards the incoming response's messages"""
+
+        async def run() -> List[List[str]]:
+            queue: IngestQueue = IngestQueue(maxsize=2, policy=OverflowPolicy.DROP_NEWEST)
+            await queue.put(response("a", "b"))
+            await queue.put(response("c"))
+
+            assert queue.dropped == {"c": 1}
+            return await drain(queue)
+
+        assert asyncio.run(run()) == [["a", "b"]]
+
+    def test_drop_oldest(self):
+        """Test DROP_OLDEST discards the oldest queued messages, removing emptied responses"""
+
+        async def run() -> List[List[str]]:
+            queue: IngestQueue = IngestQueue(maxsize=3, policy=OverflowPolicy.DROP_OLDEST)
+            await queue.put(response("a"))
+            await queue.put(response("b", "c"))
+            await queue.put(response("d", "e"))
+
+            assert queue.dropped_total == 2
+            assert queue.depth == 3
+            return await drain(queue)
+
+        assert asyncio.run(run()) == [["c"], ["d", "e"]]
+
+    def test_drop_by_type(self):
+        """Test DROP_BY_TYPE discards droppable messages, from the incoming response first"""
+
+        async def run() -> List[List[str]]:
+            queue: IngestQueue = IngestQueue(maxsize=3, policy=OverflowPolicy.DROP_BY_TYPE, drop_events=[LikeEvent])
+            await queue.put(response("WebcastLikeMessage", "WebcastChatMessage"))
+            await queue.put(response("WebcastChatMessage", "WebcastLikeMessage"))
+
+            assert queue.dropped == {"WebcastLikeMessage": 1}
+            return await drain(queue)
+
+        assert asyncio.run(run()) == [["WebcastLikeMessage", "WebcastChatMessage"], ["WebcastChatMessage"]]
+
+    def test_drop_by_type_then_block(self):
+        """Test DROP_BY_TYPE blocks once nothing droppable is left"""
+
+        async def run() -> bool:
+            queue: IngestQueue = IngestQueue(maxsize=2, policy=OverflowPolicy.DROP_BY_TYPE, drop_events=["WebcastLikeMessage"])
+            await queue.put(response("WebcastChatMessage", "WebcastChatMessage"))
+
+            put: asyncio.Task = asyncio.create_task(queue.put(response("WebcastChatMessage")))
+            await asyncio.sleep(0.01)
+            blocked: bool = not put.done()
+
+            await queue.get()
+            await asyncio.wait_for(put, 1)
+            return blocked
+
+        assert asyncio.run(run())
+
+    def test_block(self):
+        """Test BLOCK makes the producer wait for room"""
+
+        async def run() -> List[str]:
+            queue: IngestQueue = IngestQueue(maxsize=1)
+            order: List[str] = []
+
+            async def producer() -> None:
+                for method in ("a", "b", "c"):
+                    await queue.put(response(method))
+                    order.append(f"put {method}")
+
+                queue.close()
+
+            task: asyncio.Task = asyncio.create_task(producer())
+
+            while (received := await queue.get()) is not None:
+                order.append(f"got {received.webcast_response.messages[0].method}")
+                await asyncio.sleep(0)
+
+            await task
+            return order
+
+        order: List[str] = asyncio.run(run())
+        assert order.index("got a") < order.index("put b")
+        assert [entry for entry in order if entry.startswith("got")] == ["got a", "got b", "got c"]
+
+    def test_close_wakes_blocked_producer(self):
+        """Test closing the queue releases a producer blocked on it (e.g. when the dispatcher dies)"""
+
+        async def run() -> None:
+            queue: IngestQueue = IngestQueue(maxsize=1)
+            await queue.put(response("a"))
+            put: asyncio.Task = asyncio.create_task(queue.put(response("b")))
+            await asyncio.sleep(0.01)
+            assert not put.done()
+
+            queue.close()
+            await asyncio.wait_for(put, 1)
+
+        asyncio.run(run())
+
+    def test_first_response_always_queued(self):
+        """Test the first response of a connection (which carries the ConnectEvent) is never dropped"""
+
+        async def run() -> List[List[str]]:
+            queue: IngestQueue = IngestQueue(maxsize=1, policy=OverflowPolicy.DROP_NEWEST)
+            await queue.put(response("a"))
+            await queue.put(response(is_first=True))
+            return await drain(queue)
+
+        assert asyncio.run(run()) == [["a"], []]
+
+    def test_reconnect_event_carried(self):
+        """Test the reconnect event of a resumed session's first response is delivered with it"""
+
+        async def run() -> Optional[ReceivedResponse]:
+            queue: IngestQueue = IngestQueue(maxsize=1, policy=OverflowPolicy.DROP_NEWEST)
+            reconnect_event: ReconnectEvent = ReconnectEvent(unique_id="user", room_id=1, attempts=2, gap=1.0)
+            await queue.put(response("a"))
+            await queue.put(ReceivedResponse(WebcastResponse(is_first=True), reconnect_event))
+
+            await queue.get()
+            return await queue.get()
+
+        assert asyncio.run(run()).reconnect_event.attempts == 2
+
+    def test_reset(self):
+        """Test resetting empties & reopens the queue, keeping the counters"""
+
+        async def run() -> Optional[ReceivedResponse]:
+            queue: IngestQueue = IngestQueue(maxsize=1, policy=OverflowPolicy.DROP_NEWEST)
+            await queue.put(response("a"))
+            await queue.put(response("b"))
+            queue.close()
+            queue.reset()
+
+            assert (queue.depth, queue.dropped_total) == (0, 1)
+            await queue.put(response("c"))
+            return await queue.get()
+
+        assert asyncio.run(run()).webcast_response.messages[0].method == "c"
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"maxsize": 0},
+            {"policy": OverflowPolicy.DROP_BY_TYPE},
+            {"policy": OverflowPolicy.DROP_BY_TYPE, "drop_events": [DisconnectEvent]},
+        ]
+    )
+    def test_invalid_arguments(self, kwargs: dict):
+        """Test the queue size & droppable types are validated (only events decoded from messages can be dropped)"""
+
+        with pytest.raises(ValueError):
+            IngestQueue(**kwargs)
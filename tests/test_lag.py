@@ -0,0 +1,80 @@
+"""
+Tests for the lag tracker
+"""
+from TikTokLive import TikTokLiveClient
+from TikTokLive.client.lag import LagTracker
+from TikTokLive.events import CommentEvent
+from TikTokLive.proto import WebcastResponse, Common
+
+
+class FakeClock:
+    """A clock advanced by hand"""
+
+    def __init__(self, now: float):
+        self.now: float = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def comment(created_at: float) -> CommentEvent:
+    """A comment created by the server at the given time"""
+
+    return CommentEvent(common=Common(create_time=int(created_at * 1000)), content="hi")
+
+
+class TestLagTracker:
+    """Test the measures of the lag tracker"""
+
+    def test_response_measures(self):
+        """Test the network, queue, receive & dispatch lags of a response's event"""
+
+        clock: FakeClock = FakeClock(100.0)
+        tracker: LagTracker = LagTracker(stamp_events=True, clock=clock)
+        response: WebcastResponse = WebcastResponse(now=99_500)
+
+        tracker.received(response)
+        clock.now = 100.25
+        received_at: float = tracker.dispatching(response)
+        clock.now = 100.5
+        event: CommentEvent = comment(99.0)
+        tracker.dispatched(event, received_at)
+
+        assert received_at == 100.0
+        assert tracker.network.latest == 0.5
+        assert tracker.queue.latest == 0.25
+        assert (event.lag.receive, event.lag.dispatch) == (1.0, 1.5)
+
+    def test_events_without_server_timestamp(self):
+        """Test the client's own events (without a create_time) aren't measured"""
+
+        tracker: LagTracker = LagTracker(stamp_events=True, clock=FakeClock(100.0))
+
+        assert tracker.dispatched(CommentEvent(content="hi"), 100.0) is None
+        assert tracker.receive.count == 0
+
+    def test_timer_events_not_measured(self):
+        """Test events emitted on a timer (outside a response) aren't measured against the last response's receive time"""
+
+        client: TikTokLiveClient = TikTokLiveClient("user")
+        clock: FakeClock = FakeClock(100.0)
+        client._lag = LagTracker(clock=clock)
+
+        client._dispatch_event(comment(99.0), client._lag.dispatching(WebcastResponse()))
+        clock.now = 200.0
+        client._dispatch_event(comment(150.0))
+
+        assert client._lag.receive.count == 1
+        assert client._lag.dispatch.count == 1
+
+    def test_percentiles(self):
+        """Test the rolling window & nearest-rank percentiles"""
+
+        tracker: LagTracker = LagTracker(window=10)
+
+        for value in range(20):
+            tracker.network.add(float(value))
+
+        assert tracker.network.count == 20
+        assert tracker.snapshot((50, 100))["network"] == {50: 14.0, 100: 19.0}
+        assert tracker.snapshot()["queue"] == {50: None, 90: None, 99: None}
@@ -0,0 +1,53 @@
+"""
+Tests for the event loop owned by a client
+"""
+import asyncio
+
+import pytest
+
+from TikTokLive import TikTokLiveClient
+from TikTokLive.client.loop import EventLoopRunner
+
+
+class TestEventLoopRunner:
+    """Test the lifecycle of the loop runner"""
+
+    def test_close_cancels_tasks(self):
+        """Test closing cancels the tasks left on the loop & closes it"""
+
+        runner: EventLoopRunner = EventLoopRunner()
+        task: asyncio.Task = runner.loop.create_task(asyncio.sleep(60))
+        loop: asyncio.AbstractEventLoop = runner.loop
+
+        runner.close()
+
+        assert task.cancelled()
+        assert loop.is_closed() and runner.closed
+
+    def test_close_without_default_executor_shutdown(self, monkeypatch: pytest.MonkeyPatch):
+        """Test closing works on loops without shutdown_default_executor (Python 3.8)"""
+
+        monkeypatch.delattr(asyncio.BaseEventLoop, "shutdown_default_executor")
+        monkeypatch.delattr(asyncio.AbstractEventLoop, "shutdown_default_executor")
+        runner: EventLoopRunner = EventLoopRunner()
+
+        assert runner.run(asyncio.sleep(0, result="done")) == "done"
+        runner.close()
+        assert runner.closed
+
+
+class TestClientRun:
+    """Test the client runs on the loop it was asked for"""
+
+    def test_conflicting_uvloop_flag(self):
+        """Test run() refuses a use_uvloop that differs from the loop the client already created"""
+
+        client: TikTokLiveClient = TikTokLiveClient("user")
+        loop: asyncio.AbstractEventLoop = client._asyncio_loop
+
+        with pytest.raises(RuntimeError):
+            client.run(use_uvloop=True)
+
+        # The existing loop is left as it was
+        assert client._asyncio_loop is loop
+        client._loop_runner.close()
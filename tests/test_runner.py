@@ -0,0 +1,81 @@
+"""
+Tests for the sharding of the multi-process runner
+"""
+import hashlib
+from typing import Dict, List
+
+import pytest
+
+from TikTokLive.runner.hashing import ConsistentHashRing
+from TikTokLive.runner.supervisor import ShardedRunner
+
+"""Room keys to shard"""
+KEYS: List[str] = [f"room_{index}" for index in range(2000)]
+
+
+class TestConsistentHashRing:
+    """Test how the hash ring assigns keys"""
+
+    def test_stable_hash(self):
+        """Test the hash is a fixed function of the key (the same in every process)"""
+
+        assert ConsistentHashRing.hash("room") == int.from_bytes(hashlib.blake2b(b"room", digest_size=8).digest(), "big")
+        assert 0 <= ConsistentHashRing.hash("room") < 2 ** 64
+
+    def test_hash_without_md5(self, monkeypatch: pytest.MonkeyPatch):
+        """Test hashing works where MD5 is blocked (FIPS mode)"""
+
+        def md5(*args, **kwargs):
+            raise ValueError("[digital envelope routines] unsupported")
+
+        monkeypatch.setattr(hashlib, "md5", md5)
+        assert ConsistentHashRing(range(4)).get("room") in range(4)
+
+    def test_balance(self):
+        """Test every node gets a fair share of the keys"""
+
+        ring: ConsistentHashRing = ConsistentHashRing(range(4))
+        counts: Dict[int, int] = {node: 0 for node in range(4)}
+
+        for key in KEYS:
+            counts[ring.get(key)] += 1
+
+        assert min(counts.values()) > len(KEYS) / 4 * 0.7
+
+    def test_remove_only_moves_its_keys(self):
+        """Test removing a node only reassigns the keys it owned"""
+
+        ring: ConsistentHashRing = ConsistentHashRing(range(4))
+        before: Dict[str, int] = {key: ring.get(key) for key in KEYS}
+        ring.remove(2)
+
+        assert 2 not in ring and len(ring) == 3
+
+        for key in KEYS:
+            if before[key] != 2:
+                assert ring.get(key) == before[key]
+
+    def test_empty(self):
+        """Test an empty ring can't assign keys"""
+
+        with pytest.raises(LookupError):
+            ConsistentHashRing().get("room")
+
+
+class TestShardedRunnerRooms:
+    """Test adding & removing rooms, before the workers are started"""
+
+    def test_add_and_remove(self):
+        """Test rooms are assigned once, & removing an unknown room does nothing"""
+
+        runner: ShardedRunner = ShardedRunner(workers=3)
+        worker_id: int = runner.add("@room")
+
+        assert runner.add("room") == worker_id
+        assert runner.assignments == {"room": worker_id}
+
+        runner.remove("room")
+        runner.remove("room")
+        runner.remove("@never_added")
+
+        assert runner.assignments == {}
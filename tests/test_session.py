@@ -0,0 +1,134 @@
+"""
+Tests for resumable sessions
+"""
+import asyncio
+from typing import List, Optional, Tuple
+
+import httpx
+import pytest
+from websockets import ConnectionClosed
+from websockets.frames import Close
+
+from TikTokLive import TikTokLiveClient
+from TikTokLive.client.ingest import IngestQueue
+from TikTokLive.client.session import ReconnectPolicy, WebcastSession
+from TikTokLive.events import ConnectEvent, ReconnectEvent, Event
+from TikTokLive.proto import WebcastResponse, WebcastResponseMessage
+
+
+def initial_response(cursor: str) -> WebcastResponse:
+    """A signed initial response, replaying the room's recent messages"""
+
+    return WebcastResponse(
+        is_first=True,
+        cursor=cursor,
+        messages=[WebcastResponseMessage(method="WebcastUnknownMessage", payload=b"", msg_id=1)]
+    )
+
+
+class FakeWeb:
+    """The web client calls made while resuming"""
+
+    def __init__(self, is_live_errors: int = 0):
+        self.cookies: dict = {}
+        self.headers: dict = {"User-Agent": "test"}
+        self.is_live_errors: int = is_live_errors
+        self.is_live_calls: int = 0
+        self.sign_calls: int = 0
+
+    async def fetch_is_live(self, room_id: int) -> bool:
+        self.is_live_calls += 1
+
+        if self.is_live_calls <= self.is_live_errors:
+            raise httpx.ConnectError("transient")
+
+        return True
+
+    async def fetch_signed_websocket(self) -> WebcastResponse:
+        self.sign_calls += 1
+        return initial_response("signed")
+
+
+def build_client(web: FakeWeb, drops: List[Optional[BaseException]], ingest: bool) -> TikTokLiveClient:
+    """Build a client whose WebSocket drops as given, then stays up until a disconnect is requested"""
+
+    client: TikTokLiveClient = TikTokLiveClient("user")
+    client._web = web
+    client._room_id = 1
+    client._session = WebcastSession(ReconnectPolicy(base_delay=0, max_delay=0, jitter=0))
+    client._disconnect_requested = asyncio.Event()
+    client._ingest_queue = IngestQueue() if ingest else None
+
+    async def connect(initial_webcast_response: WebcastResponse, **kwargs):
+        yield initial_webcast_response
+
+        if drops:
+            error: Optional[BaseException] = drops.pop(0)
+
+            if error is not None:
+                raise error
+            return
+
+        client._disconnect_requested.set()
+
+    client._ws.connect = connect
+    return client
+
+
+def collect(client: TikTokLiveClient) -> List[Event]:
+    """Record the connect & reconnect events, in order"""
+
+    events: List[Event] = []
+    client.add_listener(ConnectEvent, events.append)
+    client.add_listener(ReconnectEvent, events.append)
+    return events
+
+
+class TestSessionResume:
+    """Test the events & retries of a resumed session"""
+
+    @pytest.mark.parametrize("ingest", [False, True], ids=["direct", "ingest_queue"])
+    def test_resume_emits_one_connect_then_reconnect(self, ingest: bool):
+        """Test a resumed connection emits a ReconnectEvent (not a second ConnectEvent) & none of the replayed messages"""
+
+        web: FakeWeb = FakeWeb()
+        client: TikTokLiveClient = build_client(web, [ConnectionClosed(Close(1006, ""), None)], ingest)
+        events: List[Event] = collect(client)
+        dispatched: List[Tuple[WebcastResponse, Optional[ReconnectEvent]]] = []
+        dispatch = client._dispatch_webcast_response
+
+        async def record(webcast_response: WebcastResponse, reconnect_event: Optional[ReconnectEvent] = None) -> None:
+            dispatched.append((webcast_response, reconnect_event))
+            await dispatch(webcast_response, reconnect_event)
+
+        client._dispatch_webcast_response = record
+        asyncio.run(client._ws_client_loop(initial_response("cold"), True, False))
+
+        assert [type(event) for event in events] == [ConnectEvent, ReconnectEvent]
+        assert events[1].attempts == 1
+        assert [len(webcast_response.messages) for webcast_response, _ in dispatched] == [1, 0]
+        assert [reconnect_event for _, reconnect_event in dispatched] == [None, events[1]]
+
+    def test_live_check_is_retried(self):
+        """Test a transient error in the live check (after a clean close) is retried instead of ending the session"""
+
+        web: FakeWeb = FakeWeb(is_live_errors=2)
+        client: TikTokLiveClient = build_client(web, [None], ingest=False)
+        events: List[Event] = collect(client)
+
+        asyncio.run(client._ws_client_loop(initial_response("cold"), True, False))
+
+        assert web.is_live_calls == 3
+        assert web.sign_calls == 1
+        assert [type(event) for event in events] == [ConnectEvent, ReconnectEvent]
+        assert client._session.failed_attempts == 2
+
+    def test_resume_discards_replayed_messages(self):
+        """Test resuming points the response at the session's cursor & drops its messages"""
+
+        session: WebcastSession = WebcastSession(ReconnectPolicy())
+        session.track(WebcastResponse(cursor="latest", internal_ext="ext"))
+
+        resumed: WebcastResponse = session.resume(initial_response("signed"))
+
+        assert (resumed.cursor, resumed.internal_ext, resumed.messages) == ("latest", "ext", [])
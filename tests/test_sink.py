@@ -0,0 +1,73 @@
+"""
+Tests for the raw frame archive
+"""
+import os
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from TikTokLive.client.ws.ws_sink import FileFrameSink, read_frame_file
+
+
+def write_frames(path: Path, frames: List[Tuple[int, bytes]]) -> None:
+    """Append frames to an archive, opening (or continuing) it"""
+
+    with FileFrameSink(path) as sink:
+        for received_at_ns, payload in frames:
+            sink(payload, received_at_ns)
+
+
+class TestFileFrameSink:
+    """Test writing, reading & continuing frame archives"""
+
+    def test_round_trip(self, tmp_path: Path):
+        """Test frames are read back in order, with their receive times"""
+
+        path: Path = tmp_path / "frames.ttlf"
+        frames: List[Tuple[int, bytes]] = [(1, b"a" * 10), (2, b""), (3, bytes(range(256)))]
+
+        with FileFrameSink(path) as sink:
+            for received_at_ns, payload in frames:
+                sink(payload, received_at_ns)
+
+            assert sink.frames_written == 3
+            assert sink.bytes_written == 3 * FileFrameSink.RECORD_HEADER.size + 266
+
+        assert list(read_frame_file(path)) == frames
+
+    def test_reopen_appends(self, tmp_path: Path):
+        """Test reopening an archive continues it, without a second magic header"""
+
+        path: Path = tmp_path / "frames.ttlf"
+        write_frames(path, [(1, b"a" * 10)])
+        write_frames(path, [(2, b"b" * 6)])
+
+        assert list(read_frame_file(path)) == [(1, b"a" * 10), (2, b"b" * 6)]
+
+    @pytest.mark.parametrize("cut", [1, 4, 6 + FileFrameSink.RECORD_HEADER.size - 1], ids=["payload", "payload_end", "header"])
+    def test_reopen_drops_partial_record(self, tmp_path: Path, cut: int):
+        """Test reopening an archive whose last record was cut off drops that record before appending"""
+
+        path: Path = tmp_path / "frames.ttlf"
+        write_frames(path, [(1, b"a" * 10), (2, b"b" * 6)])
+
+        # Simulate a crash mid-write
+        os.truncate(path, path.stat().st_size - cut)
+        write_frames(path, [(3, b"c" * 3), (4, b"d" * 8)])
+
+        assert list(read_frame_file(path)) == [(1, b"a" * 10), (3, b"c" * 3), (4, b"d" * 8)]
+
+    def test_not_an_archive(self, tmp_path: Path):
+        """Test another file is never appended to"""
+
+        path: Path = tmp_path / "frames.ttlf"
+        path.write_bytes(b"not an archive")
+
+        with pytest.raises(ValueError):
+            FileFrameSink(path)
+
+        with pytest.raises(ValueError):
+            list(read_frame_file(path))
+
+        assert path.read_bytes() == b"not an archive"
@@ -0,0 +1,197 @@
+"""
+Tests for the pull-based event streams (client.events())
+"""
+import asyncio
+from typing import List, Any
+
+import pytest
+
+from TikTokLive import TikTokLiveClient
+from TikTokLive.client.dispatch import EventDispatcher
+from TikTokLive.client.ingest import OverflowPolicy
+from TikTokLive.client.stream import EventStream
+from TikTokLive.events import CommentEvent, LikeEvent, DisconnectEvent
+
+
+def contents(items: List[Any]) -> List[str]:
+    """The contents of queued comments (likes are shown as 'like')"""
+
+    return [item.content if isinstance(item, CommentEvent) else "like" for item in items]
+
+
+async def drain(stream: EventStream) -> List[Any]:
+    """Read everything currently queued"""
+
+    return [await stream.get() for _ in range(stream.depth)]
+
+
+class TestEventStream:
+    """Test the queueing, overflow policies & end of event streams"""
+
+    def test_async_iteration(self):
+        """Test events are received in order & the stream ends once closed & drained"""
+
+        async def run() -> List[str]:
+            dispatcher: EventDispatcher = EventDispatcher()
+
+            async with dispatcher.events(CommentEvent) as stream:
+                for content in ("a", "b", "c"):
+                    dispatcher.emit_event(CommentEvent(content=content))
+
+                received: List[str] = [(await stream.__anext__()).content]
+
+            # Closed by the context manager, the rest is still delivered
+            received += [event.content async for event in stream]
+            assert not dispatcher.emit_event(CommentEvent(content="late"))
+            assert dispatcher.streams == []
+            return received
+
+        assert asyncio.run(run()) == ["a", "b", "c"]
+
+    def test_drop_newest(self):
+        """Test DROP_NEWEST keeps the oldest events & counts the dropped ones"""
+
+        async def run() -> List[str]:
+            dispatcher: EventDispatcher = EventDispatcher()
+            stream: EventStream = dispatcher.events(CommentEvent, maxsize=2, policy=OverflowPolicy.DROP_NEWEST)
+
+            for content in ("a", "b", "c", "d"):
+                dispatcher.emit_event(CommentEvent(content=content))
+
+            assert stream.dropped == {"CommentEvent": 2}
+            assert not stream.blocked
+            return contents(await drain(stream))
+
+        assert asyncio.run(run()) == ["a", "b"]
+
+    def test_drop_oldest(self):
+        """Test DROP_OLDEST keeps the latest events"""
+
+        async def run() -> List[str]:
+            dispatcher: EventDispatcher = EventDispatcher()
+            stream: EventStream = dispatcher.events(CommentEvent, maxsize=2, policy=OverflowPolicy.DROP_OLDEST)
+
+            for content in ("a", "b", "c", "d"):
+                dispatcher.emit_event(CommentEvent(content=content))
+
+            assert stream.dropped == {"CommentEvent": 2}
+            assert stream.high_water_mark == 2
+            return contents(await drain(stream))
+
+        assert asyncio.run(run()) == ["c", "d"]
+
+    def test_drop_by_type(self):
+        """Test DROP_BY_TYPE drops the droppable events first, then blocks once only the others are left"""
+
+        async def run() -> List[str]:
+            dispatcher: EventDispatcher = EventDispatcher()
+            stream: EventStream = dispatcher.events(
+                CommentEvent, LikeEvent, maxsize=3, policy=OverflowPolicy.DROP_BY_TYPE, drop_events=[LikeEvent]
+            )
+
+            dispatcher.emit_event(LikeEvent())
+            dispatcher.emit_event(CommentEvent(content="a"))
+            dispatcher.emit_event(LikeEvent())
+            dispatcher.emit_event(CommentEvent(content="b"))
+            assert stream.dropped == {"LikeEvent": 1}
+
+            # Full of comments now, new likes are dropped & new comments overshoot until the producer waits
+            dispatcher.emit_event(CommentEvent(content="c"))
+            dispatcher.emit_event(LikeEvent())
+            dispatcher.emit_event(CommentEvent(content="d"))
+
+            assert stream.dropped == {"LikeEvent": 3}
+            assert stream.blocked
+            return contents(await drain(stream))
+
+        assert asyncio.run(run()) == ["a", "b", "c", "d"]
+
+    def test_drop_by_type_requires_types(self):
+        """Test DROP_BY_TYPE needs the droppable types"""
+
+        with pytest.raises(ValueError):
+            EventDispatcher().events(CommentEvent, policy=OverflowPolicy.DROP_BY_TYPE)
+
+    def test_block_backpressure(self):
+        """Test a full BLOCK stream makes the producer wait until the consumer catches up"""
+
+        async def run() -> List[str]:
+            dispatcher: EventDispatcher = EventDispatcher()
+            stream: EventStream = dispatcher.events(CommentEvent, maxsize=2)
+            order: List[str] = []
+
+            async def producer() -> None:
+                for content in ("a", "b", "c", "d"):
+                    dispatcher.emit_event(CommentEvent(content=content))
+                    await dispatcher.wait_for_streams()
+                    order.append(f"sent {content}")
+
+            task: asyncio.Task = asyncio.create_task(producer())
+            await asyncio.sleep(0.01)
+            assert order == ["sent a"] and stream.blocked
+
+            for _ in range(4):
+                order.append(f"got {(await stream.get()).content}")
+                await asyncio.sleep(0)
+
+            await task
+            return order
+
+        order: List[str] = asyncio.run(run())
+        assert order.index("got a") < order.index("sent b")
+        assert len(order) == 8
+
+    def test_get_batch(self):
+        """Test batches take everything queued, up to the limit, & are empty once the stream ends"""
+
+        async def run() -> List[int]:
+            dispatcher: EventDispatcher = EventDispatcher()
+            stream: EventStream = dispatcher.events(CommentEvent)
+
+            for content in "abcde":
+                dispatcher.emit_event(CommentEvent(content=content))
+
+            stream.close()
+            return [len(await stream.get_batch(max_items=3)) for _ in range(3)]
+
+        assert asyncio.run(run()) == [3, 2, 0]
+
+    def test_client_stream_ends_on_disconnect(self):
+        """Test a client's stream ends after a DisconnectEvent, delivering it if it was asked for"""
+
+        async def run() -> List[List[Any]]:
+            client: TikTokLiveClient = TikTokLiveClient("user")
+            comments: EventStream = client.events(CommentEvent)
+            with_disconnect: EventStream = client.events(CommentEvent, DisconnectEvent)
+
+            client.emit_event(CommentEvent(content="a"))
+            client.emit_event(DisconnectEvent())
+            client.emit_event(CommentEvent(content="after"))
+
+            assert comments.closed and with_disconnect.closed
+            return [[type(event) async for event in stream] for stream in (comments, with_disconnect)]
+
+        assert asyncio.run(run()) == [[CommentEvent], [CommentEvent, DisconnectEvent]]
+
+    def test_dispatcher_stream_survives_disconnect(self):
+        """Test streams of a plain dispatcher (e.g. a pool, spanning many connections) don't end on a DisconnectEvent"""
+
+        async def run() -> bool:
+            dispatcher: EventDispatcher = EventDispatcher()
+            stream: EventStream = dispatcher.events(CommentEvent)
+            dispatcher.emit_event(DisconnectEvent())
+            return stream.closed
+
+        assert not asyncio.run(run())
+
+    def test_extra_args(self):
+        """Test emitters passing extra arguments yield (event, *args) tuples"""
+
+        async def run() -> Any:
+            dispatcher: EventDispatcher = EventDispatcher()
+            stream: EventStream = dispatcher.events(CommentEvent)
+            dispatcher.emit_event(CommentEvent(content="a"), "client")
+            return await stream.get()
+
+        event, client = asyncio.run(run())
+        assert (event.content, client) == ("a", "client")
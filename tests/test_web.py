@@ -0,0 +1,57 @@
+"""
+Tests for the HTTP client shared between rooms
+"""
+import asyncio
+from typing import List
+
+import httpx
+
+from TikTokLive.client.web.web_base import TikTokHTTPClient, NullCookieJar
+
+
+def shared_client(requests: List[httpx.Request]) -> httpx.AsyncClient:
+    """A shared client whose server sets a cookie named after the room it is asked for"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        room: str = request.url.params["room"]
+        return httpx.Response(200, headers={"Set-Cookie": f"room_{room}={room}; Domain=.tiktok.com; Path=/"})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestSharedHttpClient:
+    """Test rooms sharing an httpx.AsyncClient keep their cookies to themselves"""
+
+    def test_cookies_stay_per_room(self):
+        """Test a room's Set-Cookie is kept by the room & never sent with another room's requests"""
+
+        requests: List[httpx.Request] = []
+        shared: httpx.AsyncClient = shared_client(requests)
+        first: TikTokHTTPClient = TikTokHTTPClient(httpx_client=shared, httpx_kwargs={"cookies": {"own": "1"}})
+        second: TikTokHTTPClient = TikTokHTTPClient(httpx_client=shared)
+
+        async def run() -> None:
+            await first.get("https://www.tiktok.com/api", extra_params={"room": "1"}, base_params=False)
+            await second.get("https://www.tiktok.com/api", extra_params={"room": "2"}, base_params=False)
+            await first.get("https://www.tiktok.com/api", extra_params={"room": "1"}, base_params=False)
+            await shared.aclose()
+
+        asyncio.run(run())
+
+        sent: List[str] = [request.headers.get("Cookie", "") for request in requests]
+        assert "room_1" not in sent[1] and "own" not in sent[1]
+        assert "room_1=1" in sent[2] and "own=1" in sent[2] and "room_2" not in sent[2]
+
+        assert first.cookies.get("room_1") == "1"
+        assert second.cookies.get("room_2") == "2"
+        assert len(shared.cookies) == 0
+        assert isinstance(shared.cookies.jar, NullCookieJar)
+
+    def test_owned_client_unchanged(self):
+        """Test a client created per room keeps the standard cookie jar"""
+
+        client: TikTokHTTPClient = TikTokHTTPClient()
+
+        assert not isinstance(client.httpx_client.cookies.jar, NullCookieJar)
+        asyncio.run(client.httpx_client.aclose())
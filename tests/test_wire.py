@@ -0,0 +1,151 @@
+"""
+Tests for routing WebcastResponseMessages on the wire, before decoding them
+"""
+from typing import List, Tuple
+
+import betterproto
+import pytest
+
+from TikTokLive.client.ws.ws_utils import parse_webcast_response
+from TikTokLive.proto import WebcastResponse, WebcastResponseMessage, WebcastChatMessage, WebcastLikeMessage, Common
+from TikTokLive.proto.codec import ProtoCodec, SUPPORTS_UPB, parse_message
+from TikTokLive.proto.proto_wire import (
+    iter_fields, scan_message_method, scan_webcast_response, read_varint,
+    WIRE_VARINT, WIRE_LEN_DELIM, WIRE_FIXED_32, WIRE_FIXED_64
+)
+
+"""The codecs available here"""
+CODECS: List[ProtoCodec] = [ProtoCodec.BETTERPROTO] + ([ProtoCodec.UPB] if SUPPORTS_UPB else [])
+
+
+def build_response() -> WebcastResponse:
+    """A response with messages of several methods, interleaved with the envelope's fields"""
+
+    messages: List[WebcastResponseMessage] = []
+
+    for index in range(6):
+        if index % 2:
+            payload: bytes = bytes(WebcastLikeMessage(common=Common(method="WebcastLikeMessage", msg_id=index), count=index))
+            messages.append(WebcastResponseMessage(method="WebcastLikeMessage", payload=payload, msg_id=index))
+        else:
+            payload: bytes = bytes(WebcastChatMessage(common=Common(method="WebcastChatMessage", msg_id=index), content=f"hi {index}"))
+            messages.append(WebcastResponseMessage(method="WebcastChatMessage", payload=payload, msg_id=index))
+
+    messages.append(WebcastResponseMessage(method="WebcastMemberMessage", msg_id=99))
+    return WebcastResponse(messages=messages, cursor="t-1", fetch_interval=1000, internal_ext="ext", needs_ack=True, is_first=True)
+
+
+def summary(response: WebcastResponse) -> Tuple:
+    """The envelope & messages of a response (betterproto messages compare by identity)"""
+
+    return (
+        response.cursor, response.internal_ext, response.needs_ack, response.is_first,
+        [(message.method, message.payload, message.msg_id) for message in response.messages]
+    )
+
+
+class TestWireScan:
+    """Test walking serialized messages without decoding them"""
+
+    def test_iter_fields(self):
+        """Test every wire type is read, with its value & offsets"""
+
+        data: bytes = (
+                betterproto.encode_varint(1 << 3 | WIRE_VARINT) + betterproto.encode_varint(300)
+                + betterproto.encode_varint(2 << 3 | WIRE_LEN_DELIM) + b"\x03abc"
+                + betterproto.encode_varint(3 << 3 | WIRE_FIXED_32) + (7).to_bytes(4, "little")
+                + betterproto.encode_varint(4 << 3 | WIRE_FIXED_64) + (9).to_bytes(8, "little")
+        )
+
+        fields: List[Tuple] = [
+            (number, wire_type, bytes(value) if isinstance(value, memoryview) else value, start, end)
+            for number, wire_type, value, start, end in iter_fields(memoryview(data))
+        ]
+
+        assert fields == [
+            (1, WIRE_VARINT, 300, 0, 3),
+            (2, WIRE_LEN_DELIM, b"abc", 3, 8),
+            (3, WIRE_FIXED_32, 7, 8, 13),
+            (4, WIRE_FIXED_64, 9, 13, 22),
+        ]
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            betterproto.encode_varint(1 << 3 | WIRE_LEN_DELIM) + b"\x05ab",
+            betterproto.encode_varint(1 << 3 | WIRE_FIXED_64) + b"\x01",
+            betterproto.encode_varint(1 << 3 | 3),
+            b"\x08" + b"\xff" * 11,
+        ],
+        ids=["truncated_len_delim", "truncated_fixed64", "group", "overlong_varint"]
+    )
+    def test_malformed(self, data: bytes):
+        """Test malformed messages raise instead of being misread"""
+
+        with pytest.raises((ValueError, IndexError)):
+            list(iter_fields(memoryview(data)))
+
+    def test_read_varint(self):
+        """Test varints are read up to their last byte"""
+
+        assert read_varint(memoryview(betterproto.encode_varint(2 ** 63) + b"\x01"), 0) == (2 ** 63, 10)
+
+    def test_scan_message_method(self):
+        """Test the method & payload are read, & missing ones are None"""
+
+        message: WebcastResponseMessage = WebcastResponseMessage(method="WebcastChatMessage", payload=b"\x01\x02", msg_id=5)
+        method, payload = scan_message_method(memoryview(bytes(message)))
+
+        assert (method, bytes(payload)) == ("WebcastChatMessage", b"\x01\x02")
+        assert scan_message_method(memoryview(bytes(WebcastResponseMessage(msg_id=5)))) == (None, None)
+
+    def test_scan_webcast_response(self):
+        """Test the messages of a response are listed in order, with their payloads"""
+
+        response: WebcastResponse = build_response()
+        scanned: List[Tuple[str, bytes]] = [(method, bytes(payload)) for method, payload in scan_webcast_response(bytes(response))]
+
+        assert scanned == [(message.method, message.payload) for message in response.messages]
+
+
+class TestRoutedParse:
+    """Test a response parsed with a method filter matches a full decode, filtered by method"""
+
+    @pytest.mark.parametrize("codec", CODECS, ids=[codec.name for codec in CODECS])
+    @pytest.mark.parametrize(
+        "methods",
+        [frozenset(), frozenset({"WebcastChatMessage"}), frozenset({"WebcastChatMessage", "WebcastMemberMessage", "WebcastGiftMessage"})],
+        ids=["none", "one", "several"]
+    )
+    def test_routed_equals_filtered(self, codec: ProtoCodec, methods: frozenset):
+        """Test the envelope & the kept messages are the same as with a full decode"""
+
+        data: bytes = bytes(build_response())
+
+        expected: WebcastResponse = parse_message(WebcastResponse, data, codec)
+        expected.messages = [message for message in expected.messages if message.method in methods]
+        routed: WebcastResponse = parse_webcast_response(data, codec, methods)
+
+        assert summary(routed) == summary(expected)
+        assert bytes(routed) == bytes(expected)
+
+    @pytest.mark.parametrize("codec", CODECS, ids=[codec.name for codec in CODECS])
+    def test_unfiltered(self, codec: ProtoCodec):
+        """Test no filter decodes every message"""
+
+        data: bytes = bytes(build_response())
+        assert bytes(parse_webcast_response(data, codec)) == bytes(parse_message(WebcastResponse, data, codec)) == data
+
+    def test_routed_messages_use_codec(self, monkeypatch: pytest.MonkeyPatch):
+        """Test the kept messages are decoded with the requested codec, like the envelope"""
+
+        calls: List[Tuple[str, ProtoCodec]] = []
+
+        def spy(message_type: type, data: bytes, codec: ProtoCodec = ProtoCodec.BETTERPROTO):
+            calls.append((message_type.__name__, codec))
+            return parse_message(message_type, data, codec)
+
+        monkeypatch.setattr("TikTokLive.client.ws.ws_utils.parse_message", spy)
+        parse_webcast_response(bytes(build_response()), ProtoCodec.UPB, frozenset({"WebcastChatMessage"}))
+
+        assert calls == [("WebcastResponse", ProtoCodec.UPB)] + [("WebcastResponseMessage", ProtoCodec.UPB)] * 3
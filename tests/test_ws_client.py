@@ -0,0 +1,46 @@
+"""
+Tests for the WebSocket client's outbound writes
+"""
+import asyncio
+import logging
+from typing import List, Union
+
+import pytest
+from betterproto import Message
+
+from TikTokLive.client.ws.ws_client import WebcastWSClient
+
+
+class TestQueueSend:
+    """Test messages sent without the writer task"""
+
+    def test_fallback_send_is_tracked(self, caplog: pytest.LogCaptureFixture):
+        """Test a send made without a writer is kept alive until it finishes, & its error is logged"""
+
+        client: WebcastWSClient = WebcastWSClient(ws_kwargs={})
+        sent: List[bytes] = []
+
+        async def send(message: Union[bytes, Message]) -> None:
+            await asyncio.sleep(0)
+
+            if message == b"fail":
+                raise ValueError("send failed")
+
+            sent.append(message)
+
+        client.send = send
+
+        async def run() -> int:
+            client.queue_send(b"ok")
+            client.queue_send(b"fail")
+            pending: int = len(client._fallback_sends)
+
+            await asyncio.gather(*client._fallback_sends, return_exceptions=True)
+            return pending
+
+        with caplog.at_level(logging.ERROR, logger=client._logger.name):
+            assert asyncio.run(run()) == 2
+
+        assert sent == [b"ok"]
+        assert client._fallback_sends == set()
+        assert "send failed" in caplog.text